@@ -0,0 +1,70 @@
+"""Add task_dependencies edge table backfilled from tasks.dependencies.
+
+Revision ID: 061_add_task_dependencies
+Revises: 060_add_spec_share_fields
+Create Date: 2026-10-16
+
+Normalizes Task.dependencies["depends_on"] into one row per edge, indexed in
+both directions, so blocker lookups no longer scan the tasks table.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "061_add_task_dependencies"
+down_revision = "060_add_spec_share_fields"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create task_dependencies and backfill it from the JSON column."""
+    op.create_table(
+        "task_dependencies",
+        sa.Column(
+            "task_id",
+            sa.String(),
+            sa.ForeignKey("tasks.id", ondelete="CASCADE"),
+            primary_key=True,
+            comment="Dependent task (the one that waits)",
+        ),
+        sa.Column(
+            "depends_on_task_id",
+            sa.String(),
+            primary_key=True,
+            comment="Blocking task ID; not a foreign key because depends_on may reference tasks that no longer exist",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+    )
+    op.create_index(
+        "ix_task_dependencies_depends_on_task_id",
+        "task_dependencies",
+        ["depends_on_task_id", "task_id"],
+    )
+
+    # Backfill: one edge per distinct depends_on entry
+    op.execute(
+        """
+        INSERT INTO task_dependencies (task_id, depends_on_task_id, created_at)
+        SELECT DISTINCT t.id, dep.value, t.created_at
+        FROM tasks t
+        CROSS JOIN LATERAL jsonb_array_elements_text(t.dependencies -> 'depends_on') AS dep(value)
+        WHERE jsonb_typeof(t.dependencies -> 'depends_on') = 'array'
+          AND dep.value <> ''
+        ON CONFLICT DO NOTHING
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop task_dependencies (tasks.dependencies is untouched)."""
+    op.drop_index(
+        "ix_task_dependencies_depends_on_task_id", table_name="task_dependencies"
+    )
+    op.drop_table("task_dependencies")
@@ -0,0 +1,97 @@
+"""Add pgvector embedding column and HNSW index to task_memories.
+
+Revision ID: 062_add_task_memories_vector
+Revises: 061_add_task_dependencies
+Create Date: 2026-10-16
+
+MemoryService semantic search used to load every context_embedding
+(a float array) into Python. This adds a pgvector copy of the embedding,
+backfilled from context_embedding, with an HNSW cosine index so similarity,
+threshold and top-K run inside Postgres.
+
+HNSW is used instead of IVFFlat because it needs no training data and the
+table may be empty when the migration runs.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect, text
+
+# revision identifiers, used by Alembic.
+revision: str = "062_add_task_memories_vector"
+down_revision: Union[str, None] = "061_add_task_dependencies"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Embedding dimension constant - must match DEFAULT_EMBEDDING_DIMENSIONS in embedding.py
+EMBEDDING_DIMENSIONS = 1536
+
+TABLE_NAME = "task_memories"
+COLUMN_NAME = "embedding_vector"
+INDEX_NAME = "idx_task_memories_embedding_vector_hnsw"
+
+
+def _column_exists(inspector, table_name: str, column_name: str) -> bool:
+    """Check if column exists in table."""
+    if table_name not in inspector.get_table_names():
+        return False
+    columns = [col["name"] for col in inspector.get_columns(table_name)]
+    return column_name in columns
+
+
+def upgrade() -> None:
+    """Add, backfill and index task_memories.embedding_vector."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+
+    if TABLE_NAME not in inspector.get_table_names():
+        print(f"⊘ {TABLE_NAME} table does not exist, skipping")
+        return
+
+    try:
+        bind.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+    except Exception as e:
+        print(f"⚠ Could not create pgvector extension: {e}")
+        print("  MemoryService will keep using in-memory similarity search")
+        return
+
+    if not _column_exists(inspector, TABLE_NAME, COLUMN_NAME):
+        bind.execute(
+            text(f"""
+            ALTER TABLE {TABLE_NAME}
+            ADD COLUMN {COLUMN_NAME} vector({EMBEDDING_DIMENSIONS})
+        """)
+        )
+        print(f"  ✓ Created column {COLUMN_NAME} with vector({EMBEDDING_DIMENSIONS})")
+
+    # Backfill from the float array column (only full-dimension vectors cast)
+    bind.execute(
+        text(f"""
+        UPDATE {TABLE_NAME}
+        SET {COLUMN_NAME} = context_embedding::vector({EMBEDDING_DIMENSIONS})
+        WHERE {COLUMN_NAME} IS NULL
+          AND context_embedding IS NOT NULL
+          AND array_length(context_embedding, 1) = {EMBEDDING_DIMENSIONS}
+    """)
+    )
+    print("  ✓ Backfilled embedding_vector from context_embedding")
+
+    bind.execute(
+        text(f"""
+        CREATE INDEX IF NOT EXISTS {INDEX_NAME}
+        ON {TABLE_NAME}
+        USING hnsw ({COLUMN_NAME} vector_cosine_ops)
+    """)
+    )
+    print("  ✓ Created HNSW index with cosine similarity")
+
+
+def downgrade() -> None:
+    """Drop task_memories.embedding_vector and its index."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+
+    bind.execute(text(f"DROP INDEX IF EXISTS {INDEX_NAME}"))
+    if _column_exists(inspector, TABLE_NAME, COLUMN_NAME):
+        bind.execute(text(f"ALTER TABLE {TABLE_NAME} DROP COLUMN {COLUMN_NAME}"))
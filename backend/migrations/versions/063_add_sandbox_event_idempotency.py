@@ -0,0 +1,74 @@
+"""Add idempotency_key and sequence to sandbox_events.
+
+Revision ID: 063_sandbox_event_idempotency
+Revises: 062_add_task_memories_vector
+Create Date: 2026-10-16
+
+Sandbox workers can now post events in batches to
+POST /sandboxes/{sandbox_id}/events/batch. Each event carries a
+client-generated idempotency key and a sequence number so a retried batch
+is not stored twice. The partial unique index backs the
+ON CONFLICT DO NOTHING used by the bulk INSERT; events posted without a key
+(the single-event endpoint) are unaffected.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "063_sandbox_event_idempotency"
+down_revision: Union[str, None] = "062_add_task_memories_vector"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE_NAME = "sandbox_events"
+INDEX_NAME = "uq_sandbox_events_sandbox_idempotency_key"
+
+
+def _column_exists(inspector, table_name: str, column_name: str) -> bool:
+    """Check if column exists in table."""
+    if table_name not in inspector.get_table_names():
+        return False
+    columns = [col["name"] for col in inspector.get_columns(table_name)]
+    return column_name in columns
+
+
+def upgrade() -> None:
+    """Add sandbox_events.idempotency_key/sequence and the unique index."""
+    inspector = inspect(op.get_bind())
+
+    if TABLE_NAME not in inspector.get_table_names():
+        print(f"⊘ {TABLE_NAME} table does not exist, skipping")
+        return
+
+    if not _column_exists(inspector, TABLE_NAME, "idempotency_key"):
+        op.add_column(
+            TABLE_NAME,
+            sa.Column("idempotency_key", sa.String(length=200), nullable=True),
+        )
+    if not _column_exists(inspector, TABLE_NAME, "sequence"):
+        op.add_column(TABLE_NAME, sa.Column("sequence", sa.BigInteger(), nullable=True))
+
+    op.create_index(
+        INDEX_NAME,
+        TABLE_NAME,
+        ["sandbox_id", "idempotency_key"],
+        unique=True,
+        postgresql_where=sa.text("idempotency_key IS NOT NULL"),
+        if_not_exists=True,
+    )
+    print("  ✓ Added idempotency_key/sequence to sandbox_events")
+
+
+def downgrade() -> None:
+    """Drop sandbox_events.idempotency_key/sequence and the unique index."""
+    inspector = inspect(op.get_bind())
+
+    op.drop_index(INDEX_NAME, table_name=TABLE_NAME, if_exists=True)
+    if _column_exists(inspector, TABLE_NAME, "sequence"):
+        op.drop_column(TABLE_NAME, "sequence")
+    if _column_exists(inspector, TABLE_NAME, "idempotency_key"):
+        op.drop_column(TABLE_NAME, "idempotency_key")
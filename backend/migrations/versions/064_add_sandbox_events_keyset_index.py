@@ -0,0 +1,47 @@
+"""Add a (sandbox_id, created_at, id) index to sandbox_events.
+
+Revision ID: 064_sandbox_events_keyset_index
+Revises: 063_sandbox_event_idempotency
+Create Date: 2026-10-16
+
+The sandbox event and trajectory endpoints page with keyset cursors on
+(created_at, id) within a sandbox. This index serves those pages, in either
+direction, without sorting or skipping rows, so a deep page of a long
+sandbox costs the same as the first.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "064_sandbox_events_keyset_index"
+down_revision: Union[str, None] = "063_sandbox_event_idempotency"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE_NAME = "sandbox_events"
+INDEX_NAME = "ix_sandbox_events_sandbox_created_id"
+
+
+def upgrade() -> None:
+    """Create the keyset pagination index."""
+    inspector = inspect(op.get_bind())
+
+    if TABLE_NAME not in inspector.get_table_names():
+        print(f"⊘ {TABLE_NAME} table does not exist, skipping")
+        return
+
+    op.create_index(
+        INDEX_NAME,
+        TABLE_NAME,
+        ["sandbox_id", "created_at", "id"],
+        if_not_exists=True,
+    )
+    print(f"  ✓ Created {INDEX_NAME}")
+
+
+def downgrade() -> None:
+    """Drop the keyset pagination index."""
+    op.drop_index(INDEX_NAME, table_name=TABLE_NAME, if_exists=True)
@@ -0,0 +1,78 @@
+"""Add transcript_ref and transcript_size to claude_session_transcripts.
+
+Revision ID: 065_session_transcript_ref
+Revises: 064_sandbox_events_keyset_index
+Create Date: 2026-10-16
+
+Session transcripts are now stored zstd-compressed in a content-addressed
+transcript store; rows keep only the reference. transcript_b64 becomes
+nullable and is only written when the store is disabled. Existing rows
+keep their inline transcripts and are still read.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = "065_session_transcript_ref"
+down_revision: Union[str, None] = "064_sandbox_events_keyset_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE_NAME = "claude_session_transcripts"
+INDEX_NAME = "ix_claude_session_transcripts_transcript_ref"
+
+
+def _column_exists(inspector, table_name: str, column_name: str) -> bool:
+    """Check if column exists in table."""
+    if table_name not in inspector.get_table_names():
+        return False
+    columns = [col["name"] for col in inspector.get_columns(table_name)]
+    return column_name in columns
+
+
+def upgrade() -> None:
+    """Add the transcript reference columns and relax transcript_b64."""
+    inspector = inspect(op.get_bind())
+
+    if TABLE_NAME not in inspector.get_table_names():
+        print(f"⊘ {TABLE_NAME} table does not exist, skipping")
+        return
+
+    if not _column_exists(inspector, TABLE_NAME, "transcript_ref"):
+        op.add_column(
+            TABLE_NAME,
+            sa.Column(
+                "transcript_ref",
+                sa.String(length=80),
+                nullable=True,
+                comment="Content-addressed transcript store reference (sha256:<hex>)",
+            ),
+        )
+    if not _column_exists(inspector, TABLE_NAME, "transcript_size"):
+        op.add_column(
+            TABLE_NAME,
+            sa.Column(
+                "transcript_size",
+                sa.BigInteger(),
+                nullable=True,
+                comment="Uncompressed transcript size in bytes",
+            ),
+        )
+    op.alter_column(TABLE_NAME, "transcript_b64", nullable=True)
+    op.create_index(INDEX_NAME, TABLE_NAME, ["transcript_ref"], if_not_exists=True)
+    print(f"  ✓ Added transcript_ref to {TABLE_NAME}")
+
+
+def downgrade() -> None:
+    """Drop the transcript reference columns.
+
+    transcript_b64 stays nullable: rows written since the upgrade only have
+    a reference, and their transcripts remain in the transcript store.
+    """
+    op.drop_index(INDEX_NAME, table_name=TABLE_NAME, if_exists=True)
+    op.drop_column(TABLE_NAME, "transcript_size")
+    op.drop_column(TABLE_NAME, "transcript_ref")
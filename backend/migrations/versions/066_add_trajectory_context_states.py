@@ -0,0 +1,69 @@
+"""Add trajectory_context_states for incremental trajectory context.
+
+Revision ID: 066_trajectory_context_states
+Revises: 065_session_transcript_ref
+Create Date: 2026-10-17
+
+Keeps each agent's (or sandbox's) accumulated trajectory state and its
+log watermark, so a rebuild after a cache eviction or a restart only reads
+logs past the watermark.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "066_trajectory_context_states"
+down_revision = "065_session_transcript_ref"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create trajectory_context_states (filled as contexts are built)."""
+    op.create_table(
+        "trajectory_context_states",
+        sa.Column(
+            "context_key",
+            sa.String(length=300),
+            primary_key=True,
+            comment="Agent ID, or sandbox:<sandbox_id> for sandbox contexts",
+        ),
+        sa.Column(
+            "watermark_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="created_at of the last folded log",
+        ),
+        sa.Column(
+            "watermark_id",
+            sa.String(),
+            nullable=True,
+            comment="ID of the last folded log",
+        ),
+        sa.Column(
+            "log_count",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+            comment="Logs folded into the state",
+        ),
+        sa.Column(
+            "state",
+            postgresql.JSONB(),
+            nullable=False,
+            comment="Serialized accumulated extraction state",
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop trajectory_context_states (states are rebuilt from the logs)."""
+    op.drop_table("trajectory_context_states")
@@ -0,0 +1,114 @@
+"""Shared request/response models and runner for bulk-upsert endpoints.
+
+A bulk-upsert request carries a list of items; an item with an ``id``
+updates that entity, an item without one creates a new entity. Items are
+applied in order through the same code paths as the single-item routes,
+and each item gets its own result, so one bad item does not fail the batch.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, List, Literal, Optional
+
+from fastapi import HTTPException
+from pydantic import BaseModel, Field, ValidationError
+
+from omoi_os.logging import get_logger
+
+logger = get_logger(__name__)
+
+MAX_BULK_ITEMS = 200
+
+
+class BulkUpsertItem(BaseModel):
+    """One create (no id) or update (id) in a bulk-upsert request."""
+
+    local_id: Optional[str] = None  # Client reference, echoed in the result
+    id: Optional[str] = None
+    data: Dict[str, Any]
+
+
+class BulkUpsertRequest(BaseModel):
+    items: List[BulkUpsertItem] = Field(..., max_length=MAX_BULK_ITEMS)
+
+
+class BulkUpsertResult(BaseModel):
+    local_id: Optional[str] = None
+    id: Optional[str] = None
+    action: Literal["created", "updated", "failed"]
+    status_code: int
+    error: Optional[str] = None
+    item: Optional[Dict[str, Any]] = None
+
+
+class BulkUpsertResponse(BaseModel):
+    results: List[BulkUpsertResult] = []
+    created: int = 0
+    updated: int = 0
+    failed: int = 0
+
+    def add(self, result: BulkUpsertResult) -> None:
+        """Append a result and count its action."""
+        self.results.append(result)
+        setattr(self, result.action, getattr(self, result.action) + 1)
+
+
+async def run_bulk_upsert(
+    items: List[BulkUpsertItem],
+    create: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]],
+    update: Callable[[str, Dict[str, Any]], Awaitable[Dict[str, Any]]],
+) -> BulkUpsertResponse:
+    """
+    Apply bulk-upsert items in order, collecting a result per item.
+
+    Args:
+        items: Items from the request
+        create: Creates an entity from item data, returning it as a dict
+        update: Updates the entity with the given ID, returning it as a dict
+
+    Returns:
+        Per-item results and counts
+    """
+    response = BulkUpsertResponse()
+    for item in items:
+        action = "updated" if item.id else "created"
+        try:
+            if item.id:
+                entity = await update(item.id, item.data)
+            else:
+                entity = await create(item.data)
+        except HTTPException as e:
+            result = BulkUpsertResult(
+                local_id=item.local_id,
+                id=item.id,
+                action="failed",
+                status_code=e.status_code,
+                error=str(e.detail),
+            )
+        except ValidationError as e:
+            result = BulkUpsertResult(
+                local_id=item.local_id,
+                id=item.id,
+                action="failed",
+                status_code=422,
+                error=str(e),
+            )
+        except Exception as e:
+            logger.error(
+                "bulk_upsert_item_failed", local_id=item.local_id, error=str(e)
+            )
+            result = BulkUpsertResult(
+                local_id=item.local_id,
+                id=item.id,
+                action="failed",
+                status_code=500,
+                error=str(e),
+            )
+        else:
+            result = BulkUpsertResult(
+                local_id=item.local_id,
+                id=str(entity.get("id")) if entity.get("id") else item.id,
+                action=action,
+                status_code=200 if item.id else 201,
+                item=entity,
+            )
+        response.add(result)
+    return response
@@ -758,6 +758,7 @@ def get_prototype_manager() -> "PrototypeManager":
 
 # Singleton instances for embedding and deduplication services
 _embedding_service_instance = None
+_embedding_batcher_instance = None
 _ticket_dedup_service_instance = None
 
 
@@ -774,6 +775,30 @@ def get_embedding_service():
     return _embedding_service_instance
 
 
+def get_embedding_batcher():
+    """Get the shared async micro-batching embedder with lazy initialization."""
+    global _embedding_batcher_instance
+
+    if _embedding_batcher_instance is not None:
+        return _embedding_batcher_instance
+
+    from omoi_os.services.embedding_batcher import EmbeddingBatcher
+
+    _embedding_batcher_instance = EmbeddingBatcher(get_embedding_service())
+    return _embedding_batcher_instance
+
+
+async def close_embedding_batcher() -> None:
+    """Stop the shared embedding batcher if it was ever created."""
+    global _embedding_batcher_instance
+
+    if _embedding_batcher_instance is None:
+        return
+
+    batcher, _embedding_batcher_instance = _embedding_batcher_instance, None
+    await batcher.close()
+
+
 def get_ticket_dedup_service():
     """Get ticket deduplication service with lazy initialization."""
     global _ticket_dedup_service_instance
@@ -5,6 +5,7 @@ import asyncio
 import os
 from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import TYPE_CHECKING
 from uuid import uuid4
 
 from fastapi import FastAPI, Request, status, HTTPException
@@ -29,7 +30,6 @@ init_sentry()
 
 # Initialize PostHog for server-side analytics
 init_posthog()
-from omoi_os.mcp.fastmcp_server import mcp_app
 from omoi_os.api.routes import (
     agents,
     alerts,
@@ -69,44 +69,70 @@ from omoi_os.api.routes import (
     validation,
     watchdog,
 )
-from omoi_os.services.agent_health import AgentHealthService
-from omoi_os.services.agent_registry import AgentRegistryService
-from omoi_os.services.agent_status_manager import AgentStatusManager
-from omoi_os.services.approval import ApprovalService
-from omoi_os.services.budget_enforcer import BudgetEnforcerService
-from omoi_os.services.collaboration import CollaborationService
-from omoi_os.services.cost_tracking import CostTrackingService
-from omoi_os.services.database import DatabaseService
-from omoi_os.services.event_bus import EventBusService
-from omoi_os.services.heartbeat_protocol import HeartbeatProtocolService
-from omoi_os.services.phase_gate import PhaseGateService
-from omoi_os.services.phase_manager import PhaseManager
-from omoi_os.services.resource_lock import ResourceLockService
-from omoi_os.services.task_queue import TaskQueueService
-from omoi_os.services.ticket_workflow import TicketWorkflowOrchestrator
+from omoi_os.services.service_registry import get_service_registry
+
+if TYPE_CHECKING:
+    from omoi_os.services.agent_health import AgentHealthService
+    from omoi_os.services.agent_registry import AgentRegistryService
+    from omoi_os.services.agent_status_manager import AgentStatusManager
+    from omoi_os.services.approval import ApprovalService
+    from omoi_os.services.budget_enforcer import BudgetEnforcerService
+    from omoi_os.services.collaboration import CollaborationService
+    from omoi_os.services.cost_tracking import CostTrackingService
+    from omoi_os.services.database import DatabaseService
+    from omoi_os.services.event_bus import EventBusService
+    from omoi_os.services.heartbeat_protocol import HeartbeatProtocolService
+    from omoi_os.services.phase_gate import PhaseGateService
+    from omoi_os.services.phase_manager import PhaseManager
+    from omoi_os.services.resource_lock import ResourceLockService
+    from omoi_os.services.task_queue import TaskQueueService
+    from omoi_os.services.ticket_workflow import TicketWorkflowOrchestrator
 
 # Global services (initialized in lifespan)
-db: DatabaseService | None = None
-queue: TaskQueueService | None = None
-event_bus: EventBusService | None = None
-health_service: AgentHealthService | None = None
-heartbeat_protocol_service: HeartbeatProtocolService | None = None
-registry_service: AgentRegistryService | None = None
-agent_status_manager: AgentStatusManager | None = None
-approval_service: ApprovalService | None = None
-collaboration_service: CollaborationService | None = None
-lock_service: ResourceLockService | None = None
+db: "DatabaseService | None" = None
+queue: "TaskQueueService | None" = None
+event_bus: "EventBusService | None" = None
+health_service: "AgentHealthService | None" = None
+heartbeat_protocol_service: "HeartbeatProtocolService | None" = None
+registry_service: "AgentRegistryService | None" = None
+agent_status_manager: "AgentStatusManager | None" = None
+approval_service: "ApprovalService | None" = None
+collaboration_service: "CollaborationService | None" = None
+lock_service: "ResourceLockService | None" = None
 monitor_service = None  # Defined below in lifespan
-phase_gate_service: PhaseGateService | None = None
-phase_manager: PhaseManager | None = None
-cost_tracking_service: CostTrackingService | None = None
-budget_enforcer_service: BudgetEnforcerService | None = None
-result_submission_service = None  # Defined below in lifespan
-diagnostic_service = None
-llm_service = None  # Unified LLM service  # Defined below in lifespan
-validation_orchestrator = None  # Defined below in lifespan
-ticket_workflow_orchestrator = None  # Defined below in lifespan
-monitoring_loop = None  # Intelligent monitoring loop  # Defined below in lifespan
+phase_gate_service: "PhaseGateService | None" = None
+phase_manager: "PhaseManager | None" = None
+cost_tracking_service: "CostTrackingService | None" = None
+budget_enforcer_service: "BudgetEnforcerService | None" = None
+ticket_workflow_orchestrator: "TicketWorkflowOrchestrator | None" = None
+
+# Heavy services are registered in lifespan and built on first use; these
+# module attributes resolve through the service registry (see __getattr__)
+_LAZY_SERVICES = {
+    "embedding_service": "embedding",
+    "memory_service": "memory",
+    "discovery_service": "discovery",
+    "billing_service": "billing",
+    "result_submission_service": "result_submission",
+    "diagnostic_service": "diagnostic",
+    "validation_orchestrator": "validation_orchestrator",
+    "llm_service": "llm",
+    "monitoring_loop": "monitoring_loop",
+}
+
+# Built in the background right after startup when monitoring runs
+MONITORING_WARMUP = ("diagnostic", "monitoring_loop")
+
+
+def __getattr__(name: str):
+    """Resolve lazily constructed services, constructing them on first use."""
+    service_name = _LAZY_SERVICES.get(name)
+    if service_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    services = get_service_registry()
+    if not services.is_registered(service_name):
+        return None  # Lifespan has not run
+    return services.get(service_name)
 
 
 async def orchestrator_loop():
@@ -415,9 +441,9 @@ async def heartbeat_monitoring_loop():
 
 async def diagnostic_monitoring_loop():
     """Check for stuck workflows and spawn diagnostic agents."""
-    global db, diagnostic_service, event_bus
+    global db, event_bus
 
-    if not db or not diagnostic_service or not event_bus:
+    if not db or not event_bus:
         return
 
     # Load diagnostic settings
@@ -430,6 +456,11 @@ async def diagnostic_monitoring_loop():
         logger.info("Diagnostic agent system disabled")
         return
 
+    # Built off the event loop (loads the embedding model via memory)
+    diagnostic_service = await asyncio.to_thread(
+        get_service_registry().get, "diagnostic"
+    )
+
     logger.info("Diagnostic monitoring loop started")
 
     while True:
@@ -570,11 +601,15 @@ async def anomaly_monitoring_loop():
     Monitors agents for composite anomaly scores >= 0.8 for 3 consecutive readings
     and automatically spawns diagnostic agents to investigate.
     """
-    global db, monitor_service, diagnostic_service, event_bus
+    global db, monitor_service, event_bus
 
-    if not db or not monitor_service or not diagnostic_service:
+    if not db or not monitor_service:
         return
 
+    diagnostic_service = await asyncio.to_thread(
+        get_service_registry().get, "diagnostic"
+    )
+
     logger.info("Anomaly monitoring loop started")
 
     # Track agents that have already triggered diagnostic runs (to avoid duplicate spawns)
@@ -684,6 +719,20 @@ async def anomaly_monitoring_loop():
             await asyncio.sleep(60)
 
 
+async def start_intelligent_monitoring():
+    """Build the monitoring services off the event loop, then start the loop."""
+    services = get_service_registry()
+    await services.warmup(MONITORING_WARMUP)
+
+    monitoring_loop = services.peek("monitoring_loop")
+    if monitoring_loop:
+        try:
+            await monitoring_loop.start()
+            logger.info("Intelligent Monitoring Loop started (background)")
+        except Exception as e:
+            logger.warning("Failed to start MonitoringLoop", error=str(e))
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for FastAPI app."""
@@ -703,13 +752,22 @@ async def lifespan(app: FastAPI):
         phase_manager, \
         cost_tracking_service, \
         budget_enforcer_service, \
-        result_submission_service, \
-        diagnostic_service, \
-        validation_orchestrator, \
-        ticket_workflow_orchestrator, \
-        llm_service, \
-        monitoring_loop, \
-        mcp_app
+        ticket_workflow_orchestrator
+
+    from omoi_os.services.agent_health import AgentHealthService
+    from omoi_os.services.agent_registry import AgentRegistryService
+    from omoi_os.services.agent_status_manager import AgentStatusManager
+    from omoi_os.services.approval import ApprovalService
+    from omoi_os.services.budget_enforcer import BudgetEnforcerService
+    from omoi_os.services.collaboration import CollaborationService
+    from omoi_os.services.cost_tracking import CostTrackingService
+    from omoi_os.services.database import DatabaseService
+    from omoi_os.services.event_bus import EventBusService
+    from omoi_os.services.heartbeat_protocol import HeartbeatProtocolService
+    from omoi_os.services.phase_gate import PhaseGateService
+    from omoi_os.services.resource_lock import ResourceLockService
+    from omoi_os.services.task_queue import TaskQueueService
+    from omoi_os.services.ticket_workflow import TicketWorkflowOrchestrator
 
     app_settings = get_app_settings()
 
@@ -727,6 +785,27 @@ async def lifespan(app: FastAPI):
     )
     event_bus = EventBusService(redis_url=app_settings.redis.url)
 
+    # Publish from request handlers without blocking the event loop
+    from omoi_os.services.async_event_bus import AsyncEventBus
+
+    async_event_bus = AsyncEventBus(redis_url=app_settings.redis.url)
+    if event_bus.available and await async_event_bus.start():
+        event_bus.attach_async_publisher(async_event_bus)
+
+    # Drop cached dependency graph snapshots on task/ticket events
+    from omoi_os.services.graph_snapshot_cache import get_graph_snapshot_cache
+
+    graph_snapshot_cache = get_graph_snapshot_cache()
+    graph_cache_bus = EventBusService(redis_url=app_settings.redis.url)
+    graph_snapshot_cache.attach_event_bus(graph_cache_bus)
+
+    # Record ticket changes for incremental board deltas
+    from omoi_os.services.board_changes import get_board_change_log
+
+    board_change_log = get_board_change_log()
+    board_change_bus = EventBusService(redis_url=app_settings.redis.url)
+    board_change_log.attach_event_bus(board_change_bus)
+
     # Initialize token blacklist service (Redis-based JWT invalidation)
     from omoi_os.services.token_blacklist import init_token_blacklist
 
@@ -770,101 +849,141 @@ async def lifespan(app: FastAPI):
     cost_tracking_service = CostTrackingService(db, event_bus)
     budget_enforcer_service = BudgetEnforcerService(db, event_bus)
 
-    # Diagnostic system services
-    from omoi_os.services.phase_loader import PhaseLoader
-    from omoi_os.services.result_submission import ResultSubmissionService
-    from omoi_os.services.diagnostic import DiagnosticService
-    from omoi_os.services.discovery import DiscoveryService
-    from omoi_os.services.memory import MemoryService
-    from omoi_os.services.embedding import EmbeddingService, preload_embedding_model
-    from omoi_os.services.billing_service import BillingService
-
-    # Start background preload of embedding model (if configured)
-    # This allows the model to load while other services initialize
+    # Heavy services are built on first use (or warmed up after startup)
+    # instead of before the server accepts traffic
+    services = get_service_registry()
+    services.clear()
+
+    # Start background preload of embedding model (if configured); the
+    # service picks the model up when it is first used
+    from omoi_os.services.embedding import preload_embedding_model
+
     preload_embedding_model()
 
-    phase_loader = PhaseLoader()
+    def build_embedding():
+        from omoi_os.services.embedding import EmbeddingService
 
-    # Initialize billing service for workflow completion tracking
-    billing_service = BillingService(db, event_bus)
+        return EmbeddingService()
 
-    result_submission_service = ResultSubmissionService(
-        db, event_bus, phase_loader, billing_service=billing_service
-    )
+    def build_memory():
+        from omoi_os.services.memory import MemoryService
 
-    # Initialize diagnostic service with dependencies
-    # Model will be ready immediately if preload finished, or lazy-loaded on first use
-    embedding_service = EmbeddingService()
-    memory_service = MemoryService(embedding_service, event_bus)
-    discovery_service = DiscoveryService(event_bus)
-    diagnostic_service = DiagnosticService(
-        db=db,
-        discovery=discovery_service,
-        memory=memory_service,
-        monitor=monitor_service,
-        event_bus=event_bus,
-    )
+        return MemoryService(services.get("embedding"), event_bus)
 
-    # Initialize FastMCP server with services
-    from omoi_os.mcp.fastmcp_server import initialize_mcp_services, mcp_app
+    def build_discovery():
+        from omoi_os.services.discovery import DiscoveryService
 
-    initialize_mcp_services(
-        db=db,
-        event_bus=event_bus,
-        task_queue=queue,
-        discovery_service=discovery_service,
-        collaboration_service=collaboration_service,
-    )
+        return DiscoveryService(event_bus)
 
-    # Validation system services
-    from omoi_os.services.validation_orchestrator import ValidationOrchestrator
+    def build_billing():
+        # Billing service for workflow completion tracking
+        from omoi_os.services.billing_service import BillingService
 
-    validation_orchestrator = ValidationOrchestrator(
-        db=db,
-        agent_registry=registry_service,
-        memory=memory_service,
-        diagnostic=diagnostic_service,
-        event_bus=event_bus,
-    )
+        return BillingService(db, event_bus)
 
-    # Ticket workflow orchestrator
-    ticket_workflow_orchestrator = TicketWorkflowOrchestrator(
-        db=db,
-        task_queue=queue,
-        phase_gate=phase_gate_service,
-        event_bus=event_bus,
-    )
+    def build_result_submission():
+        from omoi_os.services.phase_loader import PhaseLoader
+        from omoi_os.services.result_submission import ResultSubmissionService
+
+        return ResultSubmissionService(
+            db, event_bus, PhaseLoader(), billing_service=services.get("billing")
+        )
 
-    # Unified LLM service
-    from omoi_os.services.llm_service import get_llm_service
+    def build_diagnostic():
+        from omoi_os.services.diagnostic import DiagnosticService
 
-    llm_service = get_llm_service()
+        return DiagnosticService(
+            db=db,
+            discovery=services.get("discovery"),
+            memory=services.get("memory"),
+            monitor=monitor_service,
+            event_bus=event_bus,
+        )
 
-    # Intelligent Monitoring Loop (Guardian + Conductor)
-    try:
-        from omoi_os.services.monitoring_loop import MonitoringLoop, MonitoringConfig
-
-        monitoring_config = MonitoringConfig(
-            guardian_interval_seconds=app_settings.monitoring.guardian_interval_seconds,
-            conductor_interval_seconds=app_settings.monitoring.conductor_interval_seconds,
-            health_check_interval_seconds=app_settings.monitoring.health_check_interval_seconds,
-            auto_steering_enabled=app_settings.monitoring.auto_steering_enabled,
-            max_concurrent_analyses=app_settings.monitoring.max_concurrent_analyses,
-            workspace_root=app_settings.workspace.root,
+    def build_validation_orchestrator():
+        from omoi_os.services.validation_orchestrator import ValidationOrchestrator
+
+        return ValidationOrchestrator(
+            db=db,
+            agent_registry=registry_service,
+            memory=services.get("memory"),
+            diagnostic=services.get("diagnostic"),
+            event_bus=event_bus,
         )
 
-        monitoring_loop = MonitoringLoop(
+    def build_llm():
+        # Unified LLM service
+        from omoi_os.services.llm_service import get_llm_service
+
+        return get_llm_service()
+
+    def build_monitoring_loop():
+        # Intelligent Monitoring Loop (Guardian + Conductor)
+        try:
+            from omoi_os.services.monitoring_loop import (
+                MonitoringConfig,
+                MonitoringLoop,
+            )
+
+            monitoring = app_settings.monitoring
+            monitoring_config = MonitoringConfig(
+                guardian_interval_seconds=monitoring.guardian_interval_seconds,
+                conductor_interval_seconds=monitoring.conductor_interval_seconds,
+                health_check_interval_seconds=(
+                    monitoring.health_check_interval_seconds
+                ),
+                auto_steering_enabled=monitoring.auto_steering_enabled,
+                max_concurrent_analyses=monitoring.max_concurrent_analyses,
+                workspace_root=app_settings.workspace.root,
+            )
+
+            loop = MonitoringLoop(
+                db=db,
+                event_bus=event_bus,
+                config=monitoring_config,
+            )
+            logger.info("Intelligent Monitoring Loop initialized")
+            return loop
+        except ImportError as e:
+            logger.warning("MonitoringLoop not available", error=str(e))
+            return None
+        except Exception as e:
+            logger.warning("Failed to initialize MonitoringLoop", error=str(e))
+            return None
+
+    services.register("embedding", build_embedding)
+    services.register("memory", build_memory)
+    services.register("discovery", build_discovery)
+    services.register("billing", build_billing)
+    services.register("result_submission", build_result_submission)
+    services.register("diagnostic", build_diagnostic)
+    services.register("validation_orchestrator", build_validation_orchestrator)
+    services.register("llm", build_llm)
+    services.register("monitoring_loop", build_monitoring_loop)
+
+    def build_mcp():
+        # FastMCP server with its services; built by combined_lifespan when
+        # MCP is enabled, otherwise on the first /mcp request
+        from omoi_os.mcp.fastmcp_server import initialize_mcp_services, mcp_app
+
+        initialize_mcp_services(
             db=db,
             event_bus=event_bus,
-            config=monitoring_config,
+            task_queue=queue,
+            discovery_service=services.get("discovery"),
+            collaboration_service=collaboration_service,
         )
-        logger.info("Intelligent Monitoring Loop initialized")
-    except ImportError as e:
-        logger.warning("MonitoringLoop not available", error=str(e))
-        monitoring_loop = None
-    except Exception as e:
-        logger.warning("Failed to initialize MonitoringLoop", error=str(e))
-        monitoring_loop = None
+        return mcp_app
+
+    services.register("mcp", build_mcp)
+
+    # Ticket workflow orchestrator
+    ticket_workflow_orchestrator = TicketWorkflowOrchestrator(
+        db=db,
+        task_queue=queue,
+        phase_gate=phase_gate_service,
+        event_bus=event_bus,
+    )
 
     # NOTE: Database tables should be created via alembic migrations, not create_all()
     # Run: alembic upgrade head (handled in Dockerfile CMD)
@@ -884,6 +1003,7 @@ async def lifespan(app: FastAPI):
     anomaly_task = None
     blocking_detection_task = None
     approval_timeout_task = None
+    monitoring_start_task = None
 
     # Orchestrator disabled by default for local dev; enable via ORCHESTRATOR_ENABLED=true
     if not is_testing and orchestrator_enabled:
@@ -906,13 +1026,9 @@ async def lifespan(app: FastAPI):
         blocking_detection_task = asyncio.create_task(blocking_detection_loop())
         approval_timeout_task = asyncio.create_task(approval_timeout_loop())
 
-        # Start intelligent monitoring loop if available (as background task, don't block startup)
-        if monitoring_loop:
-            try:
-                asyncio.create_task(monitoring_loop.start())
-                logger.info("Intelligent Monitoring Loop started (background)")
-            except Exception as e:
-                logger.warning("Failed to start MonitoringLoop", error=str(e))
+        # Build and start intelligent monitoring loop if available (as background
+        # task, don't block startup)
+        monitoring_start_task = asyncio.create_task(start_intelligent_monitoring())
 
     yield
 
@@ -929,8 +1045,11 @@ async def lifespan(app: FastAPI):
         blocking_detection_task.cancel()
     if approval_timeout_task:
         approval_timeout_task.cancel()
+    if monitoring_start_task:
+        monitoring_start_task.cancel()
 
     # Stop intelligent monitoring loop if running (and wasn't skipped)
+    monitoring_loop = services.peek("monitoring_loop")
     if monitoring_loop and not skip_monitoring:
         try:
             await monitoring_loop.stop()
@@ -977,17 +1096,32 @@ async def lifespan(app: FastAPI):
         except asyncio.CancelledError:
             pass
 
-    # Shutdown MCP server if it has a lifespan
-    if "mcp_app" in globals() and mcp_app:
-        try:
-            async with mcp_app.lifespan(app):
-                pass
-        except Exception:
-            pass
+    try:
+        from omoi_os.api.dependencies import close_embedding_batcher
 
+        await close_embedding_batcher()
+    except Exception as e:
+        logger.warning("Error closing embedding batcher", error=str(e))
+
+    graph_snapshot_cache.stop()
+    graph_cache_bus.close()
+    board_change_log.stop()
+    board_change_bus.close()
+    event_bus.attach_async_publisher(None)
+    await async_event_bus.close()
     event_bus.close()
 
 
+async def mcp_asgi_app(scope, receive, send):
+    """ASGI entry for /mcp that builds the FastMCP server on first use.
+
+    Its lifespan is run by combined_lifespan when MCP is enabled.
+    """
+    mcp_app = get_service_registry().get("mcp")
+
+    await mcp_app(scope, receive, send)
+
+
 # Combine lifespans for FastAPI and FastMCP
 @asynccontextmanager
 async def combined_lifespan(app: FastAPI):
@@ -1003,8 +1137,8 @@ async def combined_lifespan(app: FastAPI):
                 logger.warning("MCP server DISABLED (default for local dev)")
             yield
         else:
-            # Import here to avoid circular dependencies
-            from omoi_os.mcp.fastmcp_server import mcp_app
+            # Built (imported and initialized) only when MCP is enabled
+            mcp_app = await asyncio.to_thread(get_service_registry().get, "mcp")
 
             async with mcp_app.lifespan(app):
                 yield
@@ -1221,8 +1355,8 @@ app.include_router(explore.router, prefix="/api/v1", tags=["explore"])
 # Analytics proxy routes (for bypassing ad blockers)
 app.include_router(analytics_proxy.router, prefix="/ingest", tags=["analytics"])
 
-# Mount FastMCP server at /mcp
-app.mount("/mcp", mcp_app)
+# Mount FastMCP server at /mcp (imported on first request, not at load time)
+app.mount("/mcp", mcp_asgi_app)
 
 # Conditionally include monitor router if Phase 4 is available
 try:
@@ -0,0 +1,49 @@
+"""Keyset cursors and ETags shared by paginated list endpoints.
+
+A keyset cursor is the (created_at, id) position of the last row on a page,
+encoded as an opaque URL-safe string. The next page is fetched with
+``WHERE (created_at, id) < (:created_at, :id)``, which costs the same
+however deep the page is.
+"""
+
+import base64
+import hashlib
+from datetime import datetime
+from typing import Optional
+
+from fastapi import Request, Response
+
+
+def encode_keyset_cursor(created_at: datetime, row_id: str) -> str:
+    """Opaque cursor for a row's (created_at, id) position."""
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_keyset_cursor(cursor: str) -> Optional[tuple[datetime, str]]:
+    """Decode a cursor from encode_keyset_cursor (None if it isn't one)."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, row_id = raw.decode().split("|", 1)
+        return datetime.fromisoformat(created_at), row_id
+    except ValueError:
+        return None
+
+
+def etag_response(request: Request, body: str) -> Response:
+    """
+    JSON response with an ETag, or 304 if the client already has the body.
+
+    Args:
+        request: Incoming request (read for If-None-Match)
+        body: Serialized JSON response body
+
+    Returns:
+        200 with the body, or an empty 304 when If-None-Match matches
+    """
+    etag = f'W/"{hashlib.sha256(body.encode()).hexdigest()[:32]}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in {tag.strip() for tag in if_none_match.split(",")}:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -8,8 +8,10 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
 
 from omoi_os.api.dependencies import get_db_service, get_current_user
+from omoi_os.api.pagination import decode_keyset_cursor
 from omoi_os.models.user import User
 from omoi_os.services.board import BoardService
+from omoi_os.services.board_changes import get_board_change_log
 from omoi_os.services.database import DatabaseService
 from omoi_os.services.event_bus import EventBusService
 
@@ -29,6 +31,27 @@ class BoardViewResponse(BaseModel):
     """Response for board view."""
 
     columns: List[Dict[str, Any]]
+    version: Optional[str] = None
+
+
+class ColumnTicketsResponse(BaseModel):
+    """One page of a board column's tickets."""
+
+    column_id: str
+    tickets: List[Dict[str, Any]]
+    has_more: bool
+    next_cursor: Optional[str] = None
+
+
+class BoardDeltaResponse(BaseModel):
+    """Board changes since a version."""
+
+    version: Optional[str]
+    reset: bool
+    inserted: List[Dict[str, Any]]
+    moved: List[Dict[str, Any]]
+    removed: List[str]
+    columns: List[Dict[str, Any]]
 
 
 class ColumnStatsResponse(BaseModel):
@@ -56,7 +79,12 @@ class WIPViolationResponse(BaseModel):
 def get_board_service() -> BoardService:
     """Get board service with dependencies."""
     event_bus = EventBusService()
-    return BoardService(event_bus=event_bus)
+    # Versions are only meaningful while board events are being recorded
+    change_log = get_board_change_log()
+    return BoardService(
+        event_bus=event_bus,
+        change_log=change_log if change_log.listening else None,
+    )
 
 
 # ============================================================================
@@ -71,6 +99,7 @@ def _get_board_view_sync(
     board_service: BoardService,
     user_id: UUID,
     project_id: Optional[str] = None,
+    limit_per_column: Optional[int] = None,
 ) -> Dict[str, Any]:
     """Get board view (runs in thread pool)."""
     with db.get_session() as session:
@@ -84,11 +113,49 @@ def _get_board_view_sync(
             session.commit()
 
         board_data = board_service.get_board_view(
-            session=session, project_id=project_id, user_id=user_id
+            session=session,
+            project_id=project_id,
+            user_id=user_id,
+            limit_per_column=limit_per_column,
         )
         return board_data
 
 
+def _get_column_tickets_sync(
+    db: DatabaseService,
+    board_service: BoardService,
+    column_id: str,
+    user_id: UUID,
+    project_id: Optional[str],
+    cursor: Optional[tuple],
+    limit: int,
+) -> Dict[str, Any]:
+    """Get a page of column tickets (runs in thread pool)."""
+    with db.get_session() as session:
+        return board_service.get_column_tickets(
+            session=session,
+            column_id=column_id,
+            project_id=project_id,
+            user_id=user_id,
+            cursor=cursor,
+            limit=limit,
+        )
+
+
+def _get_board_delta_sync(
+    db: DatabaseService,
+    board_service: BoardService,
+    since: str,
+    user_id: UUID,
+    project_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Get board delta (runs in thread pool)."""
+    with db.get_session() as session:
+        return board_service.get_board_delta(
+            session=session, since_version=since, project_id=project_id, user_id=user_id
+        )
+
+
 def _move_ticket_sync(
     db: DatabaseService,
     board_service: BoardService,
@@ -179,6 +246,9 @@ async def get_board_view(
     project_id: Optional[str] = Query(
         None, description="Filter tickets by project ID. Omit for cross-project board."
     ),
+    limit: Optional[int] = Query(
+        None, ge=1, le=500, description="Tickets per column. Omit for all tickets."
+    ),
     current_user: User = Depends(get_current_user),
     db: DatabaseService = Depends(get_db_service),
     board_service: BoardService = Depends(get_board_service),
@@ -190,13 +260,23 @@ async def get_board_view(
     Automatically initializes default board columns if none exist.
     Only shows tickets belonging to the authenticated user.
 
+    Column counts cover every ticket even when limit truncates a column;
+    load the rest with GET /board/columns/{column_id}/tickets. Pass the
+    returned version to GET /board/delta to fetch later changes only.
+
     Args:
         project_id: Optional project ID to filter tickets. If omitted, shows all user's tickets (cross-project board).
+        limit: Optional page size per column.
     """
     try:
         # Run sync service in thread pool (non-blocking)
         board_data = await asyncio.to_thread(
-            _get_board_view_sync, db, board_service, current_user.id, project_id
+            _get_board_view_sync,
+            db,
+            board_service,
+            current_user.id,
+            project_id,
+            limit,
         )
         return BoardViewResponse(**board_data)
     except Exception as e:
@@ -205,6 +285,78 @@ async def get_board_view(
         )
 
 
+@router.get("/columns/{column_id}/tickets", response_model=ColumnTicketsResponse)
+async def get_column_tickets(
+    column_id: str,
+    project_id: Optional[str] = Query(
+        None, description="Filter tickets by project ID. Omit for cross-project board."
+    ),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the board view or previous page"
+    ),
+    limit: int = Query(50, ge=1, le=500, description="Tickets per page"),
+    current_user: User = Depends(get_current_user),
+    db: DatabaseService = Depends(get_db_service),
+    board_service: BoardService = Depends(get_board_service),
+) -> ColumnTicketsResponse:
+    """
+    Get the next page of a board column's tickets, newest first.
+    """
+    position = None
+    if cursor:
+        position = decode_keyset_cursor(cursor)
+        if position is None:
+            raise HTTPException(status_code=422, detail="Invalid cursor")
+    try:
+        # Run sync service in thread pool (non-blocking)
+        page = await asyncio.to_thread(
+            _get_column_tickets_sync,
+            db,
+            board_service,
+            column_id,
+            current_user.id,
+            project_id,
+            position,
+            limit,
+        )
+        return ColumnTicketsResponse(**page)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to get column tickets: {str(e)}"
+        )
+
+
+@router.get("/delta", response_model=BoardDeltaResponse)
+async def get_board_delta(
+    since: str = Query(..., description="version from the board view or last delta"),
+    project_id: Optional[str] = Query(
+        None, description="Filter tickets by project ID. Omit for cross-project board."
+    ),
+    current_user: User = Depends(get_current_user),
+    db: DatabaseService = Depends(get_db_service),
+    board_service: BoardService = Depends(get_board_service),
+) -> BoardDeltaResponse:
+    """
+    Get ticket moves, inserts and removals since a board version.
+
+    Use the same project_id as the board view. When reset is true the
+    version can no longer be served (another server, restart, or too old)
+    and the client should reload GET /board/view.
+    """
+    try:
+        # Run sync service in thread pool (non-blocking)
+        delta = await asyncio.to_thread(
+            _get_board_delta_sync, db, board_service, since, current_user.id, project_id
+        )
+        return BoardDeltaResponse(**delta)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to get board delta: {str(e)}"
+        )
+
+
 @router.post("/move")
 async def move_ticket(
     request: MoveTicketRequest,
@@ -2,8 +2,10 @@
 
 import asyncio
 import json
-from typing import List, Optional, Set
+from collections import defaultdict
+from typing import Any, Dict, FrozenSet, List, Optional, Set
 
+import redis.asyncio as aioredis
 from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel
 
@@ -67,127 +69,290 @@ class EventSubscriptionRequest(BaseModel):
     entity_ids: Optional[List[str]] = None
 
 
+# Filter key -> SystemEvent field it restricts
+ROUTING_FIELDS = (
+    ("event_types", "event_type"),
+    ("entity_types", "entity_type"),
+    ("entity_ids", "entity_id"),
+)
+
+
+class SubscriptionIndex:
+    """Connections indexed by the event field values their filters accept.
+
+    A connection is listed under each value of each filter it sets, and as a
+    wildcard for each filter it leaves empty. Routing an event starts from
+    the smallest candidate set (across the three fields) and checks the other
+    fields with set lookups, so the cost follows the number of subscribers
+    that could match rather than the number of connections.
+    """
+
+    def __init__(self) -> None:
+        self._exact: Dict[str, Dict[str, Set[Any]]] = {
+            key: defaultdict(set) for key, _ in ROUTING_FIELDS
+        }
+        self._wildcard: Dict[str, Set[Any]] = {key: set() for key, _ in ROUTING_FIELDS}
+        self._filters: Dict[Any, Dict[str, FrozenSet[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._filters)
+
+    def add(self, connection: Any, filters: dict) -> None:
+        """Index a connection, replacing any filters it had."""
+        self.remove(connection)
+        normalized = {
+            key: frozenset(filters[key])
+            for key, _ in ROUTING_FIELDS
+            if filters.get(key)
+        }
+        self._filters[connection] = normalized
+        for key, _ in ROUTING_FIELDS:
+            if key in normalized:
+                for value in normalized[key]:
+                    self._exact[key][value].add(connection)
+            else:
+                self._wildcard[key].add(connection)
+
+    def remove(self, connection: Any) -> None:
+        """Drop a connection from the index."""
+        normalized = self._filters.pop(connection, None)
+        if normalized is None:
+            return
+        for key, _ in ROUTING_FIELDS:
+            if key not in normalized:
+                self._wildcard[key].discard(connection)
+                continue
+            for value in normalized[key]:
+                subscribers = self._exact[key].get(value)
+                if subscribers is not None:
+                    subscribers.discard(connection)
+                    if not subscribers:
+                        del self._exact[key][value]
+
+    def match(self, fields: Dict[str, Any]) -> List[Any]:
+        """Connections whose filters accept an event with these fields."""
+        candidates: Optional[tuple] = None
+        for key, field in ROUTING_FIELDS:
+            exact = self._exact[key].get(fields.get(field), ())
+            wildcard = self._wildcard[key]
+            if candidates is None or len(exact) + len(wildcard) < candidates[0]:
+                candidates = (len(exact) + len(wildcard), exact, wildcard)
+
+        matches = []
+        for group in candidates[1:]:
+            for connection in group:
+                filters = self._filters[connection]
+                if all(
+                    fields.get(field) in filters[key]
+                    for key, field in ROUTING_FIELDS
+                    if key in filters
+                ):
+                    matches.append(connection)
+        return matches
+
+
 class WebSocketEventManager:
-    """Manages WebSocket connections and event subscriptions."""
+    """Manages WebSocket connections and event subscriptions.
+
+    Events arrive from Redis Pub/Sub on an asyncio listener and are routed
+    through a SubscriptionIndex to matching connections only. Each event is
+    encoded once; every connection has a bounded send queue drained by its
+    own task, so a slow client delays nobody else. A client whose queue
+    fills up is disconnected (close code 1013) instead of buffering without
+    bound.
+    """
 
-    def __init__(self, event_bus: EventBusService):
+    def __init__(
+        self,
+        event_bus: EventBusService,
+        redis_client: Optional[aioredis.Redis] = None,
+        send_queue_size: int = 256,
+    ):
+        """
+        Initialize the manager.
+
+        Args:
+            event_bus: Event bus whose Redis the listener subscribes to
+            redis_client: Preconfigured async client (tests); defaults to one
+                for the event bus's Redis URL
+            send_queue_size: Messages buffered per client before it is
+                disconnected as a slow consumer
+        """
         self.event_bus = event_bus
+        self.send_queue_size = send_queue_size
         self.active_connections: Set[WebSocket] = set()
         self.connection_filters: dict[WebSocket, dict] = {}
+        self.subscriptions = SubscriptionIndex()
         self.redis_listener_task: Optional[asyncio.Task] = None
-        self.redis_pubsub = None
+        self._redis = redis_client
+        self._send_queues: dict[WebSocket, asyncio.Queue] = {}
+        self._senders: dict[WebSocket, asyncio.Task] = {}
+        self._closing: Set[asyncio.Task] = set()
+        self.stats = {
+            "events_routed": 0,
+            "messages_queued": 0,
+            "slow_consumers_evicted": 0,
+            "send_errors": 0,
+        }
 
     async def connect(self, websocket: WebSocket, filters: Optional[dict] = None):
         """Accept WebSocket connection and store filters."""
         await websocket.accept()
         self.active_connections.add(websocket)
         self.connection_filters[websocket] = filters or {}
+        self.subscriptions.add(websocket, self.connection_filters[websocket])
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.send_queue_size)
+        self._send_queues[websocket] = queue
+        self._senders[websocket] = asyncio.create_task(
+            self._send_loop(websocket, queue)
+        )
 
         if not self.redis_listener_task or self.redis_listener_task.done():
             self._start_redis_listener()
 
+    def update_filters(self, websocket: WebSocket, filters: dict) -> None:
+        """Merge new filters into a connection's subscription."""
+        if websocket not in self.active_connections:
+            return
+        self.connection_filters[websocket].update(filters)
+        self.subscriptions.add(websocket, self.connection_filters[websocket])
+
     def disconnect(self, websocket: WebSocket):
         """Remove WebSocket connection."""
         self.active_connections.discard(websocket)
         self.connection_filters.pop(websocket, None)
+        self.subscriptions.remove(websocket)
+        self._send_queues.pop(websocket, None)
+        sender = self._senders.pop(websocket, None)
+        if sender is not None:
+            sender.cancel()
+
+    def send(self, websocket: WebSocket, message: dict) -> bool:
+        """Queue a reply for one connection, behind any events already queued.
+
+        Returns:
+            False if the connection is gone (or was just evicted as slow)
+        """
+        queue = self._send_queues.get(websocket)
+        if queue is None:
+            return False
+        try:
+            queue.put_nowait(json.dumps(message))
+        except asyncio.QueueFull:
+            self._evict_slow_consumer(websocket)
+            return False
+        return True
+
+    async def flush(self) -> None:
+        """Wait until every queued message has been sent."""
+        await asyncio.gather(*(queue.join() for queue in self._send_queues.values()))
 
     def _start_redis_listener(self):
         """Start background task to listen to Redis Pub/Sub."""
-        self.redis_pubsub = self.event_bus.redis_client.pubsub()
+        if self._redis is None:
+            redis_url = getattr(self.event_bus, "redis_url", None)
+            if not redis_url:
+                logger.warning("Redis unavailable, WebSocket clients get no events")
+                return
+            self._redis = aioredis.from_url(redis_url, decode_responses=True)
         self.redis_listener_task = asyncio.create_task(self._listen_to_redis())
 
     async def _listen_to_redis(self):
-        """Listen to Redis Pub/Sub and forward events to WebSocket clients."""
-        # Subscribe to all event channels (pattern: events.*)
-        loop = asyncio.get_event_loop()
-
-        def subscribe():
-            self.redis_pubsub.psubscribe("events.*")
-
-        await loop.run_in_executor(None, subscribe)
-
+        """Listen to Redis Pub/Sub and route events to WebSocket clients."""
+        backoff = 0.5
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                # Subscribe to all event channels (pattern: events.*)
+                await pubsub.psubscribe("events.*")
+                backoff = 0.5
+                async for message in pubsub.listen():
+                    if message["type"] == "pmessage":
+                        self._route_message(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Error in Redis listener", error=str(e), exc_info=True)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 30.0)
+
+    def _route_message(self, data: str) -> None:
+        """Route a Redis event message, forwarding its JSON unchanged.
+
+        EventBusService publishes SystemEvent.model_dump_json(), which is
+        already the message format clients receive.
+        """
         try:
-            while True:
-                # Run blocking Redis get_message in executor
-                message = await loop.run_in_executor(
-                    None,
-                    lambda: self.redis_pubsub.get_message(
-                        ignore_subscribe_messages=True, timeout=1.0
-                    ),
-                )
-
-                if message is None:
-                    continue
-
-                if message["type"] == "pmessage":
-                    data = json.loads(message["data"])
-
-                    event = SystemEvent(
-                        event_type=data["event_type"],
-                        entity_type=data["entity_type"],
-                        entity_id=data["entity_id"],
-                        payload=data["payload"],
-                    )
-
-                    # Forward to all connected clients that match filters
-                    await self._broadcast_event(event)
-
-        except asyncio.CancelledError:
-            pass
-        except Exception as e:
-            logger.error("Error in Redis listener", error=str(e), exc_info=True)
-        finally:
-            if self.redis_pubsub:
-
-                def close():
-                    self.redis_pubsub.close()
-
-                await loop.run_in_executor(None, close)
+            fields = json.loads(data)
+        except (TypeError, ValueError):
+            logger.warning("Ignoring malformed event message from Redis")
+            return
+        self._route(fields, data)
+
+    def _route(self, fields: Dict[str, Any], message: str) -> None:
+        """Queue an encoded event for every matching connection."""
+        self.stats["events_routed"] += 1
+        for websocket in self.subscriptions.match(fields):
+            queue = self._send_queues.get(websocket)
+            if queue is None:
+                continue
+            try:
+                queue.put_nowait(message)
+                self.stats["messages_queued"] += 1
+            except asyncio.QueueFull:
+                self._evict_slow_consumer(websocket)
 
     async def _broadcast_event(self, event: SystemEvent):
         """Broadcast event to all matching WebSocket connections."""
-        disconnected = set()
+        self._route(
+            {
+                "event_type": event.event_type,
+                "entity_type": event.entity_type,
+                "entity_id": event.entity_id,
+            },
+            event.model_dump_json(),
+        )
 
-        for websocket in self.active_connections:
+    async def _send_loop(self, websocket: WebSocket, queue: asyncio.Queue) -> None:
+        """Send one connection's queued messages in order."""
+        while True:
+            message = await queue.get()
             try:
-                filters = self.connection_filters.get(websocket, {})
-
-                # Apply filters
-                if not self._matches_filters(event, filters):
-                    continue
-
-                # Send event to client
-                await websocket.send_json(
-                    {
-                        "event_type": event.event_type,
-                        "entity_type": event.entity_type,
-                        "entity_id": event.entity_id,
-                        "payload": event.payload,
-                    }
-                )
+                await websocket.send_text(message)
             except Exception as e:
                 logger.error("Error sending event to WebSocket client", error=str(e))
-                disconnected.add(websocket)
-
-        # Clean up disconnected clients
-        for ws in disconnected:
-            self.disconnect(ws)
-
-    def _matches_filters(self, event: SystemEvent, filters: dict) -> bool:
-        """Check if event matches connection filters."""
-        event_types = filters.get("event_types")
-        if event_types and event.event_type not in event_types:
-            return False
-
-        entity_types = filters.get("entity_types")
-        if entity_types and event.entity_type not in entity_types:
-            return False
-
-        entity_ids = filters.get("entity_ids")
-        if entity_ids and event.entity_id not in entity_ids:
-            return False
+                self.stats["send_errors"] += 1
+                self.disconnect(websocket)
+                return
+            finally:
+                queue.task_done()
+
+    def _evict_slow_consumer(self, websocket: WebSocket) -> None:
+        """Disconnect a client that is not keeping up with its events."""
+        logger.warning(
+            "Disconnecting slow WebSocket client",
+            queued=self.send_queue_size,
+        )
+        self.stats["slow_consumers_evicted"] += 1
+        self.disconnect(websocket)
+        task = asyncio.create_task(
+            self._close_quietly(websocket, code=1013, reason="Slow consumer")
+        )
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
 
-        return True
+    @staticmethod
+    async def _close_quietly(websocket: WebSocket, **kwargs: Any) -> None:
+        try:
+            await websocket.close(**kwargs)
+        except Exception:
+            pass
 
     async def close_all(self):
         """Close all connections and cleanup."""
@@ -199,6 +364,7 @@ class WebSocketEventManager:
                 pass
 
         for websocket in list(self.active_connections):
+            self.disconnect(websocket)
             try:
                 await websocket.close()
             except Exception:
@@ -300,15 +466,17 @@ async def websocket_events(
                         if "entity_ids" in message:
                             new_filters["entity_ids"] = message["entity_ids"]
 
-                        ws_manager.connection_filters[websocket].update(new_filters)
-                        await websocket.send_json(
-                            {"status": "subscribed", "filters": new_filters}
+                        ws_manager.update_filters(websocket, new_filters)
+                        ws_manager.send(
+                            websocket, {"status": "subscribed", "filters": new_filters}
                         )
                 except json.JSONDecodeError:
-                    await websocket.send_json({"error": "Invalid JSON message"})
+                    ws_manager.send(websocket, {"error": "Invalid JSON message"})
             except asyncio.TimeoutError:
-                # Send ping to keep connection alive
-                await websocket.send_json({"type": "ping"})
+                # Send ping to keep connection alive (queued like events, so
+                # replies never interleave with the sender task's writes)
+                if not ws_manager.send(websocket, {"type": "ping"}):
+                    break  # Disconnected as a slow consumer
     except WebSocketDisconnect:
         pass
     finally:
@@ -7,6 +7,7 @@ from omoi_os.api.dependencies import get_db_service, get_task_queue
 from omoi_os.services.database import DatabaseService
 from omoi_os.services.task_queue import TaskQueueService
 from omoi_os.services.dependency_graph import DependencyGraphService
+from omoi_os.services.graph_snapshot_cache import get_graph_snapshot_cache
 from omoi_os.models.task import Task
 
 router = APIRouter()
@@ -62,7 +63,11 @@ async def get_project_dependency_graph(
     Returns:
         Graph structure with nodes and edges
     """
-    graph_service = DependencyGraphService(db)
+    # Snapshots are only safe to serve while invalidation events arrive
+    snapshot_cache = get_graph_snapshot_cache()
+    graph_service = DependencyGraphService(
+        db, snapshot_cache=snapshot_cache if snapshot_cache.listening else None
+    )
     return graph_service.build_project_graph(
         project_id=project_id, include_resolved=include_resolved
     )
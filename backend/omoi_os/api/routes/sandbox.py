@@ -15,17 +15,21 @@ Phase 2 Fix:
 - InMemoryMessageQueue available for testing
 """
 
+import asyncio
 import os
-from datetime import datetime, timezone
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
 from typing import Any, Literal, Optional
 from uuid import uuid4
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 
-from sqlalchemy import select
+from sqlalchemy import and_, func, or_, select, tuple_
 
 from omoi_os.api.dependencies import get_db_service
+from omoi_os.api.pagination import decode_keyset_cursor, encode_keyset_cursor
 from omoi_os.logging import get_logger
 from omoi_os.models.billing import BillingAccount
 from omoi_os.models.spec import Spec, SpecRequirement, SpecTask, SpecAcceptanceCriterion
@@ -34,7 +38,9 @@ from omoi_os.models.ticket import Ticket
 from omoi_os.models.project import Project
 from omoi_os.services.cost_tracking import CostTrackingService
 from omoi_os.services.database import DatabaseService
+from omoi_os.schemas.events import HEARTBEAT_EVENTS
 from omoi_os.services.event_bus import EventBusService, SystemEvent
+from omoi_os.services.sandbox_liveness import get_liveness_store
 from omoi_os.utils.datetime import utc_now
 from omoi_os.services.message_queue import (
     InMemoryMessageQueue,
@@ -45,6 +51,9 @@ from omoi_os.services.message_queue import (
 logger = get_logger(__name__)
 router = APIRouter()
 
+# Event payload field carrying a base64 session transcript (agent.completed)
+TRANSCRIPT_EVENT_FIELD = "transcript_b64"
+
 
 # Global event_bus instance (injected at module level for testability)
 # Can be mocked in tests via patch('omoi_os.api.routes.sandbox.event_bus', mock_bus)
@@ -92,6 +101,52 @@ class SandboxEventResponse(BaseModel):
     timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
+# Upper bound on events per batch ingest request
+MAX_EVENT_BATCH_SIZE = 500
+
+
+class SandboxEventBatchItem(SandboxEventCreate):
+    """One event in a batch ingest request."""
+
+    idempotency_key: str | None = Field(
+        default=None,
+        max_length=200,
+        description="Client-generated key; events already stored under the same "
+        "key for this sandbox are skipped",
+    )
+    sequence: int | None = Field(
+        default=None, description="Client-side sequence number (emission order)"
+    )
+
+
+class SandboxEventBatchCreate(BaseModel):
+    """Request schema for batch event ingest."""
+
+    events: list[SandboxEventBatchItem] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_EVENT_BATCH_SIZE,
+        description="Events in emission order",
+    )
+
+
+class SandboxEventBatchResponse(BaseModel):
+    """Response schema for batch event ingest."""
+
+    status: str
+    sandbox_id: str
+    accepted: int = Field(description="Events newly stored and broadcast")
+    absorbed: int = Field(
+        default=0,
+        description="Heartbeats folded into the liveness rollup (broadcast, not stored)",
+    )
+    duplicates: int = Field(description="Events skipped as already received")
+    event_ids: list[str] = Field(
+        default_factory=list, description="Persisted IDs of accepted events"
+    )
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
 # ============================================================================
 # PHASE 2: MESSAGE SCHEMAS (Testable via Contract Tests)
 # ============================================================================
@@ -200,6 +255,8 @@ def _create_system_event(
     Returns:
         SystemEvent ready for publishing to EventBus
     """
+    # Transcripts go to the transcript store, never to subscribers
+    event_data, _ = split_event_transcript(event_data)
     return SystemEvent(
         event_type=f"SANDBOX_{event_type}",
         entity_type="sandbox",
@@ -212,6 +269,28 @@ def _create_system_event(
     )
 
 
+def split_event_transcript(event_data: dict) -> tuple[dict, str | None]:
+    """
+    Separate the base64 session transcript from an event payload.
+
+    UNIT TESTABLE: No external dependencies.
+
+    agent.completed events carry the whole transcript; it is saved to the
+    transcript store and left out of the persisted and broadcast payloads.
+
+    Args:
+        event_data: Event payload dictionary
+
+    Returns:
+        Tuple of (payload without the transcript, transcript_b64 or None)
+    """
+    if TRANSCRIPT_EVENT_FIELD not in event_data:
+        return event_data, None
+    stripped = dict(event_data)
+    transcript_b64 = stripped.pop(TRANSCRIPT_EVENT_FIELD)
+    return stripped, transcript_b64
+
+
 def broadcast_sandbox_event(
     sandbox_id: str,
     event_type: str,
@@ -234,6 +313,49 @@ def broadcast_sandbox_event(
     bus.publish(system_event)
 
 
+def record_sandbox_heartbeat(sandbox_id: str, event_data: dict) -> dict | None:
+    """
+    Record a heartbeat in the liveness store.
+
+    Heartbeats are not stored as one row each. A summarized row (rollup) is
+    persisted once per rollup interval, carrying the number of heartbeats
+    since the previous rollup in heartbeat_count.
+
+    UNIT TESTABLE: Uses get_liveness_store() which can be mocked.
+
+    Args:
+        sandbox_id: Unique identifier for the sandbox
+        event_data: Heartbeat payload
+
+    Returns:
+        event_data for the row to persist, or None if the heartbeat needs no row
+    """
+    store = get_liveness_store()
+    try:
+        record = store.record_heartbeat(sandbox_id, status=event_data.get("status"))
+    except Exception as e:
+        logger.warning(f"Failed to record heartbeat for sandbox {sandbox_id}: {e}")
+        return event_data
+
+    if not store.shared:
+        # Other processes can't see this store; they read liveness from rows
+        return event_data
+    if not store.rollup_due(record):
+        return None
+
+    try:
+        store.mark_rolled_up(record)
+    except Exception as e:
+        logger.warning(f"Failed to mark heartbeat rollup for sandbox {sandbox_id}: {e}")
+    return {
+        **event_data,
+        "rollup": True,
+        "heartbeat_count": record.pending_count,
+        "first_heartbeat_at": record.first_seen.isoformat(),
+        "last_heartbeat_at": record.last_seen.isoformat(),
+    }
+
+
 async def _update_spec_phase_data(
     db: DatabaseService,
     spec_id: str,
@@ -845,6 +967,7 @@ def persist_sandbox_event(
     """
     from omoi_os.models.sandbox_event import SandboxEvent
 
+    event_data, transcript_b64 = split_event_transcript(event_data)
     with db.get_session() as session:
         db_event = SandboxEvent(
             sandbox_id=sandbox_id,
@@ -864,7 +987,7 @@ def persist_sandbox_event(
                 session_id=event_data["session_id"],
                 sandbox_id=sandbox_id,
                 task_id=event_data.get("task_id"),  # Get task_id from event_data
-                transcript_b64=event_data.get("transcript_b64"),
+                transcript_b64=transcript_b64,
                 metadata={
                     "turns": event_data.get("turns"),
                     "cost_usd": event_data.get("cost_usd"),
@@ -909,6 +1032,7 @@ async def persist_sandbox_event_async(
 
     from omoi_os.models.sandbox_event import SandboxEvent
 
+    event_data, transcript_b64 = split_event_transcript(event_data)
     async with db.get_async_session() as session:
         db_event = SandboxEvent(
             sandbox_id=sandbox_id,
@@ -924,26 +1048,161 @@ async def persist_sandbox_event_async(
 
     # Save session transcript for cross-sandbox resumption (outside session)
     if event_type == "agent.completed" and event_data.get("session_id"):
-        await save_session_transcript_async(
-            db=db,
-            session_id=event_data["session_id"],
-            sandbox_id=sandbox_id,
-            task_id=event_data.get("task_id"),
-            transcript_b64=event_data.get("transcript_b64"),
-            metadata={
-                "turns": event_data.get("turns"),
-                "cost_usd": event_data.get("cost_usd"),
-                "stop_reason": event_data.get("stop_reason"),
-                "input_tokens": event_data.get("input_tokens"),
-                "output_tokens": event_data.get("output_tokens"),
-                "cache_read_tokens": event_data.get("cache_read_tokens"),
-                "cache_write_tokens": event_data.get("cache_write_tokens"),
-            },
+        await _save_completed_session_transcript_async(
+            db, sandbox_id, event_data, transcript_b64
         )
 
     return event_id
 
 
+async def _save_completed_session_transcript_async(
+    db: DatabaseService,
+    sandbox_id: str,
+    event_data: dict,
+    transcript_b64: str | None,
+) -> None:
+    """Save the transcript carried by an agent.completed event."""
+    await save_session_transcript_async(
+        db=db,
+        session_id=event_data["session_id"],
+        sandbox_id=sandbox_id,
+        task_id=event_data.get("task_id"),
+        transcript_b64=transcript_b64,
+        metadata={
+            "turns": event_data.get("turns"),
+            "cost_usd": event_data.get("cost_usd"),
+            "stop_reason": event_data.get("stop_reason"),
+            "input_tokens": event_data.get("input_tokens"),
+            "output_tokens": event_data.get("output_tokens"),
+            "cache_read_tokens": event_data.get("cache_read_tokens"),
+            "cache_write_tokens": event_data.get("cache_write_tokens"),
+        },
+    )
+
+
+async def persist_sandbox_events_batch_async(
+    db: DatabaseService,
+    sandbox_id: str,
+    events: list[SandboxEventBatchItem],
+) -> list[str | None]:
+    """
+    Persist a batch of events with one multi-row INSERT.
+
+    Events whose idempotency_key is already stored for this sandbox are
+    skipped (ON CONFLICT DO NOTHING), so a retried batch is not stored twice.
+    created_at is spaced by one microsecond per event so queries ordered by
+    created_at return the batch in emission order.
+
+    Callers should remove duplicate keys within the batch first; see
+    post_sandbox_events_batch.
+
+    Args:
+        db: Database service
+        sandbox_id: Unique identifier for the sandbox
+        events: Events in emission order
+
+    Returns:
+        Persisted event ID for each event, or None for events skipped as
+        duplicates
+    """
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+    from omoi_os.models.sandbox_event import SandboxEvent
+
+    received_at = utc_now()
+    payloads = [split_event_transcript(event.event_data) for event in events]
+    rows = [
+        {
+            "id": str(uuid4()),
+            "sandbox_id": sandbox_id,
+            "spec_id": event.event_data.get("spec_id"),
+            "event_type": event.event_type,
+            "event_data": payloads[i][0],
+            "source": event.source,
+            "idempotency_key": event.idempotency_key,
+            "sequence": event.sequence,
+            "created_at": received_at + timedelta(microseconds=i),
+        }
+        for i, event in enumerate(events)
+    ]
+    stmt = (
+        pg_insert(SandboxEvent)
+        .values(rows)
+        .on_conflict_do_nothing(
+            index_elements=["sandbox_id", "idempotency_key"],
+            index_where=SandboxEvent.idempotency_key.isnot(None),
+        )
+        .returning(SandboxEvent.id)
+    )
+
+    async with db.get_async_session() as session:
+        result = await session.execute(stmt)
+        inserted = set(result.scalars().all())
+        await session.commit()
+
+    event_ids = [row["id"] if row["id"] in inserted else None for row in rows]
+
+    for event, event_id, (event_data, transcript_b64) in zip(
+        events, event_ids, payloads
+    ):
+        if (
+            event_id
+            and event.event_type == "agent.completed"
+            and event_data.get("session_id")
+        ):
+            await _save_completed_session_transcript_async(
+                db, sandbox_id, event_data, transcript_b64
+            )
+
+    return event_ids
+
+
+def _store_transcript(transcript_b64: str) -> dict:
+    """
+    Store a transcript, returning the ClaudeSessionTranscript column values.
+
+    Uses the transcript store when enabled; otherwise the transcript is
+    kept inline in transcript_b64.
+    """
+    from omoi_os.services.transcript_store import get_transcript_store
+
+    store = get_transcript_store()
+    if store is None:
+        return {
+            "transcript_b64": transcript_b64,
+            "transcript_ref": None,
+            "transcript_size": None,
+        }
+    stored = store.put_b64(transcript_b64)
+    return {
+        "transcript_b64": None,
+        "transcript_ref": stored.ref,
+        "transcript_size": stored.size,
+    }
+
+
+def _load_transcript_b64(transcript: Any) -> str | None:
+    """
+    Base64 transcript content of a ClaudeSessionTranscript row.
+
+    Stored transcripts are decompressed chunk by chunk; rows written before
+    the transcript store existed still carry transcript_b64.
+    """
+    if not transcript.transcript_ref:
+        return transcript.transcript_b64
+
+    from omoi_os.services.transcript_store import get_transcript_store
+
+    store = get_transcript_store()
+    if store is None:
+        logger.warning(
+            f"Transcript store disabled, cannot load {transcript.transcript_ref} "
+            f"for session {transcript.session_id}"
+        )
+        return transcript.transcript_b64
+    return store.read_b64(transcript.transcript_ref)
+
+
 def save_session_transcript(
     db: DatabaseService,
     session_id: str,
@@ -953,7 +1212,10 @@ def save_session_transcript(
     metadata: dict | None = None,
 ) -> None:
     """
-    Save Claude session transcript to database (SYNC version).
+    Save Claude session transcript (SYNC version).
+
+    The transcript goes to the transcript store (zstd-compressed,
+    content-addressed); the database row keeps its reference.
 
     Args:
         db: Database service
@@ -975,6 +1237,8 @@ def save_session_transcript(
     try:
         from omoi_os.models.claude_session_transcript import ClaudeSessionTranscript
 
+        columns = _store_transcript(transcript_b64)
+
         with db.get_session() as session:
             # Check if transcript already exists
             existing = (
@@ -985,7 +1249,8 @@ def save_session_transcript(
 
             if existing:
                 # Update existing transcript
-                existing.transcript_b64 = transcript_b64
+                for name, value in columns.items():
+                    setattr(existing, name, value)
                 existing.sandbox_id = sandbox_id
                 if task_id:
                     existing.task_id = task_id
@@ -995,10 +1260,10 @@ def save_session_transcript(
                 # Create new transcript
                 transcript = ClaudeSessionTranscript(
                     session_id=session_id,
-                    transcript_b64=transcript_b64,
                     sandbox_id=sandbox_id,
                     task_id=task_id,
                     session_metadata=metadata or {},
+                    **columns,
                 )
                 session.add(transcript)
 
@@ -1017,7 +1282,9 @@ async def save_session_transcript_async(
     metadata: dict | None = None,
 ) -> None:
     """
-    Save Claude session transcript to database (ASYNC version - non-blocking).
+    Save Claude session transcript (ASYNC version - non-blocking).
+
+    Compression and the blob write run in a worker thread.
 
     Args:
         db: Database service
@@ -1041,6 +1308,8 @@ async def save_session_transcript_async(
 
         from omoi_os.models.claude_session_transcript import ClaudeSessionTranscript
 
+        columns = await asyncio.to_thread(_store_transcript, transcript_b64)
+
         async with db.get_async_session() as session:
             # Check if transcript already exists
             result = await session.execute(
@@ -1050,7 +1319,8 @@ async def save_session_transcript_async(
 
             if existing:
                 # Update existing transcript
-                existing.transcript_b64 = transcript_b64
+                for name, value in columns.items():
+                    setattr(existing, name, value)
                 existing.sandbox_id = sandbox_id
                 if task_id:
                     existing.task_id = task_id
@@ -1060,10 +1330,10 @@ async def save_session_transcript_async(
                 # Create new transcript
                 transcript = ClaudeSessionTranscript(
                     session_id=session_id,
-                    transcript_b64=transcript_b64,
                     sandbox_id=sandbox_id,
                     task_id=task_id,
                     session_metadata=metadata or {},
+                    **columns,
                 )
                 session.add(transcript)
 
@@ -1075,7 +1345,7 @@ async def save_session_transcript_async(
 
 def get_session_transcript(db: DatabaseService, session_id: str) -> str | None:
     """
-    Retrieve Claude session transcript from database (SYNC version).
+    Retrieve Claude session transcript (SYNC version).
 
     Args:
         db: Database service
@@ -1094,7 +1364,7 @@ def get_session_transcript(db: DatabaseService, session_id: str) -> str | None:
                 .first()
             )
             if transcript:
-                return transcript.transcript_b64
+                return _load_transcript_b64(transcript)
     except Exception as e:
         logger.warning(f"Failed to retrieve session transcript {session_id}: {e}")
 
@@ -1105,7 +1375,7 @@ async def get_session_transcript_async(
     db: DatabaseService, session_id: str
 ) -> str | None:
     """
-    Retrieve Claude session transcript from database (ASYNC version - non-blocking).
+    Retrieve Claude session transcript (ASYNC version - non-blocking).
 
     Args:
         db: Database service
@@ -1124,8 +1394,8 @@ async def get_session_transcript_async(
                 select(ClaudeSessionTranscript).filter_by(session_id=session_id)
             )
             transcript = result.scalar_one_or_none()
-            if transcript:
-                return transcript.transcript_b64
+        if transcript:
+            return await asyncio.to_thread(_load_transcript_b64, transcript)
     except Exception as e:
         logger.warning(f"Failed to retrieve session transcript {session_id}: {e}")
 
@@ -1160,7 +1430,7 @@ def get_session_transcript_for_task(
                 .first()
             )
             if transcript:
-                return transcript.session_id, transcript.transcript_b64
+                return transcript.session_id, _load_transcript_b64(transcript)
     except Exception as e:
         logger.warning(f"Failed to retrieve session transcript for task {task_id}: {e}")
 
@@ -1193,579 +1463,600 @@ async def get_session_transcript_for_task_async(
                 select(ClaudeSessionTranscript)
                 .filter_by(task_id=task_id)
                 .order_by(ClaudeSessionTranscript.updated_at.desc())
+                .limit(1)
             )
             transcript = result.scalar_one_or_none()
-            if transcript:
-                return transcript.session_id, transcript.transcript_b64
+        if transcript:
+            transcript_b64 = await asyncio.to_thread(_load_transcript_b64, transcript)
+            return transcript.session_id, transcript_b64
     except Exception as e:
         logger.warning(f"Failed to retrieve session transcript for task {task_id}: {e}")
 
     return None, None
 
 
-@router.post("/{sandbox_id}/events", response_model=SandboxEventResponse)
-async def post_sandbox_event(
+STATUS_TRANSITION_EVENT_TYPES = frozenset(
+    {
+        "agent.started",
+        "agent.completed",
+        "continuous.completed",  # Contains validation_passed result
+        "agent.failed",
+        "agent.error",
+        # Spec phase events for incremental sync
+        "spec.phase_started",
+        "spec.phase_completed",
+        "spec.phase_failed",
+        "spec.phase_retry",
+        "spec.execution_completed",  # Final spec completion
+        "spec.criterion_met",  # Acceptance criteria completion from sandbox
+    }
+)
+
+
+async def _handle_status_transition(
     sandbox_id: str,
-    event: SandboxEventCreate,
-) -> SandboxEventResponse:
+    event_type: str,
+    event_data: dict,
+    task_id: Optional[str] = None,
+) -> Optional[str]:
     """
-    Receive event from sandbox worker and broadcast to subscribers.
+    Apply task/spec status changes implied by a sandbox event.
 
-    This endpoint is called by worker scripts running inside Daytona sandboxes
-    to report progress, tool usage, errors, and other events to the backend.
+    Handles: agent.started -> running, agent.completed/continuous.completed ->
+    completed, agent.failed/error -> failed. continuous.completed contains the
+    actual validation result (validation_passed field). Also handles spec phase
+    events for incremental spec sync and acceptance criteria updates.
 
-    Events are:
-    - Persisted to database (Phase 4) - optional, fails gracefully
-    - Broadcast via EventBus to:
-      - WebSocket clients (real-time UI updates)
-      - Guardian monitoring (trajectory analysis)
+    Errors are logged, never raised: status updates shouldn't break event
+    processing.
 
     Args:
-        sandbox_id: Unique identifier for the sandbox (from URL path)
-        event: Event data from request body
+        sandbox_id: Unique identifier for the sandbox
+        event_type: Event type (one of STATUS_TRANSITION_EVENT_TYPES)
+        event_data: Event payload dictionary
+        task_id: Task already resolved for this sandbox, used when event_data
+            has no task_id (skips the lookup by sandbox_id)
 
     Returns:
-        SandboxEventResponse with status, timestamp, and event_id
-
-    Example:
-        POST /api/v1/sandboxes/sandbox-abc123/events
-        {
-            "event_type": "agent.tool_use",
-            "event_data": {"tool": "bash", "command": "npm install"},
-            "source": "agent"
-        }
+        The task ID the event applied to, if one was found
     """
-    from sqlalchemy import select
-
-    # Log incoming request for debugging 502 issues
-    logger.info(
-        f"[SandboxEvent] Received {event.event_type} from sandbox {sandbox_id[:20]}... "
-        f"(source: {event.source})"
-    )
-
-    # Persist to database (Phase 4) - optional, fails gracefully
-    # Using async version to avoid blocking the event loop
-    event_id: str | None = None
     try:
         db = get_db_service()
-        # Extract spec_id from event_data if present (for spec-driven development)
-        spec_id = event.event_data.get("spec_id")
-        event_id = await persist_sandbox_event_async(
-            db=db,
-            sandbox_id=sandbox_id,
-            event_type=event.event_type,
-            event_data=event.event_data,
-            source=event.source,
-            spec_id=spec_id,
-        )
+        from omoi_os.services.task_queue import TaskQueueService
+
+        task_id = event_data.get("task_id") or task_id
         logger.debug(
-            f"[SandboxEvent] Persisted event {event_id} for {event.event_type}"
-            + (f" (spec_id={spec_id})" if spec_id else "")
-        )
-    except Exception as e:
-        # Persistence is optional - don't fail if DB unavailable
-        logger.warning(
-            f"[SandboxEvent] Failed to persist event {event.event_type} for sandbox {sandbox_id}: {e}"
+            f"Task status update: event_type={event_type}, task_id={task_id}, sandbox_id={sandbox_id}"
         )
 
-    # Handle task status transitions based on event type
-    # This includes: agent.started -> running, agent.completed/continuous.completed -> completed, agent.failed/error -> failed
-    # NOTE: continuous.completed contains the actual validation result (validation_passed field)
-    # Also handles spec phase events for incremental spec sync and acceptance criteria updates
-    if event.event_type in (
-        "agent.started",
-        "agent.completed",
-        "continuous.completed",  # Contains validation_passed result
-        "agent.failed",
-        "agent.error",
-        # Spec phase events for incremental sync
-        "spec.phase_started",
-        "spec.phase_completed",
-        "spec.phase_failed",
-        "spec.phase_retry",
-        "spec.execution_completed",  # Final spec completion
-        "spec.criterion_met",  # Acceptance criteria completion from sandbox
-    ):
-        try:
-            db = get_db_service()
-            from omoi_os.services.task_queue import TaskQueueService
-
-            task_id = event.event_data.get("task_id")
+        if not task_id:
+            # Try to find task by sandbox_id as fallback (async)
             logger.debug(
-                f"Task status update: event_type={event.event_type}, task_id={task_id}, sandbox_id={sandbox_id}"
+                f"No task_id in event_data, searching by sandbox_id={sandbox_id}"
             )
-
-            if not task_id:
-                # Try to find task by sandbox_id as fallback (async)
-                logger.debug(
-                    f"No task_id in event_data, searching by sandbox_id={sandbox_id}"
+            async with db.get_async_session() as session:
+                result = await session.execute(
+                    select(Task)
+                    .filter(Task.sandbox_id == sandbox_id)
+                    .filter(Task.status.in_(["claiming", "assigned", "running"]))
                 )
+                task = result.scalar_one_or_none()
+                if task:
+                    task_id = str(task.id)
+                    logger.info(f"Found task {task_id} by sandbox_id fallback")
+                else:
+                    logger.warning(
+                        f"No task found for sandbox {sandbox_id} with status claiming/assigned/running"
+                    )
+
+        # Handle criterion_met - can work with or without task_id
+        if event_type == "spec.criterion_met":
+            criterion_id = event_data.get("criterion_id")
+            requirement_id = event_data.get("requirement_id")
+            evidence = event_data.get("evidence", "")
+            spec_id = event_data.get("spec_id")
+
+            # If no spec_id in event, try to get it from task result
+            if not spec_id and task_id:
                 async with db.get_async_session() as session:
                     result = await session.execute(
-                        select(Task)
-                        .filter(Task.sandbox_id == sandbox_id)
-                        .filter(Task.status.in_(["claiming", "assigned", "running"]))
+                        select(Task).where(Task.id == task_id)
                     )
                     task = result.scalar_one_or_none()
-                    if task:
-                        task_id = str(task.id)
-                        logger.info(f"Found task {task_id} by sandbox_id fallback")
-                    else:
-                        logger.warning(
-                            f"No task found for sandbox {sandbox_id} with status claiming/assigned/running"
-                        )
+                    if task and task.result:
+                        spec_id = task.result.get("spec_id")
 
-            # Handle criterion_met - can work with or without task_id
-            if event.event_type == "spec.criterion_met":
-                criterion_id = event.event_data.get("criterion_id")
-                requirement_id = event.event_data.get("requirement_id")
-                evidence = event.event_data.get("evidence", "")
-                spec_id = event.event_data.get("spec_id")
+            if criterion_id:
+                logger.info(
+                    f"Acceptance criterion met: {criterion_id} (requirement: {requirement_id}, spec: {spec_id})"
+                )
+                async with db.get_async_session() as session:
+                    from omoi_os.models.spec import SpecAcceptanceCriterion
 
-                # If no spec_id in event, try to get it from task result
-                if not spec_id and task_id:
-                    async with db.get_async_session() as session:
-                        result = await session.execute(
-                            select(Task).where(Task.id == task_id)
+                    result = await session.execute(
+                        select(SpecAcceptanceCriterion).where(
+                            SpecAcceptanceCriterion.id == criterion_id
                         )
-                        task = result.scalar_one_or_none()
-                        if task and task.result:
-                            spec_id = task.result.get("spec_id")
-
-                if criterion_id:
-                    logger.info(
-                        f"Acceptance criterion met: {criterion_id} (requirement: {requirement_id}, spec: {spec_id})"
                     )
-                    async with db.get_async_session() as session:
-                        from omoi_os.models.spec import SpecAcceptanceCriterion
-
-                        result = await session.execute(
-                            select(SpecAcceptanceCriterion).where(
-                                SpecAcceptanceCriterion.id == criterion_id
+                    criterion = result.scalar_one_or_none()
+                    if criterion:
+                        criterion.completed = True
+                        await session.commit()
+                        logger.info(f"Criterion {criterion_id} marked as completed")
+
+                        # Emit real-time event for UI update
+                        from omoi_os.services.event_bus import SystemEvent
+
+                        event_bus.publish(
+                            SystemEvent(
+                                event_type="CRITERION_COMPLETED",
+                                entity_type="criterion",
+                                entity_id=criterion_id,
+                                payload={
+                                    "criterion_id": criterion_id,
+                                    "requirement_id": requirement_id,
+                                    "spec_id": spec_id,
+                                    "evidence": evidence,
+                                    "sandbox_id": sandbox_id,
+                                    "task_id": task_id,
+                                },
                             )
                         )
-                        criterion = result.scalar_one_or_none()
-                        if criterion:
-                            criterion.completed = True
-                            await session.commit()
-                            logger.info(f"Criterion {criterion_id} marked as completed")
-
-                            # Emit real-time event for UI update
-                            from omoi_os.services.event_bus import SystemEvent
-
-                            event_bus.publish(
-                                SystemEvent(
-                                    event_type="CRITERION_COMPLETED",
-                                    entity_type="criterion",
-                                    entity_id=criterion_id,
-                                    payload={
-                                        "criterion_id": criterion_id,
-                                        "requirement_id": requirement_id,
-                                        "spec_id": spec_id,
-                                        "evidence": evidence,
-                                        "sandbox_id": sandbox_id,
-                                        "task_id": task_id,
-                                    },
-                                )
-                            )
-                        else:
-                            logger.warning(
-                                f"Criterion {criterion_id} not found for update"
-                            )
+                    else:
+                        logger.warning(f"Criterion {criterion_id} not found for update")
 
-            if task_id:
-                task_queue = TaskQueueService(db, event_bus=get_event_bus())
+        if task_id:
+            task_queue = TaskQueueService(db, event_bus=get_event_bus())
 
-                # Handle agent.started -> transition to running (async)
-                if event.event_type == "agent.started":
-                    logger.info(
-                        f"Updating task {task_id} status to running (agent.started)"
+            # Handle agent.started -> transition to running (async)
+            if event_type == "agent.started":
+                logger.info(
+                    f"Updating task {task_id} status to running (agent.started)"
+                )
+                await task_queue.update_task_status_async(
+                    task_id=task_id,
+                    status="running",
+                )
+                logger.info(f"Successfully updated task {task_id} to running")
+
+            # Handle agent.completed or continuous.completed -> trigger validation or complete directly
+            # continuous.completed contains the actual validation_passed result after validation runs
+            elif event_type in ("agent.completed", "continuous.completed"):
+                # Check if this is a validator agent completion
+                is_validator = event_data.get("agent_type") == "validator"
+
+                # Extract result from event_data
+                result = {
+                    "success": event_data.get("success", True),
+                    "turns": event_data.get("turns"),
+                    "cost_usd": event_data.get("cost_usd"),
+                    "session_id": event_data.get("session_id"),
+                    "stop_reason": event_data.get("stop_reason"),
+                }
+                # Include branch name for validation workflow
+                if "branch_name" in event_data and event_data["branch_name"]:
+                    result["branch_name"] = event_data["branch_name"]
+                # Include final output if available
+                if "final_output" in event_data:
+                    result["output"] = event_data["final_output"]
+                    logger.debug(
+                        f"Task {task_id} completion includes final_output ({len(result.get('output', ''))} chars)"
                     )
-                    await task_queue.update_task_status_async(
-                        task_id=task_id,
-                        status="running",
+                else:
+                    logger.debug(f"Task {task_id} completion missing final_output")
+
+                # Generate artifacts from validation state for phase gate requirements
+                artifacts = []
+                code_pushed = event_data.get("code_pushed", False)
+                pr_created = event_data.get("pr_created", False)
+                tests_passed = event_data.get("tests_passed", False)
+                pr_url = event_data.get("pr_url")
+                pr_number = event_data.get("pr_number")
+                files_changed = event_data.get("files_changed", 0)
+                ci_status = event_data.get("ci_status")
+
+                # Create code_changes artifact if code was pushed
+                if code_pushed or pr_created:
+                    artifacts.append(
+                        {
+                            "type": "code_changes",
+                            "path": pr_url,
+                            "content": {
+                                "has_tests": tests_passed,
+                                "branch_name": result.get("branch_name"),
+                                "pr_created": pr_created,
+                                "pr_url": pr_url,
+                                "pr_number": pr_number,
+                                "files_changed": files_changed,
+                            },
+                        }
                     )
-                    logger.info(f"Successfully updated task {task_id} to running")
-
-                # Handle agent.completed or continuous.completed -> trigger validation or complete directly
-                # continuous.completed contains the actual validation_passed result after validation runs
-                elif event.event_type in ("agent.completed", "continuous.completed"):
-                    # Check if this is a validator agent completion
-                    is_validator = event.event_data.get("agent_type") == "validator"
-
-                    # Extract result from event_data
-                    result = {
-                        "success": event.event_data.get("success", True),
-                        "turns": event.event_data.get("turns"),
-                        "cost_usd": event.event_data.get("cost_usd"),
-                        "session_id": event.event_data.get("session_id"),
-                        "stop_reason": event.event_data.get("stop_reason"),
-                    }
-                    # Include branch name for validation workflow
-                    if (
-                        "branch_name" in event.event_data
-                        and event.event_data["branch_name"]
-                    ):
-                        result["branch_name"] = event.event_data["branch_name"]
-                    # Include final output if available
-                    if "final_output" in event.event_data:
-                        result["output"] = event.event_data["final_output"]
-                        logger.debug(
-                            f"Task {task_id} completion includes final_output ({len(result.get('output', ''))} chars)"
-                        )
-                    else:
-                        logger.debug(f"Task {task_id} completion missing final_output")
-
-                    # Generate artifacts from validation state for phase gate requirements
-                    artifacts = []
-                    code_pushed = event.event_data.get("code_pushed", False)
-                    pr_created = event.event_data.get("pr_created", False)
-                    tests_passed = event.event_data.get("tests_passed", False)
-                    pr_url = event.event_data.get("pr_url")
-                    pr_number = event.event_data.get("pr_number")
-                    files_changed = event.event_data.get("files_changed", 0)
-                    ci_status = event.event_data.get("ci_status")
-
-                    # Create code_changes artifact if code was pushed
-                    if code_pushed or pr_created:
-                        artifacts.append(
+
+                # Create test_coverage artifact if tests passed
+                if tests_passed:
+                    # Parse CI status to get more specific test info
+                    test_details = {}
+                    if ci_status and isinstance(ci_status, list):
+                        test_details["checks"] = [
                             {
-                                "type": "code_changes",
-                                "path": pr_url,
-                                "content": {
-                                    "has_tests": tests_passed,
-                                    "branch_name": result.get("branch_name"),
-                                    "pr_created": pr_created,
-                                    "pr_url": pr_url,
-                                    "pr_number": pr_number,
-                                    "files_changed": files_changed,
-                                },
+                                "name": check.get("name"),
+                                "conclusion": check.get("conclusion"),
+                                "state": check.get("state"),
                             }
+                            for check in ci_status
+                        ]
+                        test_details["all_passed"] = all(
+                            check.get("conclusion") == "success"
+                            for check in ci_status
+                            if check.get("state") == "completed"
                         )
 
-                    # Create test_coverage artifact if tests passed
-                    if tests_passed:
-                        # Parse CI status to get more specific test info
-                        test_details = {}
-                        if ci_status and isinstance(ci_status, list):
-                            test_details["checks"] = [
-                                {
-                                    "name": check.get("name"),
-                                    "conclusion": check.get("conclusion"),
-                                    "state": check.get("state"),
-                                }
-                                for check in ci_status
-                            ]
-                            test_details["all_passed"] = all(
-                                check.get("conclusion") == "success"
-                                for check in ci_status
-                                if check.get("state") == "completed"
-                            )
-
-                        artifacts.append(
-                            {
-                                "type": "test_coverage",
-                                "content": {
-                                    "percentage": 80,  # Default - CI passed implies adequate coverage
-                                    "all_passed": True,
-                                    "has_tests": True,
-                                    **test_details,
-                                },
-                            }
-                        )
+                    artifacts.append(
+                        {
+                            "type": "test_coverage",
+                            "content": {
+                                "percentage": 80,  # Default - CI passed implies adequate coverage
+                                "all_passed": True,
+                                "has_tests": True,
+                                **test_details,
+                            },
+                        }
+                    )
 
-                    if artifacts:
-                        result["artifacts"] = artifacts
-                        logger.info(
-                            f"Task {task_id} generated {len(artifacts)} artifacts for phase gate",
-                            extra={"artifact_types": [a["type"] for a in artifacts]},
-                        )
+                if artifacts:
+                    result["artifacts"] = artifacts
+                    logger.info(
+                        f"Task {task_id} generated {len(artifacts)} artifacts for phase gate",
+                        extra={"artifact_types": [a["type"] for a in artifacts]},
+                    )
 
-                    # Handle completion events:
-                    # - continuous.completed with validation_passed = true: In-sandbox validation passed, mark complete
-                    # - continuous.completed with validation_passed = false: In-sandbox validation failed
-                    # - agent.completed: Agent work done, check if validation_passed is set
-                    # - Validator agent completion: External validator result
+                # Handle completion events:
+                # - continuous.completed with validation_passed = true: In-sandbox validation passed, mark complete
+                # - continuous.completed with validation_passed = false: In-sandbox validation failed
+                # - agent.completed: Agent work done, check if validation_passed is set
+                # - Validator agent completion: External validator result
 
-                    validation_passed = event.event_data.get("validation_passed")
+                validation_passed = event_data.get("validation_passed")
 
-                    # continuous.completed is the final validation result from in-sandbox validation
-                    if event.event_type == "continuous.completed":
-                        if validation_passed:
-                            # In-sandbox validation passed - mark task complete
-                            logger.info(
-                                f"In-sandbox validation passed for task {task_id}, marking completed"
-                            )
-                            await task_queue.update_task_status_async(
-                                task_id=task_id,
-                                status="completed",
-                                result={
-                                    **result,
-                                    "validation_passed": True,
-                                    "validation_type": "in_sandbox",
-                                },
-                            )
-                            logger.info(
-                                f"Successfully updated task {task_id} to completed"
-                            )
-                        else:
-                            # In-sandbox validation failed
-                            logger.info(
-                                f"In-sandbox validation failed for task {task_id}"
-                            )
-                            # Don't mark as failed yet - may have recommendations
-                            # The task stays in current status
-                    elif is_validator:
-                        # This is an external validator agent completion
-                        validation_feedback = event.event_data.get(
-                            "validation_feedback",
-                            (
-                                "Validation passed"
-                                if validation_passed
-                                else "Validation failed"
-                            ),
-                        )
+                # continuous.completed is the final validation result from in-sandbox validation
+                if event_type == "continuous.completed":
+                    if validation_passed:
+                        # In-sandbox validation passed - mark task complete
                         logger.info(
-                            f"Validator completed for task {task_id}: passed={validation_passed}",
-                            extra={"validation_feedback": validation_feedback},
+                            f"In-sandbox validation passed for task {task_id}, marking completed"
                         )
-
-                        # Call handle_validation_result to properly update task status
-                        from omoi_os.services.task_validator import get_task_validator
-
-                        validator_service = get_task_validator(
-                            db=db, event_bus=get_event_bus()
-                        )
-                        await validator_service.handle_validation_result(
+                        await task_queue.update_task_status_async(
                             task_id=task_id,
-                            validator_agent_id=event.event_data.get(
-                                "agent_id", f"validator-{sandbox_id[:8]}"
-                            ),
-                            passed=validation_passed or False,
-                            feedback=validation_feedback,
-                            evidence={
-                                "tests_passed": event.event_data.get(
-                                    "tests_passed", False
-                                ),
-                                "code_pushed": event.event_data.get(
-                                    "code_pushed", False
-                                ),
-                                "pr_created": event.event_data.get("pr_created", False),
-                                "pr_url": event.event_data.get("pr_url"),
+                            status="completed",
+                            result={
+                                **result,
+                                "validation_passed": True,
+                                "validation_type": "in_sandbox",
                             },
-                            recommendations=None,
-                        )
-                        logger.info(
-                            f"Validation result processed for task {task_id}: "
-                            f"new_status={'completed' if validation_passed else 'needs_revision'}"
                         )
+                        logger.info(f"Successfully updated task {task_id} to completed")
                     else:
-                        # agent.completed - implementation done, wait for continuous.completed
-                        # Don't trigger external validation since we use in-sandbox validation
-                        logger.info(
-                            f"Agent completed for task {task_id}, waiting for validation result"
-                        )
+                        # In-sandbox validation failed
+                        logger.info(f"In-sandbox validation failed for task {task_id}")
+                        # Don't mark as failed yet - may have recommendations
+                        # The task stays in current status
+                elif is_validator:
+                    # This is an external validator agent completion
+                    validation_feedback = event_data.get(
+                        "validation_feedback",
+                        (
+                            "Validation passed"
+                            if validation_passed
+                            else "Validation failed"
+                        ),
+                    )
+                    logger.info(
+                        f"Validator completed for task {task_id}: passed={validation_passed}",
+                        extra={"validation_feedback": validation_feedback},
+                    )
+
+                    # Call handle_validation_result to properly update task status
+                    from omoi_os.services.task_validator import get_task_validator
+
+                    validator_service = get_task_validator(
+                        db=db, event_bus=get_event_bus()
+                    )
+                    await validator_service.handle_validation_result(
+                        task_id=task_id,
+                        validator_agent_id=event_data.get(
+                            "agent_id", f"validator-{sandbox_id[:8]}"
+                        ),
+                        passed=validation_passed or False,
+                        feedback=validation_feedback,
+                        evidence={
+                            "tests_passed": event_data.get("tests_passed", False),
+                            "code_pushed": event_data.get("code_pushed", False),
+                            "pr_created": event_data.get("pr_created", False),
+                            "pr_url": event_data.get("pr_url"),
+                        },
+                        recommendations=None,
+                    )
+                    logger.info(
+                        f"Validation result processed for task {task_id}: "
+                        f"new_status={'completed' if validation_passed else 'needs_revision'}"
+                    )
+                else:
+                    # agent.completed - implementation done, wait for continuous.completed
+                    # Don't trigger external validation since we use in-sandbox validation
+                    logger.info(
+                        f"Agent completed for task {task_id}, waiting for validation result"
+                    )
 
-                    # Record cost if cost data is available
-                    cost_usd = event.event_data.get("cost_usd")
-                    if cost_usd is not None and cost_usd > 0:
-                        try:
-                            input_tokens = event.event_data.get("input_tokens", 0)
-                            output_tokens = event.event_data.get("output_tokens", 0)
-                            model = event.event_data.get("model", "claude-sonnet-4")
-
-                            # Look up billing_account_id from task -> ticket -> project -> organization
-                            billing_account_id = None
-                            async with db.get_async_session() as cost_session:
-                                # Query task with joined relationships
-                                task_result = await cost_session.execute(
-                                    select(Task).where(Task.id == task_id)
+                # Record cost if cost data is available
+                cost_usd = event_data.get("cost_usd")
+                if cost_usd is not None and cost_usd > 0:
+                    try:
+                        input_tokens = event_data.get("input_tokens", 0)
+                        output_tokens = event_data.get("output_tokens", 0)
+                        model = event_data.get("model", "claude-sonnet-4")
+
+                        # Look up billing_account_id from task -> ticket -> project -> organization
+                        billing_account_id = None
+                        async with db.get_async_session() as cost_session:
+                            # Query task with joined relationships
+                            task_result = await cost_session.execute(
+                                select(Task).where(Task.id == task_id)
+                            )
+                            task_obj = task_result.scalar_one_or_none()
+
+                            if task_obj and task_obj.ticket_id:
+                                ticket_result = await cost_session.execute(
+                                    select(Ticket).where(
+                                        Ticket.id == task_obj.ticket_id
+                                    )
                                 )
-                                task_obj = task_result.scalar_one_or_none()
+                                ticket_obj = ticket_result.scalar_one_or_none()
 
-                                if task_obj and task_obj.ticket_id:
-                                    ticket_result = await cost_session.execute(
-                                        select(Ticket).where(
-                                            Ticket.id == task_obj.ticket_id
+                                if ticket_obj and ticket_obj.project_id:
+                                    project_result = await cost_session.execute(
+                                        select(Project).where(
+                                            Project.id == ticket_obj.project_id
                                         )
                                     )
-                                    ticket_obj = ticket_result.scalar_one_or_none()
+                                    project_obj = project_result.scalar_one_or_none()
 
-                                    if ticket_obj and ticket_obj.project_id:
-                                        project_result = await cost_session.execute(
-                                            select(Project).where(
-                                                Project.id == ticket_obj.project_id
+                                    if project_obj and project_obj.organization_id:
+                                        billing_result = await cost_session.execute(
+                                            select(BillingAccount).where(
+                                                BillingAccount.organization_id
+                                                == project_obj.organization_id
                                             )
                                         )
-                                        project_obj = (
-                                            project_result.scalar_one_or_none()
+                                        billing_account = (
+                                            billing_result.scalar_one_or_none()
                                         )
+                                        if billing_account:
+                                            billing_account_id = str(billing_account.id)
 
-                                        if project_obj and project_obj.organization_id:
-                                            billing_result = await cost_session.execute(
-                                                select(BillingAccount).where(
-                                                    BillingAccount.organization_id
-                                                    == project_obj.organization_id
-                                                )
-                                            )
-                                            billing_account = (
-                                                billing_result.scalar_one_or_none()
-                                            )
-                                            if billing_account:
-                                                billing_account_id = str(
-                                                    billing_account.id
-                                                )
-
-                            # Record the cost
-                            cost_service = CostTrackingService(db)
-                            cost_record = cost_service.record_sandbox_cost(
-                                task_id=task_id,
-                                sandbox_id=sandbox_id,
-                                cost_usd=cost_usd,
-                                input_tokens=input_tokens,
-                                output_tokens=output_tokens,
-                                model=model,
-                                agent_id=(
-                                    task_obj.assigned_agent_id if task_obj else None
-                                ),
-                                billing_account_id=billing_account_id,
-                            )
-                            logger.info(
-                                f"Recorded cost for task {task_id}: ${cost_usd:.4f} "
-                                f"(billing_account={billing_account_id}, record_id={cost_record.id})"
-                            )
-                        except Exception as cost_error:
-                            # Cost recording should not block task completion
-                            logger.error(
-                                f"Failed to record cost for task {task_id}: {cost_error}",
-                                exc_info=True,
-                            )
+                        # Record the cost
+                        cost_service = CostTrackingService(db)
+                        cost_record = cost_service.record_sandbox_cost(
+                            task_id=task_id,
+                            sandbox_id=sandbox_id,
+                            cost_usd=cost_usd,
+                            input_tokens=input_tokens,
+                            output_tokens=output_tokens,
+                            model=model,
+                            agent_id=(task_obj.assigned_agent_id if task_obj else None),
+                            billing_account_id=billing_account_id,
+                        )
+                        logger.info(
+                            f"Recorded cost for task {task_id}: ${cost_usd:.4f} "
+                            f"(billing_account={billing_account_id}, record_id={cost_record.id})"
+                        )
+                    except Exception as cost_error:
+                        # Cost recording should not block task completion
+                        logger.error(
+                            f"Failed to record cost for task {task_id}: {cost_error}",
+                            exc_info=True,
+                        )
 
-                # Handle agent.failed/error -> transition to failed (async)
-                elif event.event_type in ("agent.failed", "agent.error"):
-                    error_message = event.event_data.get(
-                        "error", "Task execution failed"
-                    )
-                    logger.info(
-                        f"Updating task {task_id} status to failed: {error_message}"
-                    )
-                    await task_queue.update_task_status_async(
-                        task_id=task_id,
-                        status="failed",
-                        error_message=error_message,
-                    )
-                    logger.info(f"Successfully updated task {task_id} to failed")
-            else:
-                # Check if this is a spec sandbox (has spec_id but no task_id)
-                # Spec sandboxes don't need task status updates - they have their own workflow
-                spec_id = event.event_data.get("spec_id")
-                if spec_id:
-                    logger.info(
-                        f"Spec sandbox event received: spec_id={spec_id}, "
-                        f"event_type={event.event_type}, sandbox_id={sandbox_id}"
-                    )
-                    # Handle spec completion - update spec's phase_data
-                    # Also handle continuous.completed for defense in depth
-                    if event.event_type in ("agent.completed", "continuous.completed"):
-                        phase_data = event.event_data.get("phase_data")
-                        if phase_data:
-                            logger.info(
-                                f"Updating spec {spec_id} with phase_data: phases={list(phase_data.keys())}"
-                            )
-                            await _update_spec_phase_data(
-                                db=db,
-                                spec_id=spec_id,
-                                phase_data=phase_data,
-                                success=event.event_data.get("success", True),
-                            )
-                        else:
-                            logger.warning(
-                                f"Received {event.event_type} for spec {spec_id} but phase_data is empty or missing. "
-                                f"event_data keys: {list(event.event_data.keys())}"
-                            )
-                    # Handle phase started - update current_phase and progress immediately for real-time UI sync
-                    elif event.event_type == "spec.phase_started":
-                        phase_name = event.event_data.get("phase")
-                        if phase_name:
-                            logger.info(
-                                f"Phase started: spec {spec_id} now in phase {phase_name}"
-                            )
-                            # Calculate progress based on phase order
-                            # Phases: explore, prd, requirements, design, tasks, sync (6 phases)
-                            # Progress shows "starting this phase" - we show the previous phase's completion
-                            phase_progress = {
-                                "explore": 0.0,
-                                "prd": 16.0,
-                                "requirements": 32.0,
-                                "design": 48.0,
-                                "tasks": 64.0,
-                                "sync": 80.0,
-                            }
-                            new_progress = phase_progress.get(phase_name, 0.0)
+            # Handle agent.failed/error -> transition to failed (async)
+            elif event_type in ("agent.failed", "agent.error"):
+                error_message = event_data.get("error", "Task execution failed")
+                logger.info(
+                    f"Updating task {task_id} status to failed: {error_message}"
+                )
+                await task_queue.update_task_status_async(
+                    task_id=task_id,
+                    status="failed",
+                    error_message=error_message,
+                )
+                logger.info(f"Successfully updated task {task_id} to failed")
+        else:
+            # Check if this is a spec sandbox (has spec_id but no task_id)
+            # Spec sandboxes don't need task status updates - they have their own workflow
+            spec_id = event_data.get("spec_id")
+            if spec_id:
+                logger.info(
+                    f"Spec sandbox event received: spec_id={spec_id}, "
+                    f"event_type={event_type}, sandbox_id={sandbox_id}"
+                )
+                # Handle spec completion - update spec's phase_data
+                # Also handle continuous.completed for defense in depth
+                if event_type in ("agent.completed", "continuous.completed"):
+                    phase_data = event_data.get("phase_data")
+                    if phase_data:
+                        logger.info(
+                            f"Updating spec {spec_id} with phase_data: phases={list(phase_data.keys())}"
+                        )
+                        await _update_spec_phase_data(
+                            db=db,
+                            spec_id=spec_id,
+                            phase_data=phase_data,
+                            success=event_data.get("success", True),
+                        )
+                    else:
+                        logger.warning(
+                            f"Received {event_type} for spec {spec_id} but phase_data is empty or missing. "
+                            f"event_data keys: {list(event_data.keys())}"
+                        )
+                # Handle phase started - update current_phase and progress immediately for real-time UI sync
+                elif event_type == "spec.phase_started":
+                    phase_name = event_data.get("phase")
+                    if phase_name:
+                        logger.info(
+                            f"Phase started: spec {spec_id} now in phase {phase_name}"
+                        )
+                        # Calculate progress based on phase order
+                        # Phases: explore, prd, requirements, design, tasks, sync (6 phases)
+                        # Progress shows "starting this phase" - we show the previous phase's completion
+                        phase_progress = {
+                            "explore": 0.0,
+                            "prd": 16.0,
+                            "requirements": 32.0,
+                            "design": 48.0,
+                            "tasks": 64.0,
+                            "sync": 80.0,
+                        }
+                        new_progress = phase_progress.get(phase_name, 0.0)
 
-                            async with db.get_async_session() as session:
-                                result = await session.execute(
-                                    select(Spec).where(Spec.id == spec_id)
-                                )
-                                spec = result.scalar_one_or_none()
-                                if spec:
-                                    spec.current_phase = phase_name
-                                    spec.progress = new_progress
-                                    spec.updated_at = utc_now()
-                                    await session.commit()
-                                    logger.info(
-                                        f"Spec {spec_id} current_phase={phase_name}, progress={new_progress}%"
-                                    )
-                    # Handle incremental phase completion - sync phase_data as each phase finishes
-                    elif event.event_type == "spec.phase_completed":
-                        phase_name = event.event_data.get("phase")
-                        phase_output = event.event_data.get("phase_output")
-                        if phase_name and phase_output:
-                            logger.info(
-                                f"Incremental sync: spec {spec_id} phase {phase_name} completed"
-                            )
-                            await _update_spec_phase_data(
-                                db=db,
-                                spec_id=spec_id,
-                                phase_data={phase_name: phase_output},
-                                success=True,
-                            )
-                        else:
-                            # Log but don't warn - older sandboxes won't have phase_output
-                            logger.debug(
-                                f"spec.phase_completed for {spec_id} missing phase or phase_output: "
-                                f"phase={phase_name}, has_output={phase_output is not None}"
-                            )
-                    # Handle spec execution completed - mark spec as completed
-                    elif event.event_type == "spec.execution_completed":
-                        logger.info(f"Spec {spec_id} execution completed")
                         async with db.get_async_session() as session:
                             result = await session.execute(
                                 select(Spec).where(Spec.id == spec_id)
                             )
                             spec = result.scalar_one_or_none()
                             if spec:
-                                spec.status = "completed"
-                                spec.progress = 100.0
+                                spec.current_phase = phase_name
+                                spec.progress = new_progress
                                 spec.updated_at = utc_now()
                                 await session.commit()
                                 logger.info(
-                                    f"Spec {spec_id} marked as completed (100%)"
+                                    f"Spec {spec_id} current_phase={phase_name}, progress={new_progress}%"
                                 )
-                    # Note: spec.criterion_met is handled above at the top level
-                    # (before task_id check) to work with both task-based and spec-based events
-                else:
-                    logger.warning(
-                        f"Could not determine task_id for status update. event_type={event.event_type}, sandbox_id={sandbox_id}, event_data keys={list(event.event_data.keys())}"
-                    )
+                # Handle incremental phase completion - sync phase_data as each phase finishes
+                elif event_type == "spec.phase_completed":
+                    phase_name = event_data.get("phase")
+                    phase_output = event_data.get("phase_output")
+                    if phase_name and phase_output:
+                        logger.info(
+                            f"Incremental sync: spec {spec_id} phase {phase_name} completed"
+                        )
+                        await _update_spec_phase_data(
+                            db=db,
+                            spec_id=spec_id,
+                            phase_data={phase_name: phase_output},
+                            success=True,
+                        )
+                    else:
+                        # Log but don't warn - older sandboxes won't have phase_output
+                        logger.debug(
+                            f"spec.phase_completed for {spec_id} missing phase or phase_output: "
+                            f"phase={phase_name}, has_output={phase_output is not None}"
+                        )
+                # Handle spec execution completed - mark spec as completed
+                elif event_type == "spec.execution_completed":
+                    logger.info(f"Spec {spec_id} execution completed")
+                    async with db.get_async_session() as session:
+                        result = await session.execute(
+                            select(Spec).where(Spec.id == spec_id)
+                        )
+                        spec = result.scalar_one_or_none()
+                        if spec:
+                            spec.status = "completed"
+                            spec.progress = 100.0
+                            spec.updated_at = utc_now()
+                            await session.commit()
+                            logger.info(f"Spec {spec_id} marked as completed (100%)")
+                # Note: spec.criterion_met is handled above at the top level
+                # (before task_id check) to work with both task-based and spec-based events
+            else:
+                logger.warning(
+                    f"Could not determine task_id for status update. event_type={event_type}, sandbox_id={sandbox_id}, event_data keys={list(event_data.keys())}"
+                )
+    except Exception as e:
+        # Task status update is important but shouldn't break event processing
+        # Log error with full stack trace for debugging
+        logger.error(
+            f"Failed to update task status for sandbox {sandbox_id}, event_type={event_type}: {e}",
+            exc_info=True,
+        )
+    return task_id
+
+
+@router.post("/{sandbox_id}/events", response_model=SandboxEventResponse)
+async def post_sandbox_event(
+    sandbox_id: str,
+    event: SandboxEventCreate,
+) -> SandboxEventResponse:
+    """
+    Receive event from sandbox worker and broadcast to subscribers.
+
+    This endpoint is called by worker scripts running inside Daytona sandboxes
+    to report progress, tool usage, errors, and other events to the backend.
+
+    Events are:
+    - Persisted to database (Phase 4) - optional, fails gracefully
+      (heartbeats update the liveness store; only periodic rollups are persisted)
+    - Broadcast via EventBus to:
+      - WebSocket clients (real-time UI updates)
+      - Guardian monitoring (trajectory analysis)
+
+    Args:
+        sandbox_id: Unique identifier for the sandbox (from URL path)
+        event: Event data from request body
+
+    Returns:
+        SandboxEventResponse with status, timestamp, and event_id
+
+    Example:
+        POST /api/v1/sandboxes/sandbox-abc123/events
+        {
+            "event_type": "agent.tool_use",
+            "event_data": {"tool": "bash", "command": "npm install"},
+            "source": "agent"
+        }
+    """
+    # Log incoming request for debugging 502 issues
+    logger.info(
+        f"[SandboxEvent] Received {event.event_type} from sandbox {sandbox_id[:20]}... "
+        f"(source: {event.source})"
+    )
+
+    # Heartbeats go to the liveness store; only periodic rollups are persisted
+    event_data: dict | None = event.event_data
+    if event.event_type in HEARTBEAT_EVENTS:
+        # The liveness store is sync Redis; keep it off the event loop
+        event_data = await asyncio.to_thread(
+            record_sandbox_heartbeat, sandbox_id, event.event_data
+        )
+
+    # Persist to database (Phase 4) - optional, fails gracefully
+    # Using async version to avoid blocking the event loop
+    event_id: str | None = None
+    if event_data is not None:
+        try:
+            db = get_db_service()
+            # Extract spec_id from event_data if present (for spec-driven development)
+            spec_id = event_data.get("spec_id")
+            event_id = await persist_sandbox_event_async(
+                db=db,
+                sandbox_id=sandbox_id,
+                event_type=event.event_type,
+                event_data=event_data,
+                source=event.source,
+                spec_id=spec_id,
+            )
+            logger.debug(
+                f"[SandboxEvent] Persisted event {event_id} for {event.event_type}"
+                + (f" (spec_id={spec_id})" if spec_id else "")
+            )
         except Exception as e:
-            # Task status update is important but shouldn't break event processing
-            # Log error with full stack trace for debugging
-            logger.error(
-                f"Failed to update task status for sandbox {sandbox_id}, event_type={event.event_type}: {e}",
-                exc_info=True,
+            # Persistence is optional - don't fail if DB unavailable
+            logger.warning(
+                f"[SandboxEvent] Failed to persist event {event.event_type} "
+                f"for sandbox {sandbox_id}: {e}"
             )
 
+    # Handle task status transitions based on event type
+    if event.event_type in STATUS_TRANSITION_EVENT_TYPES:
+        await _handle_status_transition(sandbox_id, event.event_type, event.event_data)
+
     # Broadcast via EventBus
     broadcast_sandbox_event(
         sandbox_id=sandbox_id,
@@ -1782,19 +2073,149 @@ async def post_sandbox_event(
     )
 
 
+@router.post("/{sandbox_id}/events/batch", response_model=SandboxEventBatchResponse)
+async def post_sandbox_events_batch(
+    sandbox_id: str,
+    batch: SandboxEventBatchCreate,
+) -> SandboxEventBatchResponse:
+    """
+    Receive an ordered batch of events from a sandbox worker.
+
+    Same handling as POST /{sandbox_id}/events, amortized over the batch:
+    - One multi-row INSERT instead of a transaction per event
+    - Events with an idempotency_key already received (earlier in the batch
+      or in a previous, retried request) are skipped
+    - Status transitions run in order for the status events only, and the
+      task is resolved by sandbox_id at most once per batch
+    - Heartbeats update the liveness store instead of adding rows; those
+      folded into a rollup are broadcast but counted as absorbed, since a
+      retried heartbeat can't be told apart from a new one without a row
+    - Accepted events are broadcast via EventBus in order
+
+    Args:
+        sandbox_id: Unique identifier for the sandbox (from URL path)
+        batch: Events in emission order
+
+    Returns:
+        SandboxEventBatchResponse with accepted/absorbed/duplicate counts and
+        event IDs
+
+    Example:
+        POST /api/v1/sandboxes/sandbox-abc123/events/batch
+        {
+            "events": [
+                {
+                    "event_type": "agent.tool_use",
+                    "event_data": {"tool": "bash"},
+                    "idempotency_key": "worker-1:41",
+                    "sequence": 41
+                }
+            ]
+        }
+    """
+    events: list[SandboxEventBatchItem] = []
+    seen_keys: set[str] = set()
+    for event in batch.events:
+        if event.idempotency_key is not None:
+            if event.idempotency_key in seen_keys:
+                continue
+            seen_keys.add(event.idempotency_key)
+        events.append(event)
+
+    logger.info(
+        f"[SandboxEvent] Received batch of {len(batch.events)} events from sandbox "
+        f"{sandbox_id[:20]}..."
+    )
+
+    # Heartbeats go to the liveness store; only periodic rollups are persisted.
+    # The rollup payload is stored, but the original heartbeat is broadcast,
+    # as POST /{sandbox_id}/events does.
+    rows: list[SandboxEventBatchItem] = []
+    absorbed: set[int] = set()
+    for i, event in enumerate(events):
+        if event.event_type in HEARTBEAT_EVENTS:
+            event_data = await asyncio.to_thread(
+                record_sandbox_heartbeat, sandbox_id, event.event_data
+            )
+            if event_data is None:
+                absorbed.add(i)
+                continue
+            event = event.model_copy(update={"event_data": event_data})
+        rows.append(event)
+
+    # Persistence is optional, as for single events - without it every
+    # event is treated as new
+    stored: list[str | None] = [None] * len(rows)
+    persisted = False
+    if rows:
+        try:
+            db = get_db_service()
+            stored = await persist_sandbox_events_batch_async(
+                db=db, sandbox_id=sandbox_id, events=rows
+            )
+            persisted = True
+        except Exception as e:
+            logger.warning(
+                f"[SandboxEvent] Failed to persist batch of {len(rows)} events "
+                f"for sandbox {sandbox_id}: {e}"
+            )
+
+    # Only newly stored events count as accepted; absorbed heartbeats are
+    # still broadcast for live views
+    accepted: list[SandboxEventBatchItem] = []
+    to_broadcast: list[SandboxEventBatchItem] = []
+    event_ids: list[str] = []
+    stored_ids = iter(stored)
+    for i, event in enumerate(events):
+        if i in absorbed:
+            to_broadcast.append(event)
+            continue
+        event_id = next(stored_ids)
+        if event_id:
+            event_ids.append(event_id)
+        if event_id or not persisted:
+            accepted.append(event)
+            to_broadcast.append(event)
+
+    task_id: str | None = None
+    for event in to_broadcast:
+        if event.event_type in STATUS_TRANSITION_EVENT_TYPES:
+            task_id = await _handle_status_transition(
+                sandbox_id, event.event_type, event.event_data, task_id=task_id
+            )
+        broadcast_sandbox_event(
+            sandbox_id=sandbox_id,
+            event_type=event.event_type,
+            event_data=event.event_data,
+            source=event.source,
+        )
+
+    return SandboxEventBatchResponse(
+        status="received",
+        sandbox_id=sandbox_id,
+        accepted=len(accepted),
+        absorbed=len(absorbed),
+        duplicates=len(batch.events) - len(accepted) - len(absorbed),
+        event_ids=event_ids,
+    )
+
+
 # ============================================================================
 # PHASE 4: EVENT QUERY SCHEMAS AND ENDPOINT
 # ============================================================================
 
 
 class SandboxEventItem(BaseModel):
-    """Response model for individual sandbox event."""
+    """Response model for individual sandbox event.
+
+    source and event_data are None when left out through the fields parameter.
+    """
 
     id: str
     sandbox_id: str
     event_type: str
-    event_data: dict[str, Any]
-    source: str
+    event_data: Optional[dict[str, Any]] = None
+    source: Optional[str] = None
     created_at: datetime
 
 
@@ -1802,8 +2223,10 @@ class SandboxEventsListResponse(BaseModel):
     """Response model for list of sandbox events."""
 
     events: list[SandboxEventItem]
-    total_count: int
+    total_count: int  # May lag new events by a few seconds (cached)
     sandbox_id: str
+    next_cursor: Optional[str] = None  # Pass as cursor to get the next page
+    has_more: bool = False
 
 
 class HeartbeatSummary(BaseModel):
@@ -1831,21 +2254,195 @@ class TrajectorySummaryResponse(BaseModel):
     trajectory_events: int  # Count excluding heartbeats and noise
     # Cursor-based pagination
     next_cursor: Optional[str] = (
-        None  # ID of oldest event in this batch (for loading older)
+        None  # Position of oldest event in this batch (for loading older)
     )
     prev_cursor: Optional[str] = (
-        None  # ID of newest event in this batch (for loading newer)
+        None  # Position of newest event in this batch (for loading newer)
     )
     has_more: bool = False  # Whether there are more events to load
 
 
+# Columns every event query returns; source and event_data (the bulk of a
+# row) are loaded only when requested through the fields parameter
+EVENT_BASE_FIELDS = ("id", "sandbox_id", "event_type", "created_at")
+EVENT_OPTIONAL_FIELDS = ("source", "event_data")
+
+
+def parse_event_fields(fields: Optional[str]) -> tuple[str, ...]:
+    """
+    Resolve a comma-separated fields parameter to the columns to load.
+
+    Args:
+        fields: e.g. "event_type,source"; None selects every column
+
+    Returns:
+        Column names, always including EVENT_BASE_FIELDS
+
+    Raises:
+        ValueError: If an unknown field is requested
+    """
+    if fields is None:
+        return EVENT_BASE_FIELDS + EVENT_OPTIONAL_FIELDS
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - set(EVENT_BASE_FIELDS + EVENT_OPTIONAL_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown event fields: {', '.join(sorted(unknown))}")
+    return EVENT_BASE_FIELDS + tuple(
+        name for name in EVENT_OPTIONAL_FIELDS if name in requested
+    )
+
+
+# Event cursors are (created_at, id) keyset cursors
+encode_event_cursor = encode_keyset_cursor
+decode_event_cursor = decode_keyset_cursor
+
+
+class EventCountCache:
+    """
+    Per-sandbox event counts, reused for ttl seconds.
+
+    The UI polls the event endpoints for every open sandbox view. A cached
+    count may lag new events by up to ttl seconds, but spares a COUNT(*)
+    over all of the sandbox's events on every poll.
+    """
+
+    def __init__(self, ttl: float = 10.0, max_entries: int = 4096):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, tuple[float, int]] = OrderedDict()
+
+    def get(self, key: tuple) -> Optional[int]:
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.ttl:
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: tuple, count: int) -> None:
+        self._entries[key] = (time.monotonic(), count)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+event_count_cache = EventCountCache()
+
+
+def _count_filter(sandbox_id: str, event_type: Optional[str]) -> Any:
+    from omoi_os.models.sandbox_event import SandboxEvent
+
+    count_filter = SandboxEvent.sandbox_id == sandbox_id
+    if event_type:
+        count_filter = count_filter & (SandboxEvent.event_type == event_type)
+    return count_filter
+
+
+def _count_events(session: Any, sandbox_id: str, event_type: Optional[str]) -> int:
+    """Cached count of a sandbox's events (SYNC version)."""
+    key = (sandbox_id, event_type)
+    count = event_count_cache.get(key)
+    if count is None:
+        count = (
+            session.execute(
+                select(func.count()).filter(_count_filter(sandbox_id, event_type))
+            ).scalar()
+            or 0
+        )
+        event_count_cache.set(key, count)
+    return count
+
+
+async def _count_events_async(
+    session: Any, sandbox_id: str, event_type: Optional[str]
+) -> int:
+    """Cached count of a sandbox's events (ASYNC version)."""
+    key = (sandbox_id, event_type)
+    count = event_count_cache.get(key)
+    if count is None:
+        result = await session.execute(
+            select(func.count()).filter(_count_filter(sandbox_id, event_type))
+        )
+        count = result.scalar() or 0
+        event_count_cache.set(key, count)
+    return count
+
+
+def _legacy_cursor_query(cursor: str) -> Any:
+    """Position lookup for a pre-keyset cursor (a bare event ID)."""
+    from omoi_os.models.sandbox_event import SandboxEvent
+
+    return select(SandboxEvent.created_at, SandboxEvent.id).filter(
+        SandboxEvent.id == cursor
+    )
+
+
+def _event_page_query(
+    fields: tuple[str, ...],
+    page_filter: Any,
+    position: Optional[tuple[datetime, str]],
+    direction: str,
+    limit: int,
+) -> Any:
+    """
+    Keyset page of events after position, ordered by (created_at, id).
+
+    With the (sandbox_id, created_at, id) index, any page costs the same as
+    the first. One extra row is fetched to tell whether more events follow.
+
+    Args:
+        fields: Columns to load
+        page_filter: Filter on the sandbox's events
+        position: (created_at, id) to continue from; None starts at the end
+        direction: "older" pages newest first, "newer" oldest first
+        limit: Page size
+    """
+    from omoi_os.models.sandbox_event import SandboxEvent
+
+    query = select(*[getattr(SandboxEvent, name) for name in fields]).filter(
+        page_filter
+    )
+    key = tuple_(SandboxEvent.created_at, SandboxEvent.id)
+    if direction == "older":
+        if position:
+            query = query.filter(key < tuple_(*position))
+        order = (SandboxEvent.created_at.desc(), SandboxEvent.id.desc())
+    else:
+        if position:
+            query = query.filter(key > tuple_(*position))
+        order = (SandboxEvent.created_at.asc(), SandboxEvent.id.asc())
+    return query.order_by(*order).limit(limit + 1)
+
+
+def _event_row_dict(row: Any, fields: tuple[str, ...]) -> dict:
+    values = row._mapping
+    event = {name: values[name] for name in fields}
+    event["id"] = str(event["id"])
+    return event
+
+
+def _page_result(
+    rows: list, fields: tuple[str, ...], limit: int
+) -> tuple[list[dict], Optional[str]]:
+    """Trim the extra row of a page; returns events and the next cursor."""
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = (
+        encode_event_cursor(rows[-1].created_at, str(rows[-1].id))
+        if rows and has_more
+        else None
+    )
+    return [_event_row_dict(row, fields) for row in rows], next_cursor
+
+
 def query_sandbox_events(
     db: DatabaseService,
     sandbox_id: str,
     limit: int = 100,
     offset: int = 0,
     event_type: Optional[str] = None,
-) -> tuple[list[dict], int]:
+    cursor: Optional[str] = None,
+    fields: Optional[tuple[str, ...]] = None,
+) -> tuple[list[dict], int, Optional[str]]:
     """
     Query persisted events for a sandbox (SYNC version).
 
@@ -1853,44 +2450,28 @@ def query_sandbox_events(
         db: Database service
         sandbox_id: Sandbox identifier
         limit: Maximum events to return
-        offset: Pagination offset
+        offset: Pagination offset (ignored when a cursor is given)
         event_type: Optional filter by event type
+        cursor: next_cursor of the previous page
+        fields: Columns to load (see parse_event_fields); default all
 
     Returns:
-        Tuple of (events list, total count)
+        Tuple of (events list, total count, next cursor or None)
     """
-    from omoi_os.models.sandbox_event import SandboxEvent
-
+    fields = fields or parse_event_fields(None)
     with db.get_session() as session:
-        query = session.query(SandboxEvent).filter(
-            SandboxEvent.sandbox_id == sandbox_id
-        )
+        position = decode_event_cursor(cursor) if cursor else None
+        if cursor and position is None:
+            position = session.execute(_legacy_cursor_query(cursor)).first()
 
-        if event_type:
-            query = query.filter(SandboxEvent.event_type == event_type)
+        page_filter = _count_filter(sandbox_id, event_type)
+        query = _event_page_query(fields, page_filter, position, "older", limit)
+        if offset and not cursor:
+            query = query.offset(offset)
+        rows = list(session.execute(query).all())
 
-        # Get total count
-        total_count = query.count()
-
-        # Get paginated results, ordered by created_at desc (newest first)
-        events = (
-            query.order_by(SandboxEvent.created_at.desc())
-            .offset(offset)
-            .limit(limit)
-            .all()
-        )
-
-        return [
-            {
-                "id": str(e.id),
-                "sandbox_id": e.sandbox_id,
-                "event_type": e.event_type,
-                "event_data": e.event_data,
-                "source": e.source,
-                "created_at": e.created_at,
-            }
-            for e in events
-        ], total_count
+        events, next_cursor = _page_result(rows, fields, limit)
+        return events, _count_events(session, sandbox_id, event_type), next_cursor
 
 
 async def query_sandbox_events_async(
@@ -1899,7 +2480,9 @@ async def query_sandbox_events_async(
     limit: int = 100,
     offset: int = 0,
     event_type: Optional[str] = None,
-) -> tuple[list[dict], int]:
+    cursor: Optional[str] = None,
+    fields: Optional[tuple[str, ...]] = None,
+) -> tuple[list[dict], int, Optional[str]]:
     """
     Query persisted events for a sandbox (ASYNC version - non-blocking).
 
@@ -1907,49 +2490,31 @@ async def query_sandbox_events_async(
         db: Database service
         sandbox_id: Sandbox identifier
         limit: Maximum events to return
-        offset: Pagination offset
+        offset: Pagination offset (ignored when a cursor is given)
         event_type: Optional filter by event type
+        cursor: next_cursor of the previous page
+        fields: Columns to load (see parse_event_fields); default all
 
     Returns:
-        Tuple of (events list, total count)
+        Tuple of (events list, total count, next cursor or None)
     """
-    from sqlalchemy import func, select
-
-    from omoi_os.models.sandbox_event import SandboxEvent
-
+    fields = fields or parse_event_fields(None)
     async with db.get_async_session() as session:
-        # Build base filter
-        base_filter = SandboxEvent.sandbox_id == sandbox_id
-        if event_type:
-            base_filter = base_filter & (SandboxEvent.event_type == event_type)
-
-        # Get total count
-        count_result = await session.execute(
-            select(func.count(SandboxEvent.id)).filter(base_filter)
-        )
-        total_count = count_result.scalar() or 0
+        position = decode_event_cursor(cursor) if cursor else None
+        if cursor and position is None:
+            result = await session.execute(_legacy_cursor_query(cursor))
+            position = result.first()
 
-        # Get paginated results, ordered by created_at desc (newest first)
-        result = await session.execute(
-            select(SandboxEvent)
-            .filter(base_filter)
-            .order_by(SandboxEvent.created_at.desc())
-            .offset(offset)
-            .limit(limit)
-        )
-        events = result.scalars().all()
+        page_filter = _count_filter(sandbox_id, event_type)
+        query = _event_page_query(fields, page_filter, position, "older", limit)
+        if offset and not cursor:
+            query = query.offset(offset)
+        result = await session.execute(query)
+        rows = list(result.all())
 
-        return [
-            {
-                "id": str(e.id),
-                "sandbox_id": e.sandbox_id,
-                "event_type": e.event_type,
-                "event_data": e.event_data,
-                "source": e.source,
-                "created_at": e.created_at,
-            }
-            for e in events
-        ], total_count
+        events, next_cursor = _page_result(rows, fields, limit)
+        total_count = await _count_events_async(session, sandbox_id, event_type)
+        return events, total_count, next_cursor
 
 
 @router.get("/health", response_model=dict)
@@ -2047,13 +2612,12 @@ async def get_sandbox_phase_status(sandbox_id: str):
     daytona_spawner = get_daytona_spawner_service()
     monitor = IdleSandboxMonitor(db=db, daytona_spawner=daytona_spawner)
 
-    phase_status = monitor.get_phase_completion_status(sandbox_id)
-    activity = monitor.check_sandbox_activity(sandbox_id)
+    status = monitor.get_sandbox_status(sandbox_id)
 
     return {
         "sandbox_id": sandbox_id,
-        "phase_status": phase_status,
-        "activity": activity,
+        "phase_status": status["phase_status"],
+        "activity": status["activity"],
         "timestamp": datetime.now(timezone.utc).isoformat(),
     }
 
@@ -2064,6 +2628,14 @@ async def get_sandbox_events(
     limit: int = Query(default=100, le=500, ge=1, description="Max events to return"),
     offset: int = Query(default=0, ge=0, description="Pagination offset"),
     event_type: Optional[str] = Query(default=None, description="Filter by event type"),
+    cursor: Optional[str] = Query(
+        default=None, description="next_cursor of the previous page"
+    ),
+    fields: Optional[str] = Query(
+        default=None,
+        description="Comma-separated optional fields to include "
+        "(source, event_data); default all",
+    ),
 ) -> SandboxEventsListResponse:
     """
     Query persisted events for a sandbox.
@@ -2071,32 +2643,47 @@ async def get_sandbox_events(
     Returns events in descending order by creation time (newest first).
     Supports pagination and optional filtering by event_type.
 
+    Pages after the first should pass `cursor=next_cursor` rather than an
+    offset: cursor pages cost the same however deep they are, while offset
+    pages get slower with depth. total_count is cached for a few seconds.
+
     Args:
         sandbox_id: Sandbox identifier (from URL path)
         limit: Maximum number of events to return (default: 100, max: 500)
-        offset: Pagination offset (default: 0)
+        offset: Pagination offset (default: 0; ignored with a cursor)
         event_type: Optional filter by event type (e.g., 'agent.tool_use')
+        cursor: next_cursor from the previous page
+        fields: Optional fields to load, e.g. `fields=source` to skip event_data
 
     Returns:
-        SandboxEventsListResponse with events and total count
+        SandboxEventsListResponse with events, total count and next cursor
 
     Example:
         GET /api/v1/sandboxes/sandbox-abc123/events?limit=50&event_type=agent.tool_use
     """
+    try:
+        columns = parse_event_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
     try:
         db = get_db_service()
         # Use async version to avoid blocking the event loop
-        events, total_count = await query_sandbox_events_async(
+        events, total_count, next_cursor = await query_sandbox_events_async(
             db=db,
             sandbox_id=sandbox_id,
             limit=limit,
             offset=offset,
             event_type=event_type,
+            cursor=cursor,
+            fields=columns,
         )
         return SandboxEventsListResponse(
             events=[SandboxEventItem(**e) for e in events],
             total_count=total_count,
             sandbox_id=sandbox_id,
+            next_cursor=next_cursor,
+            has_more=next_cursor is not None,
         )
     except Exception:
         # Return empty if DB unavailable
@@ -2107,6 +2694,81 @@ async def get_sandbox_events(
         )
 
 
+def _liveness_heartbeat_summary(sandbox_id: str) -> Optional[dict]:
+    """heartbeat_summary from the shared liveness store, if it has the sandbox."""
+    store = get_liveness_store()
+    if not store.shared:
+        return None
+    try:
+        record = store.get(sandbox_id)
+    except Exception as e:
+        logger.warning(f"Failed to read liveness for sandbox {sandbox_id}: {e}")
+        return None
+    if record is None:
+        return None
+    return {
+        "count": record.count,
+        "first_heartbeat": record.first_seen,
+        "last_heartbeat": record.last_seen,
+    }
+
+
+def _heartbeat_summary(heartbeat_stats: Any) -> dict:
+    """
+    Build heartbeat_summary from persisted rows.
+
+    Used when _liveness_heartbeat_summary has no record of the sandbox.
+
+    Args:
+        heartbeat_stats: Row with count/first/last aggregated from
+            sandbox_events (rollups count as their heartbeat_count)
+    """
+    return {
+        "count": (heartbeat_stats.count or 0) if heartbeat_stats else 0,
+        "first_heartbeat": heartbeat_stats.first if heartbeat_stats else None,
+        "last_heartbeat": heartbeat_stats.last if heartbeat_stats else None,
+    }
+
+
+def _heartbeat_stats_query(sandbox_id: str) -> Any:
+    """Aggregate persisted heartbeats (rollups count as their heartbeat_count)."""
+    from omoi_os.models.sandbox_event import SandboxEvent
+
+    return (
+        select(
+            func.sum(
+                func.coalesce(
+                    SandboxEvent.event_data["heartbeat_count"].as_integer(), 1
+                )
+            ).label("count"),
+            func.min(SandboxEvent.created_at).label("first"),
+            func.max(SandboxEvent.created_at).label("last"),
+        )
+        .filter(SandboxEvent.sandbox_id == sandbox_id)
+        .filter(SandboxEvent.event_type.in_(["agent.heartbeat", "heartbeat"]))
+    )
+
+
+def _noisy_explore_event() -> Any:
+    """
+    SQL condition for noisy explore subagent events.
+
+    These are tool_use/tool_result events for Grep searches or Glob with **
+    patterns (bulk exploration). Evaluated in the query, so pages stay full
+    and event_data need not be loaded to filter them.
+    """
+    from omoi_os.models.sandbox_event import SandboxEvent
+
+    tool = func.coalesce(SandboxEvent.event_data["tool"].astext, "")
+    tool_input = SandboxEvent.event_data["tool_input"]
+    pattern = func.coalesce(tool_input["pattern"].astext, "")
+    return and_(
+        SandboxEvent.event_type.in_(["agent.tool_use", "agent.tool_result"]),
+        func.coalesce(func.jsonb_typeof(tool_input), "") == "object",
+        or_(tool == "Grep", and_(tool == "Glob", pattern.contains("**"))),
+    )
+
+
 def query_trajectory_summary(
     db: DatabaseService,
     sandbox_id: str,
@@ -2129,70 +2791,40 @@ def query_trajectory_summary(
     Returns:
         Dict with events, heartbeat_summary, and counts
     """
-    from sqlalchemy import func
-
     from omoi_os.models.sandbox_event import SandboxEvent
 
+    fields = parse_event_fields(None)
     with db.get_session() as session:
         # Define heartbeat event types to exclude from main list
         heartbeat_types = ["agent.heartbeat", "heartbeat"]
 
-        # Get total count of all events
-        total_count = (
-            session.query(func.count(SandboxEvent.id))
-            .filter(SandboxEvent.sandbox_id == sandbox_id)
-            .scalar()
-        )
+        total_count = _count_events(session, sandbox_id, None)
 
         # Get heartbeat summary (count, first, last)
-        heartbeat_stats = (
-            session.query(
-                func.count(SandboxEvent.id).label("count"),
-                func.min(SandboxEvent.created_at).label("first"),
-                func.max(SandboxEvent.created_at).label("last"),
-            )
-            .filter(SandboxEvent.sandbox_id == sandbox_id)
-            .filter(SandboxEvent.event_type.in_(heartbeat_types))
-            .first()
-        )
-
-        heartbeat_count = heartbeat_stats.count if heartbeat_stats else 0
-        first_heartbeat = heartbeat_stats.first if heartbeat_stats else None
-        last_heartbeat = heartbeat_stats.last if heartbeat_stats else None
+        heartbeat_summary = _liveness_heartbeat_summary(sandbox_id)
+        if heartbeat_summary is None:
+            heartbeat_stats = session.execute(
+                _heartbeat_stats_query(sandbox_id)
+            ).first()
+            heartbeat_summary = _heartbeat_summary(heartbeat_stats)
 
         # Get non-heartbeat events (the actual trajectory)
         # Order by DESCENDING (newest first) so we get the most recent events
-        trajectory_events = (
-            session.query(SandboxEvent)
-            .filter(SandboxEvent.sandbox_id == sandbox_id)
-            .filter(~SandboxEvent.event_type.in_(heartbeat_types))
-            .order_by(SandboxEvent.created_at.desc())  # Newest first
-            .limit(limit)
-            .all()
+        page_filter = and_(
+            SandboxEvent.sandbox_id == sandbox_id,
+            ~SandboxEvent.event_type.in_(heartbeat_types),
         )
-
-        trajectory_count = len(trajectory_events)
+        rows = session.execute(
+            _event_page_query(fields, page_filter, None, "older", limit)
+        ).all()
+        events, _ = _page_result(list(rows), fields, limit)
 
         return {
             "sandbox_id": sandbox_id,
-            "events": [
-                {
-                    "id": str(e.id),
-                    "sandbox_id": e.sandbox_id,
-                    "event_type": e.event_type,
-                    "event_data": e.event_data,
-                    "source": e.source,
-                    "created_at": e.created_at,
-                }
-                for e in trajectory_events
-            ],
-            "heartbeat_summary": {
-                "count": heartbeat_count,
-                "first_heartbeat": first_heartbeat,
-                "last_heartbeat": last_heartbeat,
-            },
+            "events": events,
+            "heartbeat_summary": heartbeat_summary,
             "total_events": total_count,
-            "trajectory_events": trajectory_count,
+            "trajectory_events": len(events),
         }
 
 
@@ -2202,6 +2834,7 @@ async def query_trajectory_summary_async(
     limit: int = 100,
     cursor: Optional[str] = None,
     direction: str = "older",
+    fields: Optional[tuple[str, ...]] = None,
 ) -> dict:
     """
     Query trajectory events with heartbeat aggregation (ASYNC version - non-blocking).
@@ -2212,169 +2845,85 @@ async def query_trajectory_summary_async(
     - Returning only meaningful trajectory events
     - Supporting cursor-based pagination for infinite scroll
 
+    Pages are keyset queries on (created_at, id), so a deep page costs the
+    same as the first; the total count is cached for a few seconds and the
+    heartbeat aggregate only runs when the liveness store has no record.
+
     Args:
         db: Database service
         sandbox_id: Sandbox identifier
         limit: Maximum events to return per page (default 100)
-        cursor: Event ID to paginate from (cursor-based pagination)
+        cursor: Cursor to paginate from (an event ID is accepted too)
         direction: "older" to load events older than cursor, "newer" for newer
+        fields: Columns to load (see parse_event_fields); default all
 
     Returns:
         Dict with events, heartbeat_summary, counts, and pagination cursors
     """
-    from sqlalchemy import func, select, and_
-
     from omoi_os.models.sandbox_event import SandboxEvent
 
+    fields = fields or parse_event_fields(None)
     async with db.get_async_session() as session:
         # Event types to exclude from trajectory
         # - Heartbeats: Just noise, summarized separately
-        # - Explore subagent tool_use/tool_result for Read/Glob/Grep: Very noisy file reads
+        # - Explore subagent tool_use/tool_result for Glob/Grep: Very noisy
         excluded_event_types = ["agent.heartbeat", "heartbeat"]
 
-        # Get total count of all events
-        total_result = await session.execute(
-            select(func.count(SandboxEvent.id)).filter(
-                SandboxEvent.sandbox_id == sandbox_id
-            )
-        )
-        total_count = total_result.scalar() or 0
+        total_count = await _count_events_async(session, sandbox_id, None)
 
         # Get heartbeat summary (count, first, last)
-        heartbeat_result = await session.execute(
-            select(
-                func.count(SandboxEvent.id).label("count"),
-                func.min(SandboxEvent.created_at).label("first"),
-                func.max(SandboxEvent.created_at).label("last"),
-            )
-            .filter(SandboxEvent.sandbox_id == sandbox_id)
-            .filter(SandboxEvent.event_type.in_(["agent.heartbeat", "heartbeat"]))
+        heartbeat_summary = await asyncio.to_thread(
+            _liveness_heartbeat_summary, sandbox_id
         )
-        heartbeat_stats = heartbeat_result.first()
-
-        heartbeat_count = heartbeat_stats.count if heartbeat_stats else 0
-        first_heartbeat = heartbeat_stats.first if heartbeat_stats else None
-        last_heartbeat = heartbeat_stats.last if heartbeat_stats else None
+        if heartbeat_summary is None:
+            heartbeat_result = await session.execute(_heartbeat_stats_query(sandbox_id))
+            heartbeat_summary = _heartbeat_summary(heartbeat_result.first())
 
-        # Build base query for trajectory events
-        base_filter = and_(
+        page_filter = and_(
             SandboxEvent.sandbox_id == sandbox_id,
             ~SandboxEvent.event_type.in_(excluded_event_types),
+            ~_noisy_explore_event(),
         )
 
-        # If cursor provided, get the cursor event's created_at for pagination
-        cursor_timestamp = None
-        if cursor:
-            cursor_result = await session.execute(
-                select(SandboxEvent.created_at).filter(SandboxEvent.id == cursor)
-            )
-            cursor_row = cursor_result.first()
-            if cursor_row:
-                cursor_timestamp = cursor_row[0]
-
-        # Build pagination filter
-        if cursor_timestamp:
-            if direction == "older":
-                # Get events older than cursor (created_at < cursor's created_at)
-                pagination_filter = and_(
-                    base_filter, SandboxEvent.created_at < cursor_timestamp
-                )
-            else:
-                # Get events newer than cursor (created_at > cursor's created_at)
-                pagination_filter = and_(
-                    base_filter, SandboxEvent.created_at > cursor_timestamp
-                )
-        else:
-            pagination_filter = base_filter
-
-        # Query events - newest first for "older" direction, oldest first for "newer"
-        if direction == "older":
-            trajectory_result = await session.execute(
-                select(SandboxEvent)
-                .filter(pagination_filter)
-                .order_by(SandboxEvent.created_at.desc())
-                .limit(limit + 1)  # +1 to check if there are more
-            )
-        else:
-            trajectory_result = await session.execute(
-                select(SandboxEvent)
-                .filter(pagination_filter)
-                .order_by(SandboxEvent.created_at.asc())
-                .limit(limit + 1)
-            )
+        # Resolve the cursor to a (created_at, id) position; an unknown
+        # cursor starts from the newest events
+        position = decode_event_cursor(cursor) if cursor else None
+        if cursor and position is None:
+            cursor_result = await session.execute(_legacy_cursor_query(cursor))
+            position = cursor_result.first()
 
-        trajectory_events = list(trajectory_result.scalars().all())
+        # Newest first for "older" direction, oldest first for "newer"
+        result = await session.execute(
+            _event_page_query(fields, page_filter, position, direction, limit)
+        )
+        rows = list(result.all())
 
         # Check if there are more events
-        has_more = len(trajectory_events) > limit
-        if has_more:
-            trajectory_events = trajectory_events[:limit]
+        has_more = len(rows) > limit
+        rows = rows[:limit]
 
         # For "newer" direction, reverse to maintain newest-first order
         if direction == "newer":
-            trajectory_events = list(reversed(trajectory_events))
-
-        # Filter out noisy explore subagent events
-        # These are tool_use/tool_result events with Read/Glob/Grep from explore subagents
-        def is_noisy_explore_event(event: SandboxEvent) -> bool:
-            if event.event_type not in ("agent.tool_use", "agent.tool_result"):
-                return False
-            if not event.event_data:
-                return False
-            # Check if it's from an explore subagent
-            tool = event.event_data.get("tool", "")
-            tool_input = event.event_data.get("tool_input", {})
-            # Filter Read/Glob/Grep that are clearly explore operations
-            if tool in ("Read", "Glob", "Grep"):
-                # Keep if it's the main agent (no subagent context)
-                # Filter if it looks like bulk exploration
-                if isinstance(tool_input, dict):
-                    # Glob with ** patterns is exploratory
-                    pattern = tool_input.get("pattern", "")
-                    if tool == "Glob" and "**" in str(pattern):
-                        return True
-                    # Grep searches are usually exploratory
-                    if tool == "Grep":
-                        return True
-            return False
-
-        # Apply noise filter
-        filtered_events = [
-            e for e in trajectory_events if not is_noisy_explore_event(e)
-        ]
-
-        trajectory_count = len(filtered_events)
+            rows.reverse()
 
         # Build cursors for pagination
         next_cursor = None  # Cursor for loading older events
         prev_cursor = None  # Cursor for loading newer events
 
-        if filtered_events:
+        if rows:
             # Oldest event in batch is cursor for "load older"
-            next_cursor = str(filtered_events[-1].id) if has_more else None
+            if has_more:
+                next_cursor = encode_event_cursor(rows[-1].created_at, str(rows[-1].id))
             # Newest event in batch is cursor for "load newer" (when scrolling back up)
-            prev_cursor = str(filtered_events[0].id)
+            prev_cursor = encode_event_cursor(rows[0].created_at, str(rows[0].id))
 
+        events = [_event_row_dict(row, fields) for row in rows]
         return {
             "sandbox_id": sandbox_id,
-            "events": [
-                {
-                    "id": str(e.id),
-                    "sandbox_id": e.sandbox_id,
-                    "event_type": e.event_type,
-                    "event_data": e.event_data,
-                    "source": e.source,
-                    "created_at": e.created_at,
-                }
-                for e in filtered_events
-            ],
-            "heartbeat_summary": {
-                "count": heartbeat_count,
-                "first_heartbeat": first_heartbeat,
-                "last_heartbeat": last_heartbeat,
-            },
+            "events": events,
+            "heartbeat_summary": heartbeat_summary,
             "total_events": total_count,
-            "trajectory_events": trajectory_count,
+            "trajectory_events": len(events),
             "next_cursor": next_cursor,
             "prev_cursor": prev_cursor,
             "has_more": has_more,
@@ -2388,11 +2937,16 @@ async def get_sandbox_trajectory(
         default=100, le=1000, ge=1, description="Max events to return per page"
     ),
     cursor: Optional[str] = Query(
-        default=None, description="Event ID cursor for pagination"
+        default=None, description="next_cursor/prev_cursor for pagination"
     ),
     direction: str = Query(
         default="older", description="Load 'older' or 'newer' events from cursor"
     ),
+    fields: Optional[str] = Query(
+        default=None,
+        description="Comma-separated optional fields to include "
+        "(source, event_data); default all",
+    ),
 ) -> TrajectorySummaryResponse:
     """
     Get trajectory summary for a sandbox with heartbeat aggregation and cursor-based pagination.
@@ -2416,6 +2970,7 @@ async def get_sandbox_trajectory(
         limit: Maximum number of trajectory events to return per page (default: 100, max: 1000)
         cursor: Event ID to paginate from (for infinite scroll)
         direction: "older" to load events older than cursor, "newer" for newer events
+        fields: Optional fields to load, e.g. `fields=source` to skip event_data
 
     Returns:
         TrajectorySummaryResponse with filtered events, heartbeat summary, and pagination cursors
@@ -2440,6 +2995,11 @@ async def get_sandbox_trajectory(
             "has_more": true
         }
     """
+    try:
+        columns = parse_event_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
     try:
         db = get_db_service()
         # Use async version to avoid blocking the event loop
@@ -2449,6 +3009,7 @@ async def get_sandbox_trajectory(
             limit=limit,
             cursor=cursor,
             direction=direction,
+            fields=columns,
         )
         return TrajectorySummaryResponse(
             sandbox_id=result["sandbox_id"],
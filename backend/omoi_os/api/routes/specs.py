@@ -13,17 +13,35 @@ from datetime import datetime
 from typing import Optional, List, Any, Dict
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Depends, Query
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
-from sqlalchemy import select
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationError,
+    field_validator,
+    model_validator,
+)
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.orm import selectinload
 
+from omoi_os.api.bulk import (
+    BulkUpsertItem,
+    BulkUpsertRequest,
+    BulkUpsertResponse,
+    BulkUpsertResult,
+)
 from omoi_os.api.dependencies import (
     get_db_service,
     get_current_user,
     verify_project_access,
     verify_spec_access,
 )
+from omoi_os.api.pagination import (
+    decode_keyset_cursor,
+    encode_keyset_cursor,
+    etag_response,
+)
 from omoi_os.models.project import Project
 from omoi_os.models.user import User
 from omoi_os.models.spec import (
@@ -66,17 +84,155 @@ async def _list_project_specs_async(
                 selectinload(SpecModel.tasks),
             )
         )
-        if status:
-            query = query.filter(SpecModel.status == status)
-        # Filter out archived specs by default
-        if not include_archived:
-            query = query.filter(SpecModel.archived is False)
+        query = query.filter(*_spec_list_filters(status, include_archived))
         query = query.order_by(SpecModel.created_at.desc())
         result = await session.execute(query)
         specs = result.scalars().all()
         return specs
 
 
+def _spec_list_filters(status: Optional[str], include_archived: bool) -> list:
+    """Filters shared by the spec list queries."""
+    filters = []
+    if status:
+        filters.append(SpecModel.status == status)
+    # Filter out archived specs by default
+    if not include_archived:
+        filters.append(SpecModel.archived.is_(False))
+    return filters
+
+
+async def _list_project_spec_summaries_async(
+    db: DatabaseService,
+    project_id: str,
+    status: Optional[str] = None,
+    include_archived: bool = False,
+    cursor: Optional[tuple[datetime, str]] = None,
+    limit: int = 50,
+) -> tuple[list[dict], int, bool]:
+    """
+    One page of spec summaries for a project (ASYNC - non-blocking).
+
+    Loads only the spec columns a list view shows; requirement, criteria
+    and task counts are aggregated in SQL for the page's specs instead of
+    loading the child rows.
+
+    Args:
+        db: Database service
+        project_id: Project to list
+        status: Optional status filter
+        include_archived: Include archived specs
+        cursor: (created_at, id) of the last spec on the previous page
+        limit: Page size
+
+    Returns:
+        Tuple of (summary dicts newest first, total matching specs, has_more)
+    """
+    filters = [
+        SpecModel.project_id == project_id,
+        *_spec_list_filters(status, include_archived),
+    ]
+    page_query = select(
+        SpecModel.id,
+        SpecModel.project_id,
+        SpecModel.title,
+        SpecModel.description,
+        SpecModel.status,
+        SpecModel.phase,
+        SpecModel.current_phase,
+        SpecModel.progress,
+        SpecModel.test_coverage,
+        SpecModel.active_agents,
+        SpecModel.linked_tickets,
+        SpecModel.spec_context["source_ticket_id"].astext.label("source_ticket_id"),
+        SpecModel.created_at,
+        SpecModel.updated_at,
+    ).filter(*filters)
+    if cursor:
+        page_query = page_query.filter(
+            tuple_(SpecModel.created_at, SpecModel.id) < tuple_(*cursor)
+        )
+    page_query = page_query.order_by(
+        SpecModel.created_at.desc(), SpecModel.id.desc()
+    ).limit(limit + 1)
+
+    async with db.get_async_session() as session:
+        rows = (await session.execute(page_query)).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        total = (
+            await session.execute(select(func.count(SpecModel.id)).filter(*filters))
+        ).scalar_one()
+
+        spec_ids = [row.id for row in rows]
+        requirement_counts: dict[str, Any] = {}
+        task_counts: dict[str, dict[str, int]] = {spec_id: {} for spec_id in spec_ids}
+        if spec_ids:
+            requirement_result = await session.execute(
+                select(
+                    SpecRequirementModel.spec_id,
+                    func.count(func.distinct(SpecRequirementModel.id)),
+                    func.count(SpecCriterionModel.id),
+                    func.count(SpecCriterionModel.id).filter(
+                        SpecCriterionModel.completed.is_(True)
+                    ),
+                )
+                .outerjoin(
+                    SpecCriterionModel,
+                    SpecCriterionModel.requirement_id == SpecRequirementModel.id,
+                )
+                .filter(SpecRequirementModel.spec_id.in_(spec_ids))
+                .group_by(SpecRequirementModel.spec_id)
+            )
+            requirement_counts = {
+                spec_id: counts for spec_id, *counts in requirement_result.all()
+            }
+            task_result = await session.execute(
+                select(
+                    SpecTaskModel.spec_id,
+                    SpecTaskModel.status,
+                    func.count(SpecTaskModel.id),
+                )
+                .filter(SpecTaskModel.spec_id.in_(spec_ids))
+                .group_by(SpecTaskModel.spec_id, SpecTaskModel.status)
+            )
+            for spec_id, task_status, count in task_result.all():
+                task_counts[spec_id][task_status] = count
+
+    summaries = []
+    for row in rows:
+        requirements, criteria_total, criteria_completed = requirement_counts.get(
+            row.id, (0, 0, 0)
+        )
+        linked_tickets = row.linked_tickets
+        if row.source_ticket_id:
+            # At minimum, this spec is linked to its source ticket
+            linked_tickets = max(1, linked_tickets)
+        summaries.append(
+            {
+                "id": row.id,
+                "project_id": row.project_id,
+                "title": row.title,
+                "description": row.description,
+                "status": row.status,
+                "phase": row.phase,
+                "current_phase": row.current_phase or "explore",
+                "progress": row.progress,
+                "test_coverage": row.test_coverage,
+                "active_agents": row.active_agents,
+                "linked_tickets": linked_tickets,
+                "requirement_count": requirements,
+                "criteria_total": criteria_total,
+                "criteria_completed": criteria_completed,
+                "task_count": sum(task_counts[row.id].values()),
+                "tasks_by_status": task_counts[row.id],
+                "created_at": row.created_at,
+                "updated_at": row.updated_at,
+            }
+        )
+    return summaries, total, has_more
+
+
 async def _create_spec_async(
     db: DatabaseService,
     project_id: str,
@@ -286,6 +442,117 @@ async def _update_requirement_async(
         return req
 
 
+async def _bulk_upsert_requirements_async(
+    db: DatabaseService, spec_id: str, items: List[BulkUpsertItem]
+) -> Optional[BulkUpsertResponse]:
+    """Create/update requirements of a spec in one transaction (ASYNC - non-blocking).
+
+    Returns None if the spec does not exist.
+    """
+    async with db.get_async_session() as session:
+        result = await session.execute(
+            select(SpecModel.id).filter(SpecModel.id == spec_id)
+        )
+        if result.scalar_one_or_none() is None:
+            return None
+
+        update_ids = [item.id for item in items if item.id]
+        existing: Dict[str, SpecRequirementModel] = {}
+        if update_ids:
+            result = await session.execute(
+                select(SpecRequirementModel)
+                .filter(
+                    SpecRequirementModel.spec_id == spec_id,
+                    SpecRequirementModel.id.in_(update_ids),
+                )
+                .options(selectinload(SpecRequirementModel.criteria))
+            )
+            existing = {req.id: req for req in result.scalars()}
+
+        applied: List[Any] = []  # Requirement model, or the failed result
+        for item in items:
+            try:
+                if item.id:
+                    req = existing.get(item.id)
+                    if req is None:
+                        raise HTTPException(
+                            status_code=404, detail="Requirement not found"
+                        )
+                    updates = RequirementUpdate(**item.data)
+                    for field, value in updates.model_dump(exclude_unset=True).items():
+                        if value is not None:
+                            setattr(req, field, value)
+                else:
+                    data = RequirementCreate(**item.data)
+                    req = SpecRequirementModel(
+                        spec_id=spec_id,
+                        title=data.title,
+                        condition=data.condition,
+                        action=data.action,
+                        status="pending",
+                        linked_design=data.linked_design,
+                    )
+                    session.add(req)
+                applied.append(req)
+            except HTTPException as e:
+                applied.append(
+                    BulkUpsertResult(
+                        local_id=item.local_id,
+                        id=item.id,
+                        action="failed",
+                        status_code=e.status_code,
+                        error=str(e.detail),
+                    )
+                )
+            except ValidationError as e:
+                applied.append(
+                    BulkUpsertResult(
+                        local_id=item.local_id,
+                        id=item.id,
+                        action="failed",
+                        status_code=422,
+                        error=str(e),
+                    )
+                )
+
+        await session.flush()
+
+        response = BulkUpsertResponse()
+        for item, req in zip(items, applied):
+            if isinstance(req, BulkUpsertResult):
+                response.add(req)
+                continue
+            # New requirements have no criteria yet (avoids a lazy load)
+            criteria = (
+                [
+                    AcceptanceCriterion(id=c.id, text=c.text, completed=c.completed)
+                    for c in req.criteria
+                ]
+                if item.id
+                else []
+            )
+            response.add(
+                BulkUpsertResult(
+                    local_id=item.local_id,
+                    id=req.id,
+                    action="updated" if item.id else "created",
+                    status_code=200 if item.id else 201,
+                    item=Requirement(
+                        id=req.id,
+                        title=req.title,
+                        condition=req.condition,
+                        action=req.action,
+                        criteria=criteria,
+                        linked_design=req.linked_design,
+                        status=req.status,
+                    ).model_dump(mode="json"),
+                )
+            )
+
+        await session.commit()
+        return response
+
+
 async def _delete_requirement_async(
     db: DatabaseService, spec_id: str, req_id: str
 ) -> bool:
@@ -974,6 +1241,36 @@ class SpecListResponse(BaseModel):
     total: int
 
 
+class SpecSummary(BaseModel):
+    """List-view projection of a spec: counts instead of child rows."""
+
+    id: str
+    project_id: str
+    title: str
+    description: Optional[str] = None
+    status: str
+    phase: str
+    current_phase: str = "explore"
+    progress: float = 0
+    test_coverage: float = 0
+    active_agents: int = 0
+    linked_tickets: int = 0
+    requirement_count: int = 0
+    criteria_total: int = 0
+    criteria_completed: int = 0
+    task_count: int = 0
+    tasks_by_status: Dict[str, int] = {}
+    created_at: datetime
+    updated_at: datetime
+
+
+class SpecSummaryListResponse(BaseModel):
+    specs: list[SpecSummary]
+    total: int
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+
+
 class RequirementCreate(BaseModel):
     title: str
     condition: str
@@ -1185,6 +1482,52 @@ async def list_project_specs(
     )
 
 
+@router.get("/project/{project_id}/summary", response_model=SpecSummaryListResponse)
+async def list_project_spec_summaries(
+    project_id: str,
+    request: Request,
+    status: Optional[str] = Query(None, description="Filter by status"),
+    include_archived: bool = Query(False, description="Include archived specs"),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page"
+    ),
+    limit: int = Query(50, ge=1, le=200, description="Specs per page"),
+    current_user: User = Depends(get_current_user),
+    db: DatabaseService = Depends(get_db_service),
+    _: str = Depends(verify_project_access),  # Verify access to project
+) -> Response:
+    """
+    List spec summaries for a project, newest first.
+
+    Returns each spec's list-view fields with requirement, acceptance
+    criteria and task counts instead of the nested objects; use
+    GET /specs/{spec_id} for a fully hydrated spec. Pages are keyset
+    paginated via next_cursor. Responses carry an ETag, and a request with
+    a matching If-None-Match gets an empty 304.
+    """
+    position = None
+    if cursor:
+        position = decode_keyset_cursor(cursor)
+        if position is None:
+            raise HTTPException(status_code=422, detail="Invalid cursor")
+
+    summaries, total, has_more = await _list_project_spec_summaries_async(
+        db, project_id, status, include_archived, cursor=position, limit=limit
+    )
+    next_cursor = None
+    if has_more:
+        last = summaries[-1]
+        next_cursor = encode_keyset_cursor(last["created_at"], last["id"])
+
+    page = SpecSummaryListResponse(
+        specs=[SpecSummary(**summary) for summary in summaries],
+        total=total,
+        next_cursor=next_cursor,
+        has_more=has_more,
+    )
+    return etag_response(request, page.model_dump_json())
+
+
 @router.post("", response_model=SpecResponse)
 async def create_spec(
     spec: SpecCreate,
@@ -1411,6 +1754,23 @@ async def update_requirement(
     )
 
 
+@router.post("/{spec_id}/requirements/bulk", response_model=BulkUpsertResponse)
+async def bulk_upsert_requirements(
+    spec_id: str,
+    request: BulkUpsertRequest,
+    db: DatabaseService = Depends(get_db_service),
+):
+    """Create or update many requirements of a spec in one transaction.
+
+    Items without an id are created; items with an id are updated like
+    PATCH /{spec_id}/requirements/{req_id}. Each item gets its own result.
+    """
+    response = await _bulk_upsert_requirements_async(db, spec_id, request.items)
+    if response is None:
+        raise HTTPException(status_code=404, detail="Spec not found")
+    return response
+
+
 @router.delete("/{spec_id}/requirements/{req_id}")
 async def delete_requirement(
     spec_id: str,
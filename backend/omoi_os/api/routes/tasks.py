@@ -6,6 +6,7 @@ from fastapi import APIRouter, HTTPException, Depends, Body
 from pydantic import BaseModel
 from sqlalchemy import select, or_
 
+from omoi_os.api.bulk import BulkUpsertRequest, BulkUpsertResponse, run_bulk_upsert
 from omoi_os.api.dependencies import (
     get_db_service,
     get_task_queue,
@@ -629,6 +630,43 @@ async def create_task(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/bulk", response_model=BulkUpsertResponse)
+async def bulk_upsert_tasks(
+    request: BulkUpsertRequest,
+    current_user: User = Depends(get_current_user),
+    db: DatabaseService = Depends(get_db_service),
+    queue: TaskQueueService = Depends(get_task_queue),
+):
+    """
+    Create or update many tasks in one request.
+
+    Items without an id are created as POST /tasks creates them; items with
+    an id are applied as PATCH /tasks/{id}. Access is checked per item and
+    each item gets its own result.
+
+    Args:
+        request: Items to create or update
+        current_user: Authenticated user
+        db: Database service
+        queue: Task queue service for task creation
+
+    Returns:
+        Per-item results in request order
+    """
+
+    async def create(data: dict) -> dict:
+        return await create_task(
+            TaskCreate(**data), current_user=current_user, db=db, queue=queue
+        )
+
+    async def update(task_id: str, data: dict) -> dict:
+        return await update_task(
+            task_id, TaskUpdateRequest(**data), current_user=current_user, db=db
+        )
+
+    return await run_bulk_upsert(request.items, create, update)
+
+
 @router.get("/{task_id}/dependencies", response_model=dict)
 async def get_task_dependencies(
     task_id: str,
@@ -7,6 +7,7 @@ from fastapi import APIRouter, HTTPException, Depends, Query, BackgroundTasks
 from pydantic import BaseModel, ConfigDict
 from sqlalchemy import select, or_, func
 
+from omoi_os.api.bulk import BulkUpsertRequest, BulkUpsertResponse, run_bulk_upsert
 from omoi_os.api.dependencies import (
     get_db_service,
     get_task_queue,
@@ -14,6 +15,7 @@ from omoi_os.api.dependencies import (
     get_event_bus_service,
     get_approval_service,
     get_ticket_dedup_service,
+    get_embedding_batcher,
     get_current_user,
     get_accessible_project_ids,
     verify_project_access,
@@ -21,6 +23,7 @@ from omoi_os.api.dependencies import (
 )
 from omoi_os.models.user import User
 from omoi_os.services.ticket_dedup import TicketDeduplicationService
+from omoi_os.services.embedding_batcher import EmbeddingBatcher
 from omoi_os.models.ticket import Ticket
 from omoi_os.models.spec import Spec
 from omoi_os.models.ticket_status import TicketStatus
@@ -254,7 +257,7 @@ async def _generate_embedding_background(
     ticket_id: str,
     title: str,
     description: str | None,
-    dedup_service: TicketDeduplicationService,
+    embedding_batcher: EmbeddingBatcher,
     db: DatabaseService,
 ) -> None:
     """Background task to generate and store embedding for a ticket.
@@ -269,7 +272,7 @@ async def _generate_embedding_background(
     try:
         # Generate embedding
         content = f"{title}\n{description or ''}"
-        embedding = dedup_service.embedding_service.generate_embedding(content)
+        embedding = await embedding_batcher.embed(content)
 
         if embedding:
             # Store using async session
@@ -413,6 +416,7 @@ async def create_ticket(
     queue: TaskQueueService = Depends(get_task_queue),
     approval_service: ApprovalService = Depends(get_approval_service),
     dedup_service: TicketDeduplicationService = Depends(get_ticket_dedup_service),
+    embedding_batcher: EmbeddingBatcher = Depends(get_embedding_batcher),
     event_bus: EventBusService = Depends(get_event_bus_service),
 ):
     """
@@ -543,14 +547,14 @@ async def create_ticket(
     # Check for duplicates if enabled
     embedding = None
     if ticket_data.check_duplicates and not ticket_data.force_create:
-        # Dedup check (includes embedding generation)
-        # Note: This is still sync because it calls external embedding service
-        # TODO: Make embedding service async for full async flow
+        # Embed off the event loop, batched with concurrent requests
+        content = f"{ticket_data.title}\n{ticket_data.description or ''}"
         dedup_result = dedup_service.check_duplicate(
             title=ticket_data.title,
             description=ticket_data.description,
             threshold=ticket_data.similarity_threshold,
             exclude_statuses=["done", "cancelled"],  # Don't match closed tickets
+            embedding=await embedding_batcher.embed(content),
         )
 
         if dedup_result.is_duplicate:
@@ -643,7 +647,7 @@ async def create_ticket(
                 ticket_id=ticket_id,
                 title=ticket_data.title,
                 description=ticket_data.description,
-                dedup_service=dedup_service,
+                embedding_batcher=embedding_batcher,
                 db=db,
             )
 
@@ -900,6 +904,68 @@ async def update_ticket(
         return TicketResponse.model_validate(ticket)
 
 
+@router.post("/bulk", response_model=BulkUpsertResponse)
+async def bulk_upsert_tickets(
+    request: BulkUpsertRequest,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user),
+    db: DatabaseService = Depends(get_db_service),
+    queue: TaskQueueService = Depends(get_task_queue),
+    approval_service: ApprovalService = Depends(get_approval_service),
+    dedup_service: TicketDeduplicationService = Depends(get_ticket_dedup_service),
+    embedding_batcher: EmbeddingBatcher = Depends(get_embedding_batcher),
+    event_bus: EventBusService = Depends(get_event_bus_service),
+):
+    """
+    Create or update many tickets in one request.
+
+    Items without an id are created exactly as POST /tickets creates them
+    (access checks, approval gate, initial task, events); items with an id
+    are applied as PATCH /tickets/{id}. Each item gets its own result.
+
+    Args:
+        request: Items to create or update
+        background_tasks: FastAPI background tasks
+        current_user: Authenticated user
+        db: Database service
+        queue: Task queue service
+        approval_service: Approval service for human-in-the-loop approval
+        dedup_service: Ticket deduplication service
+
+    Returns:
+        Per-item results in request order
+    """
+
+    async def create(data: dict) -> dict:
+        ticket = await create_ticket(
+            TicketCreate(**data),
+            background_tasks,
+            requested_by_agent_id=None,
+            current_user=current_user,
+            db=db,
+            queue=queue,
+            approval_service=approval_service,
+            dedup_service=dedup_service,
+            embedding_batcher=embedding_batcher,
+            event_bus=event_bus,
+        )
+        if isinstance(ticket, DuplicateCheckResponse):
+            raise HTTPException(status_code=409, detail=ticket.message)
+        return ticket.model_dump(mode="json")
+
+    async def update(ticket_id: str, data: dict) -> dict:
+        try:
+            ticket_uuid = UUID(ticket_id)
+        except ValueError:
+            raise HTTPException(status_code=422, detail="Invalid ticket ID")
+        ticket = await update_ticket(
+            ticket_uuid, TicketUpdateRequest(**data), current_user=current_user, db=db
+        )
+        return ticket.model_dump(mode="json")
+
+    return await run_bulk_upsert(request.items, create, update)
+
+
 @router.get("/{ticket_id}/context")
 async def get_ticket_context(
     ticket_id: UUID,
@@ -594,6 +594,16 @@ class DaytonaSettings(OmoiBaseSettings):
     sandbox_cpu: int = 2  # DAYTONA_SANDBOX_CPU (default: 2, max: 4)
     sandbox_disk_gb: int = 8  # DAYTONA_SANDBOX_DISK_GB (default: 8, max: 10)
 
+    # Maximum concurrent Daytona SDK calls (each runs on its own thread)
+    sdk_max_concurrency: int = 8  # DAYTONA_SDK_MAX_CONCURRENCY
+
+    # Warm pool of pre-created, pre-provisioned sandboxes (0 disables it)
+    warm_pool_size: int = 0  # DAYTONA_WARM_POOL_SIZE (sandboxes per runtime)
+    # Keep below the sandboxes' 30 minute auto-stop interval
+    warm_pool_max_idle_seconds: int = 1200  # DAYTONA_WARM_POOL_MAX_IDLE_SECONDS
+    warm_pool_refill_interval_seconds: float = 15.0
+    warm_pool_runtimes: list[str] = ["claude"]  # DAYTONA_WARM_POOL_RUNTIMES
+
 
 def load_daytona_settings() -> DaytonaSettings:
     return get_app_settings().daytona
@@ -657,6 +667,37 @@ class EmbeddingSettings(OmoiBaseSettings):
     lazy_load: bool = True  # Defer model loading until first use
     preload_in_background: bool = False  # Preload model in background thread at startup
 
+    # Embedding result cache (see omoi_os.services.embedding_cache)
+    cache_enabled: bool = True
+    # In-process LRU bound; vectors are float32 (about 6 KB per 1536 dims,
+    # so roughly 60 MB at the default)
+    cache_max_entries: int = 10_000
+    cache_ttl_seconds: Optional[float] = 86_400  # None = evict by LRU only
+    cache_redis_enabled: bool = False  # Share vectors across processes via redis.url
+    cache_redis_ttl_seconds: int = 604_800
+
+
+class TranscriptStoreSettings(OmoiBaseSettings):
+    """
+    Out-of-row storage for Claude session transcripts.
+
+    See omoi_os.services.transcript_store. When disabled, transcripts are
+    stored base64-encoded in claude_session_transcripts. Only enable it with
+    a root every API replica reads (e.g. a shared volume); the row then
+    keeps just the reference.
+    """
+
+    yaml_section = "transcript_store"
+    model_config = SettingsConfigDict(
+        env_prefix="TRANSCRIPT_STORE_",
+        extra="ignore",
+    )
+
+    enabled: bool = False
+    backend: str = "filesystem"  # Only "filesystem" is implemented
+    root: str = str(Path.home() / ".cache" / "omoi_os" / "transcripts")
+    compression_level: int = 3  # zstd level
+
 
 class ObservabilitySettings(OmoiBaseSettings):
     """
@@ -813,6 +854,7 @@ class AppSettings:
         self.daytona = DaytonaSettings()
         self.integrations = IntegrationSettings()
         self.embedding = EmbeddingSettings()
+        self.transcript_store = TranscriptStoreSettings()
         self.observability = ObservabilitySettings()
         self.sentry = SentrySettings()
         self.posthog = PostHogSettings()
@@ -65,12 +65,14 @@ from omoi_os.models.sandbox_event import SandboxEvent
 from omoi_os.models.claude_session_transcript import ClaudeSessionTranscript
 from omoi_os.models.merge_attempt import MergeAttempt, MergeStatus
 from omoi_os.models.task import Task
+from omoi_os.models.task_dependency import TaskDependency
 from omoi_os.models.task_discovery import DiscoveryType, TaskDiscovery
 from omoi_os.models.task_memory import TaskMemory
 from omoi_os.models.ticket import Ticket
 from omoi_os.models.ticket_commit import TicketCommit
 from omoi_os.models.ticket_pull_request import TicketPullRequest
 from omoi_os.models.ticket_status import TicketStatus
+from omoi_os.models.trajectory_context_state import TrajectoryContextState
 from omoi_os.models.validation_review import ValidationReview
 from omoi_os.models.workflow_result import WorkflowResult
 from omoi_os.models.mcp_server import (
@@ -153,6 +155,7 @@ __all__ = [
     "Role",
     "SandboxEvent",
     "ClaudeSessionTranscript",
+    "TrajectoryContextState",
     "Session",
     "Spec",
     "SpecAcceptanceCriterion",
@@ -160,6 +163,7 @@ __all__ = [
     "SpecTask",
     "SpecVersion",
     "Task",
+    "TaskDependency",
     "TaskDiscovery",
     "TaskMemory",
     "TaskPattern",
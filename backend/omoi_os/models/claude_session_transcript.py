@@ -1,7 +1,9 @@
 """Claude Session Transcript model for storing Claude Code session transcripts.
 
-Enables cross-sandbox session resumption by storing session transcripts
-as base64-encoded JSONL files in the database.
+Enables cross-sandbox session resumption by storing session transcripts.
+Transcripts are kept zstd-compressed in the transcript store
+(omoi_os.services.transcript_store) and referenced by transcript_ref; rows
+written before that, or with the store disabled, hold transcript_b64.
 
 IMPORTANT: Do NOT use 'metadata' as an attribute name - it's reserved by SQLAlchemy!
 We use 'session_metadata' instead to store additional session information.
@@ -11,7 +13,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import uuid4
 
-from sqlalchemy import DateTime, ForeignKey, String, Text
+from sqlalchemy import BigInteger, DateTime, ForeignKey, String, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -30,7 +32,9 @@ class ClaudeSessionTranscript(Base):
     Attributes:
         id: Unique identifier (UUID)
         session_id: Claude Code session ID (unique, indexed)
-        transcript_b64: Base64-encoded JSONL transcript content
+        transcript_b64: Base64-encoded JSONL transcript content (legacy/inline)
+        transcript_ref: Transcript store reference ("sha256:<hex>")
+        transcript_size: Uncompressed transcript size in bytes
         sandbox_id: Daytona sandbox ID where session was created
         task_id: Optional task ID associated with this session
         session_metadata: JSONB field with additional metadata (cost, turns, model, etc.)
@@ -52,12 +56,25 @@ class ClaudeSessionTranscript(Base):
         comment="Claude Code session ID (UUID format)",
     )
 
-    transcript_b64: Mapped[str] = mapped_column(
+    transcript_b64: Mapped[Optional[str]] = mapped_column(
         Text,
-        nullable=False,
+        nullable=True,
         comment="Base64-encoded JSONL transcript file content for cross-sandbox resumption",
     )
 
+    transcript_ref: Mapped[Optional[str]] = mapped_column(
+        String(80),
+        nullable=True,
+        index=True,
+        comment="Content-addressed transcript store reference (sha256:<hex>)",
+    )
+
+    transcript_size: Mapped[Optional[int]] = mapped_column(
+        BigInteger,
+        nullable=True,
+        comment="Uncompressed transcript size in bytes",
+    )
+
     sandbox_id: Mapped[Optional[str]] = mapped_column(
         String(255),
         nullable=True,
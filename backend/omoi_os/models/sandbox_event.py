@@ -10,7 +10,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import uuid4
 
-from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, String, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -31,10 +31,24 @@ class SandboxEvent(Base):
         event_type: Type of event (e.g., 'agent.started', 'agent.tool_use')
         event_data: JSON payload with event-specific data
         source: Source of the event ('agent', 'guardian', 'system')
+        idempotency_key: Client-supplied key; a retried batch with the same key
+            for the same sandbox is not stored twice
+        sequence: Client-side sequence number (order of emission)
         created_at: Timestamp when the event was recorded
     """
 
     __tablename__ = "sandbox_events"
+    __table_args__ = (
+        Index(
+            "uq_sandbox_events_sandbox_idempotency_key",
+            "sandbox_id",
+            "idempotency_key",
+            unique=True,
+            postgresql_where=text("idempotency_key IS NOT NULL"),
+        ),
+        # Keyset pagination of a sandbox's events (newest or oldest first)
+        Index("ix_sandbox_events_sandbox_created_id", "sandbox_id", "created_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(
         String, primary_key=True, default=lambda: str(uuid4())
@@ -52,6 +66,8 @@ class SandboxEvent(Base):
     source: Mapped[str] = mapped_column(
         String(50), nullable=False, default="agent", index=True
     )
+    idempotency_key: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
+    sequence: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, default=utc_now, index=True
     )
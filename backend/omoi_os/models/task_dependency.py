@@ -0,0 +1,102 @@
+"""TaskDependency model: normalized task dependency edges."""
+
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import (
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+    delete,
+    event,
+    insert,
+    inspect,
+)
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Mapped, Mapper, mapped_column
+
+from omoi_os.models.base import Base
+from omoi_os.models.task import Task
+from omoi_os.utils.datetime import utc_now
+
+
+class TaskDependency(Base):
+    """
+    One "task depends on task" edge.
+
+    Mirrors Task.dependencies["depends_on"], which stays the source of truth
+    for writers. Edges are kept in sync on every ORM insert/update of a task,
+    so "what does X depend on" (forward) and "who is blocked by X" (reverse)
+    are both indexed lookups instead of JSON scans over the tasks table.
+    """
+
+    __tablename__ = "task_dependencies"
+
+    task_id: Mapped[str] = mapped_column(
+        String,
+        ForeignKey("tasks.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="Dependent task (the one that waits)",
+    )
+    depends_on_task_id: Mapped[str] = mapped_column(
+        String,
+        primary_key=True,
+        comment="Blocking task ID; not a foreign key because depends_on may reference tasks that no longer exist",
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=utc_now
+    )
+
+    __table_args__ = (
+        # Reverse lookups: who is blocked by depends_on_task_id
+        Index(
+            "ix_task_dependencies_depends_on_task_id", "depends_on_task_id", "task_id"
+        ),
+    )
+
+
+def dependency_ids(dependencies: Optional[dict[str, Any]]) -> list[str]:
+    """
+    Extract the depends_on task IDs from a Task.dependencies payload.
+
+    Args:
+        dependencies: Task.dependencies JSON ({"depends_on": [...]}) or None
+
+    Returns:
+        Unique dependency IDs in their original order
+    """
+    if not dependencies:
+        return []
+    depends_on = dependencies.get("depends_on")
+    if not isinstance(depends_on, list):
+        return []
+    return list(dict.fromkeys(str(dep_id) for dep_id in depends_on if dep_id))
+
+
+def sync_task_dependency_edges(connection: Connection, task: Task) -> None:
+    """Replace the edges of a task with its current depends_on list."""
+    table = TaskDependency.__table__
+    connection.execute(delete(table).where(table.c.task_id == task.id))
+    dep_ids = dependency_ids(task.dependencies)
+    if dep_ids:
+        now = utc_now()
+        connection.execute(
+            insert(table),
+            [
+                {"task_id": task.id, "depends_on_task_id": dep_id, "created_at": now}
+                for dep_id in dep_ids
+            ],
+        )
+
+
+@event.listens_for(Task, "after_insert")
+def _task_inserted(mapper: Mapper, connection: Connection, target: Task) -> None:
+    if dependency_ids(target.dependencies):
+        sync_task_dependency_edges(connection, target)
+
+
+@event.listens_for(Task, "after_update")
+def _task_updated(mapper: Mapper, connection: Connection, target: Task) -> None:
+    if inspect(target).attrs.dependencies.history.has_changes():
+        sync_task_dependency_edges(connection, target)
@@ -11,9 +11,11 @@ from sqlalchemy import (
     Float,
     DateTime,
     ForeignKey,
+    Index,
 )
 from sqlalchemy.dialects.postgresql import JSONB, ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from pgvector.sqlalchemy import Vector
 from whenever import Instant
 
 from omoi_os.models.base import Base
@@ -23,6 +25,16 @@ from omoi_os.utils.datetime import utc_now
 if TYPE_CHECKING:
     from omoi_os.models.task import Task
 
+# Must match DEFAULT_EMBEDDING_DIMENSIONS in services/embedding.py
+MEMORY_EMBEDDING_DIMENSIONS = 1536
+
+
+def pgvector_embedding(embedding: Optional[List[float]]) -> Optional[List[float]]:
+    """Value for TaskMemory.embedding_vector, or None if dimensions differ."""
+    if embedding and len(embedding) == MEMORY_EMBEDDING_DIMENSIONS:
+        return embedding
+    return None
+
 
 class TaskMemory(Base):
     """
@@ -73,6 +85,12 @@ class TaskMemory(Base):
         nullable=True,
         comment="1536-dimensional embedding vector for similarity search",
     )
+    # pgvector copy of context_embedding, HNSW-indexed for ANN search
+    embedding_vector: Mapped[Optional[List[float]]] = mapped_column(
+        Vector(MEMORY_EMBEDDING_DIMENSIONS),
+        nullable=True,
+        comment="pgvector embedding (1536 dims) for indexed cosine similarity search",
+    )
     success: Mapped[bool] = mapped_column(
         Boolean, nullable=False, index=True, comment="Whether execution was successful"
     )
@@ -98,6 +116,15 @@ class TaskMemory(Base):
     # Relationships
     task: Mapped["Task"] = relationship("Task", back_populates="memories")
 
+    __table_args__ = (
+        Index(
+            "idx_task_memories_embedding_vector_hnsw",
+            "embedding_vector",
+            postgresql_using="hnsw",
+            postgresql_ops={"embedding_vector": "vector_cosine_ops"},
+        ),
+    )
+
     def __repr__(self) -> str:
         return (
             f"<TaskMemory(id={self.id}, task_id={self.task_id}, "
@@ -0,0 +1,57 @@
+"""Persisted incremental state of trajectory context builds."""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from omoi_os.models.base import Base
+from omoi_os.utils.datetime import utc_now
+
+
+class TrajectoryContextState(Base):
+    """
+    Accumulated trajectory state of one agent or sandbox, plus its watermark.
+
+    TrajectoryContext folds only logs newer than the watermark into the
+    state. Keeping the state here lets a rebuild after a cache eviction or
+    a restart continue from the watermark instead of rescanning every log.
+    """
+
+    __tablename__ = "trajectory_context_states"
+
+    context_key: Mapped[str] = mapped_column(
+        String(300),
+        primary_key=True,
+        comment="Agent ID, or sandbox:<sandbox_id> for sandbox contexts",
+    )
+    watermark_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="created_at of the last folded log",
+    )
+    watermark_id: Mapped[Optional[str]] = mapped_column(
+        String,
+        nullable=True,
+        comment="ID of the last folded log",
+    )
+    log_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, comment="Logs folded into the state"
+    )
+    state: Mapped[dict] = mapped_column(
+        JSONB, nullable=False, comment="Serialized accumulated extraction state"
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=utc_now,
+        onupdate=utc_now,
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<TrajectoryContextState(context_key={self.context_key}, "
+            f"log_count={self.log_count})>"
+        )
@@ -2,6 +2,7 @@
 
 from omoi_os.schemas.events import (
     AgentEventTypes,
+    HEARTBEAT_EVENTS,
     IterationEventTypes,
     NON_WORK_EVENTS,
     PHASE_PROGRESSION_EVENTS,
@@ -75,6 +76,7 @@ __all__ = [
     "AgentEventTypes",
     "SpecEventTypes",
     "IterationEventTypes",
+    "HEARTBEAT_EVENTS",
     "NON_WORK_EVENTS",
     "PHASE_PROGRESSION_EVENTS",
     "is_work_event",
@@ -145,6 +145,16 @@ class IterationEventTypes:
 # =============================================================================
 
 
+# Keepalive events. Recorded in the sandbox liveness store; only periodic
+# rollups are persisted as SandboxEvent rows.
+HEARTBEAT_EVENTS: FrozenSet[str] = frozenset(
+    {
+        AgentEventTypes.HEARTBEAT,
+        SpecEventTypes.HEARTBEAT,
+    }
+)
+
+
 # Events that do NOT indicate actual work progress.
 # Used by idle_sandbox_monitor to detect inactive sandboxes.
 #
@@ -262,6 +272,7 @@ __all__ = [
     "SpecEventTypes",
     "IterationEventTypes",
     # Stable event sets
+    "HEARTBEAT_EVENTS",
     "NON_WORK_EVENTS",
     "PHASE_PROGRESSION_EVENTS",
     # Helper functions
@@ -3,47 +3,94 @@
 # NOTE: AgentExecutor removed from top-level imports due to openhands.sdk compatibility issues.
 # Import directly from omoi_os.services.agent_executor if needed (legacy code only).
 # The new Claude sandbox workers don't use AgentExecutor.
+#
+# Exports are imported on first access (PEP 562): importing one service
+# module, e.g. omoi_os.services.database, no longer imports every service.
 
-from omoi_os.services.agent_health import AgentHealthService
-from omoi_os.services.repository_service import (
-    GitHubAPIError,
-    RepositoryService,
-    RepositoryServiceError,
-)
-from omoi_os.services.agent_registry import AgentRegistryService
-from omoi_os.services.agent_status_manager import AgentStatusManager
-from omoi_os.services.ace_engine import ACEEngine
-from omoi_os.services.ace_executor import Executor
-from omoi_os.services.ace_reflector import Reflector
-from omoi_os.services.ace_curator import Curator
-from omoi_os.services.approval import ApprovalService
-from omoi_os.services.baseline_learner import BaselineLearner
-from omoi_os.services.branch_workflow import BranchWorkflowService
-from omoi_os.services.collaboration import CollaborationService
-from omoi_os.services.composite_anomaly_scorer import CompositeAnomalyScorer
-from omoi_os.services.context_service import ContextService
-from omoi_os.services.coordination import CoordinationService
-from omoi_os.services.database import DatabaseService
-from omoi_os.services.event_bus import EventBusService, SystemEvent
-from omoi_os.services.heartbeat_protocol import HeartbeatProtocolService
-from omoi_os.services.message_queue import (
-    RedisMessageQueue,
-    InMemoryMessageQueue,
-    get_message_queue,
-)
-from omoi_os.services.phase_gate import PhaseGateService
-from omoi_os.services.phase_manager import PhaseManager, get_phase_manager
-from omoi_os.services.resource_lock import ResourceLockService
-from omoi_os.services.restart_orchestrator import RestartOrchestrator
-from omoi_os.services.task_queue import TaskQueueService
-from omoi_os.services.task_scorer import TaskScorer
-from omoi_os.services.ticket_workflow import TicketWorkflowOrchestrator
-from omoi_os.services.validation_agent import ValidationAgent
-from omoi_os.services.llm_service import LLMService, get_llm_service
-from omoi_os.services.spec_driven_settings import (
-    SpecDrivenOptionsSchema,
-    SpecDrivenSettingsService,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from omoi_os.services.agent_health import AgentHealthService
+    from omoi_os.services.repository_service import (
+        GitHubAPIError,
+        RepositoryService,
+        RepositoryServiceError,
+    )
+    from omoi_os.services.agent_registry import AgentRegistryService
+    from omoi_os.services.agent_status_manager import AgentStatusManager
+    from omoi_os.services.ace_engine import ACEEngine
+    from omoi_os.services.ace_executor import Executor
+    from omoi_os.services.ace_reflector import Reflector
+    from omoi_os.services.ace_curator import Curator
+    from omoi_os.services.approval import ApprovalService
+    from omoi_os.services.baseline_learner import BaselineLearner
+    from omoi_os.services.branch_workflow import BranchWorkflowService
+    from omoi_os.services.collaboration import CollaborationService
+    from omoi_os.services.composite_anomaly_scorer import CompositeAnomalyScorer
+    from omoi_os.services.context_service import ContextService
+    from omoi_os.services.coordination import CoordinationService
+    from omoi_os.services.database import DatabaseService
+    from omoi_os.services.event_bus import EventBusService, SystemEvent
+    from omoi_os.services.heartbeat_protocol import HeartbeatProtocolService
+    from omoi_os.services.message_queue import (
+        RedisMessageQueue,
+        InMemoryMessageQueue,
+        get_message_queue,
+    )
+    from omoi_os.services.phase_gate import PhaseGateService
+    from omoi_os.services.phase_manager import PhaseManager, get_phase_manager
+    from omoi_os.services.resource_lock import ResourceLockService
+    from omoi_os.services.restart_orchestrator import RestartOrchestrator
+    from omoi_os.services.task_queue import TaskQueueService
+    from omoi_os.services.task_scorer import TaskScorer
+    from omoi_os.services.ticket_workflow import TicketWorkflowOrchestrator
+    from omoi_os.services.validation_agent import ValidationAgent
+    from omoi_os.services.llm_service import LLMService, get_llm_service
+    from omoi_os.services.spec_driven_settings import (
+        SpecDrivenOptionsSchema,
+        SpecDrivenSettingsService,
+    )
+
+_EXPORTS = {
+    "AgentHealthService": "omoi_os.services.agent_health",
+    "GitHubAPIError": "omoi_os.services.repository_service",
+    "RepositoryService": "omoi_os.services.repository_service",
+    "RepositoryServiceError": "omoi_os.services.repository_service",
+    "AgentRegistryService": "omoi_os.services.agent_registry",
+    "AgentStatusManager": "omoi_os.services.agent_status_manager",
+    "ACEEngine": "omoi_os.services.ace_engine",
+    "Executor": "omoi_os.services.ace_executor",
+    "Reflector": "omoi_os.services.ace_reflector",
+    "Curator": "omoi_os.services.ace_curator",
+    "ApprovalService": "omoi_os.services.approval",
+    "BaselineLearner": "omoi_os.services.baseline_learner",
+    "BranchWorkflowService": "omoi_os.services.branch_workflow",
+    "CollaborationService": "omoi_os.services.collaboration",
+    "CompositeAnomalyScorer": "omoi_os.services.composite_anomaly_scorer",
+    "ContextService": "omoi_os.services.context_service",
+    "CoordinationService": "omoi_os.services.coordination",
+    "DatabaseService": "omoi_os.services.database",
+    "EventBusService": "omoi_os.services.event_bus",
+    "SystemEvent": "omoi_os.services.event_bus",
+    "HeartbeatProtocolService": "omoi_os.services.heartbeat_protocol",
+    "RedisMessageQueue": "omoi_os.services.message_queue",
+    "InMemoryMessageQueue": "omoi_os.services.message_queue",
+    "get_message_queue": "omoi_os.services.message_queue",
+    "PhaseGateService": "omoi_os.services.phase_gate",
+    "PhaseManager": "omoi_os.services.phase_manager",
+    "get_phase_manager": "omoi_os.services.phase_manager",
+    "ResourceLockService": "omoi_os.services.resource_lock",
+    "RestartOrchestrator": "omoi_os.services.restart_orchestrator",
+    "TaskQueueService": "omoi_os.services.task_queue",
+    "TaskScorer": "omoi_os.services.task_scorer",
+    "TicketWorkflowOrchestrator": "omoi_os.services.ticket_workflow",
+    "ValidationAgent": "omoi_os.services.validation_agent",
+    "LLMService": "omoi_os.services.llm_service",
+    "get_llm_service": "omoi_os.services.llm_service",
+    "SpecDrivenOptionsSchema": "omoi_os.services.spec_driven_settings",
+    "SpecDrivenSettingsService": "omoi_os.services.spec_driven_settings",
+}
 
 __all__ = [
     "ACEEngine",
@@ -85,3 +132,12 @@ __all__ = [
     "SpecDrivenOptionsSchema",
     "SpecDrivenSettingsService",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
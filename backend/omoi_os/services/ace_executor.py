@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from sqlalchemy.orm import Session
 
 from omoi_os.models.task import Task
-from omoi_os.models.task_memory import TaskMemory
+from omoi_os.models.task_memory import TaskMemory, pgvector_embedding
 from omoi_os.services.embedding import EmbeddingService
 from omoi_os.services.memory import MemoryService
 from omoi_os.utils.datetime import utc_now
@@ -120,6 +120,7 @@ class Executor:
             feedback=feedback,
             tool_usage={"tools": tool_usage},  # Store as JSONB
             context_embedding=embedding,
+            embedding_vector=pgvector_embedding(embedding),
             success=True,  # Will be updated based on feedback if needed
             learned_at=utc_now(),
             reused_count=0,
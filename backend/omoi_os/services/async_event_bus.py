@@ -0,0 +1,272 @@
+"""Asyncio-native event publishing with buffered, pipelined flushes.
+
+EventBusService uses the synchronous redis client, so publishing from an
+async route blocks the event loop for a full Redis round trip per event.
+AsyncEventBus buffers events in memory and a background task flushes them
+with one pipelined round trip per batch via redis.asyncio.
+
+- publish_nowait() never blocks; when the buffer is full the event is
+  dropped and counted (events are notifications, not a durable log).
+- await publish() waits for buffer space instead (backpressure).
+- publish_nowait() may be called from any thread, so sync code running in
+  FastAPI's threadpool can use it through EventBusService.publish().
+
+Workers without an event loop keep using EventBusService directly.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Deque, Optional
+
+import redis.asyncio as aioredis
+
+from omoi_os.logging import get_logger
+from omoi_os.services.event_bus import SystemEvent
+
+logger = get_logger(__name__)
+
+
+class AsyncEventBus:
+    """Buffered Redis pub/sub publisher for asyncio code.
+
+    Publishes to the same ``events.<event_type>`` channels, with the same
+    JSON payload, as EventBusService.publish().
+    """
+
+    def __init__(
+        self,
+        redis_url: str,
+        max_buffer: int = 10_000,
+        max_batch: int = 256,
+        flush_interval_ms: float = 5.0,
+        redis_client: Optional[aioredis.Redis] = None,
+    ):
+        """
+        Initialize the publisher (call start() inside the event loop).
+
+        Args:
+            redis_url: Redis connection URL
+            max_buffer: Events held before publish_nowait() starts dropping
+            max_batch: Most events sent in one pipeline
+            flush_interval_ms: How long the flusher waits for a batch to fill
+            redis_client: Preconfigured client (tests)
+        """
+        self.redis_url = redis_url
+        self.max_buffer = max_buffer
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval_ms / 1000
+        self._redis = redis_client
+        self._buffer: Deque[tuple[str, str]] = deque()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._space: Optional[asyncio.Condition] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._flusher: Optional["asyncio.Task[None]"] = None
+        self._closing = False
+
+        self.stats = {
+            "published": 0,
+            "flushed": 0,
+            "batches": 0,
+            "dropped": 0,
+            "flush_errors": 0,
+            "buffer_high_water": 0,
+            "last_flush_ms": 0.0,
+        }
+
+    @property
+    def running(self) -> bool:
+        """Whether the flusher task is active."""
+        return self._flusher is not None and not self._flusher.done()
+
+    @property
+    def buffered(self) -> int:
+        """Events waiting to be flushed."""
+        return len(self._buffer)
+
+    async def start(self) -> bool:
+        """
+        Connect and start the background flusher.
+
+        Returns:
+            True if Redis is reachable and the flusher is running
+        """
+        if self.running:
+            return True
+        try:
+            if self._redis is None:
+                self._redis = aioredis.from_url(
+                    self.redis_url,
+                    decode_responses=True,
+                    socket_timeout=5.0,
+                    socket_connect_timeout=5.0,
+                )
+            await self._redis.ping()
+        except Exception as e:
+            logger.warning(f"Async event bus disabled, Redis unavailable: {e}")
+            return False
+
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._wakeup = asyncio.Event()
+        self._space = asyncio.Condition()
+        self._flush_lock = asyncio.Lock()
+        self._closing = False
+        self._flusher = self._loop.create_task(self._run())
+        logger.info("Async event bus started")
+        return True
+
+    def publish_nowait(self, event: SystemEvent) -> bool:
+        """
+        Buffer an event for publishing without blocking.
+
+        Safe to call from any thread.
+
+        Args:
+            event: SystemEvent to publish
+
+        Returns:
+            False if the event was dropped (buffer full or bus not running)
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed() or self._closing:
+            self.stats["dropped"] += 1
+            return False
+
+        item = (f"events.{event.event_type}", event.model_dump_json())
+        if threading.get_ident() == self._loop_thread:
+            return self._enqueue(item)
+        # deque.append is atomic; only the wakeup must run on the loop
+        if len(self._buffer) >= self.max_buffer:
+            self.stats["dropped"] += 1
+            return False
+        self._buffer.append(item)
+        self.stats["published"] += 1
+        loop.call_soon_threadsafe(self._signal)
+        return True
+
+    async def publish(self, event: SystemEvent) -> bool:
+        """
+        Buffer an event, waiting for space when the buffer is full.
+
+        Args:
+            event: SystemEvent to publish
+
+        Returns:
+            False if the bus is not running
+        """
+        if not self.running or self._space is None:
+            self.stats["dropped"] += 1
+            return False
+        async with self._space:
+            await self._space.wait_for(
+                lambda: len(self._buffer) < self.max_buffer or self._closing
+            )
+        return self.publish_nowait(event)
+
+    async def flush(self) -> None:
+        """Publish everything currently buffered."""
+        while self._buffer:
+            await self._flush_batch()
+
+    async def close(self, drain_timeout: float = 5.0) -> None:
+        """
+        Drain buffered events, stop the flusher and close the client.
+
+        The flusher is woken and left to finish its in-flight batch and the
+        rest of the buffer; it is only cancelled if that takes longer than
+        ``drain_timeout``.
+
+        Args:
+            drain_timeout: Seconds to wait for the flusher to drain
+        """
+        self._closing = True
+        if self._space is not None:
+            async with self._space:
+                self._space.notify_all()
+        if self._flusher is not None:
+            self._wakeup.set()
+            try:
+                await asyncio.wait_for(self._flusher, timeout=drain_timeout)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Async event bus drain timed out, {len(self._buffer)} "
+                    "events left buffered"
+                )
+            except Exception as e:
+                logger.warning(f"Async event bus flusher failed on close: {e}")
+            self._flusher = None
+        if self._redis is not None:
+            try:
+                # Anything published after the flusher exited; waits on
+                # _flush_lock behind any batch still in flight
+                await self.flush()
+            except Exception as e:
+                logger.warning(f"Async event bus final flush failed: {e}")
+            await self._redis.aclose()
+            self._redis = None
+        self._loop = None
+
+    def _enqueue(self, item: tuple[str, str]) -> bool:
+        if len(self._buffer) >= self.max_buffer:
+            self.stats["dropped"] += 1
+            return False
+        self._buffer.append(item)
+        self.stats["published"] += 1
+        self._signal()
+        return True
+
+    def _signal(self) -> None:
+        depth = len(self._buffer)
+        if depth > self.stats["buffer_high_water"]:
+            self.stats["buffer_high_water"] = depth
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            # Give a burst a moment to fill the batch
+            if not self._closing and len(self._buffer) < self.max_batch:
+                await asyncio.sleep(self.flush_interval)
+            while self._buffer:
+                try:
+                    await self._flush_batch()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    # Events in the failed batch are lost; keep flushing
+                    logger.warning(f"Async event bus flush failed: {e}")
+                    break
+            if self._closing:
+                return
+
+    async def _flush_batch(self) -> None:
+        # One pipeline in flight at a time keeps events in publish order
+        async with self._flush_lock:
+            batch = []
+            while self._buffer and len(batch) < self.max_batch:
+                batch.append(self._buffer.popleft())
+            if not batch:
+                return
+
+            async with self._space:
+                self._space.notify_all()
+
+            start = time.perf_counter()
+            try:
+                pipe = self._redis.pipeline(transaction=False)
+                for channel, message in batch:
+                    pipe.publish(channel, message)
+                await pipe.execute()
+            except Exception:
+                self.stats["flush_errors"] += 1
+                self.stats["dropped"] += len(batch)
+                raise
+            self.stats["batches"] += 1
+            self.stats["flushed"] += len(batch)
+            self.stats["last_flush_ms"] = (time.perf_counter() - start) * 1000
@@ -1,14 +1,19 @@
 """Board service for Kanban visualization and workflow management."""
 
-from typing import List, Dict, Any, Optional, Union
+from collections import defaultdict
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple, Union
 from uuid import UUID
 
-from sqlalchemy import select, func, or_
+from sqlalchemy import String, Select, select, func, or_, tuple_, values
+from sqlalchemy import column as sql_column
 from sqlalchemy.orm import Session
 
+from omoi_os.api.pagination import encode_keyset_cursor
 from omoi_os.models.board_column import BoardColumn
 from omoi_os.models.spec import Spec
 from omoi_os.models.ticket import Ticket
+from omoi_os.services.board_changes import CHANGE_INSERTED, BoardChangeLog
 from omoi_os.services.event_bus import EventBusService, SystemEvent
 
 
@@ -20,115 +25,389 @@ class BoardService:
     workflow representation.
     """
 
-    def __init__(self, event_bus: Optional[EventBusService] = None):
+    def __init__(
+        self,
+        event_bus: Optional[EventBusService] = None,
+        change_log: Optional[BoardChangeLog] = None,
+    ):
         """
         Initialize board service.
 
         Args:
             event_bus: Optional event bus for publishing board events.
+            change_log: Optional change log for board versions and deltas
+                (only pass one whose event listener is running).
         """
         self.event_bus = event_bus
+        self.change_log = change_log
 
     def get_board_view(
         self,
         session: Session,
         project_id: Optional[str] = None,
         user_id: Optional[Union[str, UUID]] = None,
+        limit_per_column: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
-        Get complete Kanban board view with all columns and tickets.
+        Get Kanban board view with all columns and their tickets.
+
+        Column counts and WIP flags come from one aggregate query; tickets
+        are a lean projection (no full context JSON), newest first. With
+        limit_per_column, each column holds at most that many tickets and
+        a next_cursor for get_column_tickets.
 
         Args:
             session: Database session.
             project_id: Optional project ID to filter tickets. If None, shows all tickets (cross-project board).
             user_id: Optional user ID to filter tickets. If provided, only shows tickets owned by this user.
+            limit_per_column: Optional page size per column; None loads every ticket.
 
         Returns:
-            Dictionary with columns and tickets organized by column.
+            Dictionary with columns and tickets organized by column, and the
+            board version to pass to get_board_delta (None if deltas are
+            not available).
         """
+        # Taken first, so changes made while the board loads are replayed
+        version = self.change_log.version if self.change_log else None
+
         # Get all columns ordered by sequence
         columns = (
             session.execute(select(BoardColumn).order_by(BoardColumn.sequence_order))
             .scalars()
             .all()
         )
+        columns_of_phase = self._columns_of_phase(columns)
+        counts = self._count_board_tickets(
+            session, columns_of_phase, project_id, user_id
+        )
 
-        # Collect all phase IDs from all columns to fetch tickets in a single query
-        all_phase_ids: List[str] = []
-        for column in columns:
-            all_phase_ids.extend(column.phase_mapping)
-
-        # Fetch all tickets for all phases in a single query (fixes N+1)
-        tickets_by_phase: Dict[str, List[Ticket]] = {
-            phase_id: [] for phase_id in all_phase_ids
+        tickets_by_column: Dict[str, List[Dict[str, Any]]] = {
+            column.id: [] for column in columns
         }
-
-        if all_phase_ids:
-            # Query tickets, excluding those linked to archived specs
-            query = (
-                select(Ticket)
-                .outerjoin(Spec, Ticket.spec_id == Spec.id)
-                .where(Ticket.phase_id.in_(all_phase_ids))
-                .where(
-                    # Include tickets that either:
-                    # 1. Have no spec_id (not linked to any spec), OR
-                    # 2. Are linked to a spec that is NOT archived
-                    or_(
-                        Ticket.spec_id.is_(None),
-                        Spec.archived == False,  # noqa: E712
+        if columns_of_phase:
+            # One row per (ticket, column) when phase mappings overlap
+            phase_columns = self._phase_columns(columns_of_phase)
+            column_key = phase_columns.c.column_id
+            query = self._board_ticket_query(
+                column_key.label("column_id"),
+                phase_ids=list(columns_of_phase),
+                project_id=project_id,
+                user_id=user_id,
+            ).join(phase_columns, phase_columns.c.phase_id == Ticket.phase_id)
+            if limit_per_column is not None:
+                # Top tickets of every column in one query
+                ranked = query.add_columns(
+                    func.row_number()
+                    .over(
+                        partition_by=column_key,
+                        order_by=(Ticket.created_at.desc(), Ticket.id.desc()),
                     )
+                    .label("row_number")
+                ).subquery()
+                query = (
+                    select(ranked)
+                    .where(ranked.c.row_number <= limit_per_column)
+                    .order_by(ranked.c.created_at.desc(), ranked.c.id.desc())
                 )
-            )
-            if project_id is not None:
-                query = query.where(Ticket.project_id == project_id)
-            if user_id is not None:
-                query = query.where(Ticket.user_id == user_id)
+            else:
+                query = query.order_by(Ticket.created_at.desc(), Ticket.id.desc())
 
-            all_tickets = session.execute(query).scalars().all()
-
-            # Group tickets by phase_id in memory
-            for ticket in all_tickets:
-                if ticket.phase_id in tickets_by_phase:
-                    tickets_by_phase[ticket.phase_id].append(ticket)
+            for row in session.execute(query).mappings():
+                tickets_by_column[row["column_id"]].append(self._ticket_card(row))
 
         # Build board view
-        board = {"columns": [], "project_id": project_id}
+        board = {"columns": [], "project_id": project_id, "version": version}
 
         for column in columns:
-            # Get tickets in this column from pre-fetched data
-            tickets_in_column = []
-            for phase_id in column.phase_mapping:
-                tickets_in_column.extend(tickets_by_phase.get(phase_id, []))
+            tickets_in_column = tickets_by_column[column.id]
+            current_count = counts.get(column.id, 0)
+            has_more = len(tickets_in_column) < current_count
 
             column_data = {
                 "id": column.id,
                 "name": column.name,
                 "description": column.description,
                 "sequence_order": column.sequence_order,
-                "wip_limit": column.wip_limit,
-                "current_count": len(tickets_in_column),
-                "wip_exceeded": (
-                    column.wip_limit is not None
-                    and len(tickets_in_column) > column.wip_limit
+                **self._column_counts(column, current_count),
+                "tickets": tickets_in_column,
+                "has_more": has_more,
+                "next_cursor": (
+                    self._ticket_cursor(tickets_in_column[-1]) if has_more else None
                 ),
-                "tickets": [
-                    {
-                        "id": t.id,
-                        "title": t.title,
-                        "phase_id": t.phase_id,
-                        "priority": t.priority,
-                        "status": t.status,
-                        "approval_status": t.approval_status,
-                        "context": t.context,  # Include context for spec_id tracking
-                    }
-                    for t in tickets_in_column
-                ],
             }
 
             board["columns"].append(column_data)
 
         return board
 
+    def get_column_tickets(
+        self,
+        session: Session,
+        column_id: str,
+        project_id: Optional[str] = None,
+        user_id: Optional[Union[str, UUID]] = None,
+        cursor: Optional[Tuple[datetime, str]] = None,
+        limit: int = 50,
+    ) -> Dict[str, Any]:
+        """
+        Get one page of a board column's tickets, newest first.
+
+        Args:
+            session: Database session.
+            column_id: Column to page through.
+            project_id: Optional project ID to filter tickets.
+            user_id: Optional user ID to filter tickets.
+            cursor: (created_at, id) of the last ticket on the previous page.
+            limit: Page size.
+
+        Returns:
+            Dictionary with tickets, has_more and next_cursor.
+
+        Raises:
+            ValueError: If column not found.
+        """
+        column = session.get(BoardColumn, column_id)
+        if not column:
+            raise ValueError(f"Column {column_id} not found")
+
+        query = self._board_ticket_query(
+            phase_ids=list(column.phase_mapping),
+            project_id=project_id,
+            user_id=user_id,
+        )
+        if cursor is not None:
+            query = query.where(tuple_(Ticket.created_at, Ticket.id) < tuple_(*cursor))
+        query = query.order_by(Ticket.created_at.desc(), Ticket.id.desc()).limit(
+            limit + 1
+        )
+
+        tickets = [self._ticket_card(row) for row in session.execute(query).mappings()]
+        has_more = len(tickets) > limit
+        tickets = tickets[:limit]
+        return {
+            "column_id": column_id,
+            "tickets": tickets,
+            "has_more": has_more,
+            "next_cursor": self._ticket_cursor(tickets[-1]) if has_more else None,
+        }
+
+    def get_board_delta(
+        self,
+        session: Session,
+        since_version: str,
+        project_id: Optional[str] = None,
+        user_id: Optional[Union[str, UUID]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get the board changes since a version from get_board_view.
+
+        Changed tickets are reported as inserted (created since the
+        version), moved (their current columns; this includes status-only
+        changes) or removed (deleted, archived, moved off the board or
+        outside the filters). Column counts are refreshed in full. When
+        the version can't be served, reset is True and the client should
+        reload the board.
+
+        Args:
+            session: Database session.
+            since_version: Version from a previous board view or delta.
+            project_id: Optional project ID to filter tickets.
+            user_id: Optional user ID to filter tickets.
+
+        Returns:
+            Dictionary with the new version, reset flag, inserted, moved,
+            removed and column counts.
+        """
+        delta: Dict[str, Any] = {
+            "version": self.change_log.version if self.change_log else None,
+            "reset": False,
+            "inserted": [],
+            "moved": [],
+            "removed": [],
+            "columns": [],
+        }
+        changes = (
+            self.change_log.changes_since(since_version) if self.change_log else None
+        )
+        if changes is None:
+            delta["reset"] = True
+            return delta
+
+        columns = (
+            session.execute(select(BoardColumn).order_by(BoardColumn.sequence_order))
+            .scalars()
+            .all()
+        )
+        columns_of_phase = self._columns_of_phase(columns)
+
+        found: Dict[str, Dict[str, Any]] = {}
+        if changes and columns_of_phase:
+            phase_columns = self._phase_columns(columns_of_phase)
+            query = (
+                self._board_ticket_query(
+                    phase_columns.c.column_id.label("column_id"),
+                    phase_ids=list(columns_of_phase),
+                    project_id=project_id,
+                    user_id=user_id,
+                )
+                .join(phase_columns, phase_columns.c.phase_id == Ticket.phase_id)
+                .where(Ticket.id.in_(list(changes)))
+            )
+            for row in session.execute(query).mappings():
+                entry = found.setdefault(
+                    row["id"], {"column_ids": [], "ticket": self._ticket_card(row)}
+                )
+                entry["column_ids"].append(row["column_id"])
+
+        for ticket_id, change in changes.items():
+            if ticket_id not in found:
+                delta["removed"].append(ticket_id)
+            elif change == CHANGE_INSERTED:
+                delta["inserted"].append(found[ticket_id])
+            else:
+                delta["moved"].append(found[ticket_id])
+
+        counts = self._count_board_tickets(
+            session, columns_of_phase, project_id, user_id
+        )
+        delta["columns"] = [
+            {"id": column.id, **self._column_counts(column, counts.get(column.id, 0))}
+            for column in columns
+        ]
+        return delta
+
+    @staticmethod
+    def _columns_of_phase(columns: List[BoardColumn]) -> Dict[str, List[str]]:
+        """Map each phase ID to every column that includes it, in board order."""
+        columns_of_phase: Dict[str, List[str]] = defaultdict(list)
+        for column in columns:
+            for phase_id in column.phase_mapping:
+                if column.id not in columns_of_phase[phase_id]:
+                    columns_of_phase[phase_id].append(column.id)
+        return dict(columns_of_phase)
+
+    @staticmethod
+    def _phase_columns(columns_of_phase: Dict[str, List[str]]) -> Any:
+        """(phase_id, column_id) VALUES table for joining tickets to columns."""
+        return values(
+            sql_column("phase_id", String),
+            sql_column("column_id", String),
+            name="board_phase_columns",
+        ).data(
+            [
+                (phase_id, column_id)
+                for phase_id, column_ids in columns_of_phase.items()
+                for column_id in column_ids
+            ]
+        )
+
+    def _board_ticket_query(
+        self,
+        *extra_columns: Any,
+        phase_ids: List[str],
+        project_id: Optional[str],
+        user_id: Optional[Union[str, UUID]],
+    ) -> Select:
+        """Lean ticket projection for board cards, with the board filters."""
+        query = select(
+            Ticket.id,
+            Ticket.title,
+            Ticket.phase_id,
+            Ticket.priority,
+            Ticket.status,
+            Ticket.approval_status,
+            Ticket.created_at,
+            # Only the context keys cards use (spec badge, workflow mode)
+            Ticket.context["workflow_mode"].astext.label("workflow_mode"),
+            Ticket.context["spec_id"].astext.label("context_spec_id"),
+            Ticket.context["spec_title"].astext.label("spec_title"),
+            *extra_columns,
+        )
+        return self._apply_board_filters(query, phase_ids, project_id, user_id)
+
+    @staticmethod
+    def _apply_board_filters(
+        query: Select,
+        phase_ids: List[str],
+        project_id: Optional[str],
+        user_id: Optional[Union[str, UUID]],
+    ) -> Select:
+        """Restrict to board phases and filters, excluding archived specs."""
+        query = (
+            query.outerjoin(Spec, Ticket.spec_id == Spec.id)
+            .where(Ticket.phase_id.in_(phase_ids))
+            .where(
+                # Include tickets that either:
+                # 1. Have no spec_id (not linked to any spec), OR
+                # 2. Are linked to a spec that is NOT archived
+                or_(
+                    Ticket.spec_id.is_(None),
+                    Spec.archived.is_(False),
+                )
+            )
+        )
+        if project_id is not None:
+            query = query.where(Ticket.project_id == project_id)
+        if user_id is not None:
+            query = query.where(Ticket.user_id == user_id)
+        return query
+
+    def _count_board_tickets(
+        self,
+        session: Session,
+        columns_of_phase: Dict[str, List[str]],
+        project_id: Optional[str],
+        user_id: Optional[Union[str, UUID]],
+    ) -> Dict[str, int]:
+        """Ticket count per column, from one aggregate query."""
+        if not columns_of_phase:
+            return {}
+        query = self._apply_board_filters(
+            select(Ticket.phase_id, func.count(Ticket.id)).select_from(Ticket),
+            list(columns_of_phase),
+            project_id,
+            user_id,
+        ).group_by(Ticket.phase_id)
+        counts: Dict[str, int] = defaultdict(int)
+        for phase_id, count in session.execute(query):
+            for column_id in columns_of_phase[phase_id]:
+                counts[column_id] += count
+        return counts
+
+    @staticmethod
+    def _column_counts(column: BoardColumn, current_count: int) -> Dict[str, Any]:
+        """WIP counters for a column."""
+        return {
+            "wip_limit": column.wip_limit,
+            "current_count": current_count,
+            "wip_exceeded": (
+                column.wip_limit is not None and current_count > column.wip_limit
+            ),
+        }
+
+    @staticmethod
+    def _ticket_card(row: Any) -> Dict[str, Any]:
+        """Board card for a row of _board_ticket_query."""
+        context = {
+            "workflow_mode": row["workflow_mode"],
+            "spec_id": row["context_spec_id"],
+            "spec_title": row["spec_title"],
+        }
+        return {
+            "id": row["id"],
+            "title": row["title"],
+            "phase_id": row["phase_id"],
+            "priority": row["priority"],
+            "status": row["status"],
+            "approval_status": row["approval_status"],
+            "created_at": row["created_at"],
+            "context": {k: v for k, v in context.items() if v is not None},
+        }
+
+    @staticmethod
+    def _ticket_cursor(card: Dict[str, Any]) -> str:
+        return encode_keyset_cursor(card["created_at"], card["id"])
+
     # Phase to status mapping for syncing status when moving tickets
     PHASE_TO_STATUS: Dict[str, str] = {
         "PHASE_BACKLOG": "backlog",
@@ -243,12 +522,13 @@ class BoardService:
             List of columns with WIP violations.
         """
         columns = session.execute(select(BoardColumn)).scalars().all()
+        phase_counts = self._count_tickets_by_phase(session, project_id)
 
         violations = []
         for column in columns:
             if column.wip_limit is not None:
-                current_count = self._count_tickets_in_column(
-                    session, column, project_id
+                current_count = sum(
+                    phase_counts.get(phase_id, 0) for phase_id in column.phase_mapping
                 )
                 if current_count > column.wip_limit:
                     violations.append(
@@ -334,9 +614,13 @@ class BoardService:
             .all()
         )
 
+        phase_counts = self._count_tickets_by_phase(session, project_id)
+
         stats = []
         for column in columns:
-            ticket_count = self._count_tickets_in_column(session, column, project_id)
+            ticket_count = sum(
+                phase_counts.get(phase_id, 0) for phase_id in column.phase_mapping
+            )
 
             stats.append(
                 {
@@ -359,15 +643,25 @@ class BoardService:
         self, session: Session, column: BoardColumn, project_id: Optional[str] = None
     ) -> int:
         """Count tickets in a column based on phase mapping."""
-        total = 0
-        for phase_id in column.phase_mapping:
-            query = select(func.count(Ticket.id)).where(Ticket.phase_id == phase_id)
-            # Filter by project if specified
-            if project_id is not None:
-                query = query.where(Ticket.project_id == project_id)
-            count = session.execute(query).scalar()
-            total += count or 0
-        return total
+        if not column.phase_mapping:
+            return 0
+        query = select(func.count(Ticket.id)).where(
+            Ticket.phase_id.in_(column.phase_mapping)
+        )
+        # Filter by project if specified
+        if project_id is not None:
+            query = query.where(Ticket.project_id == project_id)
+        return session.execute(query).scalar() or 0
+
+    def _count_tickets_by_phase(
+        self, session: Session, project_id: Optional[str] = None
+    ) -> Dict[str, int]:
+        """Count tickets per phase in one grouped query."""
+        query = select(Ticket.phase_id, func.count(Ticket.id)).group_by(Ticket.phase_id)
+        # Filter by project if specified
+        if project_id is not None:
+            query = query.where(Ticket.project_id == project_id)
+        return {phase_id: count for phase_id, count in session.execute(query)}
 
     def _find_column_for_phase(self, session: Session, phase_id: str) -> Optional[str]:
         """Find column ID for a given phase."""
@@ -0,0 +1,156 @@
+"""Versioned log of board ticket changes, fed by ticket events.
+
+The board page used to re-fetch the whole board after every move. With
+the change log, a board view carries a version, and the client later
+asks for the delta since that version: the log says which tickets
+changed (and which were created), and BoardService.get_board_delta loads
+just those tickets to report moves, inserts and removals.
+
+The log is in memory, per process. A version is "<epoch>:<sequence>";
+the epoch is random per log, so a version from another API worker or
+from before a restart, or one older than the retained window, is
+rejected and the client reloads the full board. Events arrive on the
+event bus listener thread, so all access is guarded by a lock.
+"""
+
+import threading
+from collections import deque
+from typing import Deque, Dict, Iterable, Optional, Tuple
+from uuid import uuid4
+
+from omoi_os.logging import get_logger
+from omoi_os.services.event_bus import EventBusService, SystemEvent
+from omoi_os.services.event_bus_listener import EventBusListener, ListenerSingleton
+
+logger = get_logger(__name__)
+
+# Events after which a ticket may have changed column, status or approval
+BOARD_EVENT_TYPES = (
+    "TICKET_CREATED",
+    "ticket_created",
+    "TICKET_STATUS_CHANGED",
+    "TICKET_APPROVED",
+    "TICKET_REJECTED",
+    "TICKET_TIMED_OUT",
+    "board.ticket_moved",
+    "ticket.phase_transitioned",
+    "ticket.status_transitioned",
+    "ticket.blocked",
+    "ticket.unblocked",
+)
+
+_INSERT_EVENT_TYPES = frozenset({"TICKET_CREATED", "ticket_created"})
+
+CHANGE_INSERTED = "inserted"
+CHANGE_UPDATED = "updated"
+
+
+class BoardChangeLog:
+    """Bounded, versioned log of ticket IDs changed by board events.
+
+    Args:
+        max_entries: Changes retained; older versions force a full reload
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.epoch = uuid4().hex[:8]
+        self._sequence = 0
+        self._entries: Deque[Tuple[int, str, str]] = deque(maxlen=max_entries)
+        self._lock = threading.Lock()
+        self._listener = EventBusListener(
+            "board-change-listener", on_error=self._reset_epoch
+        )
+
+    @property
+    def version(self) -> str:
+        """Version covering every change recorded so far."""
+        with self._lock:
+            return f"{self.epoch}:{self._sequence}"
+
+    def record(self, ticket_id: str, change: str = CHANGE_UPDATED) -> None:
+        """Record that a ticket changed (or was created)."""
+        with self._lock:
+            self._sequence += 1
+            self._entries.append((self._sequence, ticket_id, change))
+
+    def changes_since(self, version: str) -> Optional[Dict[str, str]]:
+        """
+        Tickets changed after a version, with how they changed.
+
+        A ticket created after the version is CHANGE_INSERTED, even if it
+        changed again later; any other ticket is CHANGE_UPDATED.
+
+        Returns:
+            Mapping of ticket ID to change, or None if the version is not
+            from this log or is older than the retained window
+        """
+        epoch, _, sequence = version.partition(":")
+        if not sequence.isdigit():
+            return None
+        since = int(sequence)
+        with self._lock:
+            if epoch != self.epoch or since > self._sequence:
+                return None
+            oldest = self._entries[0][0] if self._entries else self._sequence + 1
+            if since < oldest - 1:
+                return None  # Changes after `since` were already dropped
+            changes: Dict[str, str] = {}
+            for seq, ticket_id, change in self._entries:
+                if seq > since and changes.get(ticket_id) != CHANGE_INSERTED:
+                    changes[ticket_id] = change
+            return changes
+
+    def handle_event(self, event: SystemEvent) -> None:
+        """Record the ticket a board event is about."""
+        change = (
+            CHANGE_INSERTED
+            if event.event_type in _INSERT_EVENT_TYPES
+            else CHANGE_UPDATED
+        )
+        self.record(str(event.entity_id), change)
+
+    def attach_event_bus(
+        self,
+        event_bus: EventBusService,
+        event_types: Iterable[str] = BOARD_EVENT_TYPES,
+    ) -> bool:
+        """
+        Subscribe to board events and start the listener thread.
+
+        Args:
+            event_bus: Dedicated event bus (see event_bus_listener)
+            event_types: Event types that may change the board
+
+        Returns:
+            True if the listener is running, False if Redis is unavailable
+            (deltas are then not offered)
+        """
+        return self._listener.attach(event_bus, event_types, self.handle_event)
+
+    @property
+    def listening(self) -> bool:
+        """Whether the event bus listener thread is alive."""
+        return self._listener.listening
+
+    def stop(self) -> None:
+        """Stop the listener thread after its current read returns."""
+        self._listener.stop()
+
+    def _reset_epoch(self) -> None:
+        # Events may have been missed; invalidate issued versions
+        with self._lock:
+            self.epoch = uuid4().hex[:8]
+            self._entries.clear()
+
+
+_board_change_log: ListenerSingleton[BoardChangeLog] = ListenerSingleton(BoardChangeLog)
+
+
+def get_board_change_log() -> BoardChangeLog:
+    """Get the process-wide board change log."""
+    return _board_change_log.get()
+
+
+def reset_board_change_log() -> None:
+    """Reset the process-wide board change log (useful for tests)."""
+    _board_change_log.reset()
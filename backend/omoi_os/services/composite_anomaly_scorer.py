@@ -7,6 +7,7 @@ from sqlalchemy import or_
 from omoi_os.models.agent import Agent
 from omoi_os.models.agent_baseline import AgentBaseline
 from omoi_os.models.task import Task
+from omoi_os.models.task_dependency import TaskDependency
 from omoi_os.services.baseline_learner import BaselineLearner
 from omoi_os.services.database import DatabaseService
 from omoi_os.utils.datetime import utc_now
@@ -289,30 +290,23 @@ class CompositeAnomalyScorer:
         if not agent_tasks:
             return 0.0
 
-        # Count tasks that depend on these tasks
-        blocking_count = 0
-        total_dependents = 0
-
-        for task in agent_tasks:
-            # Find tasks that depend on this task
-            dependents = (
-                session.query(Task)
-                .filter(
-                    Task.dependencies.isnot(None),
-                    Task.status == "pending",
-                )
-                .all()
+        # Pending dependents of these tasks via the reverse edge index
+        dependent_priorities = (
+            session.query(Task.priority)
+            .join(TaskDependency, TaskDependency.task_id == Task.id)
+            .filter(
+                TaskDependency.depends_on_task_id.in_([t.id for t in agent_tasks]),
+                Task.status == "pending",
             )
+            .all()
+        )
 
-            for dependent in dependents:
-                if dependent.dependencies and dependent.dependencies.get("depends_on"):
-                    depends_on = dependent.dependencies["depends_on"]
-                    if isinstance(depends_on, list) and task.id in depends_on:
-                        total_dependents += 1
-                        if dependent.priority == "CRITICAL":
-                            blocking_count += 2  # CRITICAL tasks count double
-                        else:
-                            blocking_count += 1
+        blocking_count = 0
+        for (priority,) in dependent_priorities:
+            if priority == "CRITICAL":
+                blocking_count += 2  # CRITICAL tasks count double
+            else:
+                blocking_count += 1
 
         # Normalize: max impact if blocking many high-priority tasks
         # Normalize to [0, 1] range (assuming max reasonable blocking is 10 tasks)
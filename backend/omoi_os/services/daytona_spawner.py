@@ -13,7 +13,7 @@ The spawner:
 import asyncio
 import shlex
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
@@ -28,6 +28,12 @@ from omoi_os.services.ownership_validation import (
     OwnershipValidationService,
     OwnershipConflictError,
 )
+from omoi_os.services.sandbox_pool import (
+    DaytonaSandboxProvider,
+    SandboxProfile,
+    SandboxProvider,
+    WarmSandboxPool,
+)
 from omoi_os.utils.datetime import utc_now
 
 # TYPE_CHECKING import for TaskRequirements to avoid circular imports
@@ -131,11 +137,16 @@ class DaytonaSpawnerService:
         self.sandbox_memory_gb = min(daytona_settings.sandbox_memory_gb, 8)
         self.sandbox_cpu = min(daytona_settings.sandbox_cpu, 4)
         self.sandbox_disk_gb = min(daytona_settings.sandbox_disk_gb, 10)
+        self.sdk_max_concurrency = daytona_settings.sdk_max_concurrency
 
         # In-memory tracking of active sandboxes
         self._sandboxes: Dict[str, SandboxInfo] = {}
         self._task_to_sandbox: Dict[str, str] = {}  # task_id -> sandbox_id
 
+        # Warm pool of pre-provisioned sandboxes (see start_warm_pool)
+        self.warm_pool: Optional[WarmSandboxPool] = None
+        self._sandbox_provider: Optional[DaytonaSandboxProvider] = None
+
     async def spawn_for_task(
         self,
         task_id: str,
@@ -960,7 +971,9 @@ class DaytonaSpawnerService:
             daytona_sandbox = info.extra_data.get("daytona_sandbox") if info else None
             if daytona_sandbox:
                 try:
-                    preview_link = daytona_sandbox.get_preview_link(port)
+                    preview_link = await self._get_sandbox_provider().run(
+                        "get_preview_link", daytona_sandbox.get_preview_link, port
+                    )
                     preview_url = preview_link.url
                     preview_token = getattr(preview_link, "token", None)
 
@@ -1317,6 +1330,76 @@ class DaytonaSpawnerService:
 
             raise RuntimeError(f"Failed to spawn sandbox for phase {phase}: {e}") from e
 
+    def _sandbox_profile(self, runtime: str) -> SandboxProfile:
+        """Sandbox profile for this spawner's snapshot/image and resources."""
+        return SandboxProfile(
+            snapshot=self.sandbox_snapshot,
+            image=self.sandbox_image,
+            cpu=self.sandbox_cpu,
+            memory_gb=self.sandbox_memory_gb,
+            disk_gb=self.sandbox_disk_gb,
+            runtime=runtime,
+        )
+
+    def _get_sandbox_provider(self) -> DaytonaSandboxProvider:
+        """Daytona provider: one SDK client, SDK calls run off the event loop."""
+        if self._sandbox_provider is None:
+            self._sandbox_provider = DaytonaSandboxProvider(
+                api_key=self.daytona_api_key,
+                api_url=self.daytona_api_url,
+                max_concurrency=self.sdk_max_concurrency,
+            )
+        return self._sandbox_provider
+
+    def get_sdk_stats(self) -> Dict[str, Any]:
+        """Daytona SDK call stats, with queue wait and execution time per operation."""
+        if self._sandbox_provider is None:
+            return {}
+        return self._sandbox_provider.stats
+
+    async def start_warm_pool(
+        self, provider: Optional[SandboxProvider] = None
+    ) -> Optional[WarmSandboxPool]:
+        """Start the warm sandbox pool if enabled in settings.
+
+        Args:
+            provider: Sandbox provider (defaults to Daytona)
+
+        Returns:
+            The running pool, or None if daytona.warm_pool_size is 0
+        """
+        if self.warm_pool is not None:
+            return self.warm_pool
+
+        settings = load_daytona_settings()
+        if settings.warm_pool_size <= 0:
+            return None
+
+        async def provision(sandbox: Any, profile: SandboxProfile) -> None:
+            await self._get_sandbox_provider().run(
+                "provision", self._provision_sandbox, sandbox, profile.runtime
+            )
+
+        pool = WarmSandboxPool(
+            provider=provider or self._get_sandbox_provider(),
+            provision=provision,
+            max_idle=timedelta(seconds=settings.warm_pool_max_idle_seconds),
+            refill_interval=settings.warm_pool_refill_interval_seconds,
+        )
+        for runtime in settings.warm_pool_runtimes:
+            pool.add_profile(self._sandbox_profile(runtime), settings.warm_pool_size)
+        await pool.start()
+        self.warm_pool = pool
+        return pool
+
+    async def stop_warm_pool(self) -> None:
+        """Stop refilling and delete sandboxes still waiting in the pool."""
+        if self.warm_pool is None:
+            return
+        pool, self.warm_pool = self.warm_pool, None
+        logger.info("warm_sandbox_pool_stats", **pool.stats)
+        await pool.close()
+
     async def _create_daytona_sandbox(
         self,
         sandbox_id: str,
@@ -1338,75 +1421,27 @@ class DaytonaSpawnerService:
             execution_mode: Skill loading mode - determines which skills are loaded
             continuous_mode: Whether continuous iteration mode is enabled
         """
+        provisioned = False
         try:
-            from daytona import (
-                Daytona,
-                DaytonaConfig,
-                CreateSandboxFromImageParams,
-                CreateSandboxFromSnapshotParams,
-                Resources,
-            )
-
-            daytona_config = DaytonaConfig(
-                api_key=self.daytona_api_key,
-                api_url=self.daytona_api_url,
-                target="us",
-            )
-            daytona = Daytona(daytona_config)
-
-            # Configure resources for sandbox (memory, CPU, disk)
-            # Higher memory helps prevent OOM kills (exit code -9)
-            resources = Resources(
-                cpu=self.sandbox_cpu,
-                memory=self.sandbox_memory_gb,
-                disk=self.sandbox_disk_gb,
-            )
-
-            sandbox = None
-
-            # Create sandbox from snapshot if provided, otherwise use image
-            if self.sandbox_snapshot:
-                logger.info(
-                    f"Creating sandbox from snapshot: {self.sandbox_snapshot} "
-                    f"with resources: {self.sandbox_cpu} CPU, "
-                    f"{self.sandbox_memory_gb} GiB RAM, {self.sandbox_disk_gb} GiB disk"
-                )
+            profile = self._sandbox_profile(runtime)
+            pooled = None
+            if self.warm_pool is not None:
+                pooled = await self.warm_pool.lease(profile)
+
+            if pooled is not None:
+                # Warm pool hit: already created with runtime deps installed
+                sandbox = pooled.sandbox
+                provisioned = True
                 try:
-                    params = CreateSandboxFromSnapshotParams(
-                        snapshot=self.sandbox_snapshot,
-                        labels=labels or None,
-                        ephemeral=True,  # Auto-delete when stopped
-                        public=False,
-                        resources=resources,
-                        auto_stop_interval=30,  # Safety net: auto-stop after 30min idle (our own idle detection should fire first)
+                    await self._get_sandbox_provider().run(
+                        "set_labels",
+                        sandbox.set_labels,
+                        {**(sandbox.labels or {}), **labels},
                     )
-                    sandbox = daytona.create(params=params, timeout=120)
-                except Exception as snapshot_error:
-                    # Snapshot may be inactive/expired/unavailable -- fall back to image
-                    logger.warning(
-                        f"Snapshot '{self.sandbox_snapshot}' creation failed: {snapshot_error}. "
-                        f"Falling back to image-based sandbox creation."
-                    )
-                    # sandbox remains None, will be created from image below
-
-            if sandbox is None:
-                image = (
-                    self.sandbox_image or "nikolaik/python-nodejs:python3.12-nodejs22"
-                )
-                logger.info(
-                    f"Creating sandbox from image: {image} "
-                    f"with resources: {self.sandbox_cpu} CPU, "
-                    f"{self.sandbox_memory_gb} GiB RAM, {self.sandbox_disk_gb} GiB disk"
-                )
-                params = CreateSandboxFromImageParams(
-                    image=image,
-                    labels=labels or None,
-                    ephemeral=True,  # Auto-delete when stopped
-                    public=False,
-                    resources=resources,
-                    auto_stop_interval=30,  # Safety net: auto-stop after 30min idle (our own idle detection should fire first)
-                )
-                sandbox = daytona.create(params=params, timeout=120)
+                except Exception as e:
+                    logger.warning(f"Failed to label pooled sandbox {sandbox.id}: {e}")
+            else:
+                sandbox = await self._get_sandbox_provider().create(profile, labels)
 
             logger.info(f"Daytona sandbox {sandbox.id} created for {sandbox_id}")
 
@@ -1415,6 +1450,7 @@ class DaytonaSpawnerService:
             if info:
                 info.extra_data["daytona_sandbox"] = sandbox
                 info.extra_data["daytona_sandbox_id"] = sandbox.id
+                info.extra_data["warm_pool_hit"] = provisioned
 
         except ImportError as e:
             # Daytona SDK not available - only use mock in development
@@ -1452,6 +1488,7 @@ class DaytonaSpawnerService:
                 runtime,
                 execution_mode,
                 continuous_mode=continuous_mode,
+                provisioned=provisioned,
             )
             logger.info(f"Worker started successfully in sandbox {sandbox.id}")
         except Exception as e:
@@ -1466,41 +1503,16 @@ class DaytonaSpawnerService:
                 f"Worker startup failed in sandbox {sandbox.id}: {e}"
             ) from e
 
-    async def _start_worker_in_sandbox(
-        self,
-        sandbox: Any,
-        env_vars: Dict[str, str],
-        runtime: str = "openhands",
-        execution_mode: str = "implementation",
-        continuous_mode: bool = False,
-    ) -> None:
-        """Start the sandbox worker inside the Daytona sandbox.
+    def _provision_sandbox(self, sandbox: Any, runtime: str) -> None:
+        """Install the task-independent runtime tooling in a sandbox.
+
+        Runs inline for freshly created sandboxes and ahead of time for
+        warm pool sandboxes.
 
         Args:
             sandbox: Daytona sandbox instance
-            env_vars: Environment variables for the worker
             runtime: Agent runtime - "openhands" or "claude"
-            execution_mode: Skill loading mode - determines which skills are loaded
-            continuous_mode: Whether continuous iteration mode is enabled
         """
-        # Extract git clone parameters (don't pass token to env vars for security)
-        github_repo = env_vars.pop("GITHUB_REPO", None)
-        github_token = env_vars.pop("GITHUB_TOKEN", None)
-        github_owner = env_vars.pop("GITHUB_REPO_OWNER", None)
-        github_repo_name = env_vars.pop("GITHUB_REPO_NAME", None)
-        # Extract branch name but keep it in env_vars for the worker
-        branch_name = env_vars.get("BRANCH_NAME")
-
-        # Helper function to escape environment variable values for shell export
-        def escape_env_value(v: str) -> str:
-            """Escape environment variable value for shell export."""
-            # Use shlex.quote to properly escape shell values
-            return shlex.quote(str(v))
-
-        # NOTE: We delay writing env file and bashrc until AFTER all env vars are set
-        # (including GITHUB_TOKEN which gets added after git clone).
-        # See the "Persist final environment" section below.
-
         # Install required packages based on runtime
         # Use uv for faster installation if available, fallback to pip
         logger.info(f"Installing {runtime} dependencies in sandbox...")
@@ -1545,6 +1557,70 @@ class DaytonaSpawnerService:
             logger.warning(f"Failed to install GitHub CLI: {e}")
             # Continue without gh - agent can still use git commands directly
 
+    async def _start_worker_in_sandbox(
+        self,
+        sandbox: Any,
+        env_vars: Dict[str, str],
+        runtime: str = "openhands",
+        execution_mode: str = "implementation",
+        continuous_mode: bool = False,
+        provisioned: bool = False,
+    ) -> None:
+        """Start the sandbox worker inside the Daytona sandbox.
+
+        The setup is a long sequence of blocking SDK calls, so it runs on the
+        provider's SDK thread pool instead of the event loop.
+
+        Args:
+            sandbox: Daytona sandbox instance
+            env_vars: Environment variables for the worker
+            runtime: Agent runtime - "openhands" or "claude"
+            execution_mode: Skill loading mode - determines which skills are loaded
+            continuous_mode: Whether continuous iteration mode is enabled
+            provisioned: Runtime deps already installed (warm pool sandbox)
+        """
+        await self._get_sandbox_provider().run(
+            "start_worker",
+            self._setup_worker_in_sandbox,
+            sandbox,
+            env_vars,
+            runtime,
+            execution_mode,
+            continuous_mode,
+            provisioned,
+        )
+
+    def _setup_worker_in_sandbox(
+        self,
+        sandbox: Any,
+        env_vars: Dict[str, str],
+        runtime: str,
+        execution_mode: str,
+        continuous_mode: bool,
+        provisioned: bool,
+    ) -> None:
+        """Blocking body of _start_worker_in_sandbox (see its arguments)."""
+        # Extract git clone parameters (don't pass token to env vars for security)
+        github_repo = env_vars.pop("GITHUB_REPO", None)
+        github_token = env_vars.pop("GITHUB_TOKEN", None)
+        github_owner = env_vars.pop("GITHUB_REPO_OWNER", None)
+        github_repo_name = env_vars.pop("GITHUB_REPO_NAME", None)
+        # Extract branch name but keep it in env_vars for the worker
+        branch_name = env_vars.get("BRANCH_NAME")
+
+        # Helper function to escape environment variable values for shell export
+        def escape_env_value(v: str) -> str:
+            """Escape environment variable value for shell export."""
+            # Use shlex.quote to properly escape shell values
+            return shlex.quote(str(v))
+
+        # NOTE: We delay writing env file and bashrc until AFTER all env vars are set
+        # (including GITHUB_TOKEN which gets added after git clone).
+        # See the "Persist final environment" section below.
+
+        if not provisioned:
+            self._provision_sandbox(sandbox, runtime)
+
         # Upload Claude skills to sandbox (Claude runtime only)
         if runtime == "claude":
             logger.info(f"Uploading Claude skills for '{execution_mode}' mode...")
@@ -3305,7 +3381,7 @@ if __name__ == "__main__":
 
                 if daytona_sandbox:
                     # Terminate via cached Daytona object
-                    daytona_sandbox.stop()
+                    await self._get_sandbox_provider().run("stop", daytona_sandbox.stop)
                     logger.info(
                         f"Daytona sandbox {sandbox_id} terminated via cached reference"
                     )
@@ -3334,20 +3410,13 @@ if __name__ == "__main__":
         logger.info(f"Attempting direct Daytona API termination for {sandbox_id}")
 
         try:
-            from daytona import Daytona, DaytonaConfig
-
-            daytona_settings = load_daytona_settings()
-            config = DaytonaConfig(
-                api_key=self.daytona_api_key or daytona_settings.api_key,
-                api_url=self.daytona_api_url or daytona_settings.api_url,
-                target="us",
-            )
-
-            daytona = Daytona(config)
+            provider = self._get_sandbox_provider()
 
             try:
-                sandbox = daytona.get(sandbox_id)
-                sandbox.stop()
+                # Lookup and stop both run on the teardown pool
+                await provider.run(
+                    "stop", lambda: provider.client.get(sandbox_id).stop()
+                )
                 logger.info(f"Daytona sandbox {sandbox_id} terminated via direct API")
 
                 # Update in-memory cache if it exists
@@ -3456,21 +3525,13 @@ if __name__ == "__main__":
             return None
 
         try:
-            from daytona import Daytona, DaytonaConfig
-
-            daytona_settings = load_daytona_settings()
-            config = DaytonaConfig(
-                api_key=self.daytona_api_key or daytona_settings.api_key,
-                api_url=self.daytona_api_url or daytona_settings.api_url,
-                target="us",
-            )
-
-            daytona = Daytona(config)
-            sandbox = daytona.get(sandbox_id)
+            provider = self._get_sandbox_provider()
+            sandbox = await provider.get(sandbox_id)
 
             # Get recent log lines
-            result = sandbox.process.exec(
-                f"tail -n {lines} /tmp/worker.log 2>/dev/null || echo '[Log file not found or empty]'"
+            result = await provider.exec(
+                sandbox,
+                f"tail -n {lines} /tmp/worker.log 2>/dev/null || echo '[Log file not found or empty]'",
             )
             output = result.result if hasattr(result, "result") else str(result)
             return output if output.strip() != "[Log file not found or empty]" else None
@@ -3494,21 +3555,13 @@ if __name__ == "__main__":
             return None
 
         try:
-            from daytona import Daytona, DaytonaConfig
-
-            daytona_settings = load_daytona_settings()
-            config = DaytonaConfig(
-                api_key=self.daytona_api_key or daytona_settings.api_key,
-                api_url=self.daytona_api_url or daytona_settings.api_url,
-                target="us",
-            )
-
-            daytona = Daytona(config)
-            sandbox = daytona.get(sandbox_id)
+            provider = self._get_sandbox_provider()
+            sandbox = await provider.get(sandbox_id)
 
             # Get full log file
-            result = sandbox.process.exec(
-                "cat /tmp/worker.log 2>/dev/null || echo '[Log file not found]'"
+            result = await provider.exec(
+                sandbox,
+                "cat /tmp/worker.log 2>/dev/null || echo '[Log file not found]'",
             )
             output = result.result if hasattr(result, "result") else str(result)
             return output if output.strip() != "[Log file not found]" else None
@@ -3546,13 +3599,17 @@ if __name__ == "__main__":
 
             import base64
 
+            provider = self._get_sandbox_provider()
+
             # Claude Code stores sessions in ~/.claude/projects/<project_key>/<session_id>.jsonl
             # We need to find the .jsonl file in the sessions directory
             claude_dir = "/root/.claude/projects"
 
             try:
                 # List project directories
-                projects = daytona_sandbox.fs.list_files(claude_dir)
+                projects = await provider.run(
+                    "list_files", daytona_sandbox.fs.list_files, claude_dir
+                )
                 if not projects:
                     logger.debug(f"No Claude projects found in sandbox {sandbox_id}")
                     return None
@@ -3563,7 +3620,11 @@ if __name__ == "__main__":
                     if hasattr(project, "is_dir") and project.is_dir:
                         project_path = f"{claude_dir}/{project.name}"
                         try:
-                            files = daytona_sandbox.fs.list_files(project_path)
+                            files = await provider.run(
+                                "list_files",
+                                daytona_sandbox.fs.list_files,
+                                project_path,
+                            )
                             for f in files:
                                 if hasattr(f, "name") and f.name.endswith(".jsonl"):
                                     transcript_files.append(f"{project_path}/{f.name}")
@@ -3595,7 +3656,9 @@ if __name__ == "__main__":
                 logger.info(
                     f"Extracting transcript from {transcript_path} in sandbox {sandbox_id}"
                 )
-                content = daytona_sandbox.fs.download_file(transcript_path)
+                content = await provider.run(
+                    "download_file", daytona_sandbox.fs.download_file, transcript_path
+                )
 
                 if content:
                     # Encode to base64
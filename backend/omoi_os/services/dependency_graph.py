@@ -6,16 +6,31 @@ from collections import defaultdict, deque
 from sqlalchemy.orm import Session
 
 from omoi_os.models.task import Task
+from omoi_os.models.task_dependency import TaskDependency
 from omoi_os.models.ticket import Ticket
 from omoi_os.models.task_discovery import TaskDiscovery
 from omoi_os.services.database import DatabaseService
+from omoi_os.services.graph_snapshot_cache import GraphSnapshotCache
 
 
 class DependencyGraphService:
     """Builds dependency graphs from tasks, tickets, and discoveries."""
 
-    def __init__(self, db: DatabaseService):
+    def __init__(
+        self,
+        db: DatabaseService,
+        snapshot_cache: Optional[GraphSnapshotCache] = None,
+    ):
+        """
+        Initialize the graph service.
+
+        Args:
+            db: Database service
+            snapshot_cache: Serves repeated project graphs from memory
+                (only pass one whose event listener is running)
+        """
         self.db = db
+        self.snapshot_cache = snapshot_cache
 
     def build_ticket_graph(
         self,
@@ -69,13 +84,16 @@ class DependencyGraphService:
                     .all()
                 )
 
-            # 3. Build nodes
-            nodes = self._build_nodes(tasks, discoveries, session)
+            # 3. Load dependency edges for these tasks
+            depends_on = self._load_dependency_edges(session, task_ids)
+
+            # 4. Build nodes
+            nodes = self._build_nodes(tasks, discoveries, session, depends_on)
 
-            # 4. Build edges
-            edges = self._build_edges(tasks, discoveries)
+            # 5. Build edges
+            edges = self._build_edges(tasks, discoveries, depends_on)
 
-            # 5. Calculate metadata
+            # 6. Calculate metadata
             metadata = self._calculate_metadata(tasks, nodes, edges)
 
             return {"nodes": nodes, "edges": edges, "metadata": metadata}
@@ -86,6 +104,10 @@ class DependencyGraphService:
         """
         Build dependency graph for a project's tickets.
 
+        With a snapshot cache, a graph built earlier is returned as long as
+        no task or ticket event has touched the project since; the returned
+        graph is then shared and must not be modified.
+
         Args:
             project_id: Project ID to filter tickets (required for proper filtering)
             include_resolved: Whether to include completed tasks
@@ -93,6 +115,15 @@ class DependencyGraphService:
         Returns:
             Graph structure with nodes and edges
         """
+        cache_key = ("project", project_id, include_resolved)
+        cache_token = None
+        if self.snapshot_cache is not None:
+            graph = self.snapshot_cache.get(cache_key)
+            if graph is not None:
+                return graph
+            # Taken before the read so put() can spot events that race it
+            cache_token = self.snapshot_cache.token()
+
         with self.db.get_session() as session:
             # Get tickets filtered by project_id
             query = session.query(Ticket)
@@ -103,43 +134,44 @@ class DependencyGraphService:
             # Get all tasks for these tickets
             ticket_ids = [t.id for t in tickets]
             tasks = session.query(Task).filter(Task.ticket_id.in_(ticket_ids)).all()
+            # Completed tasks left out below still invalidate the snapshot
+            entity_ids = {project_id, *ticket_ids, *(t.id for t in tasks)}
+            entity_ids.discard(None)
 
             if not include_resolved:
                 tasks = [t for t in tasks if t.status != "completed"]
 
             # Build graph
-            nodes = self._build_nodes(tasks, [], session)
-            edges = self._build_edges(tasks, [])
+            depends_on = self._load_dependency_edges(session, [t.id for t in tasks])
+            nodes = self._build_nodes(tasks, [], session, depends_on)
+            edges = self._build_edges(tasks, [], depends_on)
 
-            # Build ticket lookup for dependency resolution
+            # Index tickets, their task counts and reverse blocked_by edges
+            # in one pass each, instead of rescanning per ticket
             ticket_dict = {t.id: t for t in tickets}
-
-            # Add ticket nodes
+            task_count: Dict[str, int] = defaultdict(int)
+            for task in tasks:
+                task_count[task.ticket_id] += 1
+            blocked_by_ticket: Dict[str, List[str]] = {}
+            blocks_count: Dict[str, int] = defaultdict(int)
             for ticket in tickets:
-                # Count tasks for this ticket
-                ticket_tasks = [t for t in tasks if t.ticket_id == ticket.id]
-
-                # Get blocked_by from ticket dependencies
                 blocked_by = []
                 if ticket.dependencies:
                     blocked_by = ticket.dependencies.get("blocked_by", [])
+                blocked_by_ticket[ticket.id] = blocked_by
+                for blocker_id in set(blocked_by):
+                    blocks_count[blocker_id] += 1
 
-                # Calculate blocks_count from other tickets that have this ticket in blocked_by
-                blocks_count = 0
-                for other_ticket in tickets:
-                    if other_ticket.dependencies:
-                        if ticket.id in other_ticket.dependencies.get("blocked_by", []):
-                            blocks_count += 1
+            # Add ticket nodes
+            for ticket in tickets:
+                blocked_by = blocked_by_ticket[ticket.id]
 
                 # Ticket is blocked if is_blocked flag OR has incomplete blocking tickets
-                is_blocked = ticket.is_blocked
-                if not is_blocked and blocked_by:
-                    # Check if any blocking tickets are not done
-                    for blocker_id in blocked_by:
-                        blocker = ticket_dict.get(blocker_id)
-                        if blocker and blocker.status != "done":
-                            is_blocked = True
-                            break
+                is_blocked = ticket.is_blocked or any(
+                    blocker_id in ticket_dict
+                    and ticket_dict[blocker_id].status != "done"
+                    for blocker_id in blocked_by
+                )
 
                 nodes.append(
                     {
@@ -151,8 +183,8 @@ class DependencyGraphService:
                         "priority": ticket.priority,
                         "phase_id": ticket.phase_id,
                         "is_blocked": is_blocked,
-                        "blocks_count": blocks_count,
-                        "task_count": len(ticket_tasks),
+                        "blocks_count": blocks_count[ticket.id],
+                        "task_count": task_count[ticket.id],
                         "ticket_id": ticket.id,
                         "blocked_by": blocked_by,  # Include for frontend tooltip
                     }
@@ -171,38 +203,89 @@ class DependencyGraphService:
 
             # Add ticket → ticket dependency edges (blocked_by relationships)
             for ticket in tickets:
-                if ticket.dependencies:
-                    blocked_by = ticket.dependencies.get("blocked_by", [])
-                    for blocker_id in blocked_by:
-                        # Only add edge if blocking ticket exists in our set
-                        if blocker_id in ticket_dict:
-                            edges.append(
-                                {
-                                    "source": f"ticket-{blocker_id}",
-                                    "target": f"ticket-{ticket.id}",
-                                    "type": "ticket_blocks",
-                                    "label": "blocks",
-                                }
-                            )
+                for blocker_id in blocked_by_ticket[ticket.id]:
+                    # Only add edge if blocking ticket exists in our set
+                    if blocker_id in ticket_dict:
+                        edges.append(
+                            {
+                                "source": f"ticket-{blocker_id}",
+                                "target": f"ticket-{ticket.id}",
+                                "type": "ticket_blocks",
+                                "label": "blocks",
+                            }
+                        )
 
             metadata = self._calculate_metadata(tasks, nodes, edges)
 
-            return {"nodes": nodes, "edges": edges, "metadata": metadata}
+            graph = {"nodes": nodes, "edges": edges, "metadata": metadata}
+
+        if self.snapshot_cache is not None:
+            self.snapshot_cache.put(cache_key, graph, entity_ids, token=cache_token)
+        return graph
+
+    def _load_dependency_edges(
+        self, session: Session, task_ids: List[str]
+    ) -> Dict[str, List[str]]:
+        """
+        Load forward dependency edges for a set of tasks in one query.
+
+        Returns:
+            Mapping of task ID to the IDs it depends on
+        """
+        depends_on: Dict[str, List[str]] = defaultdict(list)
+        if not task_ids:
+            return depends_on
+
+        rows = (
+            session.query(TaskDependency.task_id, TaskDependency.depends_on_task_id)
+            .filter(TaskDependency.task_id.in_(task_ids))
+            .all()
+        )
+        for task_id, dep_id in rows:
+            depends_on[task_id].append(dep_id)
+        return depends_on
 
     def _build_nodes(
-        self, tasks: List[Task], discoveries: List[TaskDiscovery], session: Session
+        self,
+        tasks: List[Task],
+        discoveries: List[TaskDiscovery],
+        session: Session,
+        depends_on: Dict[str, List[str]],
     ) -> List[Dict[str, Any]]:
         """Build node list from tasks and discoveries."""
         nodes = []
         task_dict = {task.id: task for task in tasks}
 
+        # Reverse index restricted to the task set: who is blocked by whom
+        blocked_by_task: Dict[str, List[str]] = defaultdict(list)
+        for task_id, dep_ids in depends_on.items():
+            for dep_id in dep_ids:
+                blocked_by_task[dep_id].append(task_id)
+
+        # Statuses of dependencies outside the task set, in one query
+        external_ids = {
+            dep_id
+            for dep_ids in depends_on.values()
+            for dep_id in dep_ids
+            if dep_id not in task_dict
+        }
+        external_status: Dict[str, str] = {}
+        if external_ids:
+            external_status = dict(
+                session.query(Task.id, Task.status)
+                .filter(Task.id.in_(external_ids))
+                .all()
+            )
+
         # Build task nodes
         for task in tasks:
             # Check if task is blocked
-            is_blocked = not self._check_dependencies_complete(task, task_dict, session)
+            is_blocked = not self._check_dependencies_complete(
+                depends_on.get(task.id, []), task_dict, external_status
+            )
 
             # Count how many tasks this blocks
-            blocks_count = len(self._get_blocked_tasks(task.id, tasks))
+            blocks_count = len(blocked_by_task.get(task.id, []))
 
             nodes.append(
                 {
@@ -256,7 +339,10 @@ class DependencyGraphService:
         return nodes
 
     def _build_edges(
-        self, tasks: List[Task], discoveries: List[TaskDiscovery]
+        self,
+        tasks: List[Task],
+        discoveries: List[TaskDiscovery],
+        depends_on: Dict[str, List[str]],
     ) -> List[Dict[str, Any]]:
         """Build edge list from tasks and discoveries."""
         edges = []
@@ -264,18 +350,16 @@ class DependencyGraphService:
 
         # 1. Build depends_on edges
         for task in tasks:
-            if task.dependencies:
-                depends_on = task.dependencies.get("depends_on", [])
-                for dep_id in depends_on:
-                    if dep_id in task_dict:
-                        edges.append(
-                            {
-                                "source": dep_id,
-                                "target": task.id,
-                                "type": "depends_on",
-                                "label": "depends on",
-                            }
-                        )
+            for dep_id in depends_on.get(task.id, []):
+                if dep_id in task_dict:
+                    edges.append(
+                        {
+                            "source": dep_id,
+                            "target": task.id,
+                            "type": "depends_on",
+                            "label": "depends on",
+                        }
+                    )
 
         # 2. Build parent_child edges
         for task in tasks:
@@ -306,40 +390,22 @@ class DependencyGraphService:
         return edges
 
     def _check_dependencies_complete(
-        self, task: Task, task_dict: Dict[str, Task], session: Session
+        self,
+        dep_ids: List[str],
+        task_dict: Dict[str, Task],
+        external_status: Dict[str, str],
     ) -> bool:
         """Check if all dependencies for a task are completed."""
-        if not task.dependencies:
-            return True
-
-        depends_on = task.dependencies.get("depends_on", [])
-        if not depends_on:
-            return True
-
-        # Check if all dependency tasks are completed
-        for dep_id in depends_on:
+        for dep_id in dep_ids:
             if dep_id in task_dict:
-                dep_task = task_dict[dep_id]
-                if dep_task.status != "completed":
-                    return False
+                status = task_dict[dep_id].status
             else:
-                # Dependency task not in our set - query it
-                dep_task = session.query(Task).filter(Task.id == dep_id).first()
-                if not dep_task or dep_task.status != "completed":
-                    return False
-
+                # Unknown dependency IDs count as incomplete
+                status = external_status.get(dep_id)
+            if status != "completed":
+                return False
         return True
 
-    def _get_blocked_tasks(self, task_id: str, all_tasks: List[Task]) -> List[Task]:
-        """Get tasks blocked by this task."""
-        blocked = []
-        for task in all_tasks:
-            if task.dependencies:
-                depends_on = task.dependencies.get("depends_on", [])
-                if task_id in depends_on:
-                    blocked.append(task)
-        return blocked
-
     def _calculate_metadata(
         self, tasks: List[Task], nodes: List[Dict], edges: List[Dict]
     ) -> Dict[str, Any]:
@@ -374,11 +440,11 @@ class DependencyGraphService:
         for edge in edges:
             if (
                 edge["type"] == "depends_on"
-                and edge["from"] in node_set
-                and edge["to"] in node_set
+                and edge["source"] in node_set
+                and edge["target"] in node_set
             ):
-                graph[edge["from"]].append(edge["to"])
-                in_degree[edge["to"]] += 1
+                graph[edge["source"]].append(edge["target"])
+                in_degree[edge["target"]] += 1
 
         # Initialize longest path
         longest_path = defaultdict(int)
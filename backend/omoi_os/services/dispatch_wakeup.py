@@ -0,0 +1,174 @@
+"""Dispatch wakeup signal for event-driven task dispatch.
+
+The orchestrator waits on a DispatchWakeup between dispatch attempts. Queue
+events (task created, task completed/failed/cancelled, status transitions)
+call notify(), which wakes the waiter immediately; the wait timeout is only a
+safety fallback for missed events.
+
+notify() is safe to call from any thread, which matters because the Redis
+pub/sub callbacks of EventBusService run on the listener thread.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Iterable, Optional
+
+from omoi_os.logging import get_logger
+from omoi_os.services.event_bus import EventBusService, SystemEvent
+from omoi_os.services.event_bus_listener import EventBusListener
+
+logger = get_logger(__name__)
+
+# Events after which a pending task may have become claimable: new work,
+# freed concurrency slots, completed dependencies, tasks reset to pending.
+DISPATCH_EVENT_TYPES = (
+    "TASK_CREATED",
+    "TICKET_CREATED",
+    "TASK_COMPLETED",
+    "TASK_FAILED",
+    "TASK_CANCELLED",
+    "TASK_STATUS_CHANGED",
+    "TASK_VALIDATION_PASSED",
+    "SANDBOX_agent.completed",
+    "SANDBOX_agent.failed",
+    "SANDBOX_agent.error",
+)
+
+
+class DispatchWakeup:
+    """Thread-safe wakeup signal with a polling fallback.
+
+    Tracks how many waits ended by signal vs. fallback timeout, and the
+    latency from the first pending notify() to the waiter resuming.
+    """
+
+    def __init__(self, fallback_interval: float = 5.0):
+        """
+        Initialize the wakeup signal.
+
+        Args:
+            fallback_interval: Seconds to wait before polling anyway when no
+                signal arrives
+        """
+        self.fallback_interval = fallback_interval
+        self._event = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+        self._pending_since: Optional[float] = None
+        # Errors need no cleanup: the fallback timer keeps dispatch going
+        self._listener = EventBusListener("dispatch-wakeup-listener")
+
+        self.stats = {
+            "signals": 0,
+            "signal_wakeups": 0,
+            "fallback_wakeups": 0,
+            "last_wake_latency_ms": 0.0,
+        }
+
+    def bind_loop(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """Bind to the event loop that will call wait() (defaults to running loop)."""
+        self._loop = loop or asyncio.get_running_loop()
+
+    def notify(self, reason: str = "unknown") -> None:
+        """
+        Signal that a task may be ready for dispatch.
+
+        Args:
+            reason: Event type or source, for debug logging
+        """
+        with self._lock:
+            self.stats["signals"] += 1
+            if self._pending_since is None:
+                self._pending_since = time.perf_counter()
+
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            self._event.set()
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._event.set()
+        else:
+            loop.call_soon_threadsafe(self._event.set)
+        logger.debug("dispatch_wakeup_notified", reason=reason)
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a signal or the fallback interval, whichever comes first.
+
+        A signal that arrived while the caller was busy is not lost: the next
+        wait() returns immediately.
+
+        Args:
+            timeout: Override for the fallback interval
+
+        Returns:
+            True if woken by a signal, False on fallback timeout
+        """
+        if self._loop is None:
+            self.bind_loop()
+        try:
+            await asyncio.wait_for(
+                self._event.wait(),
+                timeout=self.fallback_interval if timeout is None else timeout,
+            )
+        except asyncio.TimeoutError:
+            self.stats["fallback_wakeups"] += 1
+            return False
+
+        self._event.clear()
+        with self._lock:
+            pending_since, self._pending_since = self._pending_since, None
+        if pending_since is not None:
+            self.stats["last_wake_latency_ms"] = (
+                time.perf_counter() - pending_since
+            ) * 1000
+        self.stats["signal_wakeups"] += 1
+        return True
+
+    def attach_event_bus(
+        self,
+        event_bus: EventBusService,
+        event_types: Iterable[str] = DISPATCH_EVENT_TYPES,
+    ) -> bool:
+        """
+        Subscribe to dispatch-relevant events and start the listener thread.
+
+        Args:
+            event_bus: Dedicated event bus to subscribe on (see event_bus_listener)
+            event_types: Event types that should wake the dispatcher
+
+        Returns:
+            True if the listener is running, False if Redis is unavailable
+            (callers should then poll at a shorter interval)
+        """
+
+        def _on_event(event: SystemEvent) -> None:
+            self.notify(event.event_type)
+
+        return self._listener.attach(event_bus, event_types, _on_event)
+
+    def start_listener(self, event_bus: EventBusService) -> bool:
+        """
+        Run the bus listener on a daemon thread so subscribed callbacks fire.
+
+        Args:
+            event_bus: Event bus whose subscriptions are already registered
+
+        Returns:
+            True if the listener is running, False if Redis is unavailable
+        """
+        return self._listener.start(event_bus)
+
+    @property
+    def listening(self) -> bool:
+        """Whether the event bus listener thread is alive."""
+        return self._listener.listening
+
+    def stop(self) -> None:
+        """Stop the listener thread after its current read returns."""
+        self._listener.stop()
@@ -9,6 +9,12 @@ import numpy as np
 
 from omoi_os.config import get_app_settings
 from omoi_os.logging import get_logger
+from omoi_os.services.embedding_cache import (
+    EmbeddingCache,
+    embedding_cache_key,
+    get_embedding_cache,
+)
+from omoi_os.services.similarity import cosine_similarity
 
 if TYPE_CHECKING:
     from fastembed import TextEmbedding
@@ -191,6 +197,7 @@ class EmbeddingService:
     - Fireworks/OpenAI: Lazy client initialization, no model loading
     - Local: Models cached in embedding.cache_dir, singleton pattern
     - All: Lazy loading defers initialization until first use
+    - All: Results cached by provider+model+text hash (see embedding_cache)
     """
 
     # Fireworks AI API base URL (OpenAI-compatible)
@@ -202,6 +209,8 @@ class EmbeddingService:
         fireworks_api_key: Optional[str] = None,
         openai_api_key: Optional[str] = None,
         model_name: Optional[str] = None,
+        cache: Optional[EmbeddingCache] = None,
+        use_cache: bool = True,
     ):
         """
         Initialize embedding service.
@@ -212,6 +221,8 @@ class EmbeddingService:
             fireworks_api_key: Fireworks AI API key. Defaults to settings.embedding.fireworks_api_key.
             openai_api_key: OpenAI API key. Defaults to settings.embedding.openai_api_key.
             model_name: Model name override. Defaults based on provider.
+            cache: Embedding cache. Defaults to the shared cache from settings.
+            use_cache: Set False to always call the provider.
         """
         embedding_settings = get_app_settings().embedding
 
@@ -234,6 +245,10 @@ class EmbeddingService:
         self._lazy_load = embedding_settings.lazy_load
         self._configured_dimensions = embedding_settings.dimensions
 
+        self.cache: Optional[EmbeddingCache] = None
+        if use_cache:
+            self.cache = cache if cache is not None else get_embedding_cache()
+
         # Lazy-loaded clients (initialized on first use)
         self._fireworks_client: Optional["OpenAI"] = None
         self._openai_client: Optional["OpenAI"] = None
@@ -366,12 +381,38 @@ class EmbeddingService:
         if not text or not text.strip():
             raise ValueError("Text cannot be empty")
 
+        key = None
+        if self.cache is not None:
+            key = self._cache_key(text, is_query)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
         if self.provider == EmbeddingProvider.FIREWORKS:
-            return self._generate_fireworks_embedding(text)
+            embedding = self._generate_fireworks_embedding(text)
         elif self.provider == EmbeddingProvider.OPENAI:
-            return self._generate_openai_embedding(text)
+            embedding = self._generate_openai_embedding(text)
         else:
-            return self._generate_local_embedding(text, is_query=is_query)
+            embedding = self._generate_local_embedding(text, is_query=is_query)
+
+        if key is not None:
+            self.cache.set(key, embedding)
+        return embedding
+
+    def _cache_key(self, text: str, is_query: bool) -> str:
+        """Cache key for text under this service's provider and model."""
+        # API providers ignore is_query; only the local e5 model prefixes text
+        uses_prefix = (
+            self.provider == EmbeddingProvider.LOCAL
+            and "multilingual-e5" in self.model_name
+        )
+        return embedding_cache_key(
+            self.provider.value,
+            self.model_name,
+            text,
+            is_query=is_query and uses_prefix,
+            dimensions=self.dimensions,
+        )
 
     def _generate_fireworks_embedding(self, text: str) -> List[float]:
         """Generate embedding using Fireworks AI API (OpenAI-compatible) with retry."""
@@ -440,6 +481,29 @@ class EmbeddingService:
         if not texts:
             return []
 
+        if self.cache is None:
+            return self._batch_generate_uncached(texts, is_query)
+
+        # Only texts missing from the cache go to the provider, once each
+        keys = [self._cache_key(text, is_query) for text in texts]
+        found = self.cache.get_many(keys)
+        misses: dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in found:
+                misses.setdefault(key, text)
+
+        if misses:
+            generated = self._batch_generate_uncached(list(misses.values()), is_query)
+            computed = dict(zip(misses, generated))
+            self.cache.set_many(computed)
+            found.update(computed)
+
+        return [found[key] for key in keys]
+
+    def _batch_generate_uncached(
+        self, texts: List[str], is_query: bool
+    ) -> List[List[float]]:
+        """Call the provider's batch endpoint directly."""
         if self.provider == EmbeddingProvider.FIREWORKS:
             return self._batch_generate_fireworks_embeddings(texts)
         elif self.provider == EmbeddingProvider.OPENAI:
@@ -607,21 +671,10 @@ class EmbeddingService:
             vec2: Second vector.
 
         Returns:
-            Similarity score between -1 and 1 (1 = identical).
+            Similarity score between -1 and 1 (1 = identical); 0.0 for empty,
+            zero or mismatched vectors.
         """
-        if not vec1 or not vec2:
-            return 0.0
-
-        v1 = np.array(vec1)
-        v2 = np.array(vec2)
-
-        # Handle zero vectors
-        norm1 = np.linalg.norm(v1)
-        norm2 = np.linalg.norm(v2)
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-
-        return float(np.dot(v1, v2) / (norm1 * norm2))
+        return cosine_similarity(vec1, vec2)
 
     @staticmethod
     def euclidean_distance(vec1: List[float], vec2: List[float]) -> float:
@@ -0,0 +1,199 @@
+"""Async micro-batching front end for EmbeddingService.
+
+EmbeddingService is synchronous; calling it from a request handler blocks
+the event loop, and with the local FastEmbed model each call runs inference
+with batch size 1. EmbeddingBatcher queues embedding requests from
+concurrent coroutines, waits a few milliseconds for more to arrive, and
+runs each group as one batch_generate_embeddings call on a worker thread.
+Every caller awaits its own future, so throughput under concurrent ticket
+creation scales with batch size rather than request count.
+
+Cache hits (see embedding_cache) are answered without queueing; when the
+cache has a Redis tier the lookup runs on a thread so it cannot block the
+event loop.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional
+
+from omoi_os.logging import get_logger
+from omoi_os.services.embedding import EmbeddingService
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class _EmbeddingRequest:
+    text: str
+    is_query: bool
+    future: "asyncio.Future[List[float]]"
+
+
+class EmbeddingBatcher:
+    """Coalesces concurrent embedding requests into provider batches.
+
+    Bound to the event loop of its first embed() call. Batches run on a
+    dedicated thread pool; one worker by default because the local model
+    already parallelizes inference internally.
+    """
+
+    def __init__(
+        self,
+        embedding_service: EmbeddingService,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        max_workers: int = 1,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            embedding_service: Service whose batch API does the work
+            max_batch_size: Most texts sent to the provider in one call
+            max_wait_ms: How long the first request of a batch waits for
+                others to join
+            max_workers: Threads running provider calls
+        """
+        self.embedding_service = embedding_service
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="embedding-batcher"
+        )
+        self._queue: Optional["asyncio.Queue[_EmbeddingRequest]"] = None
+        self._worker: Optional["asyncio.Task[None]"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.stats = {
+            "requests": 0,
+            "cache_hits": 0,
+            "batches": 0,
+            "batched_texts": 0,
+            "max_batch": 0,
+        }
+
+    @property
+    def mean_batch_size(self) -> float:
+        """Average number of texts per provider call."""
+        if not self.stats["batches"]:
+            return 0.0
+        return self.stats["batched_texts"] / self.stats["batches"]
+
+    async def embed(self, text: str, is_query: bool = False) -> List[float]:
+        """
+        Embed one text, sharing a provider call with concurrent requests.
+
+        Args:
+            text: Input text.
+            is_query: Query/passage mode, as for generate_embedding.
+
+        Returns:
+            Embedding vector.
+
+        Raises:
+            ValueError: If text is empty.
+        """
+        if not text or not text.strip():
+            raise ValueError("Text cannot be empty")
+        self.stats["requests"] += 1
+
+        cache = self.embedding_service.cache
+        if cache is not None:
+            key = self.embedding_service._cache_key(text, is_query)
+            if cache.redis_enabled:
+                # A local miss falls through to a blocking Redis round trip
+                cached = await asyncio.to_thread(cache.get, key)
+            else:
+                cached = cache.get(key)
+            if cached is not None:
+                self.stats["cache_hits"] += 1
+                return cached
+
+        queue = self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await queue.put(_EmbeddingRequest(text, is_query, future))
+        return await future
+
+    async def embed_many(
+        self, texts: List[str], is_query: bool = False
+    ) -> List[List[float]]:
+        """Embed several texts concurrently; results keep input order."""
+        return list(await asyncio.gather(*(self.embed(t, is_query) for t in texts)))
+
+    async def close(self) -> None:
+        """Stop the worker and shut down the thread pool."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        self._executor.shutdown(wait=False)
+
+    def _ensure_worker(self) -> "asyncio.Queue[_EmbeddingRequest]":
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run(self._queue))
+        return self._queue
+
+    async def _run(self, queue: "asyncio.Queue[_EmbeddingRequest]") -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            for is_query in (False, True):
+                group = [r for r in batch if r.is_query == is_query]
+                if group:
+                    await self._dispatch(loop, group, is_query)
+
+    async def _dispatch(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        group: List[_EmbeddingRequest],
+        is_query: bool,
+    ) -> None:
+        self.stats["batches"] += 1
+        self.stats["batched_texts"] += len(group)
+        self.stats["max_batch"] = max(self.stats["max_batch"], len(group))
+        try:
+            vectors = await loop.run_in_executor(
+                self._executor,
+                self.embedding_service.batch_generate_embeddings,
+                [r.text for r in group],
+                is_query,
+            )
+        except Exception as e:
+            logger.warning(f"Embedding batch of {len(group)} failed: {e}")
+            for request in group:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+
+        if len(vectors) != len(group):
+            error = RuntimeError(
+                f"Embedding provider returned {len(vectors)} vectors "
+                f"for {len(group)} texts"
+            )
+            logger.warning(str(error))
+            for request in group:
+                if not request.future.done():
+                    request.future.set_exception(error)
+            return
+
+        for request, vector in zip(group, vectors):
+            if not request.future.done():
+                request.future.set_result(vector)
@@ -0,0 +1,291 @@
+"""Two-tier cache for embedding vectors.
+
+Ticket, task and spec dedup plus memory storage and search embed the same
+titles and descriptions many times in one pipeline run. EmbeddingService
+checks this cache before calling any provider:
+
+- Tier 1: bounded in-process LRU with optional TTL (always on when enabled),
+  vectors stored as contiguous float32 arrays (about 6 KB per 1536-dim
+  vector) and converted to lists only when returned
+- Tier 2: optional Redis tier shared across processes, vectors stored as
+  float32 bytes with an expiry
+
+Keys hash provider, model, dimensions, the query/passage flag and the
+normalized text, so vectors from different models never collide. Redis
+errors disable nothing permanently; the lookup just counts as a miss.
+"""
+
+import hashlib
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import redis
+
+from omoi_os.config import get_app_settings
+from omoi_os.logging import get_logger
+
+logger = get_logger(__name__)
+
+REDIS_KEY_PREFIX = "omoi:embedding:"
+
+
+def normalize_embedding_text(text: str) -> str:
+    """
+    Normalize text for cache keys.
+
+    Applies Unicode NFC and strips surrounding whitespace only; case and
+    inner whitespace reach the provider unchanged, so they stay in the key.
+    """
+    return unicodedata.normalize("NFC", text).strip()
+
+
+def embedding_cache_key(
+    provider: str,
+    model_name: str,
+    text: str,
+    is_query: bool = False,
+    dimensions: Optional[int] = None,
+) -> str:
+    """
+    Build the cache key for one embedding request.
+
+    Args:
+        provider: Embedding provider name.
+        model_name: Provider model name.
+        text: Input text (normalized here).
+        is_query: Whether the text is embedded as a query or a passage.
+        dimensions: Requested output dimensions, if any.
+
+    Returns:
+        Hex SHA-256 digest identifying the request.
+    """
+    material = "\x1f".join(
+        [
+            provider,
+            model_name,
+            str(dimensions or ""),
+            "query" if is_query else "passage",
+            normalize_embedding_text(text),
+        ]
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """Bounded LRU/TTL embedding cache with an optional Redis tier.
+
+    Thread-safe. Hit/miss counters are kept in ``stats``.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        ttl_seconds: Optional[float] = 86_400,
+        redis_url: Optional[str] = None,
+        redis_ttl_seconds: int = 7 * 86_400,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum vectors kept in process (LRU eviction)
+            ttl_seconds: In-process entry lifetime; None keeps entries until
+                evicted
+            redis_url: Enables the Redis tier when set
+            redis_ttl_seconds: Expiry for vectors written to Redis
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.redis_ttl_seconds = redis_ttl_seconds
+        self._entries: "OrderedDict[str, tuple[float, np.ndarray]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis: Optional[redis.Redis] = None
+
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "redis_hits": 0,
+            "redis_errors": 0,
+            "evictions": 0,
+            "expirations": 0,
+        }
+
+        if redis_url:
+            try:
+                self._redis = redis.from_url(
+                    redis_url,
+                    socket_timeout=1.0,
+                    socket_connect_timeout=1.0,
+                )
+                self._redis.ping()
+            except redis.exceptions.RedisError as e:
+                logger.warning(f"Embedding cache Redis tier disabled: {e}")
+                self._redis = None
+
+    @property
+    def redis_enabled(self) -> bool:
+        """Whether the Redis tier is active."""
+        return self._redis is not None
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from either tier."""
+        total = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / total if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by in-process vectors."""
+        with self._lock:
+            return sum(vector.nbytes for _, vector in self._entries.values())
+
+    def get(self, key: str) -> Optional[List[float]]:
+        """Look up one vector; None on miss."""
+        return self.get_many([key]).get(key)
+
+    def set(self, key: str, vector: List[float]) -> None:
+        """Store one vector in both tiers."""
+        self.set_many({key: vector})
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, List[float]]:
+        """
+        Look up several vectors, checking the LRU first and Redis for the rest.
+
+        Redis hits are promoted into the LRU.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Mapping of found keys to vectors (misses are absent)
+        """
+        found: Dict[str, List[float]] = {}
+        missing: List[str] = []
+        now = time.monotonic()
+
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                entry = self._entries.get(key)
+                if entry is not None and self._expired(entry, now):
+                    del self._entries[key]
+                    self.stats["expirations"] += 1
+                    entry = None
+                if entry is None:
+                    missing.append(key)
+                    continue
+                self._entries.move_to_end(key)
+                found[key] = entry[1].tolist()
+
+        if missing and self._redis is not None:
+            promoted = self._redis_get_many(missing)
+            if promoted:
+                self._store_local(promoted)
+                found.update((key, vector.tolist()) for key, vector in promoted.items())
+                missing = [key for key in missing if key not in promoted]
+
+        with self._lock:
+            self.stats["hits"] += len(found)
+            self.stats["misses"] += len(missing)
+        return found
+
+    def set_many(self, vectors: Dict[str, List[float]]) -> None:
+        """
+        Store several vectors in the LRU and, if enabled, in Redis.
+
+        Args:
+            vectors: Mapping of cache keys to vectors
+        """
+        if not vectors:
+            return
+        self._store_local(vectors)
+        if self._redis is None:
+            return
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            for key, vector in vectors.items():
+                pipe.setex(
+                    REDIS_KEY_PREFIX + key,
+                    self.redis_ttl_seconds,
+                    np.asarray(vector, dtype=np.float32).tobytes(),
+                )
+            pipe.execute()
+        except redis.exceptions.RedisError as e:
+            self.stats["redis_errors"] += 1
+            logger.warning(f"Embedding cache Redis write failed: {e}")
+
+    def clear(self) -> None:
+        """Drop all in-process entries (Redis entries expire on their own)."""
+        with self._lock:
+            self._entries.clear()
+
+    def _expired(self, entry: "tuple[float, np.ndarray]", now: float) -> bool:
+        return self.ttl_seconds is not None and now - entry[0] > self.ttl_seconds
+
+    def _store_local(self, vectors: Dict[str, "List[float] | np.ndarray"]) -> None:
+        now = time.monotonic()
+        arrays = {
+            key: np.array(vector, dtype=np.float32) for key, vector in vectors.items()
+        }
+        with self._lock:
+            for key, vector in arrays.items():
+                self._entries[key] = (now, vector)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def _redis_get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        try:
+            values = self._redis.mget([REDIS_KEY_PREFIX + key for key in keys])
+        except redis.exceptions.RedisError as e:
+            self.stats["redis_errors"] += 1
+            logger.warning(f"Embedding cache Redis read failed: {e}")
+            return {}
+
+        found = {}
+        for key, value in zip(keys, values):
+            if value:
+                found[key] = np.frombuffer(value, dtype=np.float32)
+        self.stats["redis_hits"] += len(found)
+        return found
+
+
+_shared_cache: Optional[EmbeddingCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """
+    Get the process-wide embedding cache configured from settings.
+
+    Returns:
+        The shared cache, or None if embedding.cache_enabled is false.
+    """
+    global _shared_cache
+
+    settings = get_app_settings()
+    embedding_settings = settings.embedding
+    if not embedding_settings.cache_enabled:
+        return None
+
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                _shared_cache = EmbeddingCache(
+                    max_entries=embedding_settings.cache_max_entries,
+                    ttl_seconds=embedding_settings.cache_ttl_seconds,
+                    redis_url=(
+                        settings.redis.url
+                        if embedding_settings.cache_redis_enabled
+                        else None
+                    ),
+                    redis_ttl_seconds=embedding_settings.cache_redis_ttl_seconds,
+                )
+    return _shared_cache
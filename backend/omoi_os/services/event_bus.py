@@ -37,8 +37,11 @@ class EventBusService:
             redis_url: Redis connection URL
         """
         self.redis_client: Optional[redis.Redis] = None
+        self.redis_url: Optional[str] = None  # Set once the URL is valid
         self.pubsub = None
         self._available = False
+        # Optional non-blocking publisher (see attach_async_publisher)
+        self._async_publisher = None
 
         # If no URL provided, try to get from settings
         if redis_url is None:
@@ -61,6 +64,7 @@ class EventBusService:
             )
             return
 
+        self.redis_url = redis_url
         try:
             # Add socket timeout to prevent blocking forever on unreachable hosts
             self.redis_client = redis.from_url(
@@ -81,6 +85,25 @@ class EventBusService:
         except Exception as e:
             logger.warning(f"Redis initialization failed, EventBus disabled: {e}")
 
+    @property
+    def available(self) -> bool:
+        """Whether Redis was reachable; when False, all operations are no-ops."""
+        return self._available
+
+    def attach_async_publisher(self, publisher: Any) -> None:
+        """
+        Route publish() through a running AsyncEventBus.
+
+        While the publisher is running, publish() only buffers the event and
+        returns; the publisher flushes buffered events to Redis in pipelined
+        batches from the event loop. Without one (workers, scripts, or after
+        the publisher stops) publish() talks to Redis synchronously.
+
+        Args:
+            publisher: AsyncEventBus, or None to detach
+        """
+        self._async_publisher = publisher
+
     def publish(self, event: SystemEvent) -> None:
         """
         Publish event to system bus.
@@ -88,6 +111,11 @@ class EventBusService:
         Args:
             event: SystemEvent to publish
         """
+        publisher = self._async_publisher
+        if publisher is not None and publisher.running:
+            publisher.publish_nowait(event)
+            return
+
         if not self._available or not self.redis_client:
             return  # Graceful no-op when Redis unavailable
 
@@ -0,0 +1,135 @@
+"""Background listener thread for EventBusService subscriptions.
+
+EventBusService.listen() blocks and runs subscribed callbacks on the calling
+thread. In-process consumers (dispatch wakeups, the board change log, graph
+snapshots) each run it on a daemon thread through EventBusListener, and keep
+their process-wide instance in a ListenerSingleton.
+
+Give every consumer a dedicated EventBusService: pub/sub keeps one callback
+per channel, so sharing a bus would replace other consumers' handlers.
+"""
+
+import threading
+from typing import Callable, Generic, Iterable, Optional, TypeVar
+
+import redis
+
+from omoi_os.logging import get_logger
+from omoi_os.services.event_bus import EventBusService, SystemEvent
+
+logger = get_logger(__name__)
+
+
+class EventBusListener:
+    """Runs EventBusService.listen() on a daemon thread until stopped.
+
+    The bus client has a socket timeout, so an idle listen() raises
+    TimeoutError; subscriptions survive on the pubsub connection and the
+    thread simply listens again. Other errors call ``on_error`` (events may
+    have been missed) and back off before retrying.
+
+    Args:
+        name: Thread name, included in error logs
+        on_error: Called after a listener error, before backing off
+        retry_interval: Seconds to wait after an error
+    """
+
+    def __init__(
+        self,
+        name: str,
+        on_error: Optional[Callable[[], None]] = None,
+        retry_interval: float = 1.0,
+    ):
+        self.name = name
+        self.on_error = on_error
+        self.retry_interval = retry_interval
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    def attach(
+        self,
+        event_bus: EventBusService,
+        event_types: Iterable[str],
+        callback: Callable[[SystemEvent], None],
+    ) -> bool:
+        """
+        Subscribe callback to event_types and start the listener thread.
+
+        Returns:
+            True if the listener is running, False if Redis is unavailable
+        """
+        for event_type in event_types:
+            event_bus.subscribe(event_type, callback)
+        return self.start(event_bus)
+
+    def start(self, event_bus: EventBusService) -> bool:
+        """
+        Start the listener thread for subscriptions already registered.
+
+        Returns:
+            True if the listener is running, False if Redis is unavailable
+        """
+        if not event_bus.available:
+            return False
+
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run, args=(event_bus,), name=self.name, daemon=True
+            )
+            self._thread.start()
+        return True
+
+    @property
+    def listening(self) -> bool:
+        """Whether the listener thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def stop(self) -> None:
+        """Stop the listener thread after its current read returns."""
+        self._stopped.set()
+
+    def _run(self, event_bus: EventBusService) -> None:
+        while not self._stopped.is_set():
+            try:
+                event_bus.listen()
+            except redis.exceptions.TimeoutError:
+                continue
+            except Exception as e:
+                logger.warning(
+                    "event_bus_listener_error", listener=self.name, error=str(e)
+                )
+                if self.on_error is not None:
+                    self.on_error()
+                self._stopped.wait(self.retry_interval)
+
+
+T = TypeVar("T")
+
+
+class ListenerSingleton(Generic[T]):
+    """Lazily created process-wide instance of an event bus consumer.
+
+    The instance must have a stop() method; reset() calls it so a listener
+    thread does not outlive its instance.
+    """
+
+    def __init__(self, factory: Callable[[], T]):
+        self._factory = factory
+        self._instance: Optional[T] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> T:
+        """Return the instance, creating it on first use."""
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = self._factory()
+        return self._instance
+
+    def reset(self) -> None:
+        """Stop and forget the instance (useful for tests)."""
+        with self._lock:
+            instance, self._instance = self._instance, None
+        if instance is not None:
+            instance.stop()
@@ -0,0 +1,283 @@
+"""In-memory snapshots of project dependency graphs.
+
+Building a project graph loads every ticket, task and dependency edge of
+the project and computes the critical path; the graph page asks for it
+on every view. GraphSnapshotCache keeps the built graph per project and
+drops it when a task or ticket event touches one of its entities, so
+repeated views are served from memory until something actually changes.
+
+Each snapshot is indexed by the IDs of the project, its tickets and all
+of their tasks (including completed tasks left out of the graph), so an
+event is matched by its entity_id and the task_id / ticket_id /
+project_id in its payload. Events that can add an entity the index has
+never seen (a new ticket carries no project_id) clear the whole cache.
+The TTL bounds staleness for changes that publish no event at all.
+
+A graph is read from the database before it is stored, so an event can
+arrive between the read and put(). Builders take a generation token()
+before reading and pass it to put(); invalidations are numbered, and a
+snapshot any of whose IDs was invalidated after its token is discarded
+instead of being served until the TTL runs out.
+
+Invalidation callbacks run on the event bus listener thread, so all
+access is guarded by a lock.
+"""
+
+import threading
+import time
+from collections import OrderedDict, defaultdict, deque
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from omoi_os.logging import get_logger
+from omoi_os.services.event_bus import EventBusService, SystemEvent
+from omoi_os.services.event_bus_listener import EventBusListener, ListenerSingleton
+
+logger = get_logger(__name__)
+
+# Events that can change a dependency graph's nodes, edges or statuses
+GRAPH_EVENT_TYPES = (
+    "TASK_CREATED",
+    "TASK_ASSIGNED",
+    "TASK_STARTED",
+    "TASK_STATUS_CHANGED",
+    "TASK_COMPLETED",
+    "TASK_FAILED",
+    "TASK_CANCELLED",
+    "TASK_TIMED_OUT",
+    "TASK_PERMANENTLY_FAILED",
+    "TASK_DEPENDENCY_UPDATED",
+    "TICKET_CREATED",
+    "TICKET_STATUS_CHANGED",
+    "ticket.blocked",
+    "ticket.unblocked",
+    "ticket.status_transitioned",
+    "ticket.phase_transitioned",
+)
+
+# Events whose entity may belong to a graph the index does not know about
+_CLEAR_ALL_EVENT_TYPES = frozenset({"TICKET_CREATED"})
+
+
+@dataclass(frozen=True)
+class GraphSnapshot:
+    """A built graph plus the entity IDs it was built from."""
+
+    graph: Dict[str, Any]
+    entity_ids: FrozenSet[str]
+    built_at: float
+
+
+class GraphSnapshotCache:
+    """Per-project graph snapshots, invalidated by task and ticket events.
+
+    Args:
+        max_entries: Snapshots kept before the least recently used is dropped
+        ttl: Seconds a snapshot is served without any invalidating event
+        max_history: Invalidations remembered for checking put() tokens; a
+            token older than that window is treated as invalidated
+    """
+
+    def __init__(
+        self, max_entries: int = 64, ttl: float = 300.0, max_history: int = 4096
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._snapshots: "OrderedDict[Hashable, GraphSnapshot]" = OrderedDict()
+        self._keys_by_entity: Dict[str, Set[Hashable]] = defaultdict(set)
+        self._lock = threading.Lock()
+        # Events may have been missed while disconnected
+        self._listener = EventBusListener(
+            "graph-snapshot-listener", on_error=self.clear
+        )
+        # (generation, invalidated IDs or None for clear()), oldest first
+        self._generation = 0
+        self._history: Deque[Tuple[int, Optional[FrozenSet[str]]]] = deque(
+            maxlen=max_history
+        )
+
+        self.stats = {"hits": 0, "misses": 0, "invalidations": 0, "stale_puts": 0}
+
+    def token(self) -> int:
+        """Generation token to take before reading a graph for put()."""
+        with self._lock:
+            return self._generation
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached graph for key, or None.
+
+        The returned graph is shared; callers must not modify it.
+        """
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            expired = (
+                snapshot is not None and time.monotonic() - snapshot.built_at > self.ttl
+            )
+            if expired:
+                self._drop(key)
+                snapshot = None
+            if snapshot is None:
+                self.stats["misses"] += 1
+                return None
+            self._snapshots.move_to_end(key)
+            self.stats["hits"] += 1
+            return snapshot.graph
+
+    def put(
+        self,
+        key: Hashable,
+        graph: Dict[str, Any],
+        entity_ids: Iterable[str],
+        token: Optional[int] = None,
+    ) -> bool:
+        """
+        Store a graph built from the given project, ticket and task IDs.
+
+        Args:
+            key: Cache key (project and build options)
+            graph: Built graph
+            entity_ids: IDs whose events should invalidate the graph
+            token: token() taken before the graph was read; the graph is
+                not stored if any of its IDs was invalidated since
+
+        Returns:
+            True if the snapshot was stored
+        """
+        snapshot = GraphSnapshot(
+            graph=graph, entity_ids=frozenset(entity_ids), built_at=time.monotonic()
+        )
+        with self._lock:
+            if token is not None and self._invalidated_since(
+                token, snapshot.entity_ids
+            ):
+                self._drop(key)
+                self.stats["stale_puts"] += 1
+                return False
+            self._drop(key)
+            self._snapshots[key] = snapshot
+            for entity_id in snapshot.entity_ids:
+                self._keys_by_entity[entity_id].add(key)
+            while len(self._snapshots) > self.max_entries:
+                self._drop(next(iter(self._snapshots)))
+            return True
+
+    def invalidate(self, entity_ids: Iterable[str]) -> int:
+        """
+        Drop every snapshot built from any of the given IDs.
+
+        Returns:
+            Number of snapshots dropped
+        """
+        entity_ids = frozenset(entity_ids)
+        with self._lock:
+            self._record(entity_ids)
+            keys = set()
+            for entity_id in entity_ids:
+                keys.update(self._keys_by_entity.get(entity_id, ()))
+            for key in keys:
+                self._drop(key)
+            self.stats["invalidations"] += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop all snapshots."""
+        with self._lock:
+            self._record(None)
+            self.stats["invalidations"] += len(self._snapshots)
+            self._snapshots.clear()
+            self._keys_by_entity.clear()
+
+    def handle_event(self, event: SystemEvent) -> None:
+        """Invalidate the snapshots a task or ticket event may have changed."""
+        if event.event_type in _CLEAR_ALL_EVENT_TYPES:
+            self.clear()
+            return
+        payload = event.payload or {}
+        entity_ids = {str(event.entity_id)}
+        for field in ("task_id", "ticket_id", "project_id"):
+            if payload.get(field):
+                entity_ids.add(str(payload[field]))
+        self.invalidate(entity_ids)
+
+    def _record(self, entity_ids: Optional[FrozenSet[str]]) -> None:
+        # Caller holds the lock
+        self._generation += 1
+        self._history.append((self._generation, entity_ids))
+
+    def _invalidated_since(self, token: int, entity_ids: FrozenSet[str]) -> bool:
+        # Caller holds the lock
+        if token >= self._generation:
+            return False
+        if not self._history or self._history[0][0] > token + 1:
+            return True  # Invalidations after the token were forgotten
+        for generation, invalidated in reversed(self._history):
+            if generation <= token:
+                break
+            if invalidated is None or not invalidated.isdisjoint(entity_ids):
+                return True
+        return False
+
+    def _drop(self, key: Hashable) -> None:
+        # Caller holds the lock
+        snapshot = self._snapshots.pop(key, None)
+        if snapshot is None:
+            return
+        for entity_id in snapshot.entity_ids:
+            keys = self._keys_by_entity.get(entity_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_entity[entity_id]
+
+    def attach_event_bus(
+        self,
+        event_bus: EventBusService,
+        event_types: Iterable[str] = GRAPH_EVENT_TYPES,
+    ) -> bool:
+        """
+        Subscribe to graph-changing events and start the listener thread.
+
+        Args:
+            event_bus: Dedicated event bus (see event_bus_listener)
+            event_types: Event types that may change a graph
+
+        Returns:
+            True if the listener is running, False if Redis is unavailable
+            (callers should then not serve from the cache)
+        """
+        return self._listener.attach(event_bus, event_types, self.handle_event)
+
+    @property
+    def listening(self) -> bool:
+        """Whether the event bus listener thread is alive."""
+        return self._listener.listening
+
+    def stop(self) -> None:
+        """Stop the listener thread after its current read returns."""
+        self._listener.stop()
+
+
+_graph_snapshot_cache: ListenerSingleton[GraphSnapshotCache] = ListenerSingleton(
+    GraphSnapshotCache
+)
+
+
+def get_graph_snapshot_cache() -> GraphSnapshotCache:
+    """Get the process-wide graph snapshot cache."""
+    return _graph_snapshot_cache.get()
+
+
+def reset_graph_snapshot_cache() -> None:
+    """Reset the process-wide graph snapshot cache (useful for tests)."""
+    _graph_snapshot_cache.reset()
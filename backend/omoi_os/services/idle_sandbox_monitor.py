@@ -29,9 +29,11 @@ The canonical event type definitions are in omoi_os.schemas.events.
 
 from __future__ import annotations
 
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Optional, Set
 
+from sqlalchemy import func
+
 from omoi_os.logging import get_logger
 from omoi_os.models.sandbox_event import SandboxEvent
 from omoi_os.models.task import Task
@@ -41,6 +43,7 @@ from omoi_os.schemas.events import (
     SpecEventTypes,
 )
 from omoi_os.services.event_bus import EventBusService, SystemEvent
+from omoi_os.services.sandbox_liveness import SandboxLivenessStore, get_liveness_store
 from omoi_os.utils.datetime import utc_now
 
 if TYPE_CHECKING:
@@ -122,6 +125,7 @@ class IdleSandboxMonitor:
         daytona_spawner: DaytonaSpawnerService,
         event_bus: Optional[EventBusService] = None,
         idle_threshold: Optional[timedelta] = None,
+        liveness_store: Optional[SandboxLivenessStore] = None,
     ):
         """Initialize IdleSandboxMonitor.
 
@@ -130,11 +134,18 @@ class IdleSandboxMonitor:
             daytona_spawner: Daytona spawner for sandbox termination
             event_bus: Optional event bus for publishing termination events
             idle_threshold: Time without work events before considering idle
+            liveness_store: Heartbeat store to read liveness from. Defaults to
+                the process-wide store when it is shared (Redis); otherwise
+                heartbeats are read from sandbox_events.
         """
         self.db = db
         self.daytona_spawner = daytona_spawner
         self.event_bus = event_bus
         self.idle_threshold = idle_threshold or self.DEFAULT_IDLE_THRESHOLD
+        if liveness_store is None:
+            store = get_liveness_store()
+            liveness_store = store if store.shared else None
+        self.liveness_store = liveness_store
 
     def get_active_sandbox_ids(self) -> list[str]:
         """Get sandbox IDs that have recent heartbeats (are alive).
@@ -144,6 +155,12 @@ class IdleSandboxMonitor:
         """
         cutoff = utc_now() - self.HEARTBEAT_TIMEOUT
 
+        if self.liveness_store is not None:
+            try:
+                return self.liveness_store.active_sandbox_ids(cutoff)
+            except Exception as e:
+                logger.warning("liveness_store_unavailable", error=str(e))
+
         with self.db.get_session() as session:
             # Query distinct sandbox IDs with recent heartbeats
             # Supports both agent.heartbeat and spec.heartbeat events
@@ -158,6 +175,116 @@ class IdleSandboxMonitor:
             )
             return [r[0] for r in results]
 
+    def get_activity_snapshot(self, sandbox_ids: list[str]) -> dict[str, dict]:
+        """Collect the activity facts for many sandboxes in one pass.
+
+        Runs a fixed number of queries however many sandboxes are checked:
+        1. One grouped aggregate over sandbox_events for last work, last
+           agent.completed and spec execution outcome per sandbox
+        2. Heartbeats: one liveness store round trip, plus one DISTINCT ON
+           query for sandboxes the store doesn't know about
+        3. Phase events for the spec sandboxes among them (if any)
+
+        Args:
+            sandbox_ids: IDs of the sandboxes to check
+
+        Returns:
+            Mapping of sandbox ID to a facts dict with keys:
+            - last_work_at: Timestamp of last work event (or None)
+            - last_heartbeat_at: Timestamp of last heartbeat (or None)
+            - heartbeat_status: Status from last heartbeat
+            - completed_at: Timestamp of last agent.completed (or None)
+            - has_execution_completed / has_execution_failed: Spec outcome
+            - phases_started / phases_completed: Phase names in order
+            - last_phase_completed_at: Timestamp of last phase completion
+        """
+        snapshot = {
+            sandbox_id: {
+                "last_work_at": None,
+                "last_heartbeat_at": None,
+                "heartbeat_status": None,
+                "completed_at": None,
+                "has_execution_completed": False,
+                "has_execution_failed": False,
+                "phases_started": [],
+                "phases_completed": [],
+                "last_phase_completed_at": None,
+            }
+            for sandbox_id in sandbox_ids
+        }
+        if not snapshot:
+            return snapshot
+
+        sandbox_ids = list(snapshot)
+        event_type = SandboxEvent.event_type
+        created_at = SandboxEvent.created_at
+
+        with self.db.get_session() as session:
+            # Get last work event using INVERTED logic:
+            # Any event NOT in the blocklist is considered work.
+            rows = (
+                session.query(
+                    SandboxEvent.sandbox_id,
+                    func.max(created_at).filter(
+                        event_type.notin_(self.NON_WORK_EVENT_TYPES)
+                    ),
+                    # Latest completion, so resumed work can reset it
+                    func.max(created_at).filter(
+                        event_type == AgentEventTypes.COMPLETED
+                    ),
+                    func.bool_or(event_type == SpecEventTypes.EXECUTION_COMPLETED),
+                    func.bool_or(event_type == SpecEventTypes.EXECUTION_FAILED),
+                )
+                .filter(SandboxEvent.sandbox_id.in_(sandbox_ids))
+                .group_by(SandboxEvent.sandbox_id)
+                .all()
+            )
+            for sandbox_id, last_work_at, completed_at, succeeded, failed in rows:
+                facts = snapshot[sandbox_id]
+                facts["last_work_at"] = last_work_at
+                facts["completed_at"] = completed_at
+                facts["has_execution_completed"] = bool(succeeded)
+                facts["has_execution_failed"] = bool(failed)
+
+            for sandbox_id, (last_seen, status) in self._last_heartbeats(
+                session, sandbox_ids
+            ).items():
+                snapshot[sandbox_id]["last_heartbeat_at"] = last_seen
+                snapshot[sandbox_id]["heartbeat_status"] = status
+
+            spec_ids = [sid for sid in sandbox_ids if sid.startswith("spec-")]
+            if spec_ids:
+                phase_events = (
+                    session.query(
+                        SandboxEvent.sandbox_id,
+                        event_type,
+                        SandboxEvent.event_data["phase"].astext,
+                        created_at,
+                    )
+                    .filter(
+                        SandboxEvent.sandbox_id.in_(spec_ids),
+                        event_type.in_(
+                            (
+                                SpecEventTypes.PHASE_STARTED,
+                                SpecEventTypes.PHASE_COMPLETED,
+                            )
+                        ),
+                    )
+                    .order_by(created_at.asc())
+                    .all()
+                )
+                for sandbox_id, phase_event_type, phase, at in phase_events:
+                    if not phase:
+                        continue
+                    facts = snapshot[sandbox_id]
+                    if phase_event_type == SpecEventTypes.PHASE_STARTED:
+                        facts["phases_started"].append(phase)
+                    else:
+                        facts["phases_completed"].append(phase)
+                        facts["last_phase_completed_at"] = at
+
+        return snapshot
+
     def get_phase_completion_status(self, sandbox_id: str) -> dict:
         """Get phase completion status for a spec sandbox.
 
@@ -181,131 +308,11 @@ class IdleSandboxMonitor:
             - has_execution_completed: Whether spec.execution_completed was emitted
             - has_execution_failed: Whether spec.execution_failed was emitted
         """
-        is_spec_sandbox = sandbox_id.startswith("spec-")
-
-        if not is_spec_sandbox:
-            return {
-                "sandbox_id": sandbox_id,
-                "is_spec_sandbox": False,
-                "phases_completed": [],
-                "phases_started": [],
-                "last_phase_completed": None,
-                "last_phase_completed_at": None,
-                "next_expected_phase": None,
-                "is_stuck_between_phases": False,
-                "stuck_duration_seconds": 0,
-                "has_execution_completed": False,
-                "has_execution_failed": False,
-            }
+        if not sandbox_id.startswith("spec-"):
+            return self._phase_status(sandbox_id, None, utc_now())
 
-        with self.db.get_session() as session:
-            # Get all phase_started events
-            phase_started_events = (
-                session.query(SandboxEvent)
-                .filter(
-                    SandboxEvent.sandbox_id == sandbox_id,
-                    SandboxEvent.event_type == SpecEventTypes.PHASE_STARTED,
-                )
-                .order_by(SandboxEvent.created_at.asc())
-                .all()
-            )
-
-            # Get all phase_completed events
-            phase_completed_events = (
-                session.query(SandboxEvent)
-                .filter(
-                    SandboxEvent.sandbox_id == sandbox_id,
-                    SandboxEvent.event_type == SpecEventTypes.PHASE_COMPLETED,
-                )
-                .order_by(SandboxEvent.created_at.asc())
-                .all()
-            )
-
-            # Extract phase names
-            phases_started = []
-            for e in phase_started_events:
-                phase = e.event_data.get("phase") if e.event_data else None
-                if phase:
-                    phases_started.append(phase)
-
-            phases_completed = []
-            last_phase_completed = None
-            last_phase_completed_at = None
-            for e in phase_completed_events:
-                phase = e.event_data.get("phase") if e.event_data else None
-                if phase:
-                    phases_completed.append(phase)
-                    last_phase_completed = phase
-                    last_phase_completed_at = e.created_at
-
-            # Check for execution completion/failure
-            execution_completed = (
-                session.query(SandboxEvent)
-                .filter(
-                    SandboxEvent.sandbox_id == sandbox_id,
-                    SandboxEvent.event_type == SpecEventTypes.EXECUTION_COMPLETED,
-                )
-                .first()
-            )
-
-            execution_failed = (
-                session.query(SandboxEvent)
-                .filter(
-                    SandboxEvent.sandbox_id == sandbox_id,
-                    SandboxEvent.event_type == SpecEventTypes.EXECUTION_FAILED,
-                )
-                .first()
-            )
-
-            # Determine next expected phase
-            next_expected_phase = None
-            if last_phase_completed and last_phase_completed in self.EXPECTED_PHASES:
-                idx = self.EXPECTED_PHASES.index(last_phase_completed)
-                if idx + 1 < len(self.EXPECTED_PHASES):
-                    next_expected_phase = self.EXPECTED_PHASES[idx + 1]
-
-            # Check if stuck between phases
-            is_stuck_between_phases = False
-            stuck_duration_seconds = 0
-            now = utc_now()
-
-            if (
-                last_phase_completed_at
-                and next_expected_phase
-                and next_expected_phase not in phases_started
-                and not execution_completed
-                and not execution_failed
-            ):
-                # A phase completed, next phase hasn't started, and execution isn't done
-                time_since_completion = now - last_phase_completed_at
-                if time_since_completion > self.STUCK_BETWEEN_PHASES_THRESHOLD:
-                    is_stuck_between_phases = True
-                    stuck_duration_seconds = time_since_completion.total_seconds()
-                    logger.warning(
-                        "sandbox_stuck_between_phases",
-                        sandbox_id=sandbox_id,
-                        last_phase=last_phase_completed,
-                        next_expected=next_expected_phase,
-                        stuck_seconds=stuck_duration_seconds,
-                    )
-
-            return {
-                "sandbox_id": sandbox_id,
-                "is_spec_sandbox": True,
-                "phases_completed": phases_completed,
-                "phases_started": phases_started,
-                "last_phase_completed": last_phase_completed,
-                "last_phase_completed_at": (
-                    last_phase_completed_at.isoformat()
-                    if last_phase_completed_at
-                    else None
-                ),
-                "next_expected_phase": next_expected_phase,
-                "is_stuck_between_phases": is_stuck_between_phases,
-                "stuck_duration_seconds": stuck_duration_seconds,
-                "has_execution_completed": execution_completed is not None,
-                "has_execution_failed": execution_failed is not None,
-            }
+        facts = self.get_activity_snapshot([sandbox_id])[sandbox_id]
+        return self._phase_status(sandbox_id, facts, utc_now())
 
     def check_sandbox_activity(self, sandbox_id: str) -> dict:
         """Check if a sandbox has recent work activity.
@@ -324,155 +331,250 @@ class IdleSandboxMonitor:
             - is_idle: Whether sandbox is alive but has no recent work
             - idle_duration_seconds: How long the sandbox has been idle
         """
-        with self.db.get_session() as session:
-            # Get last work event using INVERTED logic:
-            # Any event NOT in the blocklist is considered work.
-            # This is safer than allowlisting - new event types are automatically treated as work.
-            last_work = (
-                session.query(SandboxEvent)
-                .filter(
-                    SandboxEvent.sandbox_id == sandbox_id,
-                    SandboxEvent.event_type.notin_(self.NON_WORK_EVENT_TYPES),
-                )
-                .order_by(SandboxEvent.created_at.desc())
-                .first()
-            )
+        facts = self.get_activity_snapshot([sandbox_id])[sandbox_id]
+        return self._activity(sandbox_id, facts, utc_now())
 
-            # Get last heartbeat (supports both agent and spec-sandbox heartbeats)
-            last_heartbeat = (
-                session.query(SandboxEvent)
-                .filter(
-                    SandboxEvent.sandbox_id == sandbox_id,
-                    SandboxEvent.event_type.in_(self.HEARTBEAT_EVENT_TYPES),
+    def get_sandbox_status(self, sandbox_id: str) -> dict:
+        """Get activity and phase status for one sandbox from one snapshot.
+
+        Returns:
+            Dictionary with activity (check_sandbox_activity() output) and
+            phase_status (get_phase_completion_status() output)
+        """
+        now = utc_now()
+        facts = self.get_activity_snapshot([sandbox_id])[sandbox_id]
+        is_spec_sandbox = sandbox_id.startswith("spec-")
+        return {
+            "activity": self._activity(sandbox_id, facts, now),
+            "phase_status": self._phase_status(
+                sandbox_id, facts if is_spec_sandbox else None, now
+            ),
+        }
+
+    def _phase_status(
+        self, sandbox_id: str, facts: Optional[dict], now: datetime
+    ) -> dict:
+        """Build get_phase_completion_status() output from snapshot facts."""
+        if facts is None:
+            return {
+                "sandbox_id": sandbox_id,
+                "is_spec_sandbox": False,
+                "phases_completed": [],
+                "phases_started": [],
+                "last_phase_completed": None,
+                "last_phase_completed_at": None,
+                "next_expected_phase": None,
+                "is_stuck_between_phases": False,
+                "stuck_duration_seconds": 0,
+                "has_execution_completed": False,
+                "has_execution_failed": False,
+            }
+
+        phases_started = facts["phases_started"]
+        phases_completed = facts["phases_completed"]
+        last_phase_completed = phases_completed[-1] if phases_completed else None
+        last_phase_completed_at = facts["last_phase_completed_at"]
+        execution_completed = facts["has_execution_completed"]
+        execution_failed = facts["has_execution_failed"]
+
+        # Determine next expected phase
+        next_expected_phase = None
+        if last_phase_completed and last_phase_completed in self.EXPECTED_PHASES:
+            idx = self.EXPECTED_PHASES.index(last_phase_completed)
+            if idx + 1 < len(self.EXPECTED_PHASES):
+                next_expected_phase = self.EXPECTED_PHASES[idx + 1]
+
+        # Check if stuck between phases
+        is_stuck_between_phases = False
+        stuck_duration_seconds = 0
+
+        if (
+            last_phase_completed_at
+            and next_expected_phase
+            and next_expected_phase not in phases_started
+            and not execution_completed
+            and not execution_failed
+        ):
+            # A phase completed, next phase hasn't started, and execution isn't done
+            time_since_completion = now - last_phase_completed_at
+            if time_since_completion > self.STUCK_BETWEEN_PHASES_THRESHOLD:
+                is_stuck_between_phases = True
+                stuck_duration_seconds = time_since_completion.total_seconds()
+                logger.warning(
+                    "sandbox_stuck_between_phases",
+                    sandbox_id=sandbox_id,
+                    last_phase=last_phase_completed,
+                    next_expected=next_expected_phase,
+                    stuck_seconds=stuck_duration_seconds,
                 )
-                .order_by(SandboxEvent.created_at.desc())
-                .first()
-            )
 
-            # Check if agent.completed event exists (agent finished its work)
-            # Get the LATEST completion event timestamp so we can check if work
-            # happened after completion (agent was resumed)
-            completed_event = (
-                session.query(SandboxEvent)
-                .filter(
-                    SandboxEvent.sandbox_id == sandbox_id,
-                    SandboxEvent.event_type == "agent.completed",
+        return {
+            "sandbox_id": sandbox_id,
+            "is_spec_sandbox": True,
+            "phases_completed": list(phases_completed),
+            "phases_started": list(phases_started),
+            "last_phase_completed": last_phase_completed,
+            "last_phase_completed_at": (
+                last_phase_completed_at.isoformat() if last_phase_completed_at else None
+            ),
+            "next_expected_phase": next_expected_phase,
+            "is_stuck_between_phases": is_stuck_between_phases,
+            "stuck_duration_seconds": stuck_duration_seconds,
+            "has_execution_completed": execution_completed,
+            "has_execution_failed": execution_failed,
+        }
+
+    def _activity(self, sandbox_id: str, facts: dict, now: datetime) -> dict:
+        """Build check_sandbox_activity() output from snapshot facts."""
+        last_work_at = facts["last_work_at"]
+        last_heartbeat_at = facts["last_heartbeat_at"]
+        heartbeat_status = facts["heartbeat_status"]
+        completed_at = facts["completed_at"]
+
+        # Check if work happened AFTER the last completion (agent resumed work)
+        # If so, the completion is "stale" and agent is effectively running again
+        has_completed = False
+        if completed_at:
+            if last_work_at and last_work_at > completed_at:
+                # Work happened after completion - agent resumed
+                has_completed = False
+                logger.debug(
+                    "sandbox_completion_reset_by_resumed_work",
+                    sandbox_id=sandbox_id,
+                    completed_at=completed_at.isoformat(),
+                    last_work_at=last_work_at.isoformat(),
                 )
-                .order_by(SandboxEvent.created_at.desc())
-                .first()
-            )
-            completed_at = completed_event.created_at if completed_event else None
-
-            # Check if work happened AFTER the last completion (agent resumed work)
-            # If so, the completion is "stale" and agent is effectively running again
-            has_completed = False
-            if completed_at:
-                if last_work and last_work.created_at > completed_at:
-                    # Work happened after completion - agent resumed
-                    has_completed = False
-                    logger.debug(
-                        "sandbox_completion_reset_by_resumed_work",
-                        sandbox_id=sandbox_id,
-                        completed_at=completed_at.isoformat(),
-                        last_work_at=last_work.created_at.isoformat(),
-                    )
-                else:
-                    # No work after completion - agent is truly done
-                    has_completed = True
-
-            now = utc_now()
-
-            # Determine if alive (has recent heartbeat)
-            is_alive = False
-            heartbeat_status = None
-            if last_heartbeat:
-                heartbeat_age = now - last_heartbeat.created_at
-                is_alive = heartbeat_age < self.HEARTBEAT_TIMEOUT
-                # Extract status from heartbeat payload
-                if last_heartbeat.event_data:
-                    heartbeat_status = last_heartbeat.event_data.get("status")
-
-            # Determine if idle (alive but no recent work)
-            # IMPORTANT: Several conditions mean the sandbox is NOT idle:
-            # 1. Agent has completed (agent.completed event seen) - work is done
-            # 2. Heartbeat reports 'running' status - agent is actively working
-            is_idle = False
-            idle_duration_seconds = 0
-
-            # Track if agent is stuck (reports running but no actual work)
-            is_stuck_running = False
-
-            if is_alive:
-                # If agent has completed, it's not idle - it finished its work
-                if has_completed:
-                    is_idle = False
-                    idle_duration_seconds = 0
-                    logger.debug(
-                        "sandbox_not_idle_agent_completed",
-                        sandbox_id=sandbox_id,
-                    )
-                # If agent reports itself as 'running' or 'alive', check for stuck condition
-                # 'running' = spec state machine actively running
-                # 'alive' = regular agent worker actively processing
-                elif heartbeat_status in ("running", "alive"):
-                    # Check if agent is "stuck running" - reports running but no work
-                    if last_work:
-                        work_age = now - last_work.created_at
-                        if work_age > self.STUCK_RUNNING_THRESHOLD:
-                            # Agent claims running but hasn't done work in 10+ minutes
-                            # This is a stuck agent - force terminate
-                            is_idle = True
-                            is_stuck_running = True
-                            idle_duration_seconds = work_age.total_seconds()
-                            logger.warning(
-                                "sandbox_stuck_running_detected",
-                                sandbox_id=sandbox_id,
-                                heartbeat_status=heartbeat_status,
-                                work_age_seconds=work_age.total_seconds(),
-                            )
-                        else:
-                            # Agent is running and has done work recently enough
-                            is_idle = False
-                            idle_duration_seconds = 0
-                            logger.debug(
-                                "sandbox_not_idle_agent_running",
-                                sandbox_id=sandbox_id,
-                                heartbeat_status=heartbeat_status,
-                            )
+            else:
+                # No work after completion - agent is truly done
+                has_completed = True
+
+        # Determine if alive (has recent heartbeat)
+        is_alive = False
+        if last_heartbeat_at:
+            heartbeat_age = now - last_heartbeat_at
+            is_alive = heartbeat_age < self.HEARTBEAT_TIMEOUT
+
+        # Determine if idle (alive but no recent work)
+        # IMPORTANT: Several conditions mean the sandbox is NOT idle:
+        # 1. Agent has completed (agent.completed event seen) - work is done
+        # 2. Heartbeat reports 'running' status - agent is actively working
+        is_idle = False
+        idle_duration_seconds = 0
+
+        # Track if agent is stuck (reports running but no actual work)
+        is_stuck_running = False
+
+        if is_alive:
+            # If agent has completed, it's not idle - it finished its work
+            if has_completed:
+                is_idle = False
+                idle_duration_seconds = 0
+                logger.debug(
+                    "sandbox_not_idle_agent_completed",
+                    sandbox_id=sandbox_id,
+                )
+            # If agent reports itself as 'running' or 'alive', check for stuck condition
+            # 'running' = spec state machine actively running
+            # 'alive' = regular agent worker actively processing
+            elif heartbeat_status in ("running", "alive"):
+                # Check if agent is "stuck running" - reports running but no work
+                if last_work_at:
+                    work_age = now - last_work_at
+                    if work_age > self.STUCK_RUNNING_THRESHOLD:
+                        # Agent claims running but hasn't done work in 10+ minutes
+                        # This is a stuck agent - force terminate
+                        is_idle = True
+                        is_stuck_running = True
+                        idle_duration_seconds = work_age.total_seconds()
+                        logger.warning(
+                            "sandbox_stuck_running_detected",
+                            sandbox_id=sandbox_id,
+                            heartbeat_status=heartbeat_status,
+                            work_age_seconds=work_age.total_seconds(),
+                        )
                     else:
-                        # Never did any work but claims running - give it time
-                        # (might still be initializing)
+                        # Agent is running and has done work recently enough
                         is_idle = False
                         idle_duration_seconds = 0
                         logger.debug(
-                            "sandbox_not_idle_agent_running_no_work_yet",
+                            "sandbox_not_idle_agent_running",
                             sandbox_id=sandbox_id,
+                            heartbeat_status=heartbeat_status,
                         )
-                elif not last_work:
-                    # Never did any work AND agent doesn't report running AND not completed
-                    is_idle = True
-                    if last_heartbeat:
-                        idle_duration_seconds = (
-                            now - last_heartbeat.created_at
-                        ).total_seconds()
                 else:
-                    work_age = now - last_work.created_at
-                    is_idle = work_age > self.idle_threshold
-                    idle_duration_seconds = work_age.total_seconds()
+                    # Never did any work but claims running - give it time
+                    # (might still be initializing)
+                    is_idle = False
+                    idle_duration_seconds = 0
+                    logger.debug(
+                        "sandbox_not_idle_agent_running_no_work_yet",
+                        sandbox_id=sandbox_id,
+                    )
+            elif not last_work_at:
+                # Never did any work AND agent doesn't report running AND not completed
+                is_idle = True
+                if last_heartbeat_at:
+                    heartbeat_age = now - last_heartbeat_at
+                    idle_duration_seconds = heartbeat_age.total_seconds()
+            else:
+                work_age = now - last_work_at
+                is_idle = work_age > self.idle_threshold
+                idle_duration_seconds = work_age.total_seconds()
 
-            return {
-                "sandbox_id": sandbox_id,
-                "last_work_at": last_work.created_at.isoformat() if last_work else None,
-                "last_heartbeat_at": (
-                    last_heartbeat.created_at.isoformat() if last_heartbeat else None
-                ),
-                "heartbeat_status": heartbeat_status,
-                "has_completed": has_completed,
-                "is_alive": is_alive,
-                "is_idle": is_idle,
-                "is_stuck_running": is_stuck_running,
-                "idle_duration_seconds": idle_duration_seconds,
-            }
+        return {
+            "sandbox_id": sandbox_id,
+            "last_work_at": last_work_at.isoformat() if last_work_at else None,
+            "last_heartbeat_at": (
+                last_heartbeat_at.isoformat() if last_heartbeat_at else None
+            ),
+            "heartbeat_status": heartbeat_status,
+            "has_completed": has_completed,
+            "is_alive": is_alive,
+            "is_idle": is_idle,
+            "is_stuck_running": is_stuck_running,
+            "idle_duration_seconds": idle_duration_seconds,
+        }
+
+    def _last_heartbeats(
+        self, session, sandbox_ids: list[str]
+    ) -> dict[str, tuple[datetime, Optional[str]]]:
+        """Get (last heartbeat time, reported status) for each sandbox.
+
+        Reads the liveness store when available; sandboxes it doesn't know
+        about are looked up with one DISTINCT ON query over heartbeat rows.
+        Sandboxes that never sent a heartbeat are omitted.
+        """
+        heartbeats: dict[str, tuple[datetime, Optional[str]]] = {}
+        if self.liveness_store is not None:
+            try:
+                for sandbox_id, record in self.liveness_store.get_many(
+                    sandbox_ids
+                ).items():
+                    heartbeats[sandbox_id] = (record.last_seen, record.status)
+            except Exception as e:
+                logger.warning("liveness_store_unavailable", error=str(e))
+
+        missing = [sid for sid in sandbox_ids if sid not in heartbeats]
+        if not missing:
+            return heartbeats
+
+        rows = (
+            session.query(
+                SandboxEvent.sandbox_id,
+                SandboxEvent.created_at,
+                SandboxEvent.event_data["status"].astext,
+            )
+            .filter(
+                SandboxEvent.sandbox_id.in_(missing),
+                SandboxEvent.event_type.in_(self.HEARTBEAT_EVENT_TYPES),
+            )
+            .order_by(SandboxEvent.sandbox_id, SandboxEvent.created_at.desc())
+            .distinct(SandboxEvent.sandbox_id)
+            .all()
+        )
+        for sandbox_id, last_seen, status in rows:
+            heartbeats[sandbox_id] = (last_seen, status)
+        return heartbeats
 
     async def _save_transcript(self, sandbox_id: str, transcript_b64: str) -> bool:
         """Save a session transcript to the database.
@@ -664,16 +766,26 @@ class IdleSandboxMonitor:
         active_sandbox_ids = self.get_active_sandbox_ids()
         log.debug("checking_sandboxes", count=len(active_sandbox_ids))
 
+        # One snapshot for the whole fleet keeps the cycle at a fixed number
+        # of queries (plus the termination writes)
+        try:
+            snapshot = self.get_activity_snapshot(active_sandbox_ids)
+        except Exception as e:
+            log.error("sandbox_snapshot_failed", error=str(e))
+            return []
+        now = utc_now()
+
         terminated = []
 
         for sandbox_id in active_sandbox_ids:
             try:
-                activity = self.check_sandbox_activity(sandbox_id)
+                facts = snapshot[sandbox_id]
+                activity = self._activity(sandbox_id, facts, now)
 
                 # For spec sandboxes, also check phase completion status
                 phase_status = None
                 if sandbox_id.startswith("spec-"):
-                    phase_status = self.get_phase_completion_status(sandbox_id)
+                    phase_status = self._phase_status(sandbox_id, facts, now)
 
                     # Log phase status for visibility
                     log.debug(
@@ -817,9 +929,25 @@ class IdleSandboxMonitor:
         active_sandbox_ids = self.get_active_sandbox_ids()
         results = []
 
+        try:
+            snapshot = self.get_activity_snapshot(active_sandbox_ids)
+        except Exception as e:
+            logger.error("sandbox_snapshot_failed", error=str(e))
+            return [
+                {
+                    "sandbox_id": sandbox_id,
+                    "activity": None,
+                    "phase_status": None,
+                    "error": str(e),
+                }
+                for sandbox_id in active_sandbox_ids
+            ]
+        now = utc_now()
+
         for sandbox_id in active_sandbox_ids:
             try:
-                activity = self.check_sandbox_activity(sandbox_id)
+                facts = snapshot[sandbox_id]
+                activity = self._activity(sandbox_id, facts, now)
 
                 status = {
                     "sandbox_id": sandbox_id,
@@ -829,9 +957,7 @@ class IdleSandboxMonitor:
 
                 # Add phase status for spec sandboxes
                 if sandbox_id.startswith("spec-"):
-                    status["phase_status"] = self.get_phase_completion_status(
-                        sandbox_id
-                    )
+                    status["phase_status"] = self._phase_status(sandbox_id, facts, now)
 
                 results.append(status)
 
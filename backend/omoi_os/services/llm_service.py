@@ -10,11 +10,14 @@ by AgentExecutor when needed.
 
 import asyncio
 import random
-from typing import Optional, TypeVar
+from typing import TYPE_CHECKING, Optional, TypeVar
 
 from omoi_os.config import LLMSettings, load_llm_settings
 from omoi_os.logging import get_logger
-from omoi_os.services.pydantic_ai_service import PydanticAIService
+
+if TYPE_CHECKING:
+    # pydantic_ai is slow to import; load it with the first structured call
+    from omoi_os.services.pydantic_ai_service import PydanticAIService
 
 logger = get_logger(__name__)
 
@@ -44,12 +47,14 @@ class LLMService:
         self.settings = settings or load_llm_settings()
 
         # Initialize PydanticAI service for structured outputs
-        self._pydantic_ai_service: Optional[PydanticAIService] = None
+        self._pydantic_ai_service: Optional["PydanticAIService"] = None
 
     @property
-    def _pydantic_ai(self) -> PydanticAIService:
+    def _pydantic_ai(self) -> "PydanticAIService":
         """Get or create PydanticAI service instance."""
         if self._pydantic_ai_service is None:
+            from omoi_os.services.pydantic_ai_service import PydanticAIService
+
             self._pydantic_ai_service = PydanticAIService(settings=self.settings)
         return self._pydantic_ai_service
 
@@ -8,12 +8,17 @@ from sqlalchemy import select, text, func
 from sqlalchemy.orm import Session
 
 from omoi_os.logging import get_logger
-from omoi_os.models.task_memory import TaskMemory
+from omoi_os.models.task_memory import (
+    MEMORY_EMBEDDING_DIMENSIONS,
+    TaskMemory,
+    pgvector_embedding,
+)
 from omoi_os.models.learned_pattern import LearnedPattern, TaskPattern
 from omoi_os.models.memory_type import MemoryType
 from omoi_os.models.task import Task
 from omoi_os.services.embedding import EmbeddingService
 from omoi_os.services.event_bus import EventBusService, SystemEvent
+from omoi_os.services.similarity import EmbeddingMatrix
 from omoi_os.schemas.memory_analysis import MemoryClassification, PatternExtraction
 from omoi_os.utils.datetime import utc_now
 
@@ -45,10 +50,19 @@ class MemoryService:
     - Provide context suggestions for new tasks
     """
 
+    # hnsw.ef_search bounds for pgvector search: the scan keeps ef_search
+    # candidates and filters are applied afterwards, so filtered searches
+    # widen it to still find top_k matches (pgvector's default is 40, its
+    # maximum 1000)
+    HNSW_EF_SEARCH_MIN = 40
+    HNSW_EF_SEARCH_MAX = 1000
+    HNSW_FILTER_OVERFETCH = 10
+
     def __init__(
         self,
         embedding_service: EmbeddingService,
         event_bus: Optional[EventBusService] = None,
+        use_pgvector: bool = True,
     ):
         """
         Initialize memory service.
@@ -56,9 +70,14 @@ class MemoryService:
         Args:
             embedding_service: Service for generating text embeddings.
             event_bus: Optional event bus for publishing memory events.
+            use_pgvector: Run semantic search in Postgres via pgvector
+                (falls back to in-memory scoring if the query fails).
         """
         self.embedding_service = embedding_service
         self.event_bus = event_bus
+        self.use_pgvector = use_pgvector
+        # Whether pgvector supports hnsw.iterative_scan (>= 0.8); checked once
+        self._hnsw_iterative_scan: Optional[bool] = None
 
     async def classify_memory_type(
         self,
@@ -221,6 +240,7 @@ class MemoryService:
             execution_summary=execution_summary,
             memory_type=classified_type,
             context_embedding=embedding,
+            embedding_vector=pgvector_embedding(embedding),
             success=success,
             error_patterns=error_patterns,
             learned_at=utc_now(),
@@ -320,64 +340,192 @@ class MemoryService:
         memory_types: Optional[List[str]],
     ) -> List[SimilarTask]:
         """Semantic search using embedding similarity."""
+        # Validate all memory types (REQ-MEM-TAX-002)
+        for mem_type in memory_types or []:
+            if not MemoryType.is_valid(mem_type):
+                raise ValueError(
+                    f"Invalid memory_type in filter: {mem_type}. "
+                    f"Must be one of: {', '.join(MemoryType.all_types())}"
+                )
+
         # Generate embedding for query (use is_query=True for multilingual-e5-large)
         query_embedding = self.embedding_service.generate_embedding(
             task_description, is_query=True
         )
 
-        # Query memories with embeddings
-        query = select(TaskMemory).where(TaskMemory.context_embedding.isnot(None))
+        # Prefer the pgvector ANN index; fall back to scoring in Python
+        top_results = None
+        if self.use_pgvector:
+            top_results = self._semantic_search_pgvector(
+                session,
+                query_embedding,
+                top_k,
+                similarity_threshold,
+                success_only,
+                memory_types,
+            )
+        if top_results is None:
+            top_results = self._semantic_search_in_memory(
+                session,
+                query_embedding,
+                top_k,
+                similarity_threshold,
+                success_only,
+                memory_types,
+            )
 
+        # Increment reuse counters
+        for result in top_results:
+            memory = session.get(TaskMemory, result.memory_id)
+            if memory:
+                memory.increment_reuse()
+
+        return top_results
+
+    def _semantic_search_pgvector(
+        self,
+        session: Session,
+        query_embedding: List[float],
+        top_k: int,
+        similarity_threshold: float,
+        success_only: bool,
+        memory_types: Optional[List[str]],
+    ) -> Optional[List[SimilarTask]]:
+        """
+        Semantic search in Postgres using the embedding_vector HNSW index.
+
+        Similarity, threshold, filters and top-K are evaluated in one query,
+        with the query vector bound as a parameter. Filters run after the
+        index scan, so hnsw.ef_search is raised for the transaction (see
+        _hnsw_ef_search) and, on pgvector >= 0.8, iterative scans keep
+        searching until enough rows pass the filters.
+
+        Returns:
+            Results ordered by similarity, or None if pgvector is unavailable
+            (caller falls back to the in-memory path)
+        """
+        if not query_embedding or len(query_embedding) != MEMORY_EMBEDDING_DIMENSIONS:
+            return None
+
+        distance = TaskMemory.embedding_vector.cosine_distance(query_embedding)
+        query = (
+            select(
+                TaskMemory.id,
+                TaskMemory.task_id,
+                TaskMemory.execution_summary,
+                TaskMemory.success,
+                TaskMemory.reused_count,
+                distance.label("distance"),
+            )
+            .where(
+                TaskMemory.embedding_vector.isnot(None),
+                # Cosine distance = 1 - cosine similarity
+                distance <= 1.0 - similarity_threshold,
+            )
+            .order_by(distance)
+            .limit(top_k)
+        )
         if success_only:
             query = query.where(TaskMemory.success == True)  # noqa: E712
-
-        # Filter by memory types if provided (REQ-MEM-SEARCH-005)
         if memory_types:
-            # Validate all memory types (REQ-MEM-TAX-002)
-            for mem_type in memory_types:
-                if not MemoryType.is_valid(mem_type):
-                    raise ValueError(
-                        f"Invalid memory_type in filter: {mem_type}. "
-                        f"Must be one of: {', '.join(MemoryType.all_types())}"
-                    )
             query = query.where(TaskMemory.memory_type.in_(memory_types))
 
-        memories = session.execute(query).scalars().all()
-
-        # Calculate similarities
-        results = []
-        for memory in memories:
-            if memory.context_embedding:
-                similarity = self.embedding_service.cosine_similarity(
-                    query_embedding, memory.context_embedding
+        filtered = success_only or bool(memory_types)
+        try:
+            # Savepoint so a failure doesn't poison the caller's transaction
+            with session.begin_nested():
+                session.execute(
+                    select(
+                        func.set_config(
+                            "hnsw.ef_search",
+                            str(self._hnsw_ef_search(top_k, filtered)),
+                            True,
+                        )
+                    )
                 )
-
-                if similarity >= similarity_threshold:
-                    results.append(
-                        SimilarTask(
-                            task_id=memory.task_id,
-                            memory_id=memory.id,
-                            summary=memory.execution_summary,
-                            success=memory.success,
-                            similarity_score=similarity,
-                            reused_count=memory.reused_count,
-                            semantic_score=similarity,
+                if filtered and self._supports_iterative_scan(session):
+                    session.execute(
+                        select(
+                            func.set_config("hnsw.iterative_scan", "strict_order", True)
                         )
                     )
+                rows = session.execute(query).all()
+        except Exception as e:
+            logger.warning(
+                "pgvector memory search failed, using in-memory fallback",
+                error=str(e),
+            )
+            return None
 
-        # Sort by similarity descending
-        results.sort(key=lambda x: x.similarity_score, reverse=True)
+        return [
+            SimilarTask(
+                task_id=row.task_id,
+                memory_id=row.id,
+                summary=row.execution_summary,
+                success=row.success,
+                similarity_score=1.0 - row.distance,
+                reused_count=row.reused_count,
+                semantic_score=1.0 - row.distance,
+            )
+            for row in rows
+        ]
 
-        # Return top K
-        top_results = results[:top_k]
+    def _hnsw_ef_search(self, top_k: int, filtered: bool) -> int:
+        """hnsw.ef_search for a search returning top_k rows."""
+        candidates = top_k * (self.HNSW_FILTER_OVERFETCH if filtered else 1)
+        return max(self.HNSW_EF_SEARCH_MIN, min(candidates, self.HNSW_EF_SEARCH_MAX))
+
+    def _supports_iterative_scan(self, session: Session) -> bool:
+        """Whether the installed pgvector has hnsw.iterative_scan (>= 0.8)."""
+        if self._hnsw_iterative_scan is None:
+            version = session.execute(
+                text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+            ).scalar()
+            parts = tuple(int(p) for p in re.findall(r"\d+", version or "")[:2])
+            self._hnsw_iterative_scan = parts >= (0, 8)
+        return self._hnsw_iterative_scan
+
+    def _semantic_search_in_memory(
+        self,
+        session: Session,
+        query_embedding: List[float],
+        top_k: int,
+        similarity_threshold: float,
+        success_only: bool,
+        memory_types: Optional[List[str]],
+    ) -> List[SimilarTask]:
+        """Semantic search scoring every stored embedding in Python (fallback)."""
+        # Query memories with embeddings
+        query = select(TaskMemory).where(TaskMemory.context_embedding.isnot(None))
 
-        # Increment reuse counters
-        for result in top_results:
-            memory = session.get(TaskMemory, result.memory_id)
-            if memory:
-                memory.increment_reuse()
+        if success_only:
+            query = query.where(TaskMemory.success == True)  # noqa: E712
 
-        return top_results
+        # Filter by memory types if provided (REQ-MEM-SEARCH-005)
+        if memory_types:
+            query = query.where(TaskMemory.memory_type.in_(memory_types))
+
+        memories = session.execute(query).scalars().all()
+
+        # Score every embedding in one matrix-vector product
+        matrix = EmbeddingMatrix(
+            [memory.context_embedding for memory in memories],
+            dims=len(query_embedding),
+        )
+        return [
+            SimilarTask(
+                task_id=memories[i].task_id,
+                memory_id=memories[i].id,
+                summary=memories[i].execution_summary,
+                success=memories[i].success,
+                similarity_score=similarity,
+                reused_count=memories[i].reused_count,
+                semantic_score=similarity,
+            )
+            for i, similarity in matrix.top_k(
+                query_embedding, top_k, similarity_threshold
+            )
+        ]
 
     def _keyword_search(
         self,
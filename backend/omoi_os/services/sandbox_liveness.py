@@ -0,0 +1,384 @@
+"""Liveness store for sandbox heartbeats.
+
+Workers send a heartbeat every 30s per sandbox. Persisting each one as a
+SandboxEvent row made heartbeats the bulk of sandbox_events, and liveness
+checks scanned that table (DISTINCT over recent heartbeats). The liveness
+store keeps one small record per sandbox instead:
+
+- RedisLivenessStore: a sorted set of sandbox IDs scored by last-seen time
+  plus a hash per sandbox (first/last seen, count, status). One pipelined
+  round trip per heartbeat; live sandboxes are one ZRANGEBYSCORE.
+- InMemoryLivenessStore: same interface, process-local. Used in tests and
+  while Redis is unavailable; get_liveness_store() keeps retrying Redis
+  with backoff so a worker doesn't stay on private liveness for good.
+
+The store also tracks when a sandbox's heartbeats were last rolled up, so
+callers persist one summarized heartbeat row per rollup interval.
+
+Follows the RedisMessageQueue / InMemoryMessageQueue pattern from
+message_queue.py.
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional, TypeAlias
+
+import redis
+
+from omoi_os.logging import get_logger
+from omoi_os.utils.datetime import utc_now
+
+logger = get_logger(__name__)
+
+# One summarized heartbeat row per sandbox per interval
+DEFAULT_ROLLUP_INTERVAL = timedelta(minutes=10)
+
+# Sandboxes not seen for this long are dropped from the store
+DEFAULT_RECORD_TTL = timedelta(days=7)
+
+
+@dataclass(frozen=True)
+class HeartbeatRecord:
+    """Liveness state of one sandbox."""
+
+    sandbox_id: str
+    first_seen: datetime
+    last_seen: datetime
+    count: int
+    status: Optional[str] = None
+    # Heartbeats since the last persisted rollup
+    pending_count: int = 0
+    last_rollup_at: Optional[datetime] = None
+
+
+def _to_timestamp(value: datetime) -> float:
+    return value.timestamp()
+
+
+def _from_timestamp(value: str | float) -> datetime:
+    return datetime.fromtimestamp(float(value), tz=timezone.utc)
+
+
+class RedisLivenessStore:
+    """
+    Redis-backed liveness store, shared by all server processes.
+
+    Key pattern:
+    - sandbox:liveness (sorted set): sandbox_id scored by last-seen epoch
+    - sandbox:heartbeat:{sandbox_id} (hash): first_seen, last_seen, count,
+      status, pending_count, last_rollup_at
+    """
+
+    shared = True
+
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:16379",
+        rollup_interval: timedelta = DEFAULT_ROLLUP_INTERVAL,
+        record_ttl: timedelta = DEFAULT_RECORD_TTL,
+        redis_client: Optional[redis.Redis] = None,
+    ):
+        """
+        Initialize Redis liveness store.
+
+        Args:
+            redis_url: Redis connection URL
+            rollup_interval: Minimum time between persisted heartbeat rollups
+            record_ttl: How long an unseen sandbox is remembered
+            redis_client: Preconfigured client (tests)
+        """
+        self.redis_client = redis_client or redis.from_url(
+            redis_url,
+            decode_responses=True,
+            socket_timeout=2.0,
+            socket_connect_timeout=2.0,
+        )
+        self.rollup_interval = rollup_interval
+        self.record_ttl = record_ttl
+        self._index_key = "sandbox:liveness"
+        self._key_prefix = "sandbox:heartbeat:"
+
+    def _get_key(self, sandbox_id: str) -> str:
+        """Get Redis key for a sandbox's heartbeat record."""
+        return f"{self._key_prefix}{sandbox_id}"
+
+    def record_heartbeat(
+        self,
+        sandbox_id: str,
+        status: Optional[str] = None,
+        at: Optional[datetime] = None,
+    ) -> HeartbeatRecord:
+        """
+        Record a heartbeat in one round trip.
+
+        Args:
+            sandbox_id: Sandbox that sent the heartbeat
+            status: Status reported by the heartbeat ('running', 'idle', ...)
+            at: Heartbeat time (defaults to now)
+
+        Returns:
+            Updated record for the sandbox
+        """
+        now = _to_timestamp(at or utc_now())
+        key = self._get_key(sandbox_id)
+        fields = {"last_seen": now}
+        if status is not None:
+            fields["status"] = status
+
+        pipe = self.redis_client.pipeline(transaction=True)
+        pipe.zadd(self._index_key, {sandbox_id: now})
+        pipe.zremrangebyscore(
+            self._index_key, "-inf", now - self.record_ttl.total_seconds()
+        )
+        pipe.hsetnx(key, "first_seen", now)
+        pipe.hset(key, mapping=fields)
+        pipe.hincrby(key, "count", 1)
+        pipe.hincrby(key, "pending_count", 1)
+        pipe.expire(key, int(self.record_ttl.total_seconds()))
+        pipe.hgetall(key)
+        results = pipe.execute()
+        return self._parse(sandbox_id, results[-1])
+
+    def get(self, sandbox_id: str) -> Optional[HeartbeatRecord]:
+        """Get the liveness record for a sandbox, if it has sent heartbeats."""
+        data = self.redis_client.hgetall(self._get_key(sandbox_id))
+        return self._parse(sandbox_id, data) if data else None
+
+    def get_many(self, sandbox_ids: Iterable[str]) -> dict[str, HeartbeatRecord]:
+        """Get liveness records for several sandboxes in one round trip."""
+        sandbox_ids = list(sandbox_ids)
+        pipe = self.redis_client.pipeline(transaction=False)
+        for sandbox_id in sandbox_ids:
+            pipe.hgetall(self._get_key(sandbox_id))
+        return {
+            sandbox_id: self._parse(sandbox_id, data)
+            for sandbox_id, data in zip(sandbox_ids, pipe.execute())
+            if data
+        }
+
+    def active_sandbox_ids(self, since: datetime) -> list[str]:
+        """Sandbox IDs with a heartbeat at or after `since`, most recent first."""
+        return self.redis_client.zrevrangebyscore(
+            self._index_key, "+inf", _to_timestamp(since)
+        )
+
+    def rollup_due(self, record: HeartbeatRecord) -> bool:
+        """Whether the sandbox's heartbeats should be persisted as a rollup."""
+        return (
+            record.last_rollup_at is None
+            or record.last_seen - record.last_rollup_at >= self.rollup_interval
+        )
+
+    def mark_rolled_up(self, record: HeartbeatRecord) -> None:
+        """Record that `record.pending_count` heartbeats were persisted."""
+        key = self._get_key(record.sandbox_id)
+        pipe = self.redis_client.pipeline(transaction=True)
+        pipe.hset(key, "last_rollup_at", _to_timestamp(record.last_seen))
+        # Decrement rather than reset so concurrent heartbeats are kept
+        pipe.hincrby(key, "pending_count", -record.pending_count)
+        pipe.execute()
+
+    def remove(self, sandbox_id: str) -> None:
+        """Forget a sandbox (e.g. after termination)."""
+        pipe = self.redis_client.pipeline(transaction=True)
+        pipe.zrem(self._index_key, sandbox_id)
+        pipe.delete(self._get_key(sandbox_id))
+        pipe.execute()
+
+    def close(self) -> None:
+        """Close Redis connection."""
+        self.redis_client.close()
+
+    @staticmethod
+    def _parse(sandbox_id: str, data: dict) -> HeartbeatRecord:
+        last_rollup_at = data.get("last_rollup_at")
+        return HeartbeatRecord(
+            sandbox_id=sandbox_id,
+            first_seen=_from_timestamp(data["first_seen"]),
+            last_seen=_from_timestamp(data["last_seen"]),
+            count=int(data.get("count", 0)),
+            status=data.get("status"),
+            pending_count=int(data.get("pending_count", 0)),
+            last_rollup_at=_from_timestamp(last_rollup_at) if last_rollup_at else None,
+        )
+
+
+class InMemoryLivenessStore:
+    """
+    Thread-safe in-memory liveness store.
+
+    Same interface as RedisLivenessStore but only sees heartbeats received
+    by this process, so `shared` is False.
+    """
+
+    shared = False
+
+    def __init__(
+        self,
+        rollup_interval: timedelta = DEFAULT_ROLLUP_INTERVAL,
+        record_ttl: timedelta = DEFAULT_RECORD_TTL,
+    ):
+        self.rollup_interval = rollup_interval
+        self.record_ttl = record_ttl
+        self._records: dict[str, HeartbeatRecord] = {}
+        self._lock = threading.Lock()
+
+    def record_heartbeat(
+        self,
+        sandbox_id: str,
+        status: Optional[str] = None,
+        at: Optional[datetime] = None,
+    ) -> HeartbeatRecord:
+        """Record a heartbeat. Returns the updated record."""
+        now = at or utc_now()
+        with self._lock:
+            previous = self._records.get(sandbox_id)
+            if previous is None:
+                record = HeartbeatRecord(
+                    sandbox_id=sandbox_id,
+                    first_seen=now,
+                    last_seen=now,
+                    count=1,
+                    status=status,
+                    pending_count=1,
+                )
+            else:
+                record = replace(
+                    previous,
+                    last_seen=now,
+                    count=previous.count + 1,
+                    status=status if status is not None else previous.status,
+                    pending_count=previous.pending_count + 1,
+                )
+            self._records[sandbox_id] = record
+            self._prune(now)
+        return record
+
+    def get(self, sandbox_id: str) -> Optional[HeartbeatRecord]:
+        """Get the liveness record for a sandbox, if it has sent heartbeats."""
+        with self._lock:
+            return self._records.get(sandbox_id)
+
+    def get_many(self, sandbox_ids: Iterable[str]) -> dict[str, HeartbeatRecord]:
+        """Get liveness records for several sandboxes."""
+        with self._lock:
+            return {
+                sandbox_id: self._records[sandbox_id]
+                for sandbox_id in sandbox_ids
+                if sandbox_id in self._records
+            }
+
+    def active_sandbox_ids(self, since: datetime) -> list[str]:
+        """Sandbox IDs with a heartbeat at or after `since`, most recent first."""
+        with self._lock:
+            live = [r for r in self._records.values() if r.last_seen >= since]
+        live.sort(key=lambda r: r.last_seen, reverse=True)
+        return [r.sandbox_id for r in live]
+
+    def rollup_due(self, record: HeartbeatRecord) -> bool:
+        """Whether the sandbox's heartbeats should be persisted as a rollup."""
+        return (
+            record.last_rollup_at is None
+            or record.last_seen - record.last_rollup_at >= self.rollup_interval
+        )
+
+    def mark_rolled_up(self, record: HeartbeatRecord) -> None:
+        """Record that `record.pending_count` heartbeats were persisted."""
+        with self._lock:
+            current = self._records.get(record.sandbox_id)
+            if current is not None:
+                self._records[record.sandbox_id] = replace(
+                    current,
+                    last_rollup_at=record.last_seen,
+                    pending_count=current.pending_count - record.pending_count,
+                )
+
+    def remove(self, sandbox_id: str) -> None:
+        """Forget a sandbox (e.g. after termination)."""
+        with self._lock:
+            self._records.pop(sandbox_id, None)
+
+    def close(self) -> None:
+        """Nothing to close."""
+
+    def _prune(self, now: datetime) -> None:
+        cutoff = now - self.record_ttl
+        stale = [sid for sid, r in self._records.items() if r.last_seen < cutoff]
+        for sandbox_id in stale:
+            del self._records[sandbox_id]
+
+
+# Type alias for either implementation
+SandboxLivenessStore: TypeAlias = RedisLivenessStore | InMemoryLivenessStore
+
+# Redis retry backoff while the in-memory fallback is in use
+RETRY_BACKOFF_INITIAL = 5.0
+RETRY_BACKOFF_MAX = 300.0
+
+_liveness_store: Optional[SandboxLivenessStore] = None
+_liveness_store_lock = threading.Lock()
+_fallback_store: Optional[InMemoryLivenessStore] = None
+_retry_at = 0.0
+_retry_backoff = RETRY_BACKOFF_INITIAL
+
+
+def get_liveness_store() -> SandboxLivenessStore:
+    """
+    Get the process-wide liveness store.
+
+    Uses Redis from settings when reachable, otherwise (or with
+    TESTING=true) an in-memory store. While on the in-memory fallback,
+    Redis is retried after a backoff (doubling up to RETRY_BACKOFF_MAX),
+    and the shared store replaces the fallback once it answers.
+    """
+    global _liveness_store, _fallback_store, _retry_at, _retry_backoff
+    store = _liveness_store
+    if store is not None and (store.shared or time.monotonic() < _retry_at):
+        return store
+
+    with _liveness_store_lock:
+        if _liveness_store is not None and (
+            _liveness_store.shared or time.monotonic() < _retry_at
+        ):
+            return _liveness_store
+
+        if os.environ.get("TESTING", "").lower() == "true":
+            _liveness_store = InMemoryLivenessStore()
+            _retry_at = float("inf")
+            return _liveness_store
+
+        from omoi_os.config import get_app_settings
+
+        try:
+            store = RedisLivenessStore(redis_url=get_app_settings().redis.url)
+            store.redis_client.ping()
+        except Exception as e:
+            logger.warning(
+                f"Sandbox liveness store is process-local, Redis unavailable "
+                f"(retrying in {_retry_backoff:.0f}s): {e}"
+            )
+            if _fallback_store is None:
+                _fallback_store = InMemoryLivenessStore()
+            _liveness_store = _fallback_store
+            _retry_at = time.monotonic() + _retry_backoff
+            _retry_backoff = min(_retry_backoff * 2, RETRY_BACKOFF_MAX)
+            return _liveness_store
+
+        if _fallback_store is not None:
+            logger.info("Sandbox liveness store reconnected to Redis")
+        _liveness_store = store
+        _fallback_store = None
+        _retry_backoff = RETRY_BACKOFF_INITIAL
+    return _liveness_store
+
+
+def reset_liveness_store() -> None:
+    """Reset the process-wide liveness store (useful for tests)."""
+    global _liveness_store, _fallback_store, _retry_at, _retry_backoff
+    _liveness_store = None
+    _fallback_store = None
+    _retry_at = 0.0
+    _retry_backoff = RETRY_BACKOFF_INITIAL
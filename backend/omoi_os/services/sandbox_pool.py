@@ -0,0 +1,718 @@
+"""Warm pool of pre-created sandboxes for fast task startup.
+
+Creating a Daytona sandbox and installing the agent runtime dominates the
+time between a task being claimed and the agent producing output. The warm
+pool keeps a few sandboxes per profile (snapshot/image, resources, runtime)
+already created and provisioned, so DaytonaSpawnerService can lease one
+instead of creating it inline.
+
+- Profiles are registered with a target size; a background task refills
+  each profile up to its target and evicts sandboxes idle longer than
+  max_idle (which should stay below the provider's auto-stop interval).
+  Creates run as tracked tasks, so a slow create never delays eviction or
+  the next refill pass.
+  After a failed create a profile is not refilled again until its backoff
+  (doubling per consecutive failure, capped) has passed.
+- lease() never waits for creation: it returns a ready sandbox or None,
+  and the caller falls back to creating one.
+- Providers are pluggable: DaytonaSandboxProvider for real sandboxes and
+  MockSandboxProvider for tests and offline development.
+  DaytonaSandboxProvider also runs the spawner's other SDK calls, so
+  blocking Daytona requests never run on the event loop.
+
+Hit/miss/eviction counters are kept in ``stats``.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Protocol,
+    Set,
+)
+from uuid import uuid4
+
+from omoi_os.logging import get_logger
+from omoi_os.utils.datetime import utc_now
+
+logger = get_logger(__name__)
+
+DEFAULT_SANDBOX_IMAGE = "nikolaik/python-nodejs:python3.12-nodejs22"
+
+
+@dataclass(frozen=True)
+class SandboxProfile:
+    """What a sandbox is created from; pooled sandboxes are per profile."""
+
+    snapshot: Optional[str]
+    image: Optional[str]
+    cpu: int
+    memory_gb: int
+    disk_gb: int
+    runtime: str = "claude"
+
+    @property
+    def key(self) -> str:
+        """Stable identifier, also used as the sandbox's pool label."""
+        source = f"snapshot:{self.snapshot}" if self.snapshot else f"image:{self.image}"
+        return (
+            f"{source}/{self.cpu}cpu-{self.memory_gb}gb-{self.disk_gb}gb/{self.runtime}"
+        )
+
+
+@dataclass
+class PooledSandbox:
+    """A created (and provisioned) sandbox waiting in the pool."""
+
+    sandbox: Any
+    profile: SandboxProfile
+    created_at: datetime = field(default_factory=utc_now)
+    # Monotonic time the sandbox became ready, for idle eviction
+    ready_at: float = field(default_factory=time.monotonic)
+
+
+class SandboxProvider(Protocol):
+    """Creates and destroys sandboxes for the pool."""
+
+    async def create(self, profile: SandboxProfile, labels: Dict[str, str]) -> Any:
+        """Create a sandbox for a profile."""
+        ...
+
+    async def destroy(self, sandbox: Any) -> None:
+        """Delete a sandbox."""
+        ...
+
+
+class DaytonaSandboxProvider:
+    """Daytona-backed sandbox provider and the gateway for all SDK calls.
+
+    The Daytona SDK is synchronous, so every call goes through run(): it
+    executes on a dedicated thread pool, at most max_concurrency calls at a
+    time, with a per-operation timeout. Teardown (stop/delete) has its own
+    small pool, so it is never queued behind long start_worker calls. Queue
+    wait (time until a worker thread picks the call up) and execution time
+    are tracked per operation in ``stats``, so a saturated pool shows up as
+    queue wait rather than as slow sandboxes. The SDK client is created once
+    and reused.
+
+    A timed-out call keeps running on its thread. create() therefore deletes
+    the sandbox if an abandoned create finishes later, so it does not leak.
+    """
+
+    # Per-operation timeouts in seconds (start_worker covers dependency installs)
+    DEFAULT_TIMEOUTS: Dict[str, float] = {
+        "create": 300.0,
+        "provision": 600.0,
+        "start_worker": 900.0,
+        "exec": 120.0,
+    }
+    DEFAULT_TIMEOUT = 60.0
+    # Operations run on the teardown pool
+    TEARDOWN_OPERATIONS = frozenset({"stop", "delete"})
+    # Queue waits above this are logged (the pool is saturated)
+    SLOW_QUEUE_WAIT = 5.0
+
+    def __init__(
+        self,
+        api_key: str,
+        api_url: str,
+        target: str = "us",
+        max_concurrency: int = 8,
+        teardown_concurrency: int = 2,
+        timeouts: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Initialize the provider.
+
+        Args:
+            api_key: Daytona API key
+            api_url: Daytona API URL
+            target: Daytona region
+            max_concurrency: Maximum SDK calls running at once
+            teardown_concurrency: Maximum stop/delete calls running at once
+            timeouts: Per-operation timeout overrides in seconds
+        """
+        self.api_key = api_key
+        self.api_url = api_url
+        self.target = target
+        self.max_concurrency = max_concurrency
+        self.timeouts = {**self.DEFAULT_TIMEOUTS, **(timeouts or {})}
+        self._client: Any = None
+        self._client_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="daytona-sdk"
+        )
+        self._teardown_executor = ThreadPoolExecutor(
+            max_workers=teardown_concurrency, thread_name_prefix="daytona-teardown"
+        )
+        self.stats: Dict[str, Any] = {
+            "calls": 0,
+            "in_flight": 0,
+            "errors": 0,
+            "timeouts": 0,
+            "abandoned_cleanups": 0,
+            "operations": {},
+        }
+
+    @property
+    def client(self) -> Any:
+        """Daytona SDK client (raises ImportError if the SDK is missing)."""
+        with self._client_lock:
+            if self._client is None:
+                from daytona import Daytona, DaytonaConfig
+
+                self._client = Daytona(
+                    DaytonaConfig(
+                        api_key=self.api_key,
+                        api_url=self.api_url,
+                        target=self.target,
+                    )
+                )
+            return self._client
+
+    async def run(
+        self,
+        operation: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        timeout: Optional[float] = None,
+        on_abandoned: Optional[Callable[[Any], None]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Run a blocking SDK call on the SDK (or teardown) thread pool.
+
+        Args:
+            operation: Name used for timeouts and stats (e.g. "create")
+            fn: Blocking callable
+            *args: Positional arguments for fn
+            timeout: Seconds before giving up (default: per-operation)
+            on_abandoned: Blocking cleanup for the result of a call that
+                finishes after the caller timed out or was cancelled; runs on
+                the teardown pool
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            fn's return value
+
+        Raises:
+            TimeoutError: If the call did not finish within the timeout
+        """
+        if timeout is None:
+            timeout = self.timeouts.get(operation, self.DEFAULT_TIMEOUT)
+        op_stats = self.stats["operations"].setdefault(
+            operation,
+            {"calls": 0, "queue_wait_seconds": 0.0, "exec_seconds": 0.0},
+        )
+        queued_at = time.perf_counter()
+        started_at: List[float] = []
+
+        def call() -> Any:
+            started_at.append(time.perf_counter())
+            return fn(*args, **kwargs)
+
+        self.stats["calls"] += 1
+        self.stats["in_flight"] += 1
+        op_stats["calls"] += 1
+        executor = (
+            self._teardown_executor
+            if operation in self.TEARDOWN_OPERATIONS
+            else self._executor
+        )
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(executor, call)
+        try:
+            # Shielded so a late result still reaches on_abandoned
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            # The thread keeps running; only the caller stops waiting
+            if on_abandoned is not None:
+                self._cleanup_when_done(operation, future, on_abandoned)
+            raise TimeoutError(
+                f"Daytona {operation} timed out after {timeout:g}s"
+            ) from None
+        except asyncio.CancelledError:
+            if on_abandoned is not None:
+                self._cleanup_when_done(operation, future, on_abandoned)
+            raise
+        except Exception:
+            self.stats["errors"] += 1
+            raise
+        finally:
+            finished_at = time.perf_counter()
+            self.stats["in_flight"] -= 1
+            started = started_at[0] if started_at else finished_at
+            queue_wait = started - queued_at
+            op_stats["queue_wait_seconds"] += queue_wait
+            op_stats["exec_seconds"] += finished_at - started
+            if queue_wait > self.SLOW_QUEUE_WAIT:
+                logger.warning(
+                    "daytona_sdk_queue_wait",
+                    operation=operation,
+                    queue_wait_seconds=round(queue_wait, 2),
+                    in_flight=self.stats["in_flight"],
+                )
+
+    def _cleanup_when_done(
+        self,
+        operation: str,
+        future: "asyncio.Future[Any]",
+        cleanup: Callable[[Any], None],
+    ) -> None:
+        """Run cleanup on the result of an abandoned call once it finishes."""
+
+        def run_cleanup(result: Any) -> None:
+            try:
+                cleanup(result)
+            except Exception as e:
+                logger.warning(
+                    "daytona_abandoned_cleanup_failed",
+                    operation=operation,
+                    error=str(e),
+                )
+
+        def on_done(done: "asyncio.Future[Any]") -> None:
+            if done.cancelled() or done.exception() is not None:
+                return
+            self.stats["abandoned_cleanups"] += 1
+            logger.warning(
+                "daytona_abandoned_call_finished",
+                operation=operation,
+                result_id=getattr(done.result(), "id", None),
+            )
+            try:
+                self._teardown_executor.submit(run_cleanup, done.result())
+            except RuntimeError:
+                # Provider closed; clean up on this thread rather than leak
+                run_cleanup(done.result())
+
+        future.add_done_callback(on_done)
+
+    async def get(self, sandbox_id: str) -> Any:
+        """Look up a sandbox by ID."""
+        return await self.run("get", lambda: self.client.get(sandbox_id))
+
+    async def exec(
+        self, sandbox: Any, command: str, timeout: Optional[float] = None
+    ) -> Any:
+        """Run a shell command in a sandbox."""
+        return await self.run("exec", sandbox.process.exec, command, timeout=timeout)
+
+    def close(self) -> None:
+        """Release the SDK thread pools (running calls finish in the background)."""
+        self._executor.shutdown(wait=False)
+        self._teardown_executor.shutdown(wait=False)
+
+    def create_sandbox(self, profile: SandboxProfile, labels: Dict[str, str]) -> Any:
+        """Create a sandbox, from the snapshot if set, otherwise the image.
+
+        Falls back to the image when the snapshot is unavailable.
+        """
+        from daytona import (
+            CreateSandboxFromImageParams,
+            CreateSandboxFromSnapshotParams,
+            Resources,
+        )
+
+        daytona = self.client
+
+        # Configure resources for sandbox (memory, CPU, disk)
+        # Higher memory helps prevent OOM kills (exit code -9)
+        resources = Resources(
+            cpu=profile.cpu,
+            memory=profile.memory_gb,
+            disk=profile.disk_gb,
+        )
+        resource_summary = (
+            f"with resources: {profile.cpu} CPU, "
+            f"{profile.memory_gb} GiB RAM, {profile.disk_gb} GiB disk"
+        )
+
+        if profile.snapshot:
+            logger.info(
+                f"Creating sandbox from snapshot: {profile.snapshot} {resource_summary}"
+            )
+            try:
+                params = CreateSandboxFromSnapshotParams(
+                    snapshot=profile.snapshot,
+                    labels=labels or None,
+                    ephemeral=True,  # Auto-delete when stopped
+                    public=False,
+                    resources=resources,
+                    # Safety net: auto-stop after 30min idle (our own idle
+                    # detection should fire first)
+                    auto_stop_interval=30,
+                )
+                return daytona.create(params=params, timeout=120)
+            except Exception as snapshot_error:
+                # Snapshot may be inactive/expired/unavailable -- fall back to image
+                logger.warning(
+                    f"Snapshot '{profile.snapshot}' creation failed: "
+                    f"{snapshot_error}. Falling back to image-based sandbox creation."
+                )
+
+        image = profile.image or DEFAULT_SANDBOX_IMAGE
+        logger.info(f"Creating sandbox from image: {image} {resource_summary}")
+        params = CreateSandboxFromImageParams(
+            image=image,
+            labels=labels or None,
+            ephemeral=True,  # Auto-delete when stopped
+            public=False,
+            resources=resources,
+            # Safety net: auto-stop after 30min idle (our own idle detection
+            # should fire first)
+            auto_stop_interval=30,
+        )
+        return daytona.create(params=params, timeout=120)
+
+    async def create(self, profile: SandboxProfile, labels: Dict[str, str]) -> Any:
+        """Create a sandbox without blocking the event loop.
+
+        If the caller stops waiting (timeout or cancellation) the sandbox is
+        deleted once the create finishes.
+        """
+        return await self.run(
+            "create",
+            self.create_sandbox,
+            profile,
+            labels,
+            on_abandoned=lambda sandbox: sandbox.delete(),
+        )
+
+    async def destroy(self, sandbox: Any) -> None:
+        """Delete a sandbox without blocking the event loop."""
+        await self.run("delete", sandbox.delete)
+
+
+class MockProcess:
+    """Records commands run in a MockSandbox."""
+
+    def __init__(self):
+        self.commands: List[str] = []
+
+    def exec(self, command: str, timeout: Optional[int] = None) -> Any:
+        self.commands.append(command)
+        return type("ExecResult", (), {"exit_code": 0, "result": "", "stdout": ""})()
+
+
+class MockFileSystem:
+    """Records files uploaded to a MockSandbox."""
+
+    def __init__(self):
+        self.files: Dict[str, bytes] = {}
+
+    def upload_file(self, content: bytes, path: str) -> None:
+        self.files[path] = content
+
+
+class MockSandbox:
+    """In-memory stand-in for a Daytona sandbox."""
+
+    def __init__(self, labels: Optional[Dict[str, str]] = None):
+        self.id = f"mock-{uuid4().hex[:12]}"
+        self.labels = dict(labels or {})
+        self.process = MockProcess()
+        self.fs = MockFileSystem()
+        self.deleted = False
+
+    def set_labels(self, labels: Dict[str, str]) -> Dict[str, str]:
+        self.labels = dict(labels)
+        return self.labels
+
+    def delete(self) -> None:
+        self.deleted = True
+
+
+class MockSandboxProvider:
+    """Sandbox provider that creates MockSandbox objects (offline testing)."""
+
+    def __init__(self, create_delay: float = 0.0, fail_creates: int = 0):
+        """
+        Initialize the provider.
+
+        Args:
+            create_delay: Seconds each create takes
+            fail_creates: Number of initial creates that raise
+        """
+        self.create_delay = create_delay
+        self.fail_creates = fail_creates
+        self.created: List[MockSandbox] = []
+        self.destroyed: List[MockSandbox] = []
+
+    async def create(
+        self, profile: SandboxProfile, labels: Dict[str, str]
+    ) -> MockSandbox:
+        if self.create_delay:
+            await asyncio.sleep(self.create_delay)
+        if self.fail_creates > 0:
+            self.fail_creates -= 1
+            raise RuntimeError("mock sandbox creation failed")
+        sandbox = MockSandbox(labels)
+        self.created.append(sandbox)
+        return sandbox
+
+    async def destroy(self, sandbox: MockSandbox) -> None:
+        sandbox.delete()
+        self.destroyed.append(sandbox)
+
+
+# Provisions a freshly created sandbox (install runtime, tools) before pooling
+ProvisionHook = Callable[[Any, SandboxProfile], Awaitable[None]]
+
+
+class WarmSandboxPool:
+    """Pool of ready sandboxes per profile, refilled in the background."""
+
+    def __init__(
+        self,
+        provider: SandboxProvider,
+        provision: Optional[ProvisionHook] = None,
+        max_idle: timedelta = timedelta(minutes=20),
+        refill_interval: float = 15.0,
+        create_backoff: float = 15.0,
+        max_create_backoff: float = 600.0,
+    ):
+        """
+        Initialize the pool (call start() inside the event loop).
+
+        Args:
+            provider: Creates and destroys sandboxes
+            provision: Prepares a created sandbox before it is pooled
+            max_idle: Pooled sandboxes older than this are destroyed
+            refill_interval: Seconds between background refill/evict passes
+            create_backoff: Seconds a profile waits after a failed create,
+                doubled for each consecutive failure
+            max_create_backoff: Upper bound for create_backoff
+        """
+        self.provider = provider
+        self.provision = provision
+        self.max_idle = max_idle
+        self.refill_interval = refill_interval
+        self.create_backoff = create_backoff
+        self.max_create_backoff = max_create_backoff
+        self._targets: Dict[SandboxProfile, int] = {}
+        self._ready: Dict[SandboxProfile, Deque[PooledSandbox]] = {}
+        self._creating: Dict[SandboxProfile, int] = {}
+        self._create_tasks: Set["asyncio.Task[bool]"] = set()
+        # Consecutive create failures and monotonic time refills may resume
+        self._create_failures: Dict[SandboxProfile, int] = {}
+        self._retry_at: Dict[SandboxProfile, float] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "created": 0,
+            "create_errors": 0,
+            "evicted": 0,
+            "last_create_seconds": 0.0,
+        }
+
+    @property
+    def running(self) -> bool:
+        """Whether the background refill task is active."""
+        return self._task is not None and not self._task.done()
+
+    def add_profile(self, profile: SandboxProfile, size: int) -> None:
+        """Keep `size` ready sandboxes for a profile."""
+        self._targets[profile] = size
+        self._ready.setdefault(profile, deque())
+        self._creating.setdefault(profile, 0)
+        self._signal()
+
+    def ready_count(self, profile: Optional[SandboxProfile] = None) -> int:
+        """Ready sandboxes for a profile (or in total)."""
+        if profile is not None:
+            return len(self._ready.get(profile, ()))
+        return sum(len(ready) for ready in self._ready.values())
+
+    async def start(self) -> None:
+        """Start the background refill/evict task."""
+        if self.running:
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        logger.info(
+            "warm_sandbox_pool_started",
+            profiles={p.key: size for p, size in self._targets.items()},
+        )
+
+    async def lease(self, profile: SandboxProfile) -> Optional[PooledSandbox]:
+        """
+        Take a ready sandbox for a profile without waiting.
+
+        Returns:
+            The pooled sandbox, or None on a miss (caller creates one)
+        """
+        ready = self._ready.get(profile)
+        now = time.monotonic()
+        while ready:
+            pooled = ready.popleft()
+            if now - pooled.ready_at <= self.max_idle.total_seconds():
+                self.stats["hits"] += 1
+                self._signal()
+                return pooled
+            await self._destroy(pooled)
+
+        self.stats["misses"] += 1
+        self._signal()
+        return None
+
+    async def refill(self) -> int:
+        """
+        Start creating sandboxes until each profile reaches its target.
+
+        Creates run in the background (see wait_for_creates()); sandboxes
+        still being created count toward the target. Profiles still backing
+        off after a failed create are skipped.
+
+        Returns:
+            Number of creates started
+        """
+        loop = asyncio.get_running_loop()
+        started = 0
+        now = time.monotonic()
+        for profile, target in self._targets.items():
+            if now < self._retry_at.get(profile, 0.0):
+                continue
+            deficit = target - len(self._ready[profile]) - self._creating[profile]
+            for _ in range(max(deficit, 0)):
+                self._creating[profile] += 1
+                task = loop.create_task(self._create(profile))
+                self._create_tasks.add(task)
+                task.add_done_callback(self._create_tasks.discard)
+                started += 1
+        return started
+
+    async def wait_for_creates(self) -> int:
+        """
+        Wait for every create in flight to finish.
+
+        Returns:
+            Number of those creates that added a sandbox to the pool
+        """
+        if not self._create_tasks:
+            return 0
+        results = await asyncio.gather(*self._create_tasks, return_exceptions=True)
+        return sum(1 for added in results if added is True)
+
+    async def evict_idle(self) -> int:
+        """
+        Destroy pooled sandboxes idle longer than max_idle.
+
+        Returns:
+            Number of sandboxes evicted
+        """
+        cutoff = time.monotonic() - self.max_idle.total_seconds()
+        expired = []
+        for ready in self._ready.values():
+            while ready and ready[0].ready_at < cutoff:
+                expired.append(ready.popleft())
+        for pooled in expired:
+            await self._destroy(pooled)
+        return len(expired)
+
+    async def close(self) -> None:
+        """Stop the background task and destroy every pooled sandbox."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        creating = list(self._create_tasks)
+        for task in creating:
+            task.cancel()
+        await asyncio.gather(*creating, return_exceptions=True)
+        pooled = [p for ready in self._ready.values() for p in ready]
+        for ready in self._ready.values():
+            ready.clear()
+        for item in pooled:
+            await self._destroy(item, evicted=False)
+        logger.info("warm_sandbox_pool_closed", destroyed=len(pooled))
+
+    def _signal(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.evict_idle()
+                await self.refill()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("warm_sandbox_pool_refill_failed", error=str(e))
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.refill_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def _create(self, profile: SandboxProfile) -> bool:
+        start = time.perf_counter()
+        sandbox = None
+        try:
+            sandbox = await self.provider.create(
+                profile,
+                {"project": "omoios", "pool": "warm", "profile": profile.key},
+            )
+            if self.provision is not None:
+                await self.provision(sandbox, profile)
+        except asyncio.CancelledError:
+            if sandbox is not None:
+                await self._destroy(PooledSandbox(sandbox, profile), evicted=False)
+            raise
+        except Exception as e:
+            self.stats["create_errors"] += 1
+            failures = self._create_failures.get(profile, 0) + 1
+            self._create_failures[profile] = failures
+            backoff = min(
+                self.create_backoff * 2 ** (failures - 1), self.max_create_backoff
+            )
+            self._retry_at[profile] = time.monotonic() + backoff
+            logger.warning(
+                "warm_sandbox_create_failed",
+                profile=profile.key,
+                error=str(e),
+                retry_in_seconds=backoff,
+            )
+            if sandbox is not None:
+                await self._destroy(PooledSandbox(sandbox, profile), evicted=False)
+            return False
+        finally:
+            self._creating[profile] -= 1
+
+        self._create_failures.pop(profile, None)
+        self._retry_at.pop(profile, None)
+        self._ready[profile].append(PooledSandbox(sandbox, profile))
+        self.stats["created"] += 1
+        self.stats["last_create_seconds"] = time.perf_counter() - start
+        return True
+
+    async def _destroy(self, pooled: PooledSandbox, evicted: bool = True) -> None:
+        if evicted:
+            self.stats["evicted"] += 1
+        try:
+            await self.provider.destroy(pooled.sandbox)
+        except Exception as e:
+            logger.warning(
+                "warm_sandbox_destroy_failed",
+                sandbox_id=getattr(pooled.sandbox, "id", None),
+                error=str(e),
+            )
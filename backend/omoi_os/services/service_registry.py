@@ -0,0 +1,141 @@
+"""Registry of lazily constructed services for the API server.
+
+The API lifespan used to construct every service before accepting
+traffic, including heavy ones (embedding model, memory, validation,
+monitoring) that many workers never use. Services are now registered as
+factories and built on first use; heavy pieces can be warmed up in the
+background after startup, so the first request that needs them does not
+pay the full cost.
+
+Factories may get() other services, so dependencies are built in order.
+Construction is thread-safe (request handlers run services in thread
+pools): each service is built once, under its own lock, so a slow build
+does not block unrelated services.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from omoi_os.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class ServiceRegistry:
+    """Named services, constructed on first get().
+
+    Usage:
+        registry = ServiceRegistry()
+        registry.register("memory", lambda: MemoryService(registry.get("embedding")))
+        memory = registry.get("memory")
+
+    Build times (seconds) are kept in build_seconds.
+    """
+
+    def __init__(self) -> None:
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._instances: Dict[str, Any] = {}
+        self._build_locks: Dict[str, threading.RLock] = {}
+        self._lock = threading.Lock()
+        self.build_seconds: Dict[str, float] = {}
+
+    def register(self, name: str, factory: Callable[[], Any]) -> None:
+        """Register a factory, replacing any previous one and its instance."""
+        with self._lock:
+            self._factories[name] = factory
+            self._instances.pop(name, None)
+            self._build_locks.setdefault(name, threading.RLock())
+
+    def provide(self, name: str, instance: Any) -> None:
+        """Register an already constructed service."""
+        self.register(name, lambda: instance)
+        with self._lock:
+            self._instances[name] = instance
+
+    def is_registered(self, name: str) -> bool:
+        return name in self._factories
+
+    def peek(self, name: str) -> Optional[Any]:
+        """The service if it has been constructed, without constructing it."""
+        return self._instances.get(name)
+
+    def get(self, name: str) -> Any:
+        """
+        Get a service, constructing it on first use.
+
+        A factory may return None (service unavailable); that result is
+        kept like any other.
+
+        Raises:
+            KeyError: If no factory is registered under name
+        """
+        if name in self._instances:
+            return self._instances[name]
+
+        with self._lock:
+            factory = self._factories.get(name)
+            build_lock = self._build_locks.get(name)
+        if factory is None or build_lock is None:
+            raise KeyError(f"Service not registered: {name}")
+
+        with build_lock:
+            # Another thread may have built it while we waited
+            if name in self._instances:
+                return self._instances[name]
+            start = time.perf_counter()
+            instance = factory()
+            self.build_seconds[name] = time.perf_counter() - start
+            with self._lock:
+                if self._factories.get(name) is factory:
+                    self._instances[name] = instance
+        logger.info(
+            "service_constructed",
+            service=name,
+            seconds=round(self.build_seconds[name], 3),
+        )
+        return instance
+
+    async def warmup(self, names: Iterable[str]) -> None:
+        """
+        Construct services in a worker thread, one after another.
+
+        Meant to run as a background task after startup; failures are
+        logged, and the service is retried on its next get().
+        """
+        for name in names:
+            if not self.is_registered(name) or name in self._instances:
+                continue
+            try:
+                await asyncio.to_thread(self.get, name)
+            except Exception as e:
+                logger.warning("service_warmup_failed", service=name, error=str(e))
+
+    def clear(self) -> None:
+        """Forget all factories and instances."""
+        with self._lock:
+            self._factories.clear()
+            self._instances.clear()
+            self._build_locks.clear()
+            self.build_seconds.clear()
+
+
+_service_registry: Optional[ServiceRegistry] = None
+_service_registry_lock = threading.Lock()
+
+
+def get_service_registry() -> ServiceRegistry:
+    """Get the process-wide service registry."""
+    global _service_registry
+    if _service_registry is None:
+        with _service_registry_lock:
+            if _service_registry is None:
+                _service_registry = ServiceRegistry()
+    return _service_registry
+
+
+def reset_service_registry() -> None:
+    """Reset the process-wide service registry (useful for tests)."""
+    global _service_registry
+    _service_registry = None
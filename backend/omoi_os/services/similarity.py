@@ -0,0 +1,158 @@
+"""Vectorized in-process cosine similarity shared by the dedup fallbacks.
+
+When pgvector is unavailable (or its query fails), the ticket, task, spec
+and memory services score candidates in Python. Pairwise loops over Python
+lists cost O(N·d) interpreter work per check; EmbeddingMatrix instead keeps
+the candidates as one contiguous, row-normalized float32 matrix so a query
+is a single matrix-vector product plus a partial sort.
+
+Only the scoring is vectorized: callers still load their candidates and
+build a fresh matrix on every check. Candidates are inserted, re-embedded
+and change status from other workers, so a per-process cache could not be
+invalidated reliably; pgvector remains the fast path.
+"""
+
+from typing import Optional, Sequence
+
+import numpy as np
+
+__all__ = ["EmbeddingMatrix", "cosine_similarity"]
+
+
+def cosine_similarity(
+    vec1: Optional[Sequence[float]], vec2: Optional[Sequence[float]]
+) -> float:
+    """
+    Cosine similarity between two vectors.
+
+    Args:
+        vec1: First vector.
+        vec2: Second vector.
+
+    Returns:
+        Similarity between -1 and 1; 0.0 for empty, zero or mismatched vectors.
+    """
+    if vec1 is None or vec2 is None:
+        return 0.0
+
+    v1 = np.asarray(vec1, dtype=np.float64)
+    v2 = np.asarray(vec2, dtype=np.float64)
+    if v1.size == 0 or v1.shape != v2.shape:
+        return 0.0
+
+    norm1 = np.linalg.norm(v1)
+    norm2 = np.linalg.norm(v2)
+    if norm1 == 0 or norm2 == 0:
+        return 0.0
+
+    return float(np.dot(v1, v2) / (norm1 * norm2))
+
+
+class EmbeddingMatrix:
+    """
+    Candidate embeddings as a contiguous, row-normalized float32 matrix.
+
+    Rows that are missing, zero, or of a different dimension than dims are
+    skipped; top_k() reports positions in the original input, so callers can
+    index back into their own candidate list.
+    """
+
+    def __init__(
+        self,
+        vectors: Sequence[Optional[Sequence[float]]],
+        dims: Optional[int] = None,
+    ):
+        """
+        Build the matrix.
+
+        Args:
+            vectors: Candidate embeddings (lists, arrays or pgvector values)
+            dims: Expected dimension, normally the query's or the configured
+                embedding size. Defaults to the first valid row's, so a
+                single stray row can then hide every other candidate.
+        """
+        rows: list[np.ndarray] = []
+        positions: list[int] = []
+
+        for position, vector in enumerate(vectors):
+            if vector is None:
+                continue
+            row = np.asarray(vector, dtype=np.float32)
+            if row.ndim != 1 or row.size == 0:
+                continue
+            if dims is None:
+                dims = row.size
+            elif row.size != dims:
+                continue
+            rows.append(row)
+            positions.append(position)
+
+        self.dims = dims or 0
+        self._positions = np.asarray(positions, dtype=np.int64)
+
+        if rows:
+            matrix = np.ascontiguousarray(np.vstack(rows))
+            norms = np.linalg.norm(matrix, axis=1)
+            nonzero = norms > 0
+            matrix = matrix[nonzero] / norms[nonzero, None]
+            self._positions = self._positions[nonzero]
+            self._matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+        else:
+            self._matrix = np.empty((0, self.dims), dtype=np.float32)
+
+    def __len__(self) -> int:
+        return self._matrix.shape[0]
+
+    def similarities(self, query: Sequence[float]) -> np.ndarray:
+        """
+        Cosine similarity of the query against every valid row.
+
+        Args:
+            query: Query embedding
+
+        Returns:
+            float32 array aligned with the valid rows (empty if the query is
+            zero or has the wrong dimension)
+        """
+        q = np.asarray(query, dtype=np.float32)
+        if len(self) == 0 or q.ndim != 1 or q.size != self.dims:
+            return np.empty(0, dtype=np.float32)
+        norm = np.linalg.norm(q)
+        if norm == 0:
+            return np.empty(0, dtype=np.float32)
+        return self._matrix @ (q / norm)
+
+    def top_k(
+        self,
+        query: Sequence[float],
+        k: int,
+        threshold: Optional[float] = None,
+    ) -> list[tuple[int, float]]:
+        """
+        Best-matching candidates for a query.
+
+        Args:
+            query: Query embedding
+            k: Maximum number of results
+            threshold: Optional minimum similarity (inclusive)
+
+        Returns:
+            (input position, similarity) pairs, highest similarity first
+        """
+        scores = self.similarities(query)
+        if scores.size == 0 or k <= 0:
+            return []
+
+        if threshold is not None:
+            keep = np.flatnonzero(scores >= threshold)
+        else:
+            keep = np.arange(scores.size)
+        if keep.size == 0:
+            return []
+
+        if keep.size > k:
+            best = np.argpartition(scores[keep], -k)[-k:]
+            keep = keep[best]
+        order = keep[np.argsort(-scores[keep], kind="stable")]
+
+        return [(int(self._positions[i]), float(scores[i])) for i in order]
@@ -38,6 +38,7 @@ from omoi_os.models.spec import (
 )
 from omoi_os.services.database import DatabaseService
 from omoi_os.services.embedding import EmbeddingService
+from omoi_os.services.similarity import EmbeddingMatrix, cosine_similarity
 
 logger = get_logger(__name__)
 
@@ -312,7 +313,8 @@ class SpecDeduplicationService:
         """Deduplicate a batch of requirements before insertion.
 
         This is optimized for the SYNC phase where multiple requirements
-        are generated and need to be checked in bulk.
+        are generated and need to be checked in bulk: one hash query, one
+        batch embedding call and one nearest-neighbour query for the batch.
 
         Args:
             spec_id: Spec to scope the search.
@@ -326,18 +328,21 @@ class SpecDeduplicationService:
             stats={"total": len(requirements), "created": 0, "skipped": 0, "merged": 0}
         )
 
-        for req in requirements:
+        # EARS format content, as in check_requirement_duplicate
+        dedup_results = await self._check_duplicates_bulk(
+            entity_type=EntityType.REQUIREMENT,
+            scope_field="spec_id",
+            scope_value=spec_id,
+            contents=[
+                f"{req.get('condition', '')}\n{req.get('action', '')}"
+                for req in requirements
+            ],
+            model_class=SpecRequirement,
+            session=session,
+        )
+
+        for req, dedup_result in zip(requirements, dedup_results):
             title = req.get("title", "")
-            condition = req.get("condition", "")
-            action = req.get("action", "")
-
-            dedup_result = await self.check_requirement_duplicate(
-                spec_id=spec_id,
-                title=title,
-                condition=condition,
-                action=action,
-                session=session,
-            )
 
             # Add hash and embedding to the requirement dict
             req["content_hash"] = dedup_result.content_hash
@@ -384,6 +389,9 @@ class SpecDeduplicationService:
     ) -> BulkDeduplicationResult:
         """Deduplicate a batch of tasks before insertion.
 
+        Runs as one hash query, one batch embedding call and one
+        nearest-neighbour query for the whole batch.
+
         Args:
             spec_id: Spec to scope the search.
             tasks: List of task dicts with title, description.
@@ -396,16 +404,20 @@ class SpecDeduplicationService:
             stats={"total": len(tasks), "created": 0, "skipped": 0, "merged": 0}
         )
 
-        for task in tasks:
-            title = task.get("title", "")
-            description = task.get("description", "")
+        dedup_results = await self._check_duplicates_bulk(
+            entity_type=EntityType.TASK,
+            scope_field="spec_id",
+            scope_value=spec_id,
+            contents=[
+                f"{task.get('title', '')}\n{task.get('description') or ''}"
+                for task in tasks
+            ],
+            model_class=SpecTask,
+            session=session,
+        )
 
-            dedup_result = await self.check_task_duplicate(
-                spec_id=spec_id,
-                title=title,
-                description=description,
-                session=session,
-            )
+        for task, dedup_result in zip(tasks, dedup_results):
+            title = task.get("title", "")
 
             task["content_hash"] = dedup_result.content_hash
             if dedup_result.embedding:
@@ -674,6 +686,126 @@ class SpecDeduplicationService:
             async with self.db.get_async_session() as sess:
                 return await _check(sess)
 
+    async def _check_duplicates_bulk(
+        self,
+        entity_type: EntityType,
+        scope_field: str,
+        scope_value: str,
+        contents: List[str],
+        model_class: Any,
+        session: Optional[AsyncSession] = None,
+    ) -> List[DeduplicationResult]:
+        """Batched _check_duplicate for many items in the same scope.
+
+        Same two phases and outcomes as checking each item on its own, but
+        with one hash query, one batch embedding call and one
+        nearest-neighbour query for the whole batch. Like the per-item check,
+        items are compared against existing entities only, not each other.
+
+        Args:
+            entity_type: Type of entity being checked.
+            scope_field: Field name for scoping (e.g., "spec_id").
+            scope_value: Value for the scope field.
+            contents: Content of each new item.
+            model_class: SQLAlchemy model class.
+            session: Optional async session.
+
+        Returns:
+            One DeduplicationResult per item, in input order.
+        """
+        content_hashes = [compute_content_hash(content) for content in contents]
+        threshold = SIMILARITY_THRESHOLDS[entity_type]
+
+        async def _check(sess: AsyncSession) -> List[DeduplicationResult]:
+            results: List[Optional[DeduplicationResult]] = [None] * len(contents)
+
+            # Phase 1: one hash query for the whole batch
+            exact_matches: dict[str, Any] = {}
+            if content_hashes:
+                hash_query = select(model_class).where(
+                    getattr(model_class, scope_field) == scope_value,
+                    model_class.content_hash.in_(set(content_hashes)),
+                )
+                hash_result = await sess.execute(hash_query)
+                for entity in hash_result.scalars():
+                    exact_matches.setdefault(entity.content_hash, entity)
+
+            pending = []
+            for i, content_hash in enumerate(content_hashes):
+                exact_match = exact_matches.get(content_hash)
+                if exact_match is None:
+                    pending.append(i)
+                    continue
+                results[i] = DeduplicationResult(
+                    is_duplicate=True,
+                    action="skip",
+                    candidates=[
+                        DuplicateCandidate(
+                            entity_id=exact_match.id,
+                            entity_type=entity_type,
+                            content_preview=self._get_content_preview(
+                                exact_match, entity_type
+                            ),
+                            similarity_score=1.0,
+                            is_exact_match=True,
+                        )
+                    ],
+                    highest_similarity=1.0,
+                    content_hash=content_hash,
+                    reason="Exact content match via hash",
+                )
+
+            # Phase 2: one embedding call and one similarity query
+            embeddings: List[Optional[List[float]]] = [None] * len(pending)
+            neighbours: List[List[DuplicateCandidate]] = [[] for _ in pending]
+            if self.embedding_service:
+                to_embed = [j for j, i in enumerate(pending) if contents[i].strip()]
+                if to_embed:
+                    vectors = self.embedding_service.batch_generate_embeddings(
+                        [contents[pending[j]] for j in to_embed]
+                    )
+                    for j, vector in zip(to_embed, vectors):
+                        embeddings[j] = vector
+                    neighbours = await self._find_similar_by_embeddings(
+                        sess=sess,
+                        model_class=model_class,
+                        scope_field=scope_field,
+                        scope_value=scope_value,
+                        embeddings=embeddings,
+                        entity_type=entity_type,
+                        threshold=threshold,
+                        top_k=3,
+                    )
+
+            for i, embedding, candidates in zip(pending, embeddings, neighbours):
+                if candidates and candidates[0].similarity_score >= threshold:
+                    highest = candidates[0].similarity_score
+                    results[i] = DeduplicationResult(
+                        is_duplicate=True,
+                        action="skip",
+                        candidates=candidates,
+                        highest_similarity=highest,
+                        content_hash=content_hashes[i],
+                        embedding=embedding,
+                        reason=f"Semantic similarity {highest:.2f} >= {threshold}",
+                    )
+                else:
+                    results[i] = DeduplicationResult(
+                        is_duplicate=False,
+                        action="create",
+                        content_hash=content_hashes[i],
+                        embedding=embedding,
+                        reason="No duplicate found",
+                    )
+
+            return results
+
+        if session:
+            return await _check(session)
+        else:
+            async with self.db.get_async_session() as sess:
+                return await _check(sess)
+
     async def _find_similar_by_embedding(
         self,
         sess: AsyncSession,
@@ -687,8 +819,6 @@ class SpecDeduplicationService:
     ) -> List[DuplicateCandidate]:
         """Find similar entities by embedding using pgvector.
 
-        Uses cosine distance operator for similarity search.
-
         Args:
             sess: Async database session.
             model_class: SQLAlchemy model class.
@@ -702,33 +832,88 @@ class SpecDeduplicationService:
         Returns:
             List of DuplicateCandidate sorted by similarity descending.
         """
-        # Build embedding string for pgvector
-        embedding_str = "[" + ",".join(str(x) for x in embedding) + "]"
-        table_name = model_class.__tablename__
+        neighbours = await self._find_similar_by_embeddings(
+            sess,
+            model_class,
+            scope_field,
+            scope_value,
+            [embedding],
+            entity_type,
+            threshold,
+            top_k,
+        )
+        return neighbours[0]
+
+    async def _find_similar_by_embeddings(
+        self,
+        sess: AsyncSession,
+        model_class: Any,
+        scope_field: str,
+        scope_value: str,
+        embeddings: List[Optional[List[float]]],
+        entity_type: EntityType,
+        threshold: float,
+        top_k: int = 3,
+    ) -> List[List[DuplicateCandidate]]:
+        """Nearest neighbours for several embeddings in one pgvector query.
 
-        # Use raw SQL for pgvector query
+        Each query vector is bound once (as a text[] parameter cast to
+        vector[]) and searched with a LATERAL top-k subquery, so the whole
+        batch is one round trip. Matching entities are then hydrated with a
+        single IN query for their previews.
+
+        Args:
+            sess: Async database session.
+            model_class: SQLAlchemy model class.
+            scope_field: Field name for scoping.
+            scope_value: Value for the scope field.
+            embeddings: Query embeddings; None entries get no candidates.
+            entity_type: Type of entity.
+            threshold: Minimum similarity threshold.
+            top_k: Maximum number of candidates per embedding.
+
+        Returns:
+            One candidate list per embedding, sorted by similarity descending.
+        """
+        neighbours: List[List[DuplicateCandidate]] = [[] for _ in embeddings]
+        indices = [i for i, embedding in enumerate(embeddings) if embedding]
+        if not indices:
+            return neighbours
+
+        table_name = model_class.__tablename__
         query = text(f"""
-            SELECT
-                id,
-                1 - (embedding_vector <=> '{embedding_str}'::vector) as similarity
-            FROM {table_name}
-            WHERE {scope_field} = :scope_value
-            AND embedding_vector IS NOT NULL
-            AND 1 - (embedding_vector <=> '{embedding_str}'::vector) >= :threshold
-            ORDER BY embedding_vector <=> '{embedding_str}'::vector
-            LIMIT :top_k
+            SELECT q.idx AS idx, c.id AS id, c.similarity AS similarity
+            FROM unnest(
+                CAST(CAST(:vectors AS text[]) AS vector[]),
+                CAST(:indices AS integer[])
+            ) AS q(vec, idx)
+            CROSS JOIN LATERAL (
+                SELECT id, 1 - (embedding_vector <=> q.vec) AS similarity
+                FROM {table_name}
+                WHERE {scope_field} = :scope_value
+                AND embedding_vector IS NOT NULL
+                ORDER BY embedding_vector <=> q.vec
+                LIMIT :top_k
+            ) AS c
+            WHERE c.similarity >= :threshold
+            ORDER BY q.idx, c.similarity DESC
         """)
+        params = {
+            "vectors": [
+                "[" + ",".join(str(float(x)) for x in embeddings[i]) + "]"
+                for i in indices
+            ],
+            "indices": indices,
+            "scope_value": scope_value,
+            "threshold": threshold,
+            "top_k": top_k,
+        }
 
         try:
-            result = await sess.execute(
-                query,
-                {
-                    "scope_value": scope_value,
-                    "threshold": threshold,
-                    "top_k": top_k,
-                },
-            )
-            rows = result.fetchall()
+            # Savepoint so a failure doesn't poison the caller's transaction
+            async with sess.begin_nested():
+                result = await sess.execute(query, params)
+                rows = result.fetchall()
         except Exception as e:
             logger.warning(f"pgvector similarity query failed: {e}")
             # Fallback to in-memory comparison
@@ -737,32 +922,36 @@ class SpecDeduplicationService:
                 model_class,
                 scope_field,
                 scope_value,
-                embedding,
+                embeddings,
                 entity_type,
                 threshold,
                 top_k,
             )
 
-        candidates = []
-        for row in rows:
-            # Fetch the full entity for preview
-            entity_query = select(model_class).where(model_class.id == row.id)
-            entity_result = await sess.execute(entity_query)
-            entity = entity_result.scalar_one_or_none()
+        if not rows:
+            return neighbours
 
+        # Hydrate all matched entities at once for their previews
+        entity_query = select(model_class).where(
+            model_class.id.in_({row.id for row in rows})
+        )
+        entity_result = await sess.execute(entity_query)
+        entities = {str(entity.id): entity for entity in entity_result.scalars()}
+
+        for row in rows:
+            entity = entities.get(str(row.id))
             if entity:
-                preview = self._get_content_preview(entity, entity_type)
-                candidates.append(
+                neighbours[row.idx].append(
                     DuplicateCandidate(
                         entity_id=str(row.id),
                         entity_type=entity_type,
-                        content_preview=preview,
+                        content_preview=self._get_content_preview(entity, entity_type),
                         similarity_score=float(row.similarity),
                         is_exact_match=False,
                     )
                 )
 
-        return candidates
+        return neighbours
 
     async def _fallback_similarity_check(
         self,
@@ -770,11 +959,11 @@ class SpecDeduplicationService:
         model_class: Any,
         scope_field: str,
         scope_value: str,
-        embedding: List[float],
+        embeddings: List[Optional[List[float]]],
         entity_type: EntityType,
         threshold: float,
         top_k: int,
-    ) -> List[DuplicateCandidate]:
+    ) -> List[List[DuplicateCandidate]]:
         """Fallback to in-memory similarity check if pgvector fails."""
         logger.info("Using fallback in-memory similarity check")
 
@@ -785,27 +974,26 @@ class SpecDeduplicationService:
         result = await sess.execute(query)
         entities = result.scalars().all()
 
-        candidates = []
-        for entity in entities:
-            if entity.embedding_vector:
-                similarity = self._cosine_similarity(
-                    embedding, list(entity.embedding_vector)
+        # Query embeddings all come from one service, so share one dimension
+        matrix = EmbeddingMatrix(
+            [entity.embedding_vector for entity in entities],
+            dims=next((len(embedding) for embedding in embeddings if embedding), 0),
+        )
+        return [
+            [
+                DuplicateCandidate(
+                    entity_id=str(entities[i].id),
+                    entity_type=entity_type,
+                    content_preview=self._get_content_preview(entities[i], entity_type),
+                    similarity_score=similarity,
+                    is_exact_match=False,
                 )
-                if similarity >= threshold:
-                    preview = self._get_content_preview(entity, entity_type)
-                    candidates.append(
-                        DuplicateCandidate(
-                            entity_id=str(entity.id),
-                            entity_type=entity_type,
-                            content_preview=preview,
-                            similarity_score=similarity,
-                            is_exact_match=False,
-                        )
-                    )
-
-        # Sort by similarity descending
-        candidates.sort(key=lambda x: x.similarity_score, reverse=True)
-        return candidates[:top_k]
+                for i, similarity in matrix.top_k(embedding, top_k, threshold)
+            ]
+            if embedding
+            else []
+            for embedding in embeddings
+        ]
 
     def _get_content_preview(self, entity: Any, entity_type: EntityType) -> str:
         """Get a preview of entity content for debugging."""
@@ -821,17 +1009,7 @@ class SpecDeduplicationService:
 
     def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
         """Compute cosine similarity between two vectors."""
-        if not vec1 or not vec2 or len(vec1) != len(vec2):
-            return 0.0
-
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        norm1 = sum(a * a for a in vec1) ** 0.5
-        norm2 = sum(b * b for b in vec2) ** 0.5
-
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-
-        return dot_product / (norm1 * norm2)
+        return cosine_similarity(vec1, vec2)
 
 
 # =============================================================================
@@ -16,6 +16,7 @@ from omoi_os.logging import get_logger
 from omoi_os.models.task import Task
 from omoi_os.services.database import DatabaseService
 from omoi_os.services.embedding import EmbeddingService
+from omoi_os.services.similarity import EmbeddingMatrix
 
 logger = get_logger(__name__)
 
@@ -232,33 +233,33 @@ class TaskDeduplicationService:
         if ticket_id:
             filters.append(Task.ticket_id == ticket_id)
 
-        # Get all matching tasks with embeddings
-        query = select(Task).where(*filters)
-        result = session.execute(query)
-        tasks = result.scalars().all()
-
-        candidates = []
-        for task in tasks:
-            if task.embedding_vector:
-                similarity = self.embedding_service.cosine_similarity(
-                    embedding, list(task.embedding_vector)
-                )
-                if similarity >= threshold:
-                    candidates.append(
-                        DuplicateTaskCandidate(
-                            task_id=str(task.id),
-                            task_type=task.task_type,
-                            title=task.title,
-                            description=task.description or "",
-                            status=task.status,
-                            ticket_id=str(task.ticket_id),
-                            similarity_score=similarity,
-                        )
-                    )
-
-        # Sort by similarity descending
-        candidates.sort(key=lambda x: x.similarity_score, reverse=True)
-        candidates = candidates[:top_k]
+        # Load only the columns candidates need, then score them all at once
+        query = select(
+            Task.id,
+            Task.task_type,
+            Task.title,
+            Task.description,
+            Task.status,
+            Task.ticket_id,
+            Task.embedding_vector,
+        ).where(*filters)
+        rows = session.execute(query).all()
+
+        matrix = EmbeddingMatrix(
+            [row.embedding_vector for row in rows], dims=len(embedding)
+        )
+        candidates = [
+            DuplicateTaskCandidate(
+                task_id=str(rows[i].id),
+                task_type=rows[i].task_type,
+                title=rows[i].title,
+                description=rows[i].description or "",
+                status=rows[i].status,
+                ticket_id=str(rows[i].ticket_id),
+                similarity_score=similarity,
+            )
+            for i, similarity in matrix.top_k(embedding, top_k, threshold)
+        ]
 
         highest_similarity = max((c.similarity_score for c in candidates), default=0.0)
 
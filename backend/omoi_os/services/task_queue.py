@@ -1,14 +1,33 @@
 """Task queue service for managing task assignment and retrieval."""
 
-from typing import List, Optional, TYPE_CHECKING
-
-from sqlalchemy import or_, select, update, text
+from datetime import datetime
+from typing import Callable, List, Optional, Sequence, TYPE_CHECKING
+
+from sqlalchemy import (
+    DateTime,
+    Float,
+    Select,
+    and_,
+    case,
+    cast,
+    exists,
+    func,
+    literal,
+    or_,
+    select,
+    update,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, defer
 
 from omoi_os.logging import get_logger
 from omoi_os.models.task import Task
+from omoi_os.models.task_dependency import TaskDependency
 from omoi_os.services.database import DatabaseService
 from omoi_os.services.task_scorer import TaskScorer
+from omoi_os.utils.datetime import utc_now
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
@@ -16,6 +35,10 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Scoring stage for ready-task selection: receives the candidate window that
+# passed the readiness query and returns one score per task, in the same order.
+ScoringStage = Callable[[Sequence[Task], datetime], list[float]]
+
 
 async def generate_task_title(
     task_id: str,
@@ -81,10 +104,17 @@ async def generate_task_title(
 class TaskQueueService:
     """Manages task queue operations: enqueue, retrieve, assign, update."""
 
+    # Ready-task selection fetches k * READY_OVERFETCH candidates (at least
+    # READY_MIN_CANDIDATES) ordered by the SQL pre-score, which mirrors the
+    # TaskScorer formula, then ranks that window with the scoring stage.
+    READY_OVERFETCH = 4
+    READY_MIN_CANDIDATES = 32
+
     def __init__(
         self,
         db: DatabaseService,
         event_bus: Optional["EventBusService"] = None,
+        scoring_stage: Optional[ScoringStage] = None,
     ):
         """
         Initialize task queue service.
@@ -92,10 +122,13 @@ class TaskQueueService:
         Args:
             db: DatabaseService instance
             event_bus: Optional EventBusService for real-time updates
+            scoring_stage: Optional callable that scores ready candidates
+                (defaults to TaskScorer, REQ-TQM-PRI-002)
         """
         self.db = db
         self.scorer = TaskScorer(db)
         self.event_bus = event_bus
+        self.scoring_stage = scoring_stage or self._score_with_task_scorer
 
     def _publish_event(
         self,
@@ -243,75 +276,51 @@ class TaskQueueService:
             Task object or None if no pending tasks with completed dependencies and matching capabilities
         """
         with self.db.get_session() as session:
-            # Only get tasks that are truly pending (not already being claimed)
-            # Also exclude tasks that already have a sandbox_id (prevents duplicate spawns)
-            query = session.query(Task).filter(
-                Task.status == "pending",
-                Task.sandbox_id.is_(None),  # Exclude tasks with existing sandbox
+            # Only pending tasks without a sandbox whose dependencies, spec and
+            # capabilities make them claimable (one readiness query)
+            now = utc_now()
+            stmt = self._ready_tasks_stmt(
+                phase_id=phase_id,
+                agent_capabilities=agent_capabilities,
+                unclaimed_only=True,
+                limit=self._ready_candidate_limit(1),
+                now=now,
+            )
+            candidates = self._rank_ready_tasks(
+                session.execute(stmt).scalars().all(), now
             )
-            if phase_id is not None:
-                query = query.filter(Task.phase_id == phase_id)
-            tasks = query.all()
-            if not tasks:
-                return None
-
-            # Filter out tasks with incomplete dependencies and capability mismatches
-            available_tasks = []
-            for task in tasks:
-                if not self._check_dependencies_complete(session, task):
-                    continue
 
-                # Check capability matching (REQ-TQM-ASSIGN-001)
-                if agent_capabilities is not None and not self._check_capability_match(
-                    task, agent_capabilities
-                ):
-                    continue  # Skip tasks that don't match capabilities
+            # ATOMIC CLAIM: walk candidates by score and claim the first one
+            # still pending, so losing a race falls through to the runner-up
+            for task, task_id, score in candidates:
+                result = session.execute(
+                    text("""
+                        UPDATE tasks
+                        SET status = 'claiming', score = :score
+                        WHERE id = :task_id
+                        AND status = 'pending'
+                        AND sandbox_id IS NULL
+                        RETURNING id
+                    """),
+                    {"task_id": task_id, "score": score},
+                )
+                claimed_row = result.fetchone()
+                session.commit()
 
-                # Skip tasks from archived specs
-                if self._is_task_from_archived_spec(session, task):
+                if not claimed_row:
+                    logger.debug(
+                        f"Task {task_id} was claimed by another process, skipping"
+                    )
                     continue
 
-                # Compute and update score (REQ-TQM-PRI-002)
-                task.score = self.scorer.compute_score(task)
-                available_tasks.append(task)
-
-            if not available_tasks:
-                return None
-
-            # Sort by score descending (REQ-TQM-PRI-002)
-            task = max(available_tasks, key=lambda t: t.score)
-
-            # ATOMIC CLAIM: Use SELECT ... FOR UPDATE SKIP LOCKED to prevent race conditions
-            # This ensures only one orchestrator can claim this task
-            from sqlalchemy import text
-
-            # Try to atomically claim the task by updating status to 'claiming'
-            # Using row-level lock to prevent duplicate claims
-            result = session.execute(
-                text("""
-                    UPDATE tasks
-                    SET status = 'claiming', score = :score
-                    WHERE id = :task_id
-                    AND status = 'pending'
-                    AND sandbox_id IS NULL
-                    RETURNING id
-                """),
-                {"task_id": str(task.id), "score": task.score},
-            )
-            claimed_row = result.fetchone()
-            session.commit()
-
-            if not claimed_row:
-                # Another process claimed this task, try again with next available
-                logger.debug(f"Task {task.id} was claimed by another process, skipping")
-                return None
+                # Refresh to get latest state after our update
+                session.refresh(task)
 
-            # Refresh to get latest state after our update
-            session.refresh(task)
+                # Expunge so it can be used outside the session
+                session.expunge(task)
+                return task
 
-            # Expunge so it can be used outside the session
-            session.expunge(task)
-            return task
+            return None
 
     def get_ready_tasks(
         self,
@@ -333,45 +342,23 @@ class TaskQueueService:
             List of Task objects ready for execution, sorted by score descending
         """
         with self.db.get_session() as session:
-            query = session.query(Task).filter(Task.status == "pending")
-            if phase_id:
-                query = query.filter(Task.phase_id == phase_id)
-            tasks = query.all()
-
-            if not tasks:
-                return []
-
-            # Filter out tasks with incomplete dependencies and capability mismatches
-            available_tasks = []
-            for task in tasks:
-                if not self._check_dependencies_complete(session, task):
-                    continue
-
-                # Check capability matching (REQ-TQM-ASSIGN-001)
-                if agent_capabilities is not None and not self._check_capability_match(
-                    task, agent_capabilities
-                ):
-                    continue  # Skip tasks that don't match capabilities
-
-                # Skip tasks from archived specs
-                if self._is_task_from_archived_spec(session, task):
-                    continue
-
-                # Compute and update score (REQ-TQM-PRI-002)
-                task.score = self.scorer.compute_score(task)
-                available_tasks.append(task)
-
-            # Sort by score descending (REQ-TQM-PRI-002)
-            available_tasks.sort(key=lambda t: t.score, reverse=True)
+            now = utc_now()
+            stmt = self._ready_tasks_stmt(
+                phase_id=phase_id,
+                agent_capabilities=agent_capabilities,
+                limit=self._ready_candidate_limit(limit),
+                now=now,
+            )
+            ranked = self._rank_ready_tasks(session.execute(stmt).scalars().all(), now)[
+                :limit
+            ]
 
             # Take top N tasks
-            batch = available_tasks[:limit]
+            batch = [task for task, _, _ in ranked]
 
             # Update scores in database
-            for task in batch:
-                session.query(Task).filter(Task.id == task.id).update(
-                    {"score": task.score}
-                )
+            for _, task_id, score in ranked:
+                session.query(Task).filter(Task.id == task_id).update({"score": score})
             session.commit()
             # Refresh all tasks to ensure all attributes are loaded
             for task in batch:
@@ -538,6 +525,221 @@ class TaskQueueService:
                 session.expunge(task)
             return tasks
 
+    # =========================================================================
+    # READY-TASK SELECTION
+    # =========================================================================
+    # Dispatch evaluates readiness in a single statement instead of issuing
+    # dependency/ticket/spec lookups per pending task. Postgres orders ready
+    # rows by a pre-score that mirrors TaskScorer (so starving, SLA-window
+    # and blocking tasks are not cut from the window) and returns only the
+    # top candidate window; the pluggable scoring stage then ranks that
+    # window in Python. The per-task helpers below remain for single-task
+    # checks (check_dependencies_complete, etc.).
+
+    def _ready_candidate_limit(self, k: int) -> int:
+        """Candidate window size for selecting the top ``k`` ready tasks."""
+        return max(k * self.READY_OVERFETCH, self.READY_MIN_CANDIDATES)
+
+    def _ready_tasks_stmt(
+        self,
+        phase_id: Optional[str] = None,
+        agent_capabilities: Optional[List[str]] = None,
+        unclaimed_only: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        now: Optional[datetime] = None,
+    ) -> Select:
+        """
+        Build the readiness query for pending tasks.
+
+        Evaluates in Postgres what _check_dependencies_complete,
+        _is_task_from_archived_spec and _check_capability_match evaluate
+        per task:
+
+        - every task_dependencies edge points at a completed task
+          (unknown IDs count as incomplete)
+        - the task's ticket is not linked to an archived spec
+        - required_capabilities is a subset of agent_capabilities (REQ-TQM-ASSIGN-001)
+
+        Rows are ordered by a SQL pre-score (see _sql_pre_score) so ``limit``
+        keeps the candidates the scoring stage is most likely to rank
+        highest. ``embedding_vector`` is deferred since dispatch never reads
+        it.
+
+        The statement is joined to tickets, so callers can add ticket or
+        project columns without another round trip.
+
+        Args:
+            phase_id: Optional phase identifier to filter by
+            agent_capabilities: Optional agent capabilities (None = no capability filter)
+            unclaimed_only: Exclude tasks that already have a sandbox_id
+            limit: Maximum candidate rows to return (None = all ready tasks)
+            offset: Candidate rows to skip, for paging past a full window
+            now: Time the pre-score is evaluated at (defaults to utc_now())
+
+        Returns:
+            SELECT over Task with all readiness predicates applied
+        """
+        from omoi_os.models.spec import Spec
+        from omoi_os.models.ticket import Ticket
+
+        dep_task = aliased(Task, name="dep_task")
+        unmet_dependency = (
+            select(TaskDependency.depends_on_task_id)
+            .where(
+                TaskDependency.task_id == Task.id,
+                ~exists().where(
+                    dep_task.id == TaskDependency.depends_on_task_id,
+                    dep_task.status == "completed",
+                ),
+            )
+            .exists()
+        )
+
+        stmt = (
+            select(Task)
+            .options(defer(Task.embedding_vector))
+            .outerjoin(Ticket, Task.ticket_id == Ticket.id)
+            .outerjoin(Spec, Ticket.spec_id == Spec.id)
+            .where(
+                Task.status == "pending",
+                ~unmet_dependency,
+                or_(Spec.id.is_(None), Spec.archived.is_(False)),
+            )
+            .order_by(
+                self._sql_pre_score(now or utc_now()).desc(),
+                Task.created_at.asc(),
+                Task.id,
+            )
+        )
+        if unclaimed_only:
+            stmt = stmt.where(Task.sandbox_id.is_(None))
+        if phase_id is not None:
+            stmt = stmt.where(Task.phase_id == phase_id)
+        if agent_capabilities is not None:
+            required = Task.required_capabilities
+            stmt = stmt.where(
+                or_(
+                    required.is_(None),
+                    func.jsonb_typeof(required) != "array",
+                    required.contained_by(literal(list(agent_capabilities), JSONB)),
+                )
+            )
+        if offset:
+            stmt = stmt.offset(offset)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return stmt
+
+    def _sql_pre_score(self, now: datetime):
+        """
+        TaskScorer's composite score as a SQL expression over Task.
+
+        Same terms as TaskScorer.compute_scores (priority, age, deadline
+        slack, pending dependents, retry penalty, SLA boost and starvation
+        floor), so the candidate window holds the tasks the default scoring
+        stage ranks highest.
+
+        Args:
+            now: Time the score is evaluated at
+
+        Returns:
+            Float SQL expression
+        """
+        cfg = self.scorer.config
+        now_value = literal(now, DateTime(timezone=True))
+
+        priority = case(self.scorer.priority_map, value=Task.priority, else_=0.25)
+        age_seconds = func.extract("epoch", now_value - Task.created_at)
+        slack_seconds = func.extract("epoch", Task.deadline_at - now_value)
+        age_norm = func.least(age_seconds / float(cfg.age_ceiling), 1.0)
+        deadline_norm = case(
+            (Task.deadline_at.is_(None), 0.0),
+            (slack_seconds <= 0, 1.0),
+            else_=func.greatest(
+                0.0, 1.0 - slack_seconds / float(cfg.sla_urgency_window)
+            ),
+        )
+
+        dependent = aliased(Task, name="dependent_task")
+        blocker_count = (
+            select(func.count(TaskDependency.task_id))
+            .join(dependent, dependent.id == TaskDependency.task_id)
+            .where(
+                TaskDependency.depends_on_task_id == Task.id,
+                dependent.status == "pending",
+            )
+            .correlate(Task)
+            .scalar_subquery()
+        )
+        blocker_norm = func.least(
+            cast(blocker_count, Float) / float(cfg.blocker_ceiling), 1.0
+        )
+        retry_penalty = func.greatest(
+            0.0,
+            1.0 - cast(Task.retry_count, Float) / func.greatest(Task.max_retries, 1),
+        )
+
+        base_score = (
+            cfg.w_p * priority
+            + cfg.w_a * age_norm
+            + cfg.w_d * deadline_norm
+            + cfg.w_b * blocker_norm
+            + cfg.w_r * retry_penalty
+        )
+        # SLA boost (REQ-TQM-PRI-003)
+        sla_factor = case(
+            (
+                and_(
+                    Task.deadline_at.is_not(None),
+                    slack_seconds >= 0,
+                    slack_seconds <= cfg.sla_urgency_window,
+                ),
+                float(cfg.sla_boost_multiplier),
+            ),
+            else_=1.0,
+        )
+        # Starvation guard (REQ-TQM-PRI-004)
+        starvation_floor = case(
+            (age_seconds >= cfg.starvation_limit, float(cfg.starvation_floor_score)),
+            else_=0.0,
+        )
+        return func.greatest(base_score * sla_factor, starvation_floor)
+
+    def _score_with_task_scorer(
+        self, tasks: Sequence[Task], now: datetime
+    ) -> list[float]:
+        """Default scoring stage: TaskScorer composite score (REQ-TQM-PRI-002)."""
+        return self.scorer.compute_scores(tasks, now)
+
+    def _rank_ready_tasks(
+        self, tasks: Sequence[Task], now: Optional[datetime] = None
+    ) -> list[tuple[Task, str, float]]:
+        """
+        Score ready candidates through the scoring stage and sort them.
+
+        IDs and scores are returned alongside the tasks because committing a
+        claim expires the remaining candidates, which would reload their
+        ``score`` attribute from the database.
+
+        Args:
+            tasks: Candidates returned by the readiness query
+            now: Current time (defaults to utc_now())
+
+        Returns:
+            (task, task ID, score) tuples sorted by score descending; each
+            task's score attribute is set as well
+        """
+        if not tasks:
+            return []
+
+        scores = self.scoring_stage(tasks, now or utc_now())
+        ranked = []
+        for task, score in zip(tasks, scores):
+            task.score = score
+            ranked.append((task, str(task.id), score))
+        return sorted(ranked, key=lambda entry: entry[2], reverse=True)
+
     def _check_dependencies_complete(self, session, task: Task) -> bool:
         """
         Check if all dependencies for a task are completed.
@@ -655,15 +857,13 @@ class TaskQueueService:
             List of Task objects that depend on this task
         """
         with self.db.get_session() as session:
-            # Find all tasks that have this task_id in their dependencies
-            all_tasks = session.query(Task).all()
-            blocked_tasks = []
-
-            for task in all_tasks:
-                if task.dependencies:
-                    depends_on = task.dependencies.get("depends_on", [])
-                    if task_id in depends_on:
-                        blocked_tasks.append(task)
+            # Reverse edge lookup (indexed on depends_on_task_id)
+            blocked_tasks = (
+                session.query(Task)
+                .join(TaskDependency, TaskDependency.task_id == Task.id)
+                .filter(TaskDependency.depends_on_task_id == task_id)
+                .all()
+            )
 
             # Expunge tasks so they can be used outside the session
             for task in blocked_tasks:
@@ -1291,43 +1491,23 @@ class TaskQueueService:
             List of Task objects ready for execution, sorted by score descending
         """
         async with self.db.get_async_session() as session:
-            # Build query
-            stmt = select(Task).filter(Task.status == "pending")
-            if phase_id:
-                stmt = stmt.filter(Task.phase_id == phase_id)
-
+            now = utc_now()
+            stmt = self._ready_tasks_stmt(
+                phase_id=phase_id,
+                agent_capabilities=agent_capabilities,
+                limit=self._ready_candidate_limit(limit),
+                now=now,
+            )
             result = await session.execute(stmt)
-            tasks = result.scalars().all()
-
-            if not tasks:
-                return []
-
-            # Filter out tasks with incomplete dependencies and capability mismatches
-            available_tasks = []
-            for task in tasks:
-                if not await self._check_dependencies_complete_async(session, task):
-                    continue
-
-                # Check capability matching (REQ-TQM-ASSIGN-001)
-                if agent_capabilities is not None and not self._check_capability_match(
-                    task, agent_capabilities
-                ):
-                    continue
-
-                # Compute and update score (REQ-TQM-PRI-002)
-                task.score = self.scorer.compute_score(task)
-                available_tasks.append(task)
-
-            # Sort by score descending
-            available_tasks.sort(key=lambda t: t.score, reverse=True)
+            ranked = self._rank_ready_tasks(result.scalars().all(), now)[:limit]
 
             # Take top N tasks
-            batch = available_tasks[:limit]
+            batch = [task for task, _, _ in ranked]
 
             # Update scores in database
-            for task in batch:
+            for _, task_id, score in ranked:
                 await session.execute(
-                    update(Task).where(Task.id == task.id).values(score=task.score)
+                    update(Task).where(Task.id == task_id).values(score=score)
                 )
             await session.commit()
 
@@ -1445,61 +1625,44 @@ class TaskQueueService:
             Task object or None if no pending tasks available
         """
         async with self.db.get_async_session() as session:
-            # Build query for pending tasks without sandbox
-            stmt = select(Task).filter(
-                Task.status == "pending",
-                Task.sandbox_id.is_(None),
+            now = utc_now()
+            stmt = self._ready_tasks_stmt(
+                phase_id=phase_id,
+                agent_capabilities=agent_capabilities,
+                unclaimed_only=True,
+                limit=self._ready_candidate_limit(1),
+                now=now,
             )
-            if phase_id is not None:
-                stmt = stmt.filter(Task.phase_id == phase_id)
-
             result = await session.execute(stmt)
-            tasks = result.scalars().all()
-
-            if not tasks:
-                return None
-
-            # Filter out tasks with incomplete dependencies and capability mismatches
-            available_tasks = []
-            for task in tasks:
-                if not await self._check_dependencies_complete_async(session, task):
-                    continue
+            candidates = self._rank_ready_tasks(result.scalars().all(), now)
+
+            # Atomic claim using raw SQL, falling through to the next
+            # candidate when another process wins the race
+            for task, task_id, score in candidates:
+                claim_result = await session.execute(
+                    text("""
+                        UPDATE tasks
+                        SET status = 'claiming', score = :score
+                        WHERE id = :task_id
+                        AND status = 'pending'
+                        AND sandbox_id IS NULL
+                        RETURNING id
+                    """),
+                    {"task_id": task_id, "score": score},
+                )
+                claimed_row = claim_result.fetchone()
+                await session.commit()
 
-                if agent_capabilities is not None and not self._check_capability_match(
-                    task, agent_capabilities
-                ):
+                if not claimed_row:
+                    logger.debug(
+                        f"Task {task_id} was claimed by another process, skipping"
+                    )
                     continue
 
-                task.score = self.scorer.compute_score(task)
-                available_tasks.append(task)
-
-            if not available_tasks:
-                return None
-
-            # Sort by score descending
-            task = max(available_tasks, key=lambda t: t.score)
-
-            # Atomic claim using raw SQL
-            claim_result = await session.execute(
-                text("""
-                    UPDATE tasks
-                    SET status = 'claiming', score = :score
-                    WHERE id = :task_id
-                    AND status = 'pending'
-                    AND sandbox_id IS NULL
-                    RETURNING id
-                """),
-                {"task_id": str(task.id), "score": task.score},
-            )
-            claimed_row = claim_result.fetchone()
-            await session.commit()
-
-            if not claimed_row:
-                logger.debug(f"Task {task.id} was claimed by another process, skipping")
-                return None
+                await session.refresh(task)
+                return task
 
-            await session.refresh(task)
-            return task
+            return None
 
     async def assign_task_async(self, task_id: str, agent_id: str) -> None:
         """
@@ -1922,171 +2085,159 @@ class TaskQueueService:
         from omoi_os.models.project import Project
 
         with self.db.get_session() as session:
-            # Get pending tasks without sandbox
-            query = session.query(Task).filter(
-                Task.status == "pending",
-                Task.sandbox_id.is_(None),
-            )
-            if phase_id is not None:
-                query = query.filter(Task.phase_id == phase_id)
-            tasks = query.all()
-
-            if not tasks:
-                return None
-
-            # Filter out tasks with incomplete dependencies, capability mismatches,
-            # AND tasks whose projects/organizations have hit concurrency limits
-            available_tasks = []
+            # Ready, unclaimed tasks come back one pre-scored window at a
+            # time; the next window is only read when every candidate in a
+            # full window was filtered out by a concurrency limit.
+            window = self._ready_candidate_limit(1)
             project_running_counts: dict[str, int] = {}
             org_running_counts: dict[str, int] = {}
             org_agent_limits: dict[str, int] = {}
+            offset = 0
+            # One evaluation time keeps the window order stable across pages
+            now = utc_now()
 
-            for task in tasks:
-                if not self._check_dependencies_complete(session, task):
-                    continue
+            while True:
+                stmt = (
+                    self._ready_tasks_stmt(
+                        phase_id=phase_id,
+                        agent_capabilities=agent_capabilities,
+                        unclaimed_only=True,
+                        limit=window,
+                        offset=offset,
+                        now=now,
+                    )
+                    .outerjoin(Project, Ticket.project_id == Project.id)
+                    .add_columns(
+                        Ticket.project_id,
+                        Project.organization_id,
+                        Project.autonomous_execution_enabled,
+                    )
+                )
+                rows = session.execute(stmt).all()
 
-                if agent_capabilities is not None and not self._check_capability_match(
-                    task, agent_capabilities
-                ):
-                    continue
+                if not rows:
+                    return None
 
-                # Get project and organization for this task
-                ticket = (
-                    session.query(Ticket).filter(Ticket.id == task.ticket_id).first()
-                )
-                if not ticket or not ticket.project_id:
-                    # Tasks without a project are allowed (no limit)
-                    task.score = self.scorer.compute_score(task)
-                    available_tasks.append(task)
-                    continue
+                # Running counts for new candidate projects in one grouped query
+                new_project_ids = {
+                    row.project_id
+                    for row in rows
+                    if row.project_id and row.project_id not in project_running_counts
+                }
+                if new_project_ids:
+                    project_running_counts.update(
+                        {project_id: 0 for project_id in new_project_ids}
+                    )
+                    project_running_counts.update(
+                        session.query(Ticket.project_id, func.count(Task.id))
+                        .join(Ticket, Task.ticket_id == Ticket.id)
+                        .filter(
+                            Ticket.project_id.in_(new_project_ids),
+                            Task.status.in_(["claiming", "assigned", "running"]),
+                        )
+                        .group_by(Ticket.project_id)
+                        .all()
+                    )
+
+                # Filter out tasks whose projects/organizations have hit concurrency limits
+                available_tasks = []
 
-                # Skip tasks from archived specs
-                if ticket.spec_id:
-                    from omoi_os.models.spec import Spec
+                for task, project_id, org_id, autonomous_enabled in rows:
+                    if not project_id:
+                        # Tasks without a project are allowed (no limit)
+                        available_tasks.append(task)
+                        continue
+
+                    organization_id = str(org_id) if org_id else None
 
-                    spec = session.query(Spec).filter(Spec.id == ticket.spec_id).first()
-                    if spec and spec.archived:
+                    # Check if autonomous execution is enabled for this project
+                    # Tasks from projects without autonomous_execution_enabled are skipped
+                    # UNLESS force_execute is set (quick mode from command page or spec workflow)
+                    force_execute = (
+                        task.execution_config.get("force_execute", False)
+                        if task.execution_config
+                        else False
+                    )
+                    if autonomous_enabled is False and not force_execute:
                         logger.debug(
-                            f"Ticket {ticket.id} is linked to archived spec {ticket.spec_id}, "
+                            f"Project {project_id} has autonomous_execution_enabled=False, "
                             f"skipping task {task.id}"
                         )
                         continue
 
-                project_id = ticket.project_id
-
-                # Get project to find organization
-                project = (
-                    session.query(Project).filter(Project.id == project_id).first()
-                )
-                organization_id = (
-                    str(project.organization_id)
-                    if project and project.organization_id
-                    else None
-                )
-
-                # Check if autonomous execution is enabled for this project
-                # Tasks from projects without autonomous_execution_enabled are skipped
-                # UNLESS force_execute is set (quick mode from command page or spec workflow)
-                force_execute = (
-                    task.execution_config.get("force_execute", False)
-                    if task.execution_config
-                    else False
-                )
-                if (
-                    project
-                    and not project.autonomous_execution_enabled
-                    and not force_execute
-                ):
-                    logger.debug(
-                        f"Project {project_id} has autonomous_execution_enabled=False, "
-                        f"skipping task {task.id}"
-                    )
-                    continue
+                    # Check organization-level agent limits first (if org exists)
+                    if organization_id:
+                        # Cache org agent limit
+                        if organization_id not in org_agent_limits:
+                            org_agent_limits[organization_id] = (
+                                self.get_agent_limit_for_organization(
+                                    organization_id, session
+                                )
+                            )
 
-                # Check organization-level agent limits first (if org exists)
-                if organization_id:
-                    # Cache org agent limit
-                    if organization_id not in org_agent_limits:
-                        org_agent_limits[organization_id] = (
-                            self.get_agent_limit_for_organization(
-                                organization_id, session
+                        # Cache org running count
+                        if organization_id not in org_running_counts:
+                            org_running_counts[organization_id] = (
+                                self.get_running_count_by_organization(
+                                    organization_id, session
+                                )
                             )
-                        )
 
-                    # Cache org running count
-                    if organization_id not in org_running_counts:
-                        org_running_counts[organization_id] = (
-                            self.get_running_count_by_organization(
-                                organization_id, session
+                        # Check org limit (-1 means unlimited)
+                        org_limit = org_agent_limits[organization_id]
+                        if (
+                            org_limit != -1
+                            and org_running_counts[organization_id] >= org_limit
+                        ):
+                            logger.debug(
+                                f"Organization {organization_id} at agent capacity "
+                                f"({org_running_counts[organization_id]}/{org_limit}), "
+                                f"skipping task {task.id}"
                             )
-                        )
+                            continue
 
-                    # Check org limit (-1 means unlimited)
-                    org_limit = org_agent_limits[organization_id]
-                    if (
-                        org_limit != -1
-                        and org_running_counts[organization_id] >= org_limit
-                    ):
+                    # Skip if project is at capacity
+                    running = project_running_counts.get(project_id, 0)
+                    if running >= max_concurrent_per_project:
                         logger.debug(
-                            f"Organization {organization_id} at agent capacity "
-                            f"({org_running_counts[organization_id]}/{org_limit}), "
+                            f"Project {project_id} at capacity ({running}/{max_concurrent_per_project}), "
                             f"skipping task {task.id}"
                         )
                         continue
 
-                # Check/cache running count for this project
-                if project_id not in project_running_counts:
-                    count = (
-                        session.query(Task)
-                        .join(Ticket, Task.ticket_id == Ticket.id)
-                        .filter(
-                            Ticket.project_id == project_id,
-                            Task.status.in_(["claiming", "assigned", "running"]),
-                        )
-                        .count()
-                    )
-                    project_running_counts[project_id] = count
+                    available_tasks.append(task)
 
-                # Skip if project is at capacity
-                if project_running_counts[project_id] >= max_concurrent_per_project:
-                    logger.debug(
-                        f"Project {project_id} at capacity ({project_running_counts[project_id]}/{max_concurrent_per_project}), "
-                        f"skipping task {task.id}"
+                # Atomic claim using raw SQL, highest score first
+                for task, task_id, score in self._rank_ready_tasks(
+                    available_tasks, now
+                ):
+                    result = session.execute(
+                        text("""
+                            UPDATE tasks
+                            SET status = 'claiming', score = :score
+                            WHERE id = :task_id
+                            AND status = 'pending'
+                            AND sandbox_id IS NULL
+                            RETURNING id
+                        """),
+                        {"task_id": task_id, "score": score},
                     )
-                    continue
-
-                # Compute score and add to available tasks
-                task.score = self.scorer.compute_score(task)
-                available_tasks.append(task)
-
-            if not available_tasks:
-                return None
-
-            # Sort by score descending
-            task = max(available_tasks, key=lambda t: t.score)
+                    claimed_row = result.fetchone()
+                    session.commit()
 
-            # Atomic claim using raw SQL
-            result = session.execute(
-                text("""
-                    UPDATE tasks
-                    SET status = 'claiming', score = :score
-                    WHERE id = :task_id
-                    AND status = 'pending'
-                    AND sandbox_id IS NULL
-                    RETURNING id
-                """),
-                {"task_id": str(task.id), "score": task.score},
-            )
-            claimed_row = result.fetchone()
-            session.commit()
+                    if not claimed_row:
+                        logger.debug(
+                            f"Task {task_id} was claimed by another process, skipping"
+                        )
+                        continue
 
-            if not claimed_row:
-                logger.debug(f"Task {task.id} was claimed by another process, skipping")
-                return None
+                    session.refresh(task)
+                    session.expunge(task)
+                    return task
 
-            session.refresh(task)
-            session.expunge(task)
-            return task
+                if len(rows) < window:
+                    return None
+                offset += window
 
     def get_next_validation_task(
         self,
@@ -1,10 +1,14 @@
 """Task scoring service for dynamic task prioritization (REQ-TQM-PRI-002, REQ-TQM-PRI-003, REQ-TQM-PRI-004)."""
 
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Sequence
+
+import numpy as np
+from sqlalchemy import func
 
 from omoi_os.config import TaskQueueSettings
 from omoi_os.models.task import Task
+from omoi_os.models.task_dependency import TaskDependency
 from omoi_os.services.database import DatabaseService
 from omoi_os.utils.datetime import utc_now
 
@@ -106,6 +110,91 @@ class TaskScorer:
 
         return base_score
 
+    def compute_scores(
+        self, tasks: Sequence[Task], now: Optional[datetime] = None
+    ) -> list[float]:
+        """
+        Compute dynamic scores for many tasks in one pass (REQ-TQM-PRI-002).
+
+        Same formula as compute_score, evaluated over arrays: blocker counts
+        come from one grouped query instead of one query per task, and the
+        composite, SLA boost and starvation guard are applied column-wise.
+        Results are identical to calling compute_score on each task.
+
+        Args:
+            tasks: Tasks to score
+            now: Current time (defaults to utc_now())
+
+        Returns:
+            Scores in the same order as tasks
+        """
+        if not tasks:
+            return []
+        if now is None:
+            now = utc_now()
+
+        cfg = self.config
+        blocker_counts = self._get_blocker_counts([task.id for task in tasks])
+
+        priority = np.array(
+            [self.priority_map.get(task.priority, 0.25) for task in tasks]
+        )
+        age_seconds = np.array(
+            [(now - task.created_at).total_seconds() for task in tasks]
+        )
+        has_deadline = np.array([task.deadline_at is not None for task in tasks])
+        slack_seconds = np.array(
+            [
+                (task.deadline_at - now).total_seconds() if task.deadline_at else 0.0
+                for task in tasks
+            ]
+        )
+        blockers = np.array(
+            [blocker_counts.get(task.id, 0) for task in tasks], dtype=np.float64
+        )
+        retry_ratio = np.array(
+            [task.retry_count / max(task.max_retries, 1) for task in tasks]
+        )
+
+        # A(age_seconds): normalized 0.0-1.0 with cap at AGE_CEILING
+        age_norm = np.minimum(age_seconds / cfg.age_ceiling, 1.0)
+
+        # D(deadline_slack): 1.0 past deadline, linear ramp inside the window
+        deadline_norm = np.where(
+            slack_seconds <= 0,
+            1.0,
+            np.maximum(0.0, 1.0 - (slack_seconds / cfg.sla_urgency_window)),
+        )
+        deadline_norm = np.where(has_deadline, deadline_norm, 0.0)
+
+        # B(blocker_count) and R(retry_penalty)
+        blocker_norm = np.minimum(blockers / cfg.blocker_ceiling, 1.0)
+        retry_penalty = np.maximum(0.0, 1.0 - retry_ratio)
+
+        scores = (
+            cfg.w_p * priority
+            + cfg.w_a * age_norm
+            + cfg.w_d * deadline_norm
+            + cfg.w_b * blocker_norm
+            + cfg.w_r * retry_penalty
+        )
+
+        # SLA boost (REQ-TQM-PRI-003)
+        in_sla_window = (
+            has_deadline
+            & (slack_seconds >= 0)
+            & (slack_seconds <= cfg.sla_urgency_window)
+        )
+        scores = np.where(in_sla_window, scores * cfg.sla_boost_multiplier, scores)
+
+        # Starvation guard (REQ-TQM-PRI-004)
+        starving = age_seconds >= cfg.starvation_limit
+        scores = np.where(
+            starving, np.maximum(scores, cfg.starvation_floor_score), scores
+        )
+
+        return scores.tolist()
+
     def _get_blocker_count(self, task_id: str) -> int:
         """
         Get count of tasks blocked by this task (i.e., tasks that depend on this task).
@@ -117,17 +206,47 @@ class TaskScorer:
             Number of tasks blocked by this task
         """
         with self.db.get_session() as session:
-            # Find all tasks that have this task_id in their dependencies
-            all_tasks = session.query(Task).filter(Task.status == "pending").all()
-            blocker_count = 0
+            # Pending dependents via the reverse edge index
+            return (
+                session.query(func.count(TaskDependency.task_id))
+                .join(Task, Task.id == TaskDependency.task_id)
+                .filter(
+                    TaskDependency.depends_on_task_id == task_id,
+                    Task.status == "pending",
+                )
+                .scalar()
+                or 0
+            )
 
-            for task in all_tasks:
-                if task.dependencies:
-                    depends_on = task.dependencies.get("depends_on", [])
-                    if task_id in depends_on:
-                        blocker_count += 1
+    def _get_blocker_counts(self, task_ids: Sequence[str]) -> dict[str, int]:
+        """
+        Get pending-dependent counts for many tasks in one grouped query.
+
+        Args:
+            task_ids: Task IDs to check
 
-            return blocker_count
+        Returns:
+            Mapping of task ID to number of pending tasks it blocks
+            (tasks that block nothing are omitted)
+        """
+        if not task_ids:
+            return {}
+
+        with self.db.get_session() as session:
+            rows = (
+                session.query(
+                    TaskDependency.depends_on_task_id,
+                    func.count(TaskDependency.task_id),
+                )
+                .join(Task, Task.id == TaskDependency.task_id)
+                .filter(
+                    TaskDependency.depends_on_task_id.in_(task_ids),
+                    Task.status == "pending",
+                )
+                .group_by(TaskDependency.depends_on_task_id)
+                .all()
+            )
+            return dict(rows)
 
     def update_task_score(
         self, task_id: str, now: Optional[datetime] = None
@@ -176,8 +295,7 @@ class TaskScorer:
         with self.db.get_session() as session:
             tasks = session.query(Task).filter(Task.id.in_(task_ids)).all()
 
-            for task in tasks:
-                score = self.compute_score(task, now)
+            for task, score in zip(tasks, self.compute_scores(tasks, now)):
                 task.score = score
                 updated_scores[task.id] = score
 
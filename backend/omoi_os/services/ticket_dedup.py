@@ -10,6 +10,7 @@ from omoi_os.logging import get_logger
 from omoi_os.models.ticket import Ticket  # Use main model (has embedding_vector now)
 from omoi_os.services.database import DatabaseService
 from omoi_os.services.embedding import EmbeddingService
+from omoi_os.services.similarity import EmbeddingMatrix
 
 logger = get_logger(__name__)
 
@@ -70,6 +71,7 @@ class TicketDeduplicationService:
         threshold: Optional[float] = None,
         exclude_statuses: Optional[List[str]] = None,
         session: Optional[Session] = None,
+        embedding: Optional[List[float]] = None,
     ) -> DeduplicationResult:
         """Check if a ticket with similar content already exists.
 
@@ -80,6 +82,8 @@ class TicketDeduplicationService:
             threshold: Override default similarity threshold.
             exclude_statuses: List of statuses to exclude (e.g., ['done', 'cancelled']).
             session: Optional database session.
+            embedding: Precomputed embedding of the title and description
+                (e.g. from EmbeddingBatcher); generated here if omitted.
 
         Returns:
             DeduplicationResult with duplicate status and candidates.
@@ -88,8 +92,9 @@ class TicketDeduplicationService:
         exclude_statuses = exclude_statuses or []
 
         # Generate embedding for the new ticket content
-        content = f"{title}\n{description or ''}"
-        embedding = self.embedding_service.generate_embedding(content)
+        if embedding is None:
+            content = f"{title}\n{description or ''}"
+            embedding = self.embedding_service.generate_embedding(content)
 
         if not embedding:
             logger.warning("Failed to generate embedding for deduplication check")
@@ -188,34 +193,32 @@ class TicketDeduplicationService:
         """Fallback to in-memory similarity check if pgvector fails."""
         logger.info("Using fallback in-memory similarity check")
 
-        # Get all tickets with embeddings
-        query = select(Ticket).where(
+        # Load only the columns candidates need, then score them all at once
+        query = select(
+            Ticket.id,
+            Ticket.title,
+            Ticket.description,
+            Ticket.status,
+            Ticket.embedding_vector,
+        ).where(
             Ticket.embedding_vector.isnot(None),
             ~Ticket.status.in_(exclude_statuses) if exclude_statuses else True,
         )
-        result = session.execute(query)
-        tickets = result.scalars().all()
-
-        candidates = []
-        for ticket in tickets:
-            if ticket.embedding_vector:
-                similarity = self.embedding_service.cosine_similarity(
-                    embedding, list(ticket.embedding_vector)
-                )
-                if similarity >= threshold:
-                    candidates.append(
-                        DuplicateCandidate(
-                            ticket_id=str(ticket.id),
-                            title=ticket.title,
-                            description=ticket.description or "",
-                            status=ticket.status,
-                            similarity_score=similarity,
-                        )
-                    )
-
-        # Sort by similarity descending
-        candidates.sort(key=lambda x: x.similarity_score, reverse=True)
-        candidates = candidates[:top_k]
+        rows = session.execute(query).all()
+
+        matrix = EmbeddingMatrix(
+            [row.embedding_vector for row in rows], dims=len(embedding)
+        )
+        candidates = [
+            DuplicateCandidate(
+                ticket_id=str(rows[i].id),
+                title=rows[i].title,
+                description=rows[i].description or "",
+                status=rows[i].status,
+                similarity_score=similarity,
+            )
+            for i, similarity in matrix.top_k(embedding, top_k, threshold)
+        ]
 
         highest_similarity = max((c.similarity_score for c in candidates), default=0.0)
 
@@ -5,12 +5,22 @@ This class implements the core concept from trajectory thinking:
 - Track constraints that persist until lifted
 - Resolve references like "this/that"
 - Understand the complete journey, not just current state
+
+Accumulated understanding is built incrementally: each agent (or sandbox)
+keeps its extracted state plus a watermark of the last processed log, and
+a rebuild only reads and folds in logs newer than the watermark. The state
+is persisted in trajectory_context_states, so cache evictions and restarts
+do not force a full rescan.
 """
 
 import re
-from collections import defaultdict
-from datetime import timedelta
-from typing import Dict, Any, List, Optional, Tuple
+from collections import OrderedDict, defaultdict, deque
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timedelta
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from omoi_os.logging import get_logger
 from omoi_os.models.agent import Agent
@@ -18,6 +28,7 @@ from omoi_os.utils.datetime import utc_now
 from omoi_os.models.agent_log import AgentLog
 from omoi_os.models.sandbox_event import SandboxEvent
 from omoi_os.models.task import Task
+from omoi_os.models.trajectory_context_state import TrajectoryContextState
 from omoi_os.models.trajectory_analysis import (
     ConversationEvent,
     PersistentConstraint,
@@ -28,6 +39,134 @@ from omoi_os.services.database import DatabaseService
 
 logger = get_logger(__name__)
 
+# Bounds on state lists that otherwise grow with the conversation (the
+# state row is rewritten after every build)
+MAX_CONSTRAINT_CANDIDATES = 50
+MAX_LIFTED_CONSTRAINTS = 50
+MAX_REFERENCES = 50
+
+
+def _extend_unique(items: List[str], new_items: List[str]) -> None:
+    """Append items not already present, keeping order."""
+    for item in new_items:
+        if item not in items:
+            items.append(item)
+
+
+def _entry_to_json(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Conversation/log entry with its timestamp and ID as strings."""
+    data = dict(entry)
+    if isinstance(data.get("timestamp"), datetime):
+        data["timestamp"] = data["timestamp"].isoformat()
+    if "id" in data:
+        data["id"] = str(data["id"])
+    return data
+
+
+def _entry_from_json(data: Dict[str, Any]) -> Dict[str, Any]:
+    entry = dict(data)
+    if isinstance(entry.get("timestamp"), str):
+        entry["timestamp"] = datetime.fromisoformat(entry["timestamp"])
+    return entry
+
+
+@dataclass
+class _AccumulatedState:
+    """Extraction results folded from all logs up to the watermark.
+
+    Each field keeps exactly what the extractors need to produce the same
+    result as a pass over the whole conversation.
+    """
+
+    # (created_at, id) of the last folded log
+    watermark: Optional[Tuple[datetime, str]] = None
+    log_count: int = 0
+    first_log_at: Optional[datetime] = None
+    last_log_at: Optional[datetime] = None
+    conversation_length: int = 0
+    goal_statements: Deque[str] = field(default_factory=lambda: deque(maxlen=5))
+    evolved_goals: Deque[str] = field(default_factory=lambda: deque(maxlen=5))
+    constraint_candidates: List[str] = field(default_factory=list)
+    lifted_constraints: List[str] = field(default_factory=list)
+    standing_instructions: List[str] = field(default_factory=list)
+    references: Dict[str, str] = field(default_factory=dict)
+    recent_concepts: List[str] = field(default_factory=list)
+    context_markers: Dict[str, Deque[str]] = field(default_factory=dict)
+    phases_completed: List[str] = field(default_factory=list)
+    recent_conversation: Deque[Dict[str, Any]] = field(
+        default_factory=lambda: deque(maxlen=10)
+    )
+    attempted_approaches: Deque[str] = field(default_factory=lambda: deque(maxlen=10))
+    discovered_blockers: List[str] = field(default_factory=list)
+    recent_logs: Deque[Dict[str, Any]] = field(default_factory=lambda: deque(maxlen=20))
+
+    def to_json(self) -> Dict[str, Any]:
+        """Serialize for persistence (watermark and log count excluded)."""
+        data: Dict[str, Any] = {}
+        for f in fields(self):
+            if f.name in ("watermark", "log_count"):
+                continue
+            value = getattr(self, f.name)
+            if isinstance(value, datetime):
+                value = value.isoformat()
+            elif f.name == "context_markers":
+                value = {key: list(markers) for key, markers in value.items()}
+            elif f.name in ("recent_conversation", "recent_logs"):
+                value = [_entry_to_json(entry) for entry in value]
+            elif isinstance(value, deque):
+                value = list(value)
+            data[f.name] = value
+        return data
+
+    @classmethod
+    def from_json(
+        cls,
+        data: Dict[str, Any],
+        watermark: Optional[Tuple[datetime, str]],
+        log_count: int,
+    ) -> "_AccumulatedState":
+        """Restore a state serialized by to_json."""
+        state = cls(watermark=watermark, log_count=log_count)
+        for f in fields(state):
+            if f.name not in data:
+                continue
+            value = data[f.name]
+            current = getattr(state, f.name)
+            if f.name in ("first_log_at", "last_log_at"):
+                value = datetime.fromisoformat(value) if value else None
+            elif f.name == "context_markers":
+                value = {
+                    key: deque(markers, maxlen=5) for key, markers in value.items()
+                }
+            elif f.name in ("recent_conversation", "recent_logs"):
+                value = deque(
+                    (_entry_from_json(entry) for entry in value),
+                    maxlen=current.maxlen,
+                )
+            elif isinstance(current, deque):
+                value = deque(value, maxlen=current.maxlen)
+            setattr(state, f.name, value)
+        state.trim()
+        return state
+
+    def trim(self) -> None:
+        """Dedupe and cap the lists that grow with the conversation.
+
+        Lifted constraints keep the most recent; candidates already lifted
+        are dropped (they are never reported) and the earliest remaining
+        candidates are kept, since the context reports the first ten.
+        References keep the most recent.
+        """
+        lifted: List[str] = []
+        _extend_unique(lifted, self.lifted_constraints)
+        self.lifted_constraints = lifted[-MAX_LIFTED_CONSTRAINTS:]
+        lifted_set = set(self.lifted_constraints)
+        self.constraint_candidates = [
+            c for c in self.constraint_candidates if c not in lifted_set
+        ][:MAX_CONSTRAINT_CANDIDATES]
+        if len(self.references) > MAX_REFERENCES:
+            self.references = dict(list(self.references.items())[-MAX_REFERENCES:])
+
 
 class TrajectoryContext:
     """
@@ -40,17 +179,30 @@ class TrajectoryContext:
     - Understand the complete journey, not just current state
     """
 
-    def __init__(self, db: DatabaseService):
+    # Logs read per query when folding new logs into the state
+    FOLD_BATCH_SIZE = 1000
+
+    def __init__(self, db: DatabaseService, cache_max_entries: int = 256):
         """Initialize TrajectoryContext manager.
 
         Args:
             db: Database service for accessing agent logs
+            cache_max_entries: Agents/sandboxes kept in the context cache
+                (least recently used are evicted)
         """
         self.db = db
 
-        # Cache for performance
-        self.context_cache: Dict[str, Dict[str, Any]] = {}
+        # Cache for performance: built context plus the incremental state
+        self.context_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         self.cache_ttl = timedelta(minutes=5)
+        self.cache_max_entries = cache_max_entries
+
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "logs_folded": 0,
+        }
 
     def build_accumulated_context(
         self,
@@ -61,7 +213,9 @@ class TrajectoryContext:
         Build complete accumulated context for an agent.
 
         This is the core method that builds understanding from the ENTIRE
-        conversation, not just recent messages.
+        conversation, not just recent messages. With full history the
+        understanding is maintained incrementally, so only logs added since
+        the previous build are read.
 
         Args:
             agent_id: Agent ID to build context for
@@ -69,25 +223,39 @@ class TrajectoryContext:
 
         Returns:
             Complete accumulated context including goals, constraints, references
+            (a dumped TrajectoryContext model, on cache hits as well)
         """
         logger.debug(f"Building accumulated context for agent {agent_id}")
 
-        # Check cache first
-        if agent_id in self.context_cache:
-            cached = self.context_cache[agent_id]
-            if cached["timestamp"] > utc_now() - self.cache_ttl:
-                return cached["context"]
+        cache_key = agent_id if include_full_history else f"{agent_id}:limited"
+        cached = self._get_cached(cache_key)
+        if cached and cached["timestamp"] > utc_now() - self.cache_ttl:
+            self.stats["hits"] += 1
+            return cached["context"]
+        self.stats["misses"] += 1
 
         with self.db.get_session() as session:
-            # Get all logs for complete understanding
-            logs = (
-                session.query(AgentLog)
-                .filter_by(agent_id=agent_id)
-                .order_by(AgentLog.created_at)
-                .all()
-            )
+            if include_full_history:
+                state = (cached or {}).get("state") or self._load_state(
+                    session, cache_key
+                )
+                folded = state.log_count
+                self._fold_new_agent_logs(session, agent_id, state)
+            else:
+                # The limited history keeps the first and last messages of the
+                # whole conversation, so it is rebuilt from every log
+                logs = (
+                    session.query(AgentLog)
+                    .filter_by(agent_id=agent_id)
+                    .order_by(AgentLog.created_at)
+                    .all()
+                )
+                state = _AccumulatedState()
+                self._fold_logs(
+                    state, logs, self._build_conversation_history(logs, False)
+                )
 
-            if not logs:
+            if not state.log_count:
                 logger.warning(f"No logs found for agent {agent_id}")
                 return self._get_empty_context()
 
@@ -102,37 +270,15 @@ class TrajectoryContext:
                     .first()
                 )
 
-            # Build conversation history
-            conversation = self._build_conversation_history(logs, include_full_history)
-
             # Extract accumulated understanding
-            context = {
-                # Core trajectory elements
-                "overall_goal": self._extract_overall_goal(conversation, task),
-                "evolved_goals": self._track_goal_evolution(conversation),
-                "constraints": self._extract_persistent_constraints(conversation),
-                "lifted_constraints": self._identify_lifted_constraints(conversation),
-                "standing_instructions": self._extract_standing_instructions(
-                    conversation
-                ),
-                # Reference resolution
-                "references": self._resolve_references(conversation),
-                "context_markers": self._extract_context_markers(conversation),
-                # Journey tracking
-                "phases_completed": self._identify_completed_phases(conversation),
-                "current_focus": self._determine_current_focus(conversation),
-                "attempted_approaches": self._extract_attempted_approaches(
-                    conversation
-                ),
-                "discovered_blockers": self._find_discovered_blockers(conversation),
-                # Meta information
-                "conversation_length": len(conversation),
-                "session_duration": self._calculate_session_duration(logs),
-                "last_activity": logs[-1].created_at if logs else utc_now(),
-                "agent_id": agent_id,
-                "agent_type": agent.agent_type if agent else "unknown",
-                "agent_status": agent.status if agent else "unknown",
-            }
+            context = self._context_from_state(state, task)
+            context.update(
+                {
+                    "agent_id": agent_id,
+                    "agent_type": agent.agent_type if agent else "unknown",
+                    "agent_status": agent.status if agent else "unknown",
+                }
+            )
 
             # Add task-specific context
             if task:
@@ -150,26 +296,19 @@ class TrajectoryContext:
                 agent_id=agent_id,
                 context_summary=context.get("overall_goal", ""),
                 persistent_constraints=[
+                    # Constraints are extracted as plain statements
                     PersistentConstraint(
-                        constraint_type=constraint.get("type", "general"),
-                        description=constraint.get("description", ""),
-                        source=constraint.get("source", "conversation"),
-                        strength=constraint.get("strength", 1.0),
+                        constraint_type="general",
+                        description=constraint,
+                        source="conversation",
                         created_at=utc_now(),  # Would need actual timestamp from constraint
                     )
                     for constraint in context.get("constraints", [])
                 ],
                 session_duration=context.get("session_duration"),
                 conversation_events=[
-                    ConversationEvent(
-                        id=log.id or "unknown",  # AgentLog might not have UUID
-                        agent_id=agent_id,
-                        event_type=log.log_type,
-                        content=log.message,
-                        timestamp=log.created_at,
-                        metadata=log.details or {},
-                    )
-                    for log in logs[-20:]  # Last 20 events as conversation events
+                    ConversationEvent(agent_id=agent_id, **log)
+                    for log in state.recent_logs  # Last 20 events
                 ],
                 task_completion_rate=self._calculate_completion_rate(context, task),
                 last_updated=utc_now(),
@@ -183,15 +322,211 @@ class TrajectoryContext:
                 conversation_length=context.get("conversation_length", 0),
                 session_duration=context.get("session_duration"),
                 last_claude_message_marker=self._find_last_claude_marker(context),
-            )
+            ).model_dump()
 
-            # Cache the context (still store dict for cache)
-            self.context_cache[agent_id] = {
-                "context": context,
+        if include_full_history and state.log_count > folded:
+            self._save_state(cache_key, state)
+
+        # Cache the context together with the state it was built from
+        self._put_cached(
+            cache_key,
+            {
+                "context": trajectory_context,
                 "timestamp": utc_now(),
-            }
+                "state": state if include_full_history else None,
+            },
+        )
+
+        return trajectory_context
+
+    def _fold_new_agent_logs(
+        self, session, agent_id: str, state: _AccumulatedState
+    ) -> None:
+        """Fold an agent's logs newer than the state's watermark into it."""
+        while True:
+            query = session.query(AgentLog).filter_by(agent_id=agent_id)
+            if state.watermark:
+                last_at, last_id = state.watermark
+                query = query.filter(
+                    or_(
+                        AgentLog.created_at > last_at,
+                        and_(AgentLog.created_at == last_at, AgentLog.id > last_id),
+                    )
+                )
+            logs = (
+                query.order_by(AgentLog.created_at, AgentLog.id)
+                .limit(self.FOLD_BATCH_SIZE)
+                .all()
+            )
+            self._fold_logs(state, logs)
+            if len(logs) < self.FOLD_BATCH_SIZE:
+                return
+
+    def _fold_logs(
+        self,
+        state: _AccumulatedState,
+        logs: List[AgentLog],
+        conversation: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        """Fold a time-ordered batch of logs into accumulated state.
+
+        Args:
+            state: State to update in place
+            logs: Logs (or duck-typed logs) newer than the state's watermark
+            conversation: Conversation built from the logs (defaults to the
+                full conversation history)
+        """
+        if not logs:
+            return
+        if conversation is None:
+            conversation = self._build_conversation_history(logs, True)
+
+        if state.first_log_at is None:
+            state.first_log_at = logs[0].created_at
+        state.last_log_at = logs[-1].created_at
+        state.watermark = (logs[-1].created_at, str(logs[-1].id))
+        state.log_count += len(logs)
+        self.stats["logs_folded"] += len(logs)
+        for log in logs[-20:]:
+            state.recent_logs.append(
+                {
+                    "id": log.id or "unknown",  # AgentLog might not have UUID
+                    "event_type": log.log_type,
+                    "content": log.message,
+                    "timestamp": log.created_at,
+                    "metadata": log.details or {},
+                }
+            )
+
+        offset = state.conversation_length
+        state.conversation_length += len(conversation)
+
+        state.goal_statements.extend(self._find_goal_statements(conversation))
+        state.evolved_goals.extend(self._track_goal_evolution(conversation))
+        _extend_unique(
+            state.constraint_candidates,
+            self._find_constraint_candidates(conversation),
+        )
+        _extend_unique(
+            state.lifted_constraints, self._identify_lifted_constraints(conversation)
+        )
+        if offset < 20:  # Standing instructions come from early messages
+            _extend_unique(
+                state.standing_instructions,
+                self._extract_standing_instructions(conversation[: 20 - offset]),
+            )
+            del state.standing_instructions[5:]
+        state.references.update(
+            self._resolve_references(conversation, state.recent_concepts, offset)
+        )
+        for marker_type, markers in self._extract_context_markers(conversation).items():
+            state.context_markers.setdefault(marker_type, deque(maxlen=5)).extend(
+                markers
+            )
+        _extend_unique(
+            state.phases_completed, self._identify_completed_phases(conversation)
+        )
+        state.recent_conversation.extend(conversation)
+        state.attempted_approaches.extend(
+            self._extract_attempted_approaches(conversation)
+        )
+        _extend_unique(
+            state.discovered_blockers, self._find_discovered_blockers(conversation)
+        )
+        del state.discovered_blockers[10:]
+        state.trim()
+
+    def _context_from_state(
+        self, state: _AccumulatedState, task: Optional[Task]
+    ) -> Dict[str, Any]:
+        """Build the accumulated context dict from folded state."""
+        lifted = list(state.lifted_constraints)
+        return {
+            # Core trajectory elements
+            "overall_goal": self._extract_overall_goal(
+                list(state.goal_statements), task
+            ),
+            "evolved_goals": list(state.evolved_goals),
+            # Constraints persist until lifted; keep top 10 most relevant
+            "constraints": [c for c in state.constraint_candidates if c not in lifted][
+                :10
+            ],
+            "lifted_constraints": lifted,
+            "standing_instructions": list(state.standing_instructions),
+            # Reference resolution
+            "references": dict(state.references),
+            "context_markers": {
+                marker_type: list(markers)
+                for marker_type, markers in state.context_markers.items()
+            },
+            # Journey tracking
+            "phases_completed": list(state.phases_completed),
+            "current_focus": self._determine_current_focus(
+                list(state.recent_conversation)
+            ),
+            "attempted_approaches": list(state.attempted_approaches),
+            "discovered_blockers": list(state.discovered_blockers),
+            # Meta information
+            "conversation_length": state.conversation_length,
+            "session_duration": state.last_log_at - state.first_log_at,
+            "last_activity": state.last_log_at,
+        }
 
-            return trajectory_context.model_dump()
+    def _load_state(self, session, key: str) -> _AccumulatedState:
+        """Load the persisted state for a context key (empty if none)."""
+        row = session.get(TrajectoryContextState, key)
+        if row is None:
+            return _AccumulatedState()
+        watermark = (row.watermark_at, row.watermark_id) if row.watermark_at else None
+        try:
+            return _AccumulatedState.from_json(row.state, watermark, row.log_count)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Discarding unreadable trajectory state for {key}: {e}")
+            return _AccumulatedState()
+
+    def _save_state(self, key: str, state: _AccumulatedState) -> None:
+        """Persist a state, unless a state with more folded logs is stored.
+
+        Persistence is best effort: on failure the next build after an
+        eviction rescans the logs.
+        """
+        watermark_at, watermark_id = state.watermark or (None, None)
+        values = {
+            "context_key": key,
+            "watermark_at": watermark_at,
+            "watermark_id": watermark_id,
+            "log_count": state.log_count,
+            "state": state.to_json(),
+            "updated_at": utc_now(),
+        }
+        stmt = pg_insert(TrajectoryContextState).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[TrajectoryContextState.context_key],
+            set_={
+                name: stmt.excluded[name] for name in values if name != "context_key"
+            },
+            where=TrajectoryContextState.log_count <= stmt.excluded.log_count,
+        )
+        try:
+            with self.db.get_session() as session:
+                session.execute(stmt)
+        except Exception as e:
+            logger.warning(f"Failed to persist trajectory state for {key}: {e}")
+
+    def _get_cached(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cache entry, marking it most recently used."""
+        entry = self.context_cache.get(key)
+        if entry is not None:
+            self.context_cache.move_to_end(key)
+        return entry
+
+    def _put_cached(self, key: str, entry: Dict[str, Any]) -> None:
+        """Store a cache entry, evicting the least recently used."""
+        self.context_cache[key] = entry
+        self.context_cache.move_to_end(key)
+        while len(self.context_cache) > self.cache_max_entries:
+            self.context_cache.popitem(last=False)
+            self.stats["evictions"] += 1
 
     def _build_conversation_history(
         self,
@@ -243,19 +578,8 @@ class TrajectoryContext:
 
         return conversation
 
-    def _extract_overall_goal(
-        self,
-        conversation: List[Dict[str, Any]],
-        task: Optional[Task],
-    ) -> str:
-        """Extract the overall accumulated goal from conversation."""
-        # Start with task description if available
-        if task:
-            base_goal = task.enriched_description or task.raw_description
-        else:
-            base_goal = "Complete assigned task"
-
-        # Look for goal refinements in conversation
+    def _find_goal_statements(self, conversation: List[Dict[str, Any]]) -> List[str]:
+        """Find goal refinements stated in the conversation."""
         goal_patterns = [
             r"(?:the goal is|we need to|task is to|objective:)\s*(.+?)(?:\.|$)",
             r"(?:implement|create|build|fix|add|update)\s+(.+?)(?:\.|$)",
@@ -269,12 +593,24 @@ class TrajectoryContext:
                 matches = re.findall(pattern, content_lower, re.IGNORECASE)
                 refined_goals.extend(matches)
 
+        return refined_goals[-5:]
+
+    def _extract_overall_goal(
+        self,
+        refined_goals: List[str],
+        task: Optional[Task],
+    ) -> str:
+        """Extract the overall accumulated goal from recent goal statements."""
+        # Start with task description if available
+        if task:
+            base_goal = task.enriched_description or task.raw_description
+        else:
+            base_goal = "Complete assigned task"
+
         # Find most recent significant goal statement
-        if refined_goals and len(refined_goals) > 0:
+        if refined_goals:
             # Use the most detailed recent goal
-            recent_goal = (
-                max(refined_goals[-5:], key=len) if refined_goals else base_goal
-            )
+            recent_goal = max(refined_goals[-5:], key=len)
             if len(recent_goal) > len(base_goal) * 0.5:  # If it's substantial enough
                 return recent_goal.strip().capitalize()
 
@@ -300,11 +636,11 @@ class TrajectoryContext:
 
         return goals[-5:] if goals else []  # Keep last 5 goal evolutions
 
-    def _extract_persistent_constraints(
+    def _find_constraint_candidates(
         self,
         conversation: List[Dict[str, Any]],
     ) -> List[str]:
-        """Extract constraints that persist until explicitly lifted."""
+        """Extract constraints, which persist until explicitly lifted."""
         constraints = []
 
         # Patterns for constraint detection
@@ -325,11 +661,7 @@ class TrajectoryContext:
                     if len(constraint) > 10 and constraint not in constraints:
                         constraints.append(constraint)
 
-        # Filter out lifted constraints
-        lifted = self._identify_lifted_constraints(conversation)
-        active_constraints = [c for c in constraints if c not in lifted]
-
-        return active_constraints[:10]  # Keep top 10 most relevant
+        return constraints
 
     def _identify_lifted_constraints(
         self,
@@ -378,14 +710,23 @@ class TrajectoryContext:
     def _resolve_references(
         self,
         conversation: List[Dict[str, Any]],
+        recent_concepts: Optional[List[str]] = None,
+        start_index: int = 0,
     ) -> Dict[str, str]:
-        """Resolve 'this/that/it' references from conversation context."""
+        """Resolve 'this/that/it' references from conversation context.
+
+        Args:
+            conversation: Conversation entries to scan
+            recent_concepts: Concepts seen in earlier entries; updated in place
+            start_index: Position of the first entry in the whole conversation
+        """
         references = {}
 
         # Track recent nouns/concepts that could be referenced
-        recent_concepts = []
+        if recent_concepts is None:
+            recent_concepts = []
 
-        for i, entry in enumerate(conversation):
+        for i, entry in enumerate(conversation, start=start_index):
             content = entry["content"]
 
             # Extract potential reference targets (nouns, files, functions, etc.)
@@ -400,7 +741,7 @@ class TrajectoryContext:
                 recent_concepts.extend(matches)
 
             # Keep only last 10 concepts
-            recent_concepts = recent_concepts[-10:]
+            del recent_concepts[:-10]
 
             # Look for reference usage and resolve
             ref_patterns = [
@@ -548,15 +889,6 @@ class TrajectoryContext:
 
         return blockers[:10]  # Top 10 blockers
 
-    def _calculate_session_duration(self, logs: List[AgentLog]) -> timedelta:
-        """Calculate total session duration."""
-        if not logs:
-            return timedelta(0)
-
-        first_log = logs[0]
-        last_log = logs[-1]
-        return last_log.created_at - first_log.created_at
-
     def _get_empty_context(self) -> Dict[str, Any]:
         """Get empty context structure."""
         return {
@@ -644,25 +976,32 @@ class TrajectoryContext:
         """
         context = self.build_accumulated_context(agent_id, include_full_history=False)
 
+        # Built contexts are TrajectoryContext dumps; the empty context is flat
+        goal = context.get("overall_goal") or context.get("accumulated_goal") or ""
+        constraints = context.get("constraints") or (
+            context.get("accumulated_context") or {}
+        ).get("persistent_constraints", [])
+        blockers = context.get("discovered_blockers", [])
+
         summary_parts = [
-            f"Goal: {context['overall_goal'][:100]}",
+            f"Goal: {goal[:100]}",
             f"Focus: {context['current_focus']}",
             f"Duration: {str(context['session_duration']).split('.')[0]}",
         ]
 
-        if context["constraints"]:
-            summary_parts.append(f"Constraints: {len(context['constraints'])}")
+        if constraints:
+            summary_parts.append(f"Constraints: {len(constraints)}")
 
-        if context["discovered_blockers"]:
-            summary_parts.append(f"Blockers: {len(context['discovered_blockers'])}")
+        if blockers:
+            summary_parts.append(f"Blockers: {len(blockers)}")
 
         return " | ".join(summary_parts)
 
     def clear_cache(self, agent_id: Optional[str] = None):
-        """Clear context cache."""
+        """Clear context cache (and the incremental state kept with it)."""
         if agent_id:
-            if agent_id in self.context_cache:
-                del self.context_cache[agent_id]
+            self.context_cache.pop(agent_id, None)
+            self.context_cache.pop(f"{agent_id}:limited", None)
         else:
             self.context_cache.clear()
 
@@ -915,61 +1254,47 @@ class TrajectoryContext:
 
         # Check cache first
         cache_key = f"sandbox:{sandbox_id}"
-        if cache_key in self.context_cache:
-            cached = self.context_cache[cache_key]
-            if cached["timestamp"] > utc_now() - self.cache_ttl:
-                return cached["context"]
+        cached = self._get_cached(cache_key)
+        if cached and cached["timestamp"] > utc_now() - self.cache_ttl:
+            self.stats["hits"] += 1
+            return cached["context"]
+        self.stats["misses"] += 1
 
-        # Get sandbox events
-        events = self.get_sandbox_events(sandbox_id, limit=200)
+        with self.db.get_session() as session:
+            state = (cached or {}).get("state") or self._load_state(session, cache_key)
+            folded = state.log_count
 
-        if not events:
-            logger.warning(f"No sandbox events found for {sandbox_id}")
-            return self._get_empty_context()
+            # Fold in sandbox events newer than the watermark
+            while True:
+                events = self._get_sandbox_events_after(
+                    session, sandbox_id, state.watermark, self.FOLD_BATCH_SIZE
+                )
+                # Convert to AgentLog-compatible format
+                self._fold_logs(
+                    state, self._convert_sandbox_events_to_logs(events, agent_id)
+                )
+                if len(events) < self.FOLD_BATCH_SIZE:
+                    break
 
-        # Convert to AgentLog-compatible format
-        pseudo_logs = self._convert_sandbox_events_to_logs(events, agent_id)
+            if not state.log_count:
+                logger.warning(f"No sandbox events found for {sandbox_id}")
+                return self._get_empty_context()
 
-        with self.db.get_session() as session:
             # Get agent and task for context
             agent = session.query(Agent).filter_by(id=agent_id).first()
             task = session.query(Task).filter_by(sandbox_id=sandbox_id).first()
 
-            # Build conversation history from pseudo-logs
-            conversation = self._build_conversation_history(
-                pseudo_logs, include_full_history=True
-            )
-
             # Extract accumulated understanding
-            context = {
-                # Core trajectory elements
-                "overall_goal": self._extract_overall_goal(conversation, task),
-                "evolved_goals": self._track_goal_evolution(conversation),
-                "constraints": self._extract_persistent_constraints(conversation),
-                "lifted_constraints": self._identify_lifted_constraints(conversation),
-                "standing_instructions": self._extract_standing_instructions(
-                    conversation
-                ),
-                # Reference resolution
-                "references": self._resolve_references(conversation),
-                "context_markers": self._extract_context_markers(conversation),
-                # Journey tracking
-                "phases_completed": self._identify_completed_phases(conversation),
-                "current_focus": self._determine_current_focus(conversation),
-                "attempted_approaches": self._extract_attempted_approaches(
-                    conversation
-                ),
-                "discovered_blockers": self._find_discovered_blockers(conversation),
-                # Meta information
-                "conversation_length": len(conversation),
-                "session_duration": self._calculate_session_duration(pseudo_logs),
-                "last_activity": events[-1].created_at if events else utc_now(),
-                "agent_id": agent_id,
-                "sandbox_id": sandbox_id,
-                "agent_type": agent.agent_type if agent else "unknown",
-                "agent_status": agent.status if agent else "unknown",
-                "is_sandbox": True,
-            }
+            context = self._context_from_state(state, task)
+            context.update(
+                {
+                    "agent_id": agent_id,
+                    "sandbox_id": sandbox_id,
+                    "agent_type": agent.agent_type if agent else "unknown",
+                    "agent_status": agent.status if agent else "unknown",
+                    "is_sandbox": True,
+                }
+            )
 
             # Add task-specific context
             if task:
@@ -978,13 +1303,46 @@ class TrajectoryContext:
                 context["task_status"] = task.status
                 context["phase_id"] = task.phase_id
 
-            # Cache the result
-            self.context_cache[cache_key] = {
+        if state.log_count > folded:
+            self._save_state(cache_key, state)
+
+        # Cache the result
+        self._put_cached(
+            cache_key,
+            {
                 "timestamp": utc_now(),
                 "context": context,
-            }
+                "state": state,
+            },
+        )
 
-            return context
+        return context
+
+    def _get_sandbox_events_after(
+        self,
+        session,
+        sandbox_id: str,
+        watermark: Optional[Tuple[datetime, str]],
+        limit: int,
+    ) -> List[SandboxEvent]:
+        """Get a sandbox's events after a (created_at, id) watermark, in order."""
+        query = session.query(SandboxEvent).filter(
+            SandboxEvent.sandbox_id == sandbox_id
+        )
+        if watermark:
+            last_at, last_id = watermark
+            query = query.filter(
+                or_(
+                    SandboxEvent.created_at > last_at,
+                    and_(
+                        SandboxEvent.created_at == last_at,
+                        SandboxEvent.id > last_id,
+                    ),
+                )
+            )
+        return (
+            query.order_by(SandboxEvent.created_at, SandboxEvent.id).limit(limit).all()
+        )
 
     def build_accumulated_context_auto(
         self, agent_id: str, include_full_history: bool = True
@@ -0,0 +1,231 @@
+"""Content-addressed, zstd-compressed storage for Claude session transcripts.
+
+Session transcripts are multi-megabyte JSONL files. Keeping them base64
+encoded in claude_session_transcripts (and in the agent.completed event
+that carried them) bloats every query that touches those rows. Instead,
+transcripts are compressed with zstd and written once to a blob store,
+keyed by the SHA-256 of the uncompressed bytes; the database keeps only
+the reference ("sha256:<hex>").
+
+- Identical transcripts (a resumed session saved twice) share one blob
+- Blobs are written to a temporary file and renamed, so readers never see
+  a partial blob
+- Reads decompress lazily in fixed-size chunks; nothing holds the whole
+  decompressed transcript unless the caller asks for it
+
+Only a filesystem backend exists today; FilesystemBlobStore is the
+interface other backends (e.g. object storage) implement.
+"""
+
+import base64
+import hashlib
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, Optional
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+from omoi_os.config import get_app_settings
+from omoi_os.logging import get_logger
+
+logger = get_logger(__name__)
+
+TRANSCRIPT_REF_PREFIX = "sha256:"
+# A multiple of 3, so base64 of consecutive chunks concatenates cleanly
+CHUNK_SIZE = 3 * (1 << 18)
+
+
+class TranscriptNotFoundError(KeyError):
+    """Raised when a transcript reference has no stored blob."""
+
+
+@dataclass(frozen=True)
+class StoredTranscript:
+    """Reference to a stored transcript plus its sizes."""
+
+    ref: str
+    size: int
+    compressed_size: int
+
+
+class FilesystemBlobStore:
+    """
+    Immutable blobs under a root directory, fanned out by key prefix.
+
+    A key "ab12..." is stored at root/ab/12/ab12....
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root).expanduser()
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / key[2:4] / key
+
+    def exists(self, key: str) -> bool:
+        return self._path(key).exists()
+
+    def put(self, key: str, chunks: Iterable[bytes]) -> int:
+        """
+        Write a blob atomically.
+
+        Returns:
+            Bytes written
+        """
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        written = 0
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                    written += len(chunk)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return written
+
+    def open(self, key: str) -> BinaryIO:
+        """Open a blob for reading."""
+        try:
+            return open(self._path(key), "rb")
+        except FileNotFoundError:
+            raise TranscriptNotFoundError(key) from None
+
+    def size(self, key: str) -> int:
+        return self._path(key).stat().st_size
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+
+class TranscriptStore:
+    """
+    Stores transcripts compressed and content-addressed in a blob store.
+
+    Usage:
+        store = TranscriptStore(FilesystemBlobStore(Path("/var/omoi/transcripts")))
+        stored = store.put_b64(transcript_b64)
+        for chunk in store.iter_chunks(stored.ref):
+            ...
+
+    Args:
+        blobs: Blob store backend
+        level: zstd compression level
+    """
+
+    def __init__(self, blobs: FilesystemBlobStore, level: int = 3) -> None:
+        self.blobs = blobs
+        self.level = level
+
+    @staticmethod
+    def _key(ref: str) -> str:
+        if not ref.startswith(TRANSCRIPT_REF_PREFIX):
+            raise ValueError(f"Not a transcript reference: {ref!r}")
+        return ref[len(TRANSCRIPT_REF_PREFIX) :] + ".jsonl.zst"
+
+    def put(self, transcript: bytes) -> StoredTranscript:
+        """Store a transcript, unless the same content is already stored."""
+        ref = TRANSCRIPT_REF_PREFIX + hashlib.sha256(transcript).hexdigest()
+        key = self._key(ref)
+        if self.blobs.exists(key):
+            compressed_size = self.blobs.size(key)
+        else:
+            compressor = zstandard.ZstdCompressor(level=self.level)
+            compressed = compressor.compress(transcript)
+            compressed_size = self.blobs.put(key, [compressed])
+        return StoredTranscript(
+            ref=ref, size=len(transcript), compressed_size=compressed_size
+        )
+
+    def put_b64(self, transcript_b64: str) -> StoredTranscript:
+        """Store a base64-encoded transcript, as sent by sandbox workers."""
+        return self.put(base64.b64decode(transcript_b64))
+
+    def open(self, ref: str) -> BinaryIO:
+        """
+        Open a transcript as a stream, decompressed as it is read.
+
+        Raises:
+            TranscriptNotFoundError: If no blob is stored for ref
+        """
+        blob = self.blobs.open(self._key(ref))
+        return zstandard.ZstdDecompressor().stream_reader(blob, closefd=True)
+
+    def iter_chunks(self, ref: str, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        """Yield the decompressed transcript in chunks of chunk_size bytes."""
+        with self.open(ref) as reader:
+            while True:
+                chunk = reader.read(chunk_size)
+                # stream_reader may return short reads before the end
+                while chunk and len(chunk) < chunk_size:
+                    more = reader.read(chunk_size - len(chunk))
+                    if not more:
+                        break
+                    chunk += more
+                if not chunk:
+                    return
+                yield chunk
+
+    def read_b64(self, ref: str) -> str:
+        """
+        Return a transcript base64-encoded, for SESSION_TRANSCRIPT_B64.
+
+        Chunks are encoded as they are decompressed, so only the encoded
+        result is held in full.
+        """
+        return "".join(
+            base64.b64encode(chunk).decode("ascii") for chunk in self.iter_chunks(ref)
+        )
+
+
+_transcript_store: Optional[TranscriptStore] = None
+_transcript_store_lock = threading.Lock()
+
+
+def get_transcript_store() -> Optional[TranscriptStore]:
+    """
+    Get the process-wide transcript store configured from settings.
+
+    Returns:
+        The shared store, or None if transcript_store.enabled is false or
+        zstandard is not installed (transcripts are then kept inline in the
+        database, as before).
+    """
+    global _transcript_store
+
+    store_settings = get_app_settings().transcript_store
+    if not store_settings.enabled:
+        return None
+    if not ZSTD_AVAILABLE:
+        logger.warning("zstandard is not installed, storing transcripts inline")
+        return None
+
+    if _transcript_store is None:
+        with _transcript_store_lock:
+            if _transcript_store is None:
+                if store_settings.backend != "filesystem":
+                    raise ValueError(
+                        f"Unknown transcript store backend: {store_settings.backend}"
+                    )
+                _transcript_store = TranscriptStore(
+                    FilesystemBlobStore(Path(store_settings.root)),
+                    level=store_settings.compression_level,
+                )
+    return _transcript_store
+
+
+def reset_transcript_store() -> None:
+    """Reset the process-wide transcript store (useful for tests)."""
+    global _transcript_store
+    _transcript_store = None
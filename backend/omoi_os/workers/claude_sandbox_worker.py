@@ -82,11 +82,15 @@ import base64
 import difflib
 import json
 import logging
+import mmap
 import os
+import random
 from re import Match, Pattern
 import signal
+import struct
 import subprocess
 import sys
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
@@ -850,6 +854,16 @@ class WorkerConfig:
         self.initial_prompt = os.environ.get("INITIAL_PROMPT", "")
         self.poll_interval = float(os.environ.get("POLL_INTERVAL", "0.5"))
         self.heartbeat_interval = int(os.environ.get("HEARTBEAT_INTERVAL", "30"))
+        # Event batching: 0 posts every event on its own; > 0 buffers events
+        # and posts them to /events/batch at this interval (seconds)
+        self.event_flush_interval = float(os.environ.get("EVENT_FLUSH_INTERVAL", "0"))
+        self.event_batch_size = int(os.environ.get("EVENT_BATCH_SIZE", "50"))
+        # Durable outbox: events are written to this directory and sent to
+        # /events/batch in the background, surviving worker restarts
+        self.event_outbox_dir = os.environ.get("EVENT_OUTBOX_DIR", "")
+        self.event_outbox_drain_timeout = float(
+            os.environ.get("EVENT_OUTBOX_DRAIN_TIMEOUT", "10")
+        )
 
         # SDK settings
         self.max_turns = int(os.environ.get("MAX_TURNS", "50"))
@@ -1726,6 +1740,9 @@ Continue from where we left off, acknowledging the previous context."""
             "api_base_url": self.api_base_url or "default",
             "poll_interval": self.poll_interval,
             "heartbeat_interval": self.heartbeat_interval,
+            "event_flush_interval": self.event_flush_interval,
+            "event_batch_size": self.event_batch_size,
+            "event_outbox_dir": self.event_outbox_dir or None,
             "max_turns": self.max_turns,
             "max_budget_usd": self.max_budget_usd,
             "permission_mode": self.permission_mode,
@@ -2063,25 +2080,391 @@ Systematically investigate issues:
             return None
 
 
+# =============================================================================
+# Durable Event Outbox
+# =============================================================================
+
+
+class EventOutbox:
+    """Append-only on-disk event log with a persistent delivery cursor.
+
+    Mirrors spec_sandbox.reporters.outbox (this worker runs standalone).
+    events.log holds one JSON event per line; events.cursor is a memory-mapped
+    file with the byte offset of the first undelivered event, the last assigned
+    sequence and the last delivered sequence; outbox.id holds the idempotency
+    key prefix. Delivery is at-least-once: a batch sent but not committed
+    before a crash is resent with the same idempotency keys, which the batch
+    endpoint skips.
+    """
+
+    # Read offset, last assigned sequence, last delivered sequence
+    CURSOR = struct.Struct("<QQQ")
+    # Delivered log bytes kept before the log is truncated
+    COMPACT_BYTES = 1 << 20
+    # Bytes read per step when looking for the end of the last complete line
+    RECOVER_CHUNK_BYTES = 1 << 16
+
+    def __init__(self, directory: Path, key_prefix: str):
+        directory.mkdir(parents=True, exist_ok=True)
+        self.directory = directory
+        self._log_path = directory / "events.log"
+
+        id_path = directory / "outbox.id"
+        if id_path.exists():
+            self.key_prefix = id_path.read_text().strip()
+        else:
+            self.key_prefix = f"{key_prefix}:{uuid4().hex[:8]}"
+            id_path.write_text(self.key_prefix)
+
+        cursor_path = directory / "events.cursor"
+        with open(cursor_path, "ab") as f:
+            if f.tell() < self.CURSOR.size:
+                f.write(b"\0" * (self.CURSOR.size - f.tell()))
+        self._cursor_file = open(cursor_path, "r+b")
+        self._cursor = mmap.mmap(self._cursor_file.fileno(), self.CURSOR.size)
+        self._offset, self._sequence, self._delivered = self.CURSOR.unpack_from(
+            self._cursor
+        )
+
+        self._log = open(self._log_path, "ab")
+        self._recover()
+        self._oldest_pending_at: Optional[float] = None
+
+    def _recover(self) -> None:
+        """Drop a partially written last line and clamp the cursor."""
+        size = self._log_size()
+        end = self._last_line_end(size)
+        if end < size:
+            os.truncate(self._log_path, end)
+            size = end
+        if self._offset > size:
+            self._offset = size
+        self._store_cursor()
+
+    def _last_line_end(self, size: int) -> int:
+        """Offset just past the log's last newline (0 if it has none)."""
+        # Scan back in chunks: a torn line can be longer than any one chunk
+        position = size
+        with open(self._log_path, "rb") as f:
+            while position > 0:
+                start = max(0, position - self.RECOVER_CHUNK_BYTES)
+                f.seek(start)
+                newline = f.read(position - start).rfind(b"\n")
+                if newline >= 0:
+                    return start + newline + 1
+                position = start
+        return 0
+
+    def _log_size(self) -> int:
+        return os.fstat(self._log.fileno()).st_size
+
+    def _store_cursor(self) -> None:
+        self.CURSOR.pack_into(
+            self._cursor, 0, self._offset, self._sequence, self._delivered
+        )
+
+    @property
+    def pending_events(self) -> int:
+        """Events appended but not yet delivered."""
+        return self._sequence - self._delivered
+
+    @property
+    def pending_bytes(self) -> int:
+        """Size of the undelivered part of the log."""
+        return self._log_size() - self._offset
+
+    def append(self, event: dict[str, Any]) -> int:
+        """Append an event, assigning its sequence and idempotency key."""
+        # The sequence is stored first, so a crash mid-write leaves a gap
+        # rather than reusing the number (and idempotency key)
+        self._sequence += 1
+        self._store_cursor()
+        record = {
+            **event,
+            "sequence": self._sequence,
+            "idempotency_key": f"{self.key_prefix}:{self._sequence}",
+            "enqueued_at": time.time(),
+        }
+        line = json.dumps(record, separators=(",", ":"), default=str)
+        self._log.write(line.encode("utf-8") + b"\n")
+        self._log.flush()
+        if self._oldest_pending_at is None:
+            self._oldest_pending_at = record["enqueued_at"]
+        return self._sequence
+
+    def read_batch(self, limit: int) -> tuple[list[dict[str, Any]], int]:
+        """Read up to limit undelivered events and the offset to commit."""
+        records: list[dict[str, Any]] = []
+        end = self._offset
+        with open(self._log_path, "rb") as f:
+            f.seek(self._offset)
+            while len(records) < limit:
+                line = f.readline()
+                if not line.endswith(b"\n"):
+                    break
+                end += len(line)
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue  # Unreadable line; skipped with this batch
+        if records:
+            self._oldest_pending_at = records[0].get("enqueued_at")
+        return records, end
+
+    def commit(self, end: int, sequence: int) -> None:
+        """Mark events up to a read_batch() offset as delivered."""
+        self._offset = end
+        self._delivered = max(self._delivered, sequence)
+        if self._offset >= self._log_size():
+            # Nothing left; this also closes sequence gaps from a crash
+            self._delivered = self._sequence
+            self._oldest_pending_at = None
+            if self._offset >= self.COMPACT_BYTES:
+                self._log.truncate(0)
+                self._offset = 0
+        self._store_cursor()
+
+    def lag(self) -> dict[str, Any]:
+        """Delivery lag metrics."""
+        oldest = self._oldest_pending_at if self.pending_bytes else None
+        return {
+            "pending_events": self.pending_events,
+            "pending_bytes": self.pending_bytes,
+            "oldest_pending_age_seconds": (
+                round(time.time() - oldest, 3) if oldest else 0.0
+            ),
+            "last_sequence": self._sequence,
+            "delivered_sequence": self._delivered,
+        }
+
+    def close(self) -> None:
+        self._log.close()
+        self._cursor.flush()
+        self._cursor.close()
+        self._cursor_file.close()
+
+
+class OutboxSender:
+    """Drains an EventOutbox in the background, one batch per send() call.
+
+    Waits for a full batch, an urgent event or `linger` seconds, and retries
+    failed sends after an exponential backoff with jitter, so callers never
+    wait on the network.
+    """
+
+    def __init__(
+        self,
+        outbox: EventOutbox,
+        send: Any,
+        batch_size: int = 50,
+        linger: float = 1.0,
+        max_backoff: float = 30.0,
+    ):
+        self.outbox = outbox
+        self._send = send  # async (events) -> bool, True once stored
+        self.batch_size = max(1, batch_size)
+        self.linger = linger if linger > 0 else 1.0
+        self.max_backoff = max_backoff
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+        self._drained = asyncio.Event()
+        if not outbox.pending_bytes:
+            self._drained.set()
+        self.stats: dict[str, Any] = {
+            "batches_sent": 0,
+            "events_sent": 0,
+            "send_failures": 0,
+            "last_delivery_at": None,
+        }
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop sending; undelivered events stay on disk."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def notify(self, urgent: bool = False) -> None:
+        """Tell the sender events were appended."""
+        self._drained.clear()
+        if urgent or self.outbox.pending_events >= self.batch_size:
+            self._wakeup.set()
+
+    async def drain(self, timeout: float) -> bool:
+        """Wait up to timeout for every appended event to be delivered."""
+        if not self.outbox.pending_bytes:
+            return True
+        self.start()
+        self._wakeup.set()
+        try:
+            await asyncio.wait_for(self._drained.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def lag(self) -> dict[str, Any]:
+        """Outbox lag plus sender statistics."""
+        return {**self.outbox.lag(), **self.stats}
+
+    async def _run(self) -> None:
+        backoff = 0.0
+        while True:
+            if backoff:
+                await asyncio.sleep(backoff * random.uniform(0.5, 1.0))
+            elif (
+                self.outbox.pending_events < self.batch_size
+                and not self._wakeup.is_set()
+            ):
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.linger)
+                except asyncio.TimeoutError:
+                    pass
+            self._wakeup.clear()
+
+            if await self.send_batch():
+                backoff = 0.0
+                if self.outbox.pending_bytes:
+                    self._wakeup.set()  # Once woken, send everything pending
+            else:
+                backoff = min(self.max_backoff, max(0.5, backoff * 2))
+
+    async def send_batch(self) -> bool:
+        """Send the oldest pending batch; False if it was not delivered."""
+        records, end = self.outbox.read_batch(self.batch_size)
+        if records:
+            events = [
+                {k: v for k, v in record.items() if k != "enqueued_at"}
+                for record in records
+            ]
+            try:
+                delivered = await self._send(events)
+            except Exception as e:
+                logger.warning("Outbox send failed", extra={"error": str(e)})
+                delivered = False
+            if not delivered:
+                self.stats["send_failures"] += 1
+                return False
+            self.stats["batches_sent"] += 1
+            self.stats["events_sent"] += len(records)
+            self.stats["last_delivery_at"] = time.time()
+            self.outbox.commit(end, records[-1]["sequence"])
+        else:
+            self.outbox.commit(end, 0)  # Skips unreadable lines, if any
+
+        if not self.outbox.pending_bytes:
+            self._drained.set()
+        return True
+
+
 # =============================================================================
 # Event Reporter (Webhook Client)
 # =============================================================================
 
 
 class EventReporter:
-    """Reports events back to main server via HTTP POST with comprehensive tracking."""
+    """Reports events back to main server via HTTP POST with comprehensive tracking.
+
+    With config.event_flush_interval > 0, events are buffered and posted to
+    the batch endpoint every flush interval or every event_batch_size events,
+    whichever comes first. Status events (IMMEDIATE_EVENT_TYPES) flush the
+    buffer at once so task transitions are not delayed, and their report()
+    result reflects delivery. Each event carries an idempotency key, so a
+    batch retried after a failure is not stored twice. Falls back to one
+    request per event if the server has no batch endpoint.
+
+    With config.event_outbox_dir set, events are appended to a durable
+    EventOutbox instead and report() returns once the event is on disk; an
+    OutboxSender posts them to the batch endpoint in the background (status
+    events wake it at once) and retries with backoff, so the agent loop never
+    waits on the network. Undelivered events survive a worker restart.
+    """
+
+    # Events the backend acts on; never held in the buffer
+    IMMEDIATE_EVENT_TYPES = frozenset(
+        {
+            "agent.started",
+            "agent.completed",
+            "continuous.completed",
+            "agent.failed",
+            "agent.error",
+            "spec.phase_started",
+            "spec.phase_completed",
+            "spec.phase_failed",
+            "spec.phase_retry",
+            "spec.execution_completed",
+            "spec.criterion_met",
+        }
+    )
+    # Events kept for retry while the server is unreachable
+    MAX_BUFFERED_EVENTS = 1000
 
     def __init__(self, config: WorkerConfig):
         self.config = config
         self.client: Optional[httpx.AsyncClient] = None
         self.event_count = 0
+        self.flush_interval = float(getattr(config, "event_flush_interval", 0) or 0)
+        self.batch_size = max(1, int(getattr(config, "event_batch_size", 50) or 50))
+        self._buffer: list[dict[str, Any]] = []
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._batch_supported = True
+        # Distinguishes idempotency keys across worker restarts
+        self._key_prefix = f"{config.sandbox_id}:{uuid4().hex[:8]}"
+
+        self.outbox: Optional[EventOutbox] = None
+        self._sender: Optional[OutboxSender] = None
+        self.outbox_drain_timeout = float(
+            getattr(config, "event_outbox_drain_timeout", 10) or 10
+        )
+        outbox_dir = getattr(config, "event_outbox_dir", "")
+        if outbox_dir and isinstance(outbox_dir, (str, Path)):
+            self.outbox = EventOutbox(Path(outbox_dir), key_prefix=config.sandbox_id)
+            self._sender = OutboxSender(
+                self.outbox,
+                self._post_batch,
+                batch_size=self.batch_size,
+                linger=self.flush_interval,
+            )
+
+    @property
+    def batching(self) -> bool:
+        """Whether events are buffered and posted in batches."""
+        return self.flush_interval > 0 and self._batch_supported
 
     async def __aenter__(self):
         self.client = httpx.AsyncClient(timeout=30.0)
+        if self._sender:
+            self._sender.start()
+        elif self.batching:
+            self._flush_task = asyncio.create_task(self._flush_loop())
         return self
 
     async def __aexit__(self, *args):
+        if self._sender:
+            if not await self._sender.drain(self.outbox_drain_timeout):
+                logger.warning(
+                    "Event outbox not drained at shutdown",
+                    extra=self._sender.lag(),
+                )
+            await self._sender.stop()
+            self.outbox.close()
+            self._sender = None
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
         if self.client:
+            await self.flush()
             await self.client.aclose()
 
     async def report(
@@ -2090,7 +2473,11 @@ class EventReporter:
         event_data: dict[str, Any],
         source: str = "agent",
     ) -> bool:
-        """Report event to main server with full context."""
+        """Report event to main server with full context.
+
+        In batch mode, returns True once a non-status event is buffered; in
+        outbox mode, once the event is written to the outbox.
+        """
         if not self.client:
             return False
 
@@ -2108,6 +2495,117 @@ class EventReporter:
         if hasattr(self.config, "spec_id") and self.config.spec_id:
             event_data["spec_id"] = self.config.spec_id
 
+        if self._sender:
+            # Durable once appended; the sender delivers it
+            self.outbox.append(
+                {"event_type": event_type, "event_data": event_data, "source": source}
+            )
+            self._sender.notify(urgent=event_type in self.IMMEDIATE_EVENT_TYPES)
+            return True
+
+        if self.batching:
+            entry = {
+                "event_type": event_type,
+                "event_data": event_data,
+                "source": source,
+                "idempotency_key": f"{self._key_prefix}:{self.event_count}",
+                "sequence": self.event_count,
+            }
+            self._buffer.append(entry)
+            if event_type in self.IMMEDIATE_EVENT_TYPES:
+                delivered = await self.flush()
+                if not delivered:
+                    # The caller decides whether to retry, as with single posts
+                    self._buffer = [e for e in self._buffer if e is not entry]
+                return delivered
+            if len(self._buffer) >= self.batch_size:
+                await self.flush()
+            return True
+
+        return await self._post_event(event_type, event_data, source)
+
+    async def flush(self) -> bool:
+        """Post all buffered events.
+
+        In outbox mode, waits up to outbox_drain_timeout for the outbox to
+        empty.
+
+        Returns:
+            True if the buffer was delivered (or was empty)
+        """
+        if self._sender:
+            return await self._sender.drain(self.outbox_drain_timeout)
+
+        async with self._flush_lock:
+            while self._buffer:
+                batch = self._buffer[: self.batch_size]
+                del self._buffer[: self.batch_size]
+                if await self._post_batch(batch):
+                    continue
+                # Keep undelivered events for the next flush, oldest dropped first
+                self._buffer[:0] = batch
+                overflow = len(self._buffer) - self.MAX_BUFFERED_EVENTS
+                if overflow > 0:
+                    del self._buffer[:overflow]
+                    logger.warning(
+                        "Dropped buffered events", extra={"dropped": overflow}
+                    )
+                return False
+            return True
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def _post_batch(self, events: list[dict[str, Any]]) -> bool:
+        if not self._batch_supported:
+            # Deliver each event; key/sequence are batch-only fields
+            for event in events:
+                await self._post_event(
+                    event["event_type"], event["event_data"], event["source"]
+                )
+            return True
+
+        url = f"{self.config.callback_url}/api/v1/sandboxes/{self.config.sandbox_id}/events/batch"
+        try:
+            response = await self.client.post(url, json={"events": events})
+        except Exception as e:
+            # Transient (network, 502); events stay buffered for the next flush
+            if "502" not in str(e) and "bad gateway" not in str(e).lower():
+                logger.warning(
+                    "Network error reporting event batch",
+                    extra={"events": len(events), "error": str(e)},
+                )
+            return False
+
+        if response.status_code == 404:
+            # Older server without the batch endpoint
+            logger.info("Batch event endpoint unavailable, posting events one by one")
+            self._batch_supported = False
+            return await self._post_batch(events)
+        if response.status_code == 422:
+            # Malformed batch will never succeed; don't retry it forever
+            logger.error(
+                "Event batch rejected",
+                extra={"events": len(events), "status_code": response.status_code},
+            )
+            return True
+        if response.status_code != 200:
+            if response.status_code != 502:
+                logger.warning(
+                    "Event batch report failed",
+                    extra={"events": len(events), "status_code": response.status_code},
+                )
+            return False
+        return True
+
+    async def _post_event(
+        self,
+        event_type: str,
+        event_data: dict[str, Any],
+        source: str,
+    ) -> bool:
         url = f"{self.config.callback_url}/api/v1/sandboxes/{self.config.sandbox_id}/events"
 
         try:
@@ -2176,17 +2674,20 @@ class EventReporter:
                 )
             return False
 
+    def outbox_lag(self) -> Optional[dict[str, Any]]:
+        """Outbox delivery lag metrics (None without an outbox)."""
+        return self._sender.lag() if self._sender else None
+
     async def heartbeat(self) -> bool:
         """Send heartbeat event."""
-        return await self.report(
-            "agent.heartbeat",
-            {
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "status": "alive",
-                "event_count": self.event_count,
-            },
-            source="worker",
-        )
+        event_data: dict[str, Any] = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "status": "alive",
+            "event_count": self.event_count,
+        }
+        if self._sender:
+            event_data["event_outbox"] = self.outbox_lag()
+        return await self.report("agent.heartbeat", event_data, source="worker")
 
     async def report_criterion_met(
         self,
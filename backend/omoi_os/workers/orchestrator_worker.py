@@ -31,10 +31,12 @@ configure_logging(env=_env)  # type: ignore[arg-type]
 if TYPE_CHECKING:
     from omoi_os.services.database import DatabaseService
     from omoi_os.services.task_queue import TaskQueueService
-    from omoi_os.services.event_bus import EventBusService
+    from omoi_os.services.event_bus import EventBusService, SystemEvent
     from omoi_os.services.agent_registry import AgentRegistryService
     from omoi_os.services.task_requirements_analyzer import TaskRequirements
 
+from omoi_os.services.dispatch_wakeup import DISPATCH_EVENT_TYPES, DispatchWakeup
+
 logger = get_logger("orchestrator")
 
 # Task requirements analyzer (initialized in init_services)
@@ -49,8 +51,18 @@ registry_service: AgentRegistryService | None = None
 # Shutdown flag
 shutdown_event = asyncio.Event()
 
-# Task ready event - set when a new task is created (for instant wakeup)
-task_ready_event = asyncio.Event()
+# Dedicated event bus for dispatch wakeups (own pub/sub connection, so our
+# subscriptions don't replace the callbacks of services sharing event_bus)
+wakeup_bus: EventBusService | None = None
+
+# Dispatch wakeup - signalled by queue events for instant dispatch; the
+# timeout is only a safety fallback for missed events
+dispatch_wakeup = DispatchWakeup(
+    fallback_interval=float(os.getenv("ORCHESTRATOR_FALLBACK_POLL_SECONDS", "5"))
+)
+
+# Poll interval used when no event listener is running (Redis unavailable)
+POLLING_ONLY_INTERVAL = 1.0
 
 # Stats tracking (global for heartbeat access)
 stats = {
@@ -59,6 +71,7 @@ stats = {
     "tasks_failed": 0,
     "events_received": 0,
     "start_time": 0.0,
+    "last_queue_wait_ms": 0.0,
 }
 
 
@@ -747,20 +760,34 @@ async def heartbeat_task():
             tasks_processed=stats["tasks_processed"],
             tasks_failed=stats["tasks_failed"],
             events_received=stats["events_received"],
+            signal_wakeups=dispatch_wakeup.stats["signal_wakeups"],
+            fallback_wakeups=dispatch_wakeup.stats["fallback_wakeups"],
+            last_wake_latency_ms=round(
+                dispatch_wakeup.stats["last_wake_latency_ms"], 2
+            ),
+            last_queue_wait_ms=round(stats["last_queue_wait_ms"], 2),
         )
         await asyncio.sleep(30)
 
 
-def handle_task_event(event_data: dict) -> None:
+def _event_dict(event: "SystemEvent | dict") -> dict:
+    """Normalize event bus callbacks (SystemEvent) and raw dicts to a dict."""
+    return event if isinstance(event, dict) else event.model_dump()
+
+
+def handle_task_event(event: "SystemEvent | dict") -> None:
     """Handle task-related events to wake up orchestrator immediately.
 
     This is called by the Redis event bus subscriber when:
     - A new task is created (TASK_CREATED)
     - A new ticket is created (TICKET_CREATED)
-    - A task completes (SANDBOX_agent.completed) - frees up a slot
+    - A task completes, fails or is cancelled - frees a slot and may
+      complete the dependencies of pending tasks
+    - A task changes status (e.g. reset to pending)
 
-    Sets the task_ready_event to interrupt the polling sleep.
+    Signals dispatch_wakeup to interrupt the fallback wait.
     """
+    event_data = _event_dict(event)
     stats["events_received"] += 1
     event_type = event_data.get("event_type", "unknown")
     entity_id = event_data.get("entity_id", "unknown")
@@ -771,10 +798,10 @@ def handle_task_event(event_data: dict) -> None:
         events_total=stats["events_received"],
     )
     # Wake up the orchestrator loop immediately
-    task_ready_event.set()
+    dispatch_wakeup.notify(event_type)
 
 
-def handle_validation_failed(event_data: dict) -> None:
+def handle_validation_failed(event: "SystemEvent | dict") -> None:
     """Handle TASK_VALIDATION_FAILED event to reset task for re-implementation.
 
     When a validator agent fails the validation:
@@ -792,7 +819,7 @@ def handle_validation_failed(event_data: dict) -> None:
         logger.error("database_not_initialized_for_validation_handling")
         return
 
-    event_data.get("event_type", "TASK_VALIDATION_FAILED")
+    event_data = _event_dict(event)
     task_id = event_data.get("entity_id")
     payload = event_data.get("payload", {})
     iteration = payload.get("iteration", 0)
@@ -864,7 +891,7 @@ def handle_validation_failed(event_data: dict) -> None:
                 )
 
         # Wake up the orchestrator to pick up the reset task
-        task_ready_event.set()
+        dispatch_wakeup.notify("reset_for_revision")
 
     except Exception as e:
         logger.error(
@@ -881,11 +908,13 @@ async def orchestrator_loop():
     1. Legacy mode (SANDBOX_EXECUTION=false): Assigns to DB agents, workers poll
     2. Sandbox mode (SANDBOX_EXECUTION=true): Spawns Daytona sandboxes per task
 
-    Uses hybrid event-driven + polling approach:
-    - Subscribes to TASK_CREATED events for instant wakeup
-    - Falls back to polling every 5 seconds if events are missed
+    Uses event-driven dispatch with a polling fallback:
+    - Queue events (created, completed, failed, status changes) wake it instantly
+    - After a successful dispatch it loops again immediately to drain bursts
+    - Falls back to polling every ORCHESTRATOR_FALLBACK_POLL_SECONDS (default 5)
+      if events are missed, or every second when Redis is unavailable
     """
-    global db, queue, event_bus, registry_service
+    global db, queue, event_bus, registry_service, wakeup_bus
 
     # Check if orchestrator is disabled via environment variable
     if os.getenv("ORCHESTRATOR_ENABLED", "true").lower() in ("false", "0", "no"):
@@ -904,39 +933,36 @@ async def orchestrator_loop():
     # Subscribe to task events for instant wakeup (hybrid approach)
     # This allows the orchestrator to respond immediately when:
     # 1. New tasks are created (so we can spawn sandboxes)
-    # 2. Tasks complete (so we can spawn more now that a slot is free)
+    # 2. Tasks complete/fail (a slot is free, dependents may be unblocked)
     # 3. Validation fails (so we can reset task for re-implementation)
+    # Subscriptions live on a dedicated bus with its own listener thread.
+    listening = False
     try:
-        event_bus.subscribe("TASK_CREATED", handle_task_event)
-        event_bus.subscribe(
-            "TICKET_CREATED", handle_task_event
-        )  # Tickets also trigger tasks
-        # Subscribe to completion events to spawn more tasks when slots open
-        event_bus.subscribe("SANDBOX_agent.completed", handle_task_event)
-        event_bus.subscribe("SANDBOX_agent.failed", handle_task_event)
-        event_bus.subscribe("SANDBOX_agent.error", handle_task_event)
-        # Subscribe to validation events for the revision workflow
-        event_bus.subscribe("TASK_VALIDATION_FAILED", handle_validation_failed)
-        event_bus.subscribe(
-            "TASK_VALIDATION_PASSED", handle_task_event
-        )  # Just for wakeup/metrics
+        from omoi_os.config import get_app_settings
+        from omoi_os.services.event_bus import EventBusService
+
+        wakeup_bus = EventBusService(redis_url=get_app_settings().redis.url)
+        for event_type in DISPATCH_EVENT_TYPES:
+            wakeup_bus.subscribe(event_type, handle_task_event)
+        wakeup_bus.subscribe("TASK_VALIDATION_FAILED", handle_validation_failed)
+        dispatch_wakeup.bind_loop()
+        listening = dispatch_wakeup.start_listener(wakeup_bus)
         logger.info(
             "event_subscriptions_registered",
-            events=[
-                "TASK_CREATED",
-                "TICKET_CREATED",
-                "SANDBOX_agent.completed",
-                "SANDBOX_agent.failed",
-                "SANDBOX_agent.error",
-                "TASK_VALIDATION_FAILED",
-                "TASK_VALIDATION_PASSED",
-            ],
+            events=[*DISPATCH_EVENT_TYPES, "TASK_VALIDATION_FAILED"],
+            listening=listening,
         )
     except Exception as e:
         logger.warning(
             "event_subscription_failed", error=str(e), fallback="polling_only"
         )
 
+    # Event-driven: the timer is only a safety net. Without a listener, poll.
+    idle_wait = (
+        dispatch_wakeup.fallback_interval if listening else POLLING_ONLY_INTERVAL
+    )
+    logger.info("dispatch_wakeup_configured", listening=listening, idle_wait=idle_wait)
+
     # Check if sandbox execution is enabled
     from omoi_os.config import get_app_settings
 
@@ -967,6 +993,14 @@ async def orchestrator_loop():
     else:
         logger.info("legacy_mode_enabled", mode=mode)
 
+    if daytona_spawner is not None:
+        try:
+            # Pre-provisioned sandboxes for instant leases (no-op when size is 0)
+            if await daytona_spawner.start_warm_pool():
+                logger.info("warm_sandbox_pool_enabled")
+        except Exception as e:
+            logger.warning("warm_sandbox_pool_failed", error=str(e))
+
     while not shutdown_event.is_set():
         try:
             stats["poll_count"] += 1
@@ -981,6 +1015,7 @@ async def orchestrator_loop():
             from omoi_os.models.agent_status import AgentStatus
 
             available_agent_id = None
+            dispatched = False
 
             with db.get_session() as session:
                 if sandbox_execution:
@@ -1014,6 +1049,15 @@ async def orchestrator_loop():
             if task:
                 task_id = str(task.id)
                 phase_id = task.phase_id or "PHASE_IMPLEMENTATION"
+                dispatched = True
+
+                # Enqueue-to-claim latency (queue wait) for dispatch tuning
+                if task.created_at:
+                    from omoi_os.utils.datetime import utc_now
+
+                    stats["last_queue_wait_ms"] = (
+                        utc_now() - task.created_at
+                    ).total_seconds() * 1000
 
                 # Bind task context to logger
                 log = log.bind(
@@ -1026,6 +1070,7 @@ async def orchestrator_loop():
                     sandbox_id=task.sandbox_id,
                     assigned_agent_id=task.assigned_agent_id,
                     created_at=str(task.created_at) if task.created_at else None,
+                    queue_wait_ms=round(stats["last_queue_wait_ms"], 1),
                 )
 
                 # Check if task already has a sandbox (shouldn't spawn another)
@@ -1098,6 +1143,7 @@ async def orchestrator_loop():
                     max_concurrent_per_project=max_concurrent_per_project,
                 )
                 if validation_task:
+                    dispatched = True
                     val_log = log.bind(
                         task_id=str(validation_task.id),
                         phase=validation_task.phase_id or "PHASE_IMPLEMENTATION",
@@ -1131,16 +1177,19 @@ async def orchestrator_loop():
                             error_message=f"Validation sandbox spawn failed: {spawn_error}",
                         )
 
-            # Hybrid wait: event-driven with polling fallback
-            # - If TASK_CREATED event fires, wake up immediately
-            # - Otherwise, poll every 1 second as fallback
-            try:
-                await asyncio.wait_for(task_ready_event.wait(), timeout=1.0)
-                task_ready_event.clear()  # Reset for next event
-                log.debug("woke_up_from_event")
-            except asyncio.TimeoutError:
-                # Normal polling cycle - no event received
-                pass
+            # Drain bursts: more tasks may be ready, so go again right away
+            if dispatched:
+                await asyncio.sleep(0)
+                continue
+
+            # Idle: wait for a queue event, with the timer as a safety fallback
+            if await dispatch_wakeup.wait(timeout=idle_wait):
+                log.debug(
+                    "woke_up_from_event",
+                    wake_latency_ms=round(
+                        dispatch_wakeup.stats["last_wake_latency_ms"], 2
+                    ),
+                )
 
         except asyncio.CancelledError:
             logger.info("orchestrator_loop_cancelled")
@@ -1150,6 +1199,10 @@ async def orchestrator_loop():
             logger.error("orchestrator_loop_error", error=str(e))
             await asyncio.sleep(10)
 
+    if daytona_spawner is not None:
+        # Delete pooled sandboxes nobody leased
+        await daytona_spawner.stop_warm_pool()
+
 
 async def stale_task_cleanup_loop():
     """Background task that cleans up tasks stuck in 'assigned' or 'claiming' status.
@@ -1494,13 +1547,16 @@ async def shutdown():
         tasks_failed=stats["tasks_failed"],
     )
     shutdown_event.set()
+    dispatch_wakeup.stop()
 
     # Close database connections
     if db:
         db.close()
         logger.info("service_closed", service="database")
 
-    # Close event bus
+    # Close event buses
+    if wakeup_bus:
+        wakeup_bus.close()
     if event_bus:
         event_bus.close()
         logger.info("service_closed", service="event_bus")
@@ -0,0 +1,153 @@
+"""Tests for /api/v1/specs/* list endpoints."""
+
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from omoi_os.api.pagination import (
+    decode_keyset_cursor,
+    encode_keyset_cursor,
+    etag_response,
+)
+from omoi_os.models.project import Project
+from omoi_os.models.spec import Spec, SpecAcceptanceCriterion, SpecRequirement, SpecTask
+from omoi_os.services.database import DatabaseService
+from omoi_os.utils.datetime import utc_now
+
+
+def _request(if_none_match: str | None = None) -> Request:
+    headers = []
+    if if_none_match:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+@pytest.mark.unit
+class TestPagination:
+    def test_cursor_round_trip(self):
+        created_at = utc_now()
+
+        assert decode_keyset_cursor(encode_keyset_cursor(created_at, "spec-1")) == (
+            created_at,
+            "spec-1",
+        )
+        assert decode_keyset_cursor("not-a-cursor") is None
+
+    def test_etag_response(self):
+        first = etag_response(_request(), '{"specs": []}')
+        etag = first.headers["etag"]
+
+        assert first.status_code == 200
+        assert etag_response(_request(etag), '{"specs": []}').status_code == 304
+        stale_or_current = _request(f'W/"stale", {etag}')
+        assert etag_response(stale_or_current, '{"specs": []}').status_code == 304
+        assert etag_response(_request(etag), '{"specs": [1]}').status_code == 200
+
+
+@pytest.fixture
+def spec_project(db_service: DatabaseService) -> str:
+    """Project with three specs; the newest has requirements and tasks."""
+    now = utc_now()
+    with db_service.get_session() as session:
+        project = Project(name=f"Spec summary project {uuid4().hex[:8]}")
+        session.add(project)
+        session.flush()
+        specs = [
+            Spec(
+                project_id=project.id,
+                title=f"Spec {i}",
+                status="draft",
+                phase="Requirements",
+                created_at=now + timedelta(seconds=i),
+            )
+            for i in range(3)
+        ]
+        specs.append(
+            Spec(
+                project_id=project.id,
+                title="Archived spec",
+                status="draft",
+                phase="Requirements",
+                archived=True,
+            )
+        )
+        session.add_all(specs)
+        session.flush()
+
+        newest = specs[2]
+        for r in range(2):
+            requirement = SpecRequirement(
+                spec_id=newest.id, title=f"Req {r}", condition="WHEN x", action="y"
+            )
+            session.add(requirement)
+            session.flush()
+            session.add_all(
+                SpecAcceptanceCriterion(
+                    requirement_id=requirement.id, text=f"AC {c}", completed=c == 0
+                )
+                for c in range(2)
+            )
+        session.add_all(
+            SpecTask(
+                spec_id=newest.id,
+                title=f"Task {t}",
+                phase="Implementation",
+                status=status,
+            )
+            for t, status in enumerate(["pending", "pending", "completed"])
+        )
+        session.commit()
+        return project.id
+
+
+@pytest.mark.integration
+@pytest.mark.api
+@pytest.mark.requires_db
+class TestSpecSummaryListing:
+    def test_counts_are_aggregated(
+        self, authenticated_client: TestClient, spec_project: str
+    ):
+        response = authenticated_client.get(
+            f"/api/v1/specs/project/{spec_project}/summary"
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 3
+        newest = data["specs"][0]
+        assert newest["title"] == "Spec 2"
+        assert newest["requirement_count"] == 2
+        assert (newest["criteria_completed"], newest["criteria_total"]) == (2, 4)
+        assert newest["tasks_by_status"] == {"pending": 2, "completed": 1}
+        assert newest["task_count"] == 3
+        assert "requirements" not in newest
+
+    def test_cursor_pagination(
+        self, authenticated_client: TestClient, spec_project: str
+    ):
+        url = f"/api/v1/specs/project/{spec_project}/summary"
+
+        first = authenticated_client.get(url, params={"limit": 2}).json()
+        second = authenticated_client.get(
+            url, params={"limit": 2, "cursor": first["next_cursor"]}
+        ).json()
+
+        assert [s["title"] for s in first["specs"]] == ["Spec 2", "Spec 1"]
+        assert first["has_more"] is True
+        assert [s["title"] for s in second["specs"]] == ["Spec 0"]
+        assert second["has_more"] is False
+        assert second["next_cursor"] is None
+
+    def test_unchanged_page_returns_304(
+        self, authenticated_client: TestClient, spec_project: str
+    ):
+        url = f"/api/v1/specs/project/{spec_project}/summary"
+        etag = authenticated_client.get(url).headers["etag"]
+
+        response = authenticated_client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
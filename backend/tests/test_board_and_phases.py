@@ -2,10 +2,15 @@
 
 import pytest
 
+from uuid import uuid4
+
+from omoi_os.api.pagination import decode_keyset_cursor
+from omoi_os.models.project import Project
 from omoi_os.models.ticket import Ticket
 from omoi_os.models.board_column import BoardColumn
 from omoi_os.models.phase import PhaseModel
 from omoi_os.services.board import BoardService
+from omoi_os.services.board_changes import CHANGE_INSERTED, BoardChangeLog
 from omoi_os.services.phase_loader import PhaseLoader, WorkflowConfig
 
 
@@ -192,6 +197,136 @@ def test_column_stats(db_service, board_service, test_ticket):
             assert "wip_exceeded" in stat
 
 
+def _board_project(session, ticket_phases):
+    """Project with one ticket per given phase; returns (project ID, ticket IDs)."""
+    project = Project(name=f"Board project {uuid4().hex[:8]}")
+    session.add(project)
+    session.flush()
+    tickets = [
+        Ticket(
+            title=f"Ticket {i}",
+            description="Board pagination ticket",
+            phase_id=phase_id,
+            priority="MEDIUM",
+            status="building",
+            project_id=project.id,
+            context={"workflow_mode": "spec_driven", "notes": "x" * 1000},
+        )
+        for i, phase_id in enumerate(ticket_phases)
+    ]
+    session.add_all(tickets)
+    session.commit()
+    return project.id, [t.id for t in tickets]
+
+
+def test_board_view_paginates_columns(db_service, board_service):
+    """Counts cover the whole column; tickets are paged by cursor."""
+    with db_service.get_session() as session:
+        PhaseLoader().load_board_columns_to_db(
+            session=session, config_file="software_development.yaml", overwrite=True
+        )
+        session.commit()
+        project_id, _ = _board_project(session, ["PHASE_IMPLEMENTATION"] * 5)
+
+        board = board_service.get_board_view(
+            session=session, project_id=project_id, limit_per_column=2
+        )
+        building = next(c for c in board["columns"] if c["id"] == "building")
+
+        assert building["current_count"] == 5
+        assert len(building["tickets"]) == 2
+        assert building["has_more"] is True
+        assert building["tickets"][0]["context"] == {"workflow_mode": "spec_driven"}
+
+        seen = [t["id"] for t in building["tickets"]]
+        cursor = building["next_cursor"]
+        while cursor:
+            page = board_service.get_column_tickets(
+                session=session,
+                column_id="building",
+                project_id=project_id,
+                cursor=decode_keyset_cursor(cursor),
+                limit=2,
+            )
+            seen.extend(t["id"] for t in page["tickets"])
+            cursor = page["next_cursor"]
+        assert len(set(seen)) == 5
+
+
+def test_board_view_shows_ticket_in_every_mapped_column(db_service, board_service):
+    """A phase mapped by several columns puts its tickets in each of them."""
+    with db_service.get_session() as session:
+        PhaseLoader().load_board_columns_to_db(
+            session=session, config_file="software_development.yaml", overwrite=True
+        )
+        session.add(
+            BoardColumn(
+                id="in_flight",
+                name="In Flight",
+                sequence_order=99,
+                phase_mapping=["PHASE_IMPLEMENTATION", "PHASE_TESTING"],
+            )
+        )
+        session.commit()
+        project_id, (ticket_id,) = _board_project(session, ["PHASE_IMPLEMENTATION"])
+
+        try:
+            for limit in (None, 10):
+                board = board_service.get_board_view(
+                    session=session, project_id=project_id, limit_per_column=limit
+                )
+                columns = {c["id"]: c for c in board["columns"]}
+                for column_id in ("building", "in_flight"):
+                    tickets = columns[column_id]["tickets"]
+                    assert [t["id"] for t in tickets] == [ticket_id]
+                    assert columns[column_id]["current_count"] == 1
+        finally:
+            session.delete(session.get(BoardColumn, "in_flight"))
+            session.commit()
+
+
+def test_board_delta_reports_moves_inserts_and_removals(db_service):
+    """Only tickets recorded in the change log since the version come back."""
+    change_log = BoardChangeLog()
+    board_service = BoardService(event_bus=None, change_log=change_log)
+    with db_service.get_session() as session:
+        PhaseLoader().load_board_columns_to_db(
+            session=session, config_file="software_development.yaml", overwrite=True
+        )
+        session.commit()
+        project_id, (moved_id, _) = _board_project(
+            session, ["PHASE_IMPLEMENTATION", "PHASE_IMPLEMENTATION"]
+        )
+        board = board_service.get_board_view(session=session, project_id=project_id)
+        version = board["version"]
+
+        board_service.move_ticket_to_column(
+            session=session, ticket_id=moved_id, target_column_id="testing"
+        )
+        session.commit()
+        change_log.record(moved_id)
+        _, (new_id,) = _board_project(session, ["PHASE_BACKLOG"])
+        change_log.record(new_id, CHANGE_INSERTED)
+        change_log.record("deleted-ticket")
+
+        delta = board_service.get_board_delta(
+            session=session, since_version=version, project_id=project_id
+        )
+
+        assert [m["ticket"]["id"] for m in delta["moved"]] == [moved_id]
+        assert delta["moved"][0]["column_ids"] == ["testing"]
+        # The new ticket belongs to another project, so it is removed here
+        assert delta["inserted"] == []
+        assert set(delta["removed"]) == {new_id, "deleted-ticket"}
+        counts = {c["id"]: c["current_count"] for c in delta["columns"]}
+        assert counts["building"] == 1 and counts["testing"] == 1
+
+        stale = board_service.get_board_delta(
+            session=session, since_version="other:0", project_id=project_id
+        )
+        assert stale["reset"] is True
+
+
 def test_phase_done_criteria_validation(db_service):
     """Test phase done criteria validation."""
     loader = PhaseLoader()
@@ -607,3 +607,73 @@ class TestTaskScorerIntegration:
         with db_service.get_session() as session:
             task = session.get(Task, task_id)
             assert task.score == updated_score
+
+
+class TestTaskScorerBatch:
+    """Test compute_scores batch API matches the scalar path."""
+
+    def test_compute_scores_matches_compute_score(
+        self,
+        task_scorer: TaskScorer,
+        db_service: DatabaseService,
+        sample_ticket: Ticket,
+    ):
+        """Batch scores are identical to per-task compute_score results."""
+        now = utc_now()
+        window = task_scorer.config.sla_urgency_window
+        variants = [
+            {"priority": "CRITICAL"},
+            {"priority": "LOW", "retry_count": 2},
+            {"priority": "HIGH", "retry_count": 5, "max_retries": 0},
+            {"priority": "MEDIUM", "deadline_at": now - timedelta(minutes=5)},
+            {"priority": "MEDIUM", "deadline_at": now + timedelta(seconds=window / 2)},
+            {"priority": "LOW", "deadline_at": now + timedelta(seconds=window * 3)},
+            {"priority": "UNKNOWN"},
+            {
+                "priority": "LOW",
+                "created_at": now
+                - timedelta(seconds=task_scorer.config.starvation_limit + 60),
+            },
+        ]
+
+        with db_service.get_session() as session:
+            tasks = [
+                Task(
+                    ticket_id=sample_ticket.id,
+                    phase_id="PHASE_IMPLEMENTATION",
+                    task_type=f"batch_{i}",
+                    description=f"Batch task {i}",
+                    status="pending",
+                    **variant,
+                )
+                for i, variant in enumerate(variants)
+            ]
+            session.add_all(tasks)
+            session.flush()
+
+            # Give the first task pending dependents so blocker counts differ
+            for i in range(3):
+                session.add(
+                    Task(
+                        ticket_id=sample_ticket.id,
+                        phase_id="PHASE_IMPLEMENTATION",
+                        task_type=f"dependent_{i}",
+                        description=f"Dependent task {i}",
+                        priority="MEDIUM",
+                        status="pending",
+                        dependencies={"depends_on": [tasks[0].id]},
+                    )
+                )
+            session.commit()
+            for task in tasks:
+                session.refresh(task)
+                session.expunge(task)
+
+        batch = task_scorer.compute_scores(tasks, now=now)
+        scalar = [task_scorer.compute_score(task, now=now) for task in tasks]
+
+        assert batch == scalar
+
+    def test_compute_scores_empty(self, task_scorer: TaskScorer):
+        """Empty input returns an empty list without querying."""
+        assert task_scorer.compute_scores([]) == []
@@ -0,0 +1,205 @@
+"""Tests for pgvector-backed MemoryService semantic search.
+
+Checks the ANN path agrees with the in-memory fallback and benchmarks both
+at 10k and 100k memories (performance marker).
+"""
+
+import time
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from omoi_os.models.memory_type import MemoryType
+from omoi_os.models.task import Task
+from omoi_os.models.task_memory import MEMORY_EMBEDDING_DIMENSIONS, TaskMemory
+from omoi_os.models.ticket import Ticket
+from omoi_os.services.ace_executor import Executor
+from omoi_os.services.embedding import EmbeddingService
+from omoi_os.services.memory import MemoryService
+
+DIMS = MEMORY_EMBEDDING_DIMENSIONS
+
+
+def _stub_embedding_service(query_vector: list[float]) -> MagicMock:
+    """Embedding service that always returns query_vector."""
+    service = MagicMock()
+    service.generate_embedding.return_value = query_vector
+    service.cosine_similarity.side_effect = EmbeddingService.cosine_similarity
+    return service
+
+
+def _create_task(session) -> Task:
+    ticket = Ticket(
+        title="Memory search ticket",
+        phase_id="PHASE_IMPLEMENTATION",
+        priority="MEDIUM",
+        status="open",
+    )
+    session.add(ticket)
+    session.flush()
+    task = Task(
+        ticket_id=ticket.id,
+        phase_id="PHASE_IMPLEMENTATION",
+        task_type="implement_feature",
+        description="Memory search task",
+        priority="MEDIUM",
+        status="completed",
+    )
+    session.add(task)
+    session.flush()
+    return task
+
+
+def _seed_memories(db_service, count: int, rng: np.random.Generator) -> np.ndarray:
+    """Insert count memories with random embeddings; returns the vectors."""
+    vectors = rng.standard_normal((count, DIMS)).astype(np.float32)
+    with db_service.get_session() as session:
+        task = _create_task(session)
+
+        memory_types = MemoryType.all_types()
+        for start in range(0, count, 1000):
+            session.add_all(
+                TaskMemory(
+                    task_id=task.id,
+                    execution_summary=f"Memory {i}",
+                    memory_type=memory_types[i % len(memory_types)],
+                    context_embedding=vectors[i].tolist(),
+                    embedding_vector=vectors[i].tolist(),
+                    success=i % 2 == 0,
+                )
+                for i in range(start, min(start + 1000, count))
+            )
+            session.flush()
+        session.commit()
+    return vectors
+
+
+def test_pgvector_search_matches_in_memory(db_service):
+    """ANN search returns the same neighbours as the in-memory fallback."""
+    rng = np.random.default_rng(7)
+    vectors = _seed_memories(db_service, 200, rng)
+    # Query close to memory 0 so there are clear nearest neighbours
+    query = (vectors[0] + 0.05 * rng.standard_normal(DIMS)).tolist()
+    embedding_service = _stub_embedding_service(query)
+
+    kwargs = dict(
+        task_description="query",
+        top_k=5,
+        similarity_threshold=0.0,
+        success_only=True,
+        memory_types=None,
+        search_mode="semantic",
+    )
+    with db_service.get_session() as session:
+        ann = MemoryService(embedding_service).search_similar(session, **kwargs)
+        scan = MemoryService(embedding_service, use_pgvector=False).search_similar(
+            session, **kwargs
+        )
+        session.rollback()
+
+    assert [r.memory_id for r in ann] == [r.memory_id for r in scan]
+    assert all(r.success for r in ann)
+    for a, b in zip(ann, scan):
+        assert a.similarity_score == pytest.approx(b.similarity_score, abs=1e-4)
+
+
+def test_pgvector_search_filtered_by_memory_type(db_service):
+    """Filtered ANN search still returns top_k rows when enough matches exist.
+
+    Filters apply after the HNSW scan, so with the default ef_search most
+    candidates would be discarded; the search widens the scan instead.
+    """
+    rng = np.random.default_rng(5)
+    _seed_memories(db_service, 400, rng)
+    memory_type = MemoryType.all_types()[0]
+    embedding_service = _stub_embedding_service(rng.standard_normal(DIMS).tolist())
+
+    kwargs = dict(
+        task_description="query",
+        top_k=30,
+        similarity_threshold=-1.0,
+        success_only=False,
+        memory_types=[memory_type],
+        search_mode="semantic",
+    )
+    with db_service.get_session() as session:
+        expected = session.query(TaskMemory).filter_by(memory_type=memory_type).count()
+        ann = MemoryService(embedding_service).search_similar(session, **kwargs)
+        scan = MemoryService(embedding_service, use_pgvector=False).search_similar(
+            session, **kwargs
+        )
+        session.rollback()
+
+    assert expected >= 30
+    assert len(ann) == 30
+    assert [r.memory_id for r in ann] == [r.memory_id for r in scan]
+
+
+def test_pgvector_search_finds_ace_memory(db_service):
+    """Memories recorded by the ACE executor are indexed for pgvector search."""
+    rng = np.random.default_rng(3)
+    embedding = rng.standard_normal(DIMS).tolist()
+    embedding_service = _stub_embedding_service(embedding)
+    memory_service = MemoryService(embedding_service)
+    memory_service.classify_memory_type = MagicMock(
+        return_value=MemoryType.CODEBASE_KNOWLEDGE.value
+    )
+
+    with db_service.get_session() as session:
+        task = _create_task(session)
+        result = Executor(memory_service, embedding_service).execute(
+            session,
+            task_id=task.id,
+            goal="Add JWT login",
+            result="Login endpoint added",
+            tool_usage=[],
+        )
+        assert session.get(TaskMemory, result.memory_id).embedding_vector is not None
+
+        found = memory_service._semantic_search_pgvector(
+            session,
+            embedding,
+            top_k=5,
+            similarity_threshold=0.99,
+            success_only=True,
+            memory_types=None,
+        )
+        session.rollback()
+
+    assert found is not None
+    assert [r.memory_id for r in found] == [result.memory_id]
+
+
+@pytest.mark.performance
+@pytest.mark.requires_db
+@pytest.mark.parametrize("memory_count", [10_000, 100_000])
+def test_semantic_search_benchmark(db_service, memory_count: int):
+    """Benchmark pgvector ANN vs in-memory scan. Run with -s to see timings."""
+    rng = np.random.default_rng(11)
+    vectors = _seed_memories(db_service, memory_count, rng)
+    query = vectors[rng.integers(memory_count)].tolist()
+    embedding_service = _stub_embedding_service(query)
+
+    timings = {}
+    for label, service in (
+        ("pgvector", MemoryService(embedding_service)),
+        ("in_memory", MemoryService(embedding_service, use_pgvector=False)),
+    ):
+        with db_service.get_session() as session:
+            start = time.perf_counter()
+            results = service.search_similar(
+                session,
+                task_description="query",
+                top_k=10,
+                similarity_threshold=0.5,
+                search_mode="semantic",
+            )
+            timings[label] = time.perf_counter() - start
+            session.rollback()
+        assert results, f"{label} found no neighbours"
+
+    print(
+        f"\nmemories={memory_count} pgvector={timings['pgvector'] * 1000:.1f}ms "
+        f"in_memory={timings['in_memory'] * 1000:.1f}ms"
+    )
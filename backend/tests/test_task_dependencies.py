@@ -1,6 +1,7 @@
 """Tests for task dependencies and blocking functionality."""
 
 from omoi_os.models.task import Task
+from omoi_os.models.task_dependency import TaskDependency
 from omoi_os.models.ticket import Ticket
 from omoi_os.services.database import DatabaseService
 from omoi_os.services.task_queue import TaskQueueService
@@ -301,3 +302,65 @@ def test_multiple_dependencies(db_service: DatabaseService):
     # Complete both dependencies
     queue.update_task_status(task2.id, "completed")
     assert queue.check_dependencies_complete(task3.id) is True
+
+
+def test_dependency_edges_follow_json_column(db_service: DatabaseService):
+    """Test task_dependencies edges are kept in sync with Task.dependencies."""
+    queue = TaskQueueService(db_service)
+
+    with db_service.get_session() as session:
+        ticket = Ticket(
+            title="Edge Ticket",
+            phase_id="PHASE_IMPLEMENTATION",
+            status="pending",
+            priority="MEDIUM",
+        )
+        session.add(ticket)
+        session.flush()
+        ticket_id = ticket.id
+
+    blocker_a = queue.enqueue_task(
+        ticket_id=ticket_id,
+        phase_id="PHASE_IMPLEMENTATION",
+        task_type="a",
+        description="Blocker A",
+        priority="MEDIUM",
+    )
+    blocker_b = queue.enqueue_task(
+        ticket_id=ticket_id,
+        phase_id="PHASE_IMPLEMENTATION",
+        task_type="b",
+        description="Blocker B",
+        priority="MEDIUM",
+    )
+    dependent = queue.enqueue_task(
+        ticket_id=ticket_id,
+        phase_id="PHASE_IMPLEMENTATION",
+        task_type="c",
+        description="Dependent",
+        priority="MEDIUM",
+        dependencies={"depends_on": [blocker_a.id, blocker_a.id]},
+    )
+
+    def edges() -> set[str]:
+        with db_service.get_session() as session:
+            rows = (
+                session.query(TaskDependency.depends_on_task_id)
+                .filter(TaskDependency.task_id == dependent.id)
+                .all()
+            )
+            return {row[0] for row in rows}
+
+    # Duplicates in depends_on collapse to one edge
+    assert edges() == {blocker_a.id}
+    assert [t.id for t in queue.get_blocked_tasks(blocker_a.id)] == [dependent.id]
+
+    # Reassigning the JSON column replaces the edges
+    with db_service.get_session() as session:
+        task = session.get(Task, dependent.id)
+        task.dependencies = {"depends_on": [blocker_b.id]}
+        session.commit()
+
+    assert edges() == {blocker_b.id}
+    assert queue.get_blocked_tasks(blocker_a.id) == []
+    assert queue.scorer._get_blocker_count(blocker_b.id) == 1
@@ -1,13 +1,15 @@
 """Tests for WebSocket event streaming API."""
 
 import asyncio
+import json
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
 from omoi_os.api.main import app
-from omoi_os.api.routes.events import WebSocketEventManager
+from omoi_os.api.routes.events import SubscriptionIndex, WebSocketEventManager
 from omoi_os.services.event_bus import EventBusService, SystemEvent
 
 
@@ -31,7 +33,25 @@ def event_bus_service(redis_url: str) -> EventBusService:
 @pytest.fixture
 def ws_manager(event_bus_service: EventBusService) -> WebSocketEventManager:
     """Create a WebSocket event manager for testing."""
-    return WebSocketEventManager(event_bus_service)
+    try:
+        import fakeredis
+
+        redis_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    except ImportError:
+        redis_client = None
+    return WebSocketEventManager(event_bus_service, redis_client=redis_client)
+
+
+def _mock_websocket(send_text=None) -> MagicMock:
+    websocket = MagicMock()
+    websocket.accept = AsyncMock()
+    websocket.close = AsyncMock()
+    websocket.send_text = send_text or AsyncMock()
+    return websocket
+
+
+def _sent(websocket: MagicMock) -> list:
+    return [json.loads(call.args[0]) for call in websocket.send_text.call_args_list]
 
 
 @pytest.fixture
@@ -73,7 +93,14 @@ class TestWebSocketEventManager:
         assert mock_ws not in ws_manager.active_connections
         assert mock_ws not in ws_manager.connection_filters
 
-    def test_matches_filters_event_type(self, ws_manager: WebSocketEventManager):
+    @staticmethod
+    def _matches(event: SystemEvent, filters: dict) -> bool:
+        """Whether a connection with these filters receives the event."""
+        index = SubscriptionIndex()
+        index.add("ws", filters)
+        return index.match(event.model_dump()) == ["ws"]
+
+    def test_filter_by_event_type(self):
         """Test event filtering by event type."""
         event = SystemEvent(
             event_type="TASK_ASSIGNED",
@@ -83,17 +110,17 @@ class TestWebSocketEventManager:
         )
 
         # Should match
-        filters = {"event_types": ["TASK_ASSIGNED", "TASK_COMPLETED"]}
-        assert ws_manager._matches_filters(event, filters) is True
+        assert self._matches(
+            event, {"event_types": ["TASK_ASSIGNED", "TASK_COMPLETED"]}
+        )
 
         # Should not match
-        filters = {"event_types": ["TASK_COMPLETED"]}
-        assert ws_manager._matches_filters(event, filters) is False
+        assert not self._matches(event, {"event_types": ["TASK_COMPLETED"]})
 
         # No filter should match all
-        assert ws_manager._matches_filters(event, {}) is True
+        assert self._matches(event, {})
 
-    def test_matches_filters_entity_type(self, ws_manager: WebSocketEventManager):
+    def test_filter_by_entity_type(self):
         """Test event filtering by entity type."""
         event = SystemEvent(
             event_type="TASK_ASSIGNED",
@@ -102,15 +129,10 @@ class TestWebSocketEventManager:
             payload={},
         )
 
-        # Should match
-        filters = {"entity_types": ["task", "ticket"]}
-        assert ws_manager._matches_filters(event, filters) is True
-
-        # Should not match
-        filters = {"entity_types": ["ticket"]}
-        assert ws_manager._matches_filters(event, filters) is False
+        assert self._matches(event, {"entity_types": ["task", "ticket"]})
+        assert not self._matches(event, {"entity_types": ["ticket"]})
 
-    def test_matches_filters_entity_id(self, ws_manager: WebSocketEventManager):
+    def test_filter_by_entity_id(self):
         """Test event filtering by entity ID."""
         event = SystemEvent(
             event_type="TASK_ASSIGNED",
@@ -119,15 +141,10 @@ class TestWebSocketEventManager:
             payload={},
         )
 
-        # Should match
-        filters = {"entity_ids": ["task-1", "task-2"]}
-        assert ws_manager._matches_filters(event, filters) is True
+        assert self._matches(event, {"entity_ids": ["task-1", "task-2"]})
+        assert not self._matches(event, {"entity_ids": ["task-2"]})
 
-        # Should not match
-        filters = {"entity_ids": ["task-2"]}
-        assert ws_manager._matches_filters(event, filters) is False
-
-    def test_matches_filters_combined(self, ws_manager: WebSocketEventManager):
+    def test_filters_combined(self):
         """Test event filtering with multiple filter types."""
         event = SystemEvent(
             event_type="TASK_ASSIGNED",
@@ -142,7 +159,7 @@ class TestWebSocketEventManager:
             "entity_types": ["task"],
             "entity_ids": ["task-1"],
         }
-        assert ws_manager._matches_filters(event, filters) is True
+        assert self._matches(event, filters)
 
         # One filter fails
         filters = {
@@ -150,18 +167,13 @@ class TestWebSocketEventManager:
             "entity_types": ["ticket"],  # Doesn't match
             "entity_ids": ["task-1"],
         }
-        assert ws_manager._matches_filters(event, filters) is False
+        assert not self._matches(event, filters)
 
     @pytest.mark.asyncio
     async def test_broadcast_event(self, ws_manager: WebSocketEventManager):
         """Test broadcasting events to matching connections."""
-        mock_ws1 = MagicMock()
-        mock_ws1.send_json = AsyncMock()
-        mock_ws1.accept = AsyncMock()
-
-        mock_ws2 = MagicMock()
-        mock_ws2.send_json = AsyncMock()
-        mock_ws2.accept = AsyncMock()
+        mock_ws1 = _mock_websocket()
+        mock_ws2 = _mock_websocket()
 
         # Connect with different filters
         await ws_manager.connect(mock_ws1, {"event_types": ["TASK_ASSIGNED"]})
@@ -177,13 +189,14 @@ class TestWebSocketEventManager:
 
         # Broadcast
         await ws_manager._broadcast_event(event)
+        await ws_manager.flush()
 
         # Only ws1 should receive it
-        mock_ws1.send_json.assert_called_once()
-        mock_ws2.send_json.assert_not_called()
+        mock_ws1.send_text.assert_called_once()
+        mock_ws2.send_text.assert_not_called()
 
         # Verify message format
-        call_args = mock_ws1.send_json.call_args[0][0]
+        call_args = _sent(mock_ws1)[0]
         assert call_args["event_type"] == "TASK_ASSIGNED"
         assert call_args["entity_type"] == "task"
         assert call_args["entity_id"] == "task-1"
@@ -194,13 +207,10 @@ class TestWebSocketEventManager:
         self, ws_manager: WebSocketEventManager
     ):
         """Test that disconnected clients are cleaned up during broadcast."""
-        mock_ws1 = MagicMock()
-        mock_ws1.send_json = AsyncMock()
-        mock_ws1.accept = AsyncMock()
-
-        mock_ws2 = MagicMock()
-        mock_ws2.send_json = AsyncMock(side_effect=Exception("Connection closed"))
-        mock_ws2.accept = AsyncMock()
+        mock_ws1 = _mock_websocket()
+        mock_ws2 = _mock_websocket(
+            send_text=AsyncMock(side_effect=Exception("Connection closed"))
+        )
 
         await ws_manager.connect(mock_ws1)
         await ws_manager.connect(mock_ws2)
@@ -214,9 +224,11 @@ class TestWebSocketEventManager:
 
         # Broadcast should handle the error and clean up
         await ws_manager._broadcast_event(event)
+        await ws_manager.flush()
 
         # ws2 should be removed
         assert mock_ws2 not in ws_manager.active_connections
+        mock_ws1.send_text.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_close_all(self, ws_manager: WebSocketEventManager):
@@ -410,13 +422,10 @@ class TestWebSocketIntegration:
         mock_ws = MagicMock()
         mock_ws.accept = AsyncMock()
 
-        original_send_json = AsyncMock()
-
-        async def capture_send_json(data):
-            original_send_json(data)
-            await collect_event(mock_ws, data)
+        async def capture_send_text(data):
+            await collect_event(mock_ws, json.loads(data))
 
-        mock_ws.send_json = capture_send_json
+        mock_ws.send_text = capture_send_text
 
         # Connect with filter
         await ws_manager.connect(mock_ws, {"event_types": ["TASK_ASSIGNED"]})
@@ -435,8 +444,233 @@ class TestWebSocketIntegration:
 
         # Manually trigger broadcast (since Redis listener runs in background)
         await ws_manager._broadcast_event(event)
+        await ws_manager.flush()
 
         # Verify event was received
         assert len(received_events) > 0
         assert received_events[0]["event_type"] == "TASK_ASSIGNED"
         assert received_events[0]["payload"] == {"test": "data"}
+
+
+class TestSubscriptionIndex:
+    """Test routing of events to connections by their filters."""
+
+    @staticmethod
+    def _fields(event_type="TASK_ASSIGNED", entity_type="task", entity_id="task-1"):
+        return {
+            "event_type": event_type,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+        }
+
+    @staticmethod
+    def _accepts(fields: dict, filters: dict) -> bool:
+        """Reference check: every filter that is set contains the field value."""
+        return all(
+            fields[field] in filters[key]
+            for key, field in (
+                ("event_types", "event_type"),
+                ("entity_types", "entity_type"),
+                ("entity_ids", "entity_id"),
+            )
+            if filters.get(key)
+        )
+
+    def test_match_agrees_with_filters(self):
+        """Indexed routing agrees with a plain per-connection filter check."""
+        index = SubscriptionIndex()
+        filter_sets = [
+            {},
+            {"event_types": ["TASK_ASSIGNED"]},
+            {"event_types": ["TASK_COMPLETED"]},
+            {"entity_types": ["task"], "entity_ids": ["task-1", "task-2"]},
+            {"entity_types": ["ticket"]},
+            {"event_types": ["TASK_ASSIGNED"], "entity_ids": ["task-2"]},
+        ]
+        for i, filters in enumerate(filter_sets):
+            index.add(i, filters)
+
+        for fields in (
+            self._fields(),
+            self._fields(event_type="TASK_COMPLETED"),
+            self._fields(entity_type="ticket", entity_id="ticket-1"),
+            self._fields(entity_id="task-2"),
+        ):
+            expected = {
+                i
+                for i, filters in enumerate(filter_sets)
+                if self._accepts(fields, filters)
+            }
+            assert set(index.match(fields)) == expected
+
+    def test_re_adding_replaces_filters(self):
+        index = SubscriptionIndex()
+        index.add("ws", {"event_types": ["TASK_ASSIGNED"]})
+        index.add("ws", {"event_types": ["TASK_COMPLETED"]})
+
+        assert index.match(self._fields()) == []
+        assert index.match(self._fields(event_type="TASK_COMPLETED")) == ["ws"]
+        assert len(index) == 1
+
+    def test_remove(self):
+        index = SubscriptionIndex()
+        index.add("ws", {"entity_ids": ["task-1"]})
+        index.remove("ws")
+        index.remove("ws")  # Removing twice is harmless
+
+        assert index.match(self._fields()) == []
+        assert len(index) == 0
+
+
+class TestWebSocketFanout:
+    """Test per-client send queues and the asyncio Redis listener."""
+
+    @pytest.mark.asyncio
+    async def test_dynamic_filters_are_reindexed(
+        self, ws_manager: WebSocketEventManager
+    ):
+        websocket = _mock_websocket()
+        await ws_manager.connect(websocket, {"event_types": ["TASK_COMPLETED"]})
+
+        ws_manager.update_filters(websocket, {"event_types": ["TASK_ASSIGNED"]})
+        await ws_manager._broadcast_event(
+            SystemEvent(event_type="TASK_ASSIGNED", entity_type="task", entity_id="t")
+        )
+        await ws_manager.flush()
+
+        assert [e["event_type"] for e in _sent(websocket)] == ["TASK_ASSIGNED"]
+        await ws_manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_block_others(
+        self, ws_manager: WebSocketEventManager
+    ):
+        """A client that stops reading is evicted once its queue is full."""
+        ws_manager.send_queue_size = 2
+        stalled = asyncio.Event()
+
+        async def never_returns(message):
+            await stalled.wait()
+
+        slow = _mock_websocket(send_text=AsyncMock(side_effect=never_returns))
+        fast = _mock_websocket()
+        await ws_manager.connect(slow)
+        await ws_manager.connect(fast)
+
+        for i in range(5):
+            event = SystemEvent(
+                event_type="TASK_ASSIGNED", entity_type="task", entity_id=str(i)
+            )
+            await ws_manager._broadcast_event(event)
+            await asyncio.sleep(0)
+        await ws_manager.flush()
+        await asyncio.sleep(0)
+
+        assert [e["entity_id"] for e in _sent(fast)] == ["0", "1", "2", "3", "4"]
+        assert slow not in ws_manager.active_connections
+        assert ws_manager.stats["slow_consumers_evicted"] == 1
+        slow.close.assert_awaited_once_with(code=1013, reason="Slow consumer")
+        await ws_manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_replies_share_the_send_queue(
+        self, ws_manager: WebSocketEventManager
+    ):
+        """Pings and subscribe replies are queued behind pending events."""
+        websocket = _mock_websocket()
+        await ws_manager.connect(websocket)
+
+        await ws_manager._broadcast_event(
+            SystemEvent(event_type="TASK_ASSIGNED", entity_type="task", entity_id="t")
+        )
+        assert ws_manager.send(websocket, {"type": "ping"})
+        await ws_manager.flush()
+
+        event, ping = _sent(websocket)
+        assert event["event_type"] == "TASK_ASSIGNED"
+        assert ping == {"type": "ping"}
+        ws_manager.disconnect(websocket)
+        assert not ws_manager.send(websocket, {"type": "ping"})
+
+    @pytest.mark.asyncio
+    async def test_redis_messages_are_routed(self, event_bus_service: EventBusService):
+        """Events published to Redis reach subscribed clients, encoded once."""
+        fakeredis = pytest.importorskip("fakeredis")
+        redis_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        ws_manager = WebSocketEventManager(event_bus_service, redis_client=redis_client)
+        websocket = _mock_websocket()
+        await ws_manager.connect(websocket, {"entity_ids": ["task-1"]})
+        await asyncio.sleep(0.05)  # Let the listener subscribe
+
+        for entity_id in ("task-2", "task-1"):
+            event = SystemEvent(
+                event_type="TASK_ASSIGNED", entity_type="task", entity_id=entity_id
+            )
+            await redis_client.publish("events.TASK_ASSIGNED", event.model_dump_json())
+        for _ in range(50):
+            if websocket.send_text.call_count:
+                break
+            await asyncio.sleep(0.01)
+
+        assert [e["entity_id"] for e in _sent(websocket)] == ["task-1"]
+        await ws_manager.close_all()
+
+
+@pytest.mark.performance
+class TestWebSocketFanoutLoad:
+    """Fan-out latency harness: fake Redis, 1k connections.
+
+    Run with ``-m performance -s`` to see timings.
+    """
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("connections", [1000])
+    async def test_fanout_latency(
+        self, event_bus_service: EventBusService, connections: int
+    ):
+        fakeredis = pytest.importorskip("fakeredis")
+        redis_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        ws_manager = WebSocketEventManager(event_bus_service, redis_client=redis_client)
+        pending: dict[int, int] = {}
+        done: dict[int, float] = {}
+
+        async def receive(message):
+            seq = json.loads(message)["payload"]["seq"]
+            pending[seq] -= 1
+            if not pending[seq]:
+                done[seq] = time.perf_counter()
+
+        # Half the clients watch everything, half watch one entity each
+        for i in range(connections):
+            filters = {} if i % 2 else {"entity_ids": [f"task-{i}"]}
+            await ws_manager.connect(
+                _mock_websocket(send_text=AsyncMock(side_effect=receive)), filters
+            )
+        await asyncio.sleep(0.05)
+
+        started: dict[int, float] = {}
+        for seq in range(50):
+            # Every other event also reaches one entity-filtered client
+            entity_id = f"task-{seq * 2}" if seq % 2 else "task-none"
+            pending[seq] = connections // 2 + (seq % 2)
+            event = SystemEvent(
+                event_type="TASK_ASSIGNED",
+                entity_type="task",
+                entity_id=entity_id,
+                payload={"seq": seq},
+            )
+            started[seq] = time.perf_counter()
+            await redis_client.publish("events.TASK_ASSIGNED", event.model_dump_json())
+            deadline = time.perf_counter() + 5
+            while seq not in done:
+                assert time.perf_counter() < deadline, f"event {seq} not delivered"
+                await asyncio.sleep(0)
+
+        latencies = sorted(done[seq] - started[seq] for seq in started)
+        print(
+            f"\nconnections={connections} fan-out "
+            f"p50={latencies[len(latencies) // 2] * 1000:.1f}ms "
+            f"p99={latencies[-1] * 1000:.1f}ms"
+        )
+        assert ws_manager.stats["slow_consumers_evicted"] == 0
+        await ws_manager.close_all()
@@ -0,0 +1,257 @@
+"""Unit tests for AsyncEventBus (buffered, pipelined event publishing)."""
+
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from omoi_os.services.async_event_bus import AsyncEventBus
+from omoi_os.services.event_bus import EventBusService, SystemEvent
+
+
+class _FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def publish(self, channel, message):
+        self.commands.append((channel, message))
+
+    async def execute(self):
+        await asyncio.sleep(self.client.round_trip)
+        if self.client.fail:
+            raise ConnectionError("redis down")
+        self.client.round_trips += 1
+        self.client.pipeline_sizes.append(len(self.commands))
+        self.client.messages.extend(self.commands)
+
+
+class _FakeAsyncRedis:
+    """Records pipelined publishes and simulates a network round trip."""
+
+    def __init__(self, round_trip: float = 0.0):
+        self.round_trip = round_trip
+        self.fail = False
+        self.round_trips = 0
+        self.pipeline_sizes: list[int] = []
+        self.messages: list[tuple[str, str]] = []
+        self.closed = False
+
+    async def ping(self):
+        return True
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    async def publish(self, channel, message):
+        await asyncio.sleep(self.round_trip)
+        self.round_trips += 1
+        self.messages.append((channel, message))
+
+    async def aclose(self):
+        self.closed = True
+
+
+def _event(i: int) -> SystemEvent:
+    return SystemEvent(
+        event_type="TASK_CREATED", entity_type="task", entity_id=f"task-{i}"
+    )
+
+
+@pytest.mark.unit
+class TestAsyncEventBus:
+    @pytest.mark.asyncio
+    async def test_burst_is_flushed_in_pipelines(self):
+        client = _FakeAsyncRedis()
+        bus = AsyncEventBus("redis://fake", max_batch=50, redis_client=client)
+        assert await bus.start()
+
+        for i in range(120):
+            assert bus.publish_nowait(_event(i))
+        await bus.flush()
+
+        assert client.pipeline_sizes == [50, 50, 20]
+        channels = {channel for channel, _ in client.messages}
+        assert channels == {"events.TASK_CREATED"}
+        # Same payload format as EventBusService, in publish order
+        ids = [json.loads(message)["entity_id"] for _, message in client.messages]
+        assert ids == [f"task-{i}" for i in range(120)]
+        assert bus.stats["flushed"] == 120
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_background_flusher_publishes(self):
+        client = _FakeAsyncRedis()
+        bus = AsyncEventBus("redis://fake", flush_interval_ms=1, redis_client=client)
+        await bus.start()
+
+        bus.publish_nowait(_event(1))
+        for _ in range(100):
+            if client.messages:
+                break
+            await asyncio.sleep(0.005)
+
+        assert len(client.messages) == 1
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_drops_when_buffer_full(self):
+        client = _FakeAsyncRedis()
+        bus = AsyncEventBus("redis://fake", max_buffer=3, redis_client=client)
+        await bus.start()
+
+        results = [bus.publish_nowait(_event(i)) for i in range(5)]
+
+        assert results == [True, True, True, False, False]
+        assert bus.stats["dropped"] == 2
+        assert bus.stats["buffer_high_water"] == 3
+        await bus.close()
+        assert len(client.messages) == 3
+
+    @pytest.mark.asyncio
+    async def test_publish_waits_for_space(self):
+        client = _FakeAsyncRedis()
+        bus = AsyncEventBus(
+            "redis://fake", max_buffer=2, flush_interval_ms=1, redis_client=client
+        )
+        await bus.start()
+
+        results = await asyncio.gather(*(bus.publish(_event(i)) for i in range(6)))
+
+        assert all(results)
+        await bus.flush()
+        assert len(client.messages) == 6
+        assert bus.stats["dropped"] == 0
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_publish_from_other_thread(self):
+        client = _FakeAsyncRedis()
+        bus = AsyncEventBus("redis://fake", flush_interval_ms=1, redis_client=client)
+        await bus.start()
+
+        thread = threading.Thread(
+            target=lambda: [bus.publish_nowait(_event(i)) for i in range(10)]
+        )
+        thread.start()
+        thread.join()
+        for _ in range(100):
+            if len(client.messages) == 10:
+                break
+            await asyncio.sleep(0.005)
+
+        assert len(client.messages) == 10
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_flush_error_is_counted(self):
+        client = _FakeAsyncRedis()
+        client.fail = True
+        bus = AsyncEventBus("redis://fake", redis_client=client)
+        await bus.start()
+
+        bus.publish_nowait(_event(1))
+        with pytest.raises(ConnectionError):
+            await bus.flush()
+
+        assert bus.stats["flush_errors"] == 1
+        assert bus.stats["dropped"] == 1
+        client.fail = False
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_and_stops(self):
+        client = _FakeAsyncRedis()
+        bus = AsyncEventBus("redis://fake", flush_interval_ms=1000, redis_client=client)
+        await bus.start()
+        bus.publish_nowait(_event(1))
+
+        await bus.close()
+
+        assert len(client.messages) == 1
+        assert client.closed
+        assert not bus.running
+        assert bus.publish_nowait(_event(2)) is False
+
+    @pytest.mark.asyncio
+    async def test_close_keeps_in_flight_batch(self):
+        client = _FakeAsyncRedis(round_trip=0.05)
+        bus = AsyncEventBus(
+            "redis://fake", max_batch=2, flush_interval_ms=1, redis_client=client
+        )
+        await bus.start()
+        for i in range(5):
+            bus.publish_nowait(_event(i))
+        # Let the flusher pop its first batch and block in execute()
+        await asyncio.sleep(0.01)
+        assert bus.buffered < 5
+
+        await bus.close()
+
+        ids = [json.loads(message)["entity_id"] for _, message in client.messages]
+        assert ids == [f"task-{i}" for i in range(5)]
+        assert bus.stats["dropped"] == 0
+
+
+@pytest.mark.unit
+class TestEventBusServiceAdapter:
+    def test_publish_routes_to_running_async_publisher(self):
+        bus = EventBusService(redis_url="")  # No Redis: sync path is a no-op
+        publisher = MagicMock(running=True)
+        bus.attach_async_publisher(publisher)
+
+        bus.publish(_event(1))
+
+        publisher.publish_nowait.assert_called_once()
+
+    def test_publish_falls_back_when_publisher_stopped(self):
+        bus = EventBusService(redis_url="")
+        bus.redis_client = MagicMock()
+        bus._available = True
+        bus.attach_async_publisher(MagicMock(running=False))
+
+        bus.publish(_event(1))
+
+        bus.redis_client.publish.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.performance
+class TestPublishThroughput:
+    """Per-event round trips vs. buffered pipelined flushes."""
+
+    EVENTS = 200
+    ROUND_TRIP = 0.001
+
+    @pytest.mark.asyncio
+    async def test_pipelining_reduces_round_trips(self):
+        # Before: one awaited round trip per event
+        client = _FakeAsyncRedis(round_trip=self.ROUND_TRIP)
+        start = time.perf_counter()
+        for i in range(self.EVENTS):
+            await client.publish("events.TASK_CREATED", _event(i).model_dump_json())
+        per_event = time.perf_counter() - start
+        per_event_trips = client.round_trips
+
+        # After: publish_nowait returns immediately; flusher pipelines
+        client = _FakeAsyncRedis(round_trip=self.ROUND_TRIP)
+        bus = AsyncEventBus("redis://fake", max_batch=100, redis_client=client)
+        await bus.start()
+        start = time.perf_counter()
+        for i in range(self.EVENTS):
+            bus.publish_nowait(_event(i))
+        enqueue = time.perf_counter() - start
+        await bus.flush()
+        pipelined = time.perf_counter() - start
+        await bus.close()
+
+        print(
+            f"\nevents={self.EVENTS} per_event={per_event * 1000:.1f}ms "
+            f"({per_event_trips} round trips) enqueue={enqueue * 1000:.2f}ms "
+            f"pipelined={pipelined * 1000:.1f}ms ({client.round_trips} round trips)"
+        )
+        assert client.round_trips <= 2
+        assert pipelined < per_event
@@ -0,0 +1,62 @@
+"""Unit tests for BoardChangeLog (versioned board deltas)."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from omoi_os.services.board_changes import (
+    BOARD_EVENT_TYPES,
+    CHANGE_INSERTED,
+    CHANGE_UPDATED,
+    BoardChangeLog,
+)
+from omoi_os.services.event_bus import SystemEvent
+
+
+@pytest.mark.unit
+class TestBoardChangeLog:
+    def test_changes_since_version(self):
+        log = BoardChangeLog()
+        log.record("t1")
+        version = log.version
+        log.record("t2", CHANGE_INSERTED)
+        log.record("t2")
+        log.record("t3")
+
+        assert log.changes_since(version) == {
+            "t2": CHANGE_INSERTED,
+            "t3": CHANGE_UPDATED,
+        }
+        assert log.changes_since(log.version) == {}
+
+    def test_foreign_and_expired_versions_need_reset(self):
+        log = BoardChangeLog(max_entries=2)
+        version = log.version
+        for ticket_id in ("t1", "t2", "t3"):
+            log.record(ticket_id)
+
+        assert log.changes_since(version) is None
+        assert log.changes_since(BoardChangeLog().version) is None
+        assert log.changes_since("garbage") is None
+        assert log.changes_since(f"{log.epoch}:1") == {
+            "t2": CHANGE_UPDATED,
+            "t3": CHANGE_UPDATED,
+        }
+
+    def test_events_are_recorded(self):
+        bus = MagicMock()
+        bus.available = False
+        log = BoardChangeLog()
+        version = log.version
+
+        assert log.attach_event_bus(bus) is False
+        subscribed = [call.args[0] for call in bus.subscribe.call_args_list]
+        assert subscribed == list(BOARD_EVENT_TYPES)
+
+        callback = bus.subscribe.call_args_list[0].args[1]
+        callback(
+            SystemEvent(
+                event_type="TICKET_CREATED", entity_type="ticket", entity_id="t"
+            )
+        )
+        assert log.changes_since(version) == {"t": CHANGE_INSERTED}
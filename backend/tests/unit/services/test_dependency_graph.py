@@ -0,0 +1,234 @@
+"""Tests for DependencyGraphService and its graph snapshot cache."""
+
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from omoi_os.models.project import Project
+from omoi_os.models.task import Task
+from omoi_os.models.task_dependency import TaskDependency
+from omoi_os.models.ticket import Ticket
+from omoi_os.services.database import DatabaseService
+from omoi_os.services.dependency_graph import DependencyGraphService
+from omoi_os.services.event_bus import SystemEvent
+from omoi_os.services.graph_snapshot_cache import (
+    GRAPH_EVENT_TYPES,
+    GraphSnapshotCache,
+)
+
+
+def _task_node(task_id: str) -> dict:
+    return {"id": task_id, "type": "task"}
+
+
+def _depends_on(source: str, target: str) -> dict:
+    return {"source": source, "target": target, "type": "depends_on"}
+
+
+@pytest.mark.unit
+class TestCriticalPath:
+    def test_longest_dependency_chain(self):
+        service = DependencyGraphService(MagicMock())
+        nodes = [_task_node(t) for t in ("a", "b", "c", "d")]
+        edges = [
+            _depends_on("a", "b"),
+            _depends_on("b", "c"),
+            _depends_on("a", "d"),
+            {"source": "ticket-1", "target": "a", "type": "ticket_contains"},
+        ]
+
+        assert service._find_critical_path(nodes, edges) == ["a", "b", "c"]
+
+    def test_no_dependencies(self):
+        service = DependencyGraphService(MagicMock())
+
+        assert service._find_critical_path([_task_node("a")], []) == []
+
+
+@pytest.mark.unit
+class TestGraphSnapshotCache:
+    def test_event_for_member_entity_invalidates(self):
+        cache = GraphSnapshotCache()
+        cache.put("p1", {"nodes": []}, {"p1", "ticket-a", "task-a"})
+        cache.put("p2", {"nodes": []}, {"p2", "ticket-b", "task-b"})
+
+        cache.handle_event(
+            SystemEvent(
+                event_type="TASK_COMPLETED",
+                entity_type="task",
+                entity_id="task-a",
+                payload={"ticket_id": "ticket-a"},
+            )
+        )
+
+        assert cache.get("p1") is None
+        assert cache.get("p2") == {"nodes": []}
+
+    def test_new_task_matches_by_ticket(self):
+        cache = GraphSnapshotCache()
+        cache.put("p1", {"nodes": []}, {"p1", "ticket-a"})
+
+        cache.handle_event(
+            SystemEvent(
+                event_type="TASK_CREATED",
+                entity_type="task",
+                entity_id="task-new",
+                payload={"ticket_id": "ticket-a"},
+            )
+        )
+
+        assert cache.get("p1") is None
+
+    def test_new_ticket_clears_everything(self):
+        cache = GraphSnapshotCache()
+        cache.put("p1", {"nodes": []}, {"p1"})
+
+        cache.handle_event(
+            SystemEvent(
+                event_type="TICKET_CREATED", entity_type="ticket", entity_id="t"
+            )
+        )
+
+        assert cache.get("p1") is None
+
+    def test_expired_and_evicted_snapshots_are_dropped(self):
+        cache = GraphSnapshotCache(max_entries=1, ttl=-1.0)
+        cache.put("p1", {}, {"p1"})
+        cache.put("p2", {}, {"p2"})
+
+        assert "p1" not in cache._snapshots
+        assert cache.get("p2") is None
+        assert cache._keys_by_entity == {}
+
+    def test_put_discards_graph_invalidated_during_build(self):
+        cache = GraphSnapshotCache()
+        token = cache.token()
+        # Event lands between the database read and put()
+        cache.invalidate({"task-a"})
+
+        assert cache.put("p1", {"nodes": []}, {"p1", "task-a"}, token=token) is False
+        assert cache.get("p1") is None
+        assert cache.stats["stale_puts"] == 1
+
+        # Unrelated invalidations do not discard the snapshot
+        token = cache.token()
+        cache.invalidate({"task-other"})
+        assert cache.put("p1", {"nodes": []}, {"p1", "task-a"}, token=token)
+        assert cache.get("p1") == {"nodes": []}
+
+    def test_put_discards_when_token_history_is_gone(self):
+        cache = GraphSnapshotCache(max_history=2)
+        token = cache.token()
+        cache.clear()
+        for i in range(3):
+            cache.invalidate({f"task-{i}"})
+
+        assert cache.put("p1", {}, {"p1"}, token=token) is False
+
+    def test_attach_event_bus_subscribes_and_skips_unavailable(self):
+        bus = MagicMock()
+        bus.available = False
+        cache = GraphSnapshotCache()
+
+        assert cache.attach_event_bus(bus) is False
+        assert cache.listening is False
+        subscribed = [call.args[0] for call in bus.subscribe.call_args_list]
+        assert subscribed == list(GRAPH_EVENT_TYPES)
+
+
+@pytest.fixture
+def graph_project(db_service: DatabaseService) -> str:
+    """Project with two tickets; B is blocked by A, tasks a1 -> a2 -> b1."""
+    with db_service.get_session() as session:
+        project = Project(name=f"Graph project {uuid4().hex[:8]}")
+        session.add(project)
+        session.flush()
+
+        def ticket(title: str) -> Ticket:
+            return Ticket(
+                title=title,
+                description=title,
+                phase_id="PHASE_IMPLEMENTATION",
+                status="building",
+                priority="MEDIUM",
+                project_id=project.id,
+            )
+
+        ticket_a = ticket("A")
+        session.add(ticket_a)
+        session.flush()
+        ticket_b = ticket("B")
+        ticket_b.dependencies = {"blocked_by": [ticket_a.id]}
+        session.add(ticket_b)
+        session.flush()
+
+        tasks = {}
+        for name, parent, status in (
+            ("a1", ticket_a, "completed"),
+            ("a2", ticket_a, "pending"),
+            ("b1", ticket_b, "pending"),
+        ):
+            tasks[name] = Task(
+                ticket_id=parent.id,
+                phase_id="PHASE_IMPLEMENTATION",
+                task_type="implement_feature",
+                title=name,
+                description=name,
+                priority="MEDIUM",
+                status=status,
+            )
+            session.add(tasks[name])
+        session.flush()
+        session.add_all(
+            [
+                TaskDependency(
+                    task_id=tasks["a2"].id, depends_on_task_id=tasks["a1"].id
+                ),
+                TaskDependency(
+                    task_id=tasks["b1"].id, depends_on_task_id=tasks["a2"].id
+                ),
+            ]
+        )
+        session.commit()
+        return project.id
+
+
+@pytest.mark.integration
+@pytest.mark.requires_db
+class TestProjectGraph:
+    def test_ticket_nodes_and_critical_path(
+        self, db_service: DatabaseService, graph_project: str
+    ):
+        graph = DependencyGraphService(db_service).build_project_graph(graph_project)
+
+        tickets = {n["label"]: n for n in graph["nodes"] if n["type"] == "ticket"}
+        assert tickets["A"]["blocks_count"] == 1
+        assert tickets["A"]["task_count"] == 2
+        assert tickets["B"]["is_blocked"] is True
+        labels = {n["id"]: n["label"] for n in graph["nodes"]}
+        path = [labels[node_id] for node_id in graph["metadata"]["critical_path"]]
+        assert path == ["a1", "a2", "b1"]
+
+    def test_snapshot_served_until_invalidated(
+        self, db_service: DatabaseService, graph_project: str
+    ):
+        cache = GraphSnapshotCache()
+        service = DependencyGraphService(db_service, snapshot_cache=cache)
+
+        first = service.build_project_graph(graph_project)
+        assert service.build_project_graph(graph_project) is first
+
+        # The completed task is left out of this view but still invalidates it
+        service.build_project_graph(graph_project, include_resolved=False)
+        completed = next(n for n in first["nodes"] if n.get("label") == "a1")
+        cache.handle_event(
+            SystemEvent(
+                event_type="TASK_STATUS_CHANGED",
+                entity_type="task",
+                entity_id=completed["id"],
+            )
+        )
+
+        assert cache._snapshots == {}
+        assert service.build_project_graph(graph_project) is not first
@@ -0,0 +1,131 @@
+"""Unit tests for DispatchWakeup (event-driven orchestrator dispatch).
+
+Includes an enqueue-to-wake latency comparison between the previous fixed
+1s polling loop and event-driven wakeups.
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from omoi_os.services.dispatch_wakeup import DISPATCH_EVENT_TYPES, DispatchWakeup
+from omoi_os.services.event_bus import SystemEvent
+
+
+@pytest.mark.unit
+class TestDispatchWakeup:
+    @pytest.mark.asyncio
+    async def test_notify_wakes_waiter(self):
+        wakeup = DispatchWakeup(fallback_interval=5.0)
+        wakeup.bind_loop()
+
+        asyncio.get_running_loop().call_later(0.01, wakeup.notify, "TASK_CREATED")
+        start = time.perf_counter()
+        woke = await wakeup.wait()
+
+        assert woke is True
+        assert time.perf_counter() - start < 1.0
+        assert wakeup.stats["signal_wakeups"] == 1
+
+    @pytest.mark.asyncio
+    async def test_fallback_timeout(self):
+        wakeup = DispatchWakeup(fallback_interval=0.01)
+
+        assert await wakeup.wait() is False
+        assert wakeup.stats["fallback_wakeups"] == 1
+
+    @pytest.mark.asyncio
+    async def test_signal_while_busy_is_not_lost(self):
+        wakeup = DispatchWakeup(fallback_interval=5.0)
+        wakeup.bind_loop()
+
+        # Several events arrive while the dispatcher is busy
+        for _ in range(3):
+            wakeup.notify("TASK_COMPLETED")
+
+        assert await wakeup.wait(timeout=0.1) is True
+        # Coalesced into one wakeup; next wait falls back
+        assert await wakeup.wait(timeout=0.01) is False
+        assert wakeup.stats["signals"] == 3
+
+    @pytest.mark.asyncio
+    async def test_notify_from_other_thread(self):
+        wakeup = DispatchWakeup(fallback_interval=5.0)
+        wakeup.bind_loop()
+
+        threading.Timer(0.01, wakeup.notify, args=("TASK_CREATED",)).start()
+
+        assert await wakeup.wait(timeout=2.0) is True
+
+    def test_attach_event_bus_subscribes_and_skips_unavailable(self):
+        bus = MagicMock()
+        bus.available = False
+        wakeup = DispatchWakeup()
+
+        assert wakeup.attach_event_bus(bus) is False
+        subscribed = [call.args[0] for call in bus.subscribe.call_args_list]
+        assert subscribed == list(DISPATCH_EVENT_TYPES)
+
+        # Callback turns bus events into wakeup signals
+        callback = bus.subscribe.call_args_list[0].args[1]
+        callback(
+            SystemEvent(event_type="TASK_CREATED", entity_type="task", entity_id="t1")
+        )
+        assert wakeup.stats["signals"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.performance
+class TestEnqueueToClaimLatency:
+    """Compare enqueue-to-claim latency: fixed 1s polling vs event wakeups."""
+
+    ENQUEUES = 10
+
+    def _harness(self, wait_for_work):
+        """Build a dispatcher/producer pair that records time until pickup."""
+        queue: asyncio.Queue[float] = asyncio.Queue()
+        latencies: list[float] = []
+
+        async def dispatcher():
+            while len(latencies) < self.ENQUEUES:
+                while not queue.empty():
+                    latencies.append(time.perf_counter() - queue.get_nowait())
+                if len(latencies) < self.ENQUEUES:
+                    await wait_for_work()
+
+        async def producer(on_enqueue):
+            for i in range(self.ENQUEUES):
+                await asyncio.sleep(0.05 + (i % 3) * 0.1)
+                queue.put_nowait(time.perf_counter())
+                on_enqueue()
+
+        return latencies, dispatcher, producer
+
+    @pytest.mark.asyncio
+    async def test_event_wakeup_beats_fixed_polling(self):
+        # Before: fixed 1s poll interval, enqueue does not signal
+        latencies, dispatcher, producer = self._harness(lambda: asyncio.sleep(1.0))
+        await asyncio.gather(dispatcher(), producer(lambda: None))
+        polling = sorted(latencies)
+
+        # After: enqueue signals the wakeup, timer only as fallback
+        wakeup = DispatchWakeup(fallback_interval=5.0)
+        wakeup.bind_loop()
+        latencies, dispatcher, producer = self._harness(wakeup.wait)
+        await asyncio.gather(
+            dispatcher(), producer(lambda: wakeup.notify("TASK_CREATED"))
+        )
+        event_driven = sorted(latencies)
+
+        p50 = len(polling) // 2
+        print(
+            f"\nenqueue-to-claim p50: polling={polling[p50] * 1000:.1f}ms "
+            f"event={event_driven[p50] * 1000:.1f}ms; "
+            f"max: polling={polling[-1] * 1000:.1f}ms "
+            f"event={event_driven[-1] * 1000:.1f}ms"
+        )
+        assert event_driven[p50] < polling[p50]
+        assert event_driven[-1] < 0.1
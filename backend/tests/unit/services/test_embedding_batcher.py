@@ -0,0 +1,169 @@
+"""Unit tests for EmbeddingBatcher (async micro-batching of embeddings).
+
+Includes a throughput comparison between one provider call per request and
+coalesced batches under concurrent load.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from omoi_os.services.embedding_batcher import EmbeddingBatcher
+from omoi_os.services.embedding_cache import EmbeddingCache
+
+
+class _FakeEmbeddingService:
+    """Batch API with a fixed per-call cost, like local model inference."""
+
+    def __init__(self, call_cost: float = 0.0, fail: bool = False):
+        self.call_cost = call_cost
+        self.fail = fail
+        self.cache = None
+        self.calls: list[list[str]] = []
+        self.threads: set[str] = set()
+
+    def _cache_key(self, text: str, is_query: bool) -> str:
+        return f"{is_query}:{text}"
+
+    def batch_generate_embeddings(self, texts, is_query=False):
+        self.calls.append(list(texts))
+        self.threads.add(threading.current_thread().name)
+        if self.fail:
+            raise RuntimeError("provider down")
+        time.sleep(self.call_cost)
+        return [[float(len(text)), 1.0 if is_query else 0.0] for text in texts]
+
+
+@pytest.mark.unit
+class TestEmbeddingBatcher:
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_call(self):
+        service = _FakeEmbeddingService()
+        batcher = EmbeddingBatcher(service, max_wait_ms=20)
+
+        texts = [f"ticket {'x' * i}" for i in range(10)]
+        vectors = await asyncio.gather(*(batcher.embed(t) for t in texts))
+
+        assert len(service.calls) == 1
+        assert sorted(service.calls[0]) == sorted(texts)
+        # Each caller gets its own result
+        assert [v[0] for v in vectors] == [float(len(t)) for t in texts]
+        # Work runs off the event loop thread
+        assert all(name.startswith("embedding-batcher") for name in service.threads)
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_respects_max_batch_size_and_query_mode(self):
+        service = _FakeEmbeddingService()
+        batcher = EmbeddingBatcher(service, max_batch_size=4, max_wait_ms=20)
+
+        passages = batcher.embed_many([f"p{i}" for i in range(6)])
+        query = batcher.embed("q", is_query=True)
+        results, query_vector = await asyncio.gather(passages, query)
+
+        assert all(len(call) <= 4 for call in service.calls)
+        assert sum(len(call) for call in service.calls) == 7
+        assert query_vector == [1.0, 1.0]
+        assert [r[1] for r in results] == [0.0] * 6
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_caller(self):
+        batcher = EmbeddingBatcher(_FakeEmbeddingService(fail=True), max_wait_ms=5)
+
+        results = await asyncio.gather(
+            batcher.embed("a"), batcher.embed("b"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        # The worker survives a failed batch
+        batcher.embedding_service.fail = False
+        assert await batcher.embed("c") == [1.0, 0.0]
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_short_provider_result_fails_every_caller(self):
+        service = _FakeEmbeddingService()
+        real_batch = service.batch_generate_embeddings
+        service.batch_generate_embeddings = lambda texts, is_query=False: real_batch(
+            texts, is_query
+        )[:-1]
+        batcher = EmbeddingBatcher(service, max_wait_ms=20)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                batcher.embed("a"), batcher.embed("b"), return_exceptions=True
+            ),
+            timeout=1.0,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_cache_hits_skip_the_queue(self):
+        service = _FakeEmbeddingService()
+        service.cache = EmbeddingCache()
+        service.cache.set("False:cached", [4.0, 2.0])
+        batcher = EmbeddingBatcher(service)
+
+        assert await batcher.embed("cached") == [4.0, 2.0]
+        assert service.calls == []
+        assert batcher.stats["cache_hits"] == 1
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_empty_text_rejected(self):
+        batcher = EmbeddingBatcher(_FakeEmbeddingService())
+
+        with pytest.raises(ValueError):
+            await batcher.embed("   ")
+        await batcher.close()
+
+
+@pytest.mark.unit
+@pytest.mark.performance
+class TestEmbeddingBatcherThroughput:
+    """Compare one provider call per request vs. coalesced batches."""
+
+    REQUESTS = 64
+    CALL_COST = 0.01  # Fixed per-call overhead dominates small batches
+
+    @pytest.mark.asyncio
+    async def test_batching_scales_with_batch_size(self):
+        texts = [f"Create ticket {i}" for i in range(self.REQUESTS)]
+
+        # Before: each request embeds on its own, on the same single worker
+        service = _FakeEmbeddingService(call_cost=self.CALL_COST)
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=1)
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(executor, service.batch_generate_embeddings, [t])
+                for t in texts
+            )
+        )
+        unbatched = time.perf_counter() - start
+        executor.shutdown()
+        unbatched_calls = len(service.calls)
+
+        # After: concurrent requests coalesce
+        service = _FakeEmbeddingService(call_cost=self.CALL_COST)
+        batcher = EmbeddingBatcher(service, max_batch_size=32, max_wait_ms=5)
+        start = time.perf_counter()
+        await asyncio.gather(*(batcher.embed(t) for t in texts))
+        batched = time.perf_counter() - start
+        await batcher.close()
+
+        print(
+            f"\nrequests={self.REQUESTS} unbatched={unbatched * 1000:.1f}ms "
+            f"({unbatched_calls} calls) batched={batched * 1000:.1f}ms "
+            f"({batcher.stats['batches']} calls, "
+            f"mean batch {batcher.mean_batch_size:.1f})"
+        )
+        assert batcher.stats["batches"] <= self.REQUESTS // 8
+        assert batched < unbatched
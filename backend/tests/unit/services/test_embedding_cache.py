@@ -0,0 +1,161 @@
+"""Unit tests for EmbeddingCache and its use in EmbeddingService."""
+
+from unittest.mock import patch
+
+import fakeredis
+import pytest
+
+from omoi_os.services import embedding_cache as embedding_cache_module
+from omoi_os.services.embedding import EmbeddingProvider, EmbeddingService
+from omoi_os.services.embedding_cache import EmbeddingCache, embedding_cache_key
+
+
+def _fake_vectors(texts):
+    return [[float(len(text)), 1.0] for text in texts]
+
+
+@pytest.mark.unit
+class TestEmbeddingCacheKey:
+    def test_key_separates_provider_model_and_mode(self):
+        base = embedding_cache_key("openai", "m1", "hello")
+
+        assert base == embedding_cache_key("openai", "m1", "  hello \n")
+        assert base != embedding_cache_key("fireworks", "m1", "hello")
+        assert base != embedding_cache_key("openai", "m2", "hello")
+        assert base != embedding_cache_key("openai", "m1", "hello", is_query=True)
+        assert base != embedding_cache_key("openai", "m1", "Hello")
+        assert base != embedding_cache_key("openai", "m1", "hello", dimensions=512)
+
+
+@pytest.mark.unit
+class TestEmbeddingCache:
+    def test_lru_eviction(self):
+        cache = EmbeddingCache(max_entries=2, ttl_seconds=None)
+        cache.set("a", [1.0])
+        cache.set("b", [2.0])
+        cache.get("a")  # "b" becomes least recently used
+        cache.set("c", [3.0])
+
+        assert cache.get("b") is None
+        assert cache.get("a") == [1.0]
+        assert cache.get("c") == [3.0]
+        assert cache.stats["evictions"] == 1
+
+    def test_ttl_expiry(self):
+        cache = EmbeddingCache(ttl_seconds=10)
+        with patch.object(embedding_cache_module.time, "monotonic", return_value=0):
+            cache.set("a", [1.0])
+        with patch.object(embedding_cache_module.time, "monotonic", return_value=5):
+            assert cache.get("a") == [1.0]
+        with patch.object(embedding_cache_module.time, "monotonic", return_value=11):
+            assert cache.get("a") is None
+        assert cache.stats["expirations"] == 1
+
+    def test_hit_miss_metrics(self):
+        cache = EmbeddingCache()
+        cache.set("a", [1.0])
+
+        found = cache.get_many(["a", "b", "c"])
+
+        assert found == {"a": [1.0]}
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 2
+        assert cache.hit_rate == pytest.approx(1 / 3)
+
+    def test_returned_vectors_are_copies(self):
+        cache = EmbeddingCache()
+        cache.set("a", [1.0, 2.0])
+
+        cache.get("a").append(3.0)
+
+        assert cache.get("a") == [1.0, 2.0]
+
+    def test_vectors_stored_as_float32_arrays(self):
+        cache = EmbeddingCache()
+        cache.set("a", [0.5] * 1536)
+
+        assert cache.nbytes == 1536 * 4
+        assert cache.get("a") == [0.5] * 1536
+
+    def test_redis_tier_shared_between_caches(self):
+        server = fakeredis.FakeServer()
+        with patch.object(
+            embedding_cache_module.redis,
+            "from_url",
+            side_effect=lambda *a, **kw: fakeredis.FakeRedis(server=server),
+        ):
+            writer = EmbeddingCache(redis_url="redis://fake")
+            reader = EmbeddingCache(redis_url="redis://fake")
+
+        assert reader.redis_enabled
+        writer.set("a", [0.5, 0.25])
+
+        assert reader.get("a") == [0.5, 0.25]
+        assert reader.stats["redis_hits"] == 1
+        # Promoted into the local tier
+        assert len(reader) == 1
+
+
+@pytest.mark.unit
+class TestEmbeddingServiceCaching:
+    @pytest.fixture
+    def service(self):
+        return EmbeddingService(
+            provider=EmbeddingProvider.OPENAI,
+            openai_api_key="test-key",
+            model_name="text-embedding-3-small",
+            cache=EmbeddingCache(),
+        )
+
+    def test_generate_embedding_hits_cache(self, service):
+        with patch.object(
+            service, "_generate_openai_embedding", return_value=[1.0, 2.0]
+        ) as provider:
+            first = service.generate_embedding("Add login page")
+            second = service.generate_embedding("Add login page")
+
+        assert first == second == [1.0, 2.0]
+        provider.assert_called_once()
+        assert service.cache.stats["hits"] == 1
+
+    def test_batch_sends_only_misses(self, service):
+        service.cache.set(service._cache_key("cached", False), [9.0, 9.0])
+
+        with patch.object(
+            service,
+            "_batch_generate_openai_embeddings",
+            side_effect=_fake_vectors,
+        ) as provider:
+            vectors = service.batch_generate_embeddings(
+                ["cached", "new one", "new one", "other"]
+            )
+
+        provider.assert_called_once_with(["new one", "other"])
+        assert vectors == [[9.0, 9.0], [7.0, 1.0], [7.0, 1.0], [5.0, 1.0]]
+
+    def test_batch_all_cached_skips_provider(self, service):
+        with patch.object(
+            service,
+            "_batch_generate_openai_embeddings",
+            side_effect=_fake_vectors,
+        ) as provider:
+            service.batch_generate_embeddings(["a", "bb"])
+            service.batch_generate_embeddings(["bb", "a"])
+
+        provider.assert_called_once()
+
+    def test_cache_can_be_disabled(self):
+        service = EmbeddingService(
+            provider=EmbeddingProvider.OPENAI,
+            openai_api_key="test-key",
+            use_cache=False,
+        )
+        assert service.cache is None
+
+        with patch.object(
+            service, "_generate_openai_embedding", return_value=[1.0]
+        ) as provider:
+            service.generate_embedding("same")
+            service.generate_embedding("same")
+
+        assert provider.call_count == 2
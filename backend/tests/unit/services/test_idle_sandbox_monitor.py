@@ -0,0 +1,194 @@
+"""Unit tests for IdleSandboxMonitor activity snapshots."""
+
+from datetime import timedelta
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from omoi_os.models.sandbox_event import SandboxEvent
+from omoi_os.services.database import DatabaseService
+from omoi_os.services.idle_sandbox_monitor import IdleSandboxMonitor
+from omoi_os.services.sandbox_liveness import InMemoryLivenessStore
+from omoi_os.utils.datetime import utc_now
+
+
+def _facts(**overrides) -> dict:
+    facts = {
+        "last_work_at": None,
+        "last_heartbeat_at": None,
+        "heartbeat_status": None,
+        "completed_at": None,
+        "has_execution_completed": False,
+        "has_execution_failed": False,
+        "phases_started": [],
+        "phases_completed": [],
+        "last_phase_completed_at": None,
+    }
+    facts.update(overrides)
+    return facts
+
+
+@pytest.fixture
+def monitor() -> IdleSandboxMonitor:
+    return IdleSandboxMonitor(
+        db=MagicMock(),
+        daytona_spawner=MagicMock(),
+        liveness_store=InMemoryLivenessStore(),
+    )
+
+
+@pytest.mark.unit
+class TestActivityFromFacts:
+    def test_alive_without_work_is_idle(self, monitor):
+        now = utc_now()
+        activity = monitor._activity(
+            "sb-1", _facts(last_heartbeat_at=now - timedelta(seconds=30)), now
+        )
+
+        assert activity["is_alive"]
+        assert activity["is_idle"]
+        assert activity["idle_duration_seconds"] == 30
+
+    def test_work_after_completion_resets_completed(self, monitor):
+        now = utc_now()
+        facts = _facts(
+            last_heartbeat_at=now,
+            completed_at=now - timedelta(minutes=5),
+            last_work_at=now - timedelta(minutes=1),
+        )
+
+        activity = monitor._activity("sb-1", facts, now)
+
+        assert not activity["has_completed"]
+        assert not activity["is_idle"]
+
+    def test_running_without_recent_work_is_stuck(self, monitor):
+        now = utc_now()
+        facts = _facts(
+            last_heartbeat_at=now,
+            heartbeat_status="running",
+            last_work_at=now - timedelta(minutes=20),
+        )
+
+        activity = monitor._activity("sb-1", facts, now)
+
+        assert activity["is_idle"]
+        assert activity["is_stuck_running"]
+
+    def test_stuck_between_phases(self, monitor):
+        now = utc_now()
+        facts = _facts(
+            phases_started=["explore", "prd"],
+            phases_completed=["explore", "prd"],
+            last_phase_completed_at=now - timedelta(minutes=6),
+        )
+
+        status = monitor._phase_status("spec-1", facts, now)
+
+        assert status["last_phase_completed"] == "prd"
+        assert status["next_expected_phase"] == "requirements"
+        assert status["is_stuck_between_phases"]
+
+    def test_non_spec_sandbox_skips_queries(self):
+        db = MagicMock()
+        monitor = IdleSandboxMonitor(
+            db=db, daytona_spawner=MagicMock(), liveness_store=InMemoryLivenessStore()
+        )
+
+        status = monitor.get_phase_completion_status("sb-1")
+
+        assert not status["is_spec_sandbox"]
+        db.get_session.assert_not_called()
+
+
+@pytest.mark.unit
+class TestActivitySnapshotQueries:
+    """The idle check runs a fixed number of queries for any fleet size."""
+
+    def _add_events(self, db_service: DatabaseService, sandbox_id: str) -> None:
+        now = utc_now()
+        events = [
+            ("agent.heartbeat", {"status": "idle"}, now - timedelta(seconds=20)),
+            ("agent.tool_use", {}, now - timedelta(minutes=30)),
+            ("agent.heartbeat", {"status": "running"}, now - timedelta(seconds=5)),
+        ]
+        if sandbox_id.startswith("spec-"):
+            events += [
+                ("spec.phase_started", {"phase": "explore"}, now),
+                ("spec.phase_completed", {"phase": "explore"}, now),
+            ]
+        with db_service.get_session() as session:
+            for event_type, data, created_at in events:
+                session.add(
+                    SandboxEvent(
+                        sandbox_id=sandbox_id,
+                        event_type=event_type,
+                        event_data=data,
+                        source="agent",
+                        created_at=created_at,
+                    )
+                )
+            session.commit()
+
+    def _count_queries(self, db_service: DatabaseService, fn):
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+
+        event.listen(db_service.engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            result = fn()
+        finally:
+            event.remove(
+                db_service.engine, "before_cursor_execute", before_cursor_execute
+            )
+        return result, len(statements)
+
+    def test_query_count_is_independent_of_fleet_size(
+        self, db_service: DatabaseService
+    ):
+        run = uuid4().hex[:8]
+        small = [f"sb-{run}-0", f"spec-{run}-0"]
+        large = small + [f"sb-{run}-{i}" for i in range(1, 10)]
+        large += [f"spec-{run}-{i}" for i in range(1, 10)]
+        for sandbox_id in large:
+            self._add_events(db_service, sandbox_id)
+
+        monitor = IdleSandboxMonitor(
+            db=db_service,
+            daytona_spawner=MagicMock(),
+            liveness_store=InMemoryLivenessStore(),
+        )
+
+        snapshot, small_queries = self._count_queries(
+            db_service, lambda: monitor.get_activity_snapshot(small)
+        )
+        _, large_queries = self._count_queries(
+            db_service, lambda: monitor.get_activity_snapshot(large)
+        )
+
+        assert small_queries == large_queries == 3
+        facts = snapshot[f"spec-{run}-0"]
+        assert facts["heartbeat_status"] == "running"
+        assert facts["last_work_at"] is not None
+        assert facts["phases_completed"] == ["explore"]
+
+    def test_liveness_store_replaces_heartbeat_query(self, db_service: DatabaseService):
+        sandbox_id = f"sb-{uuid4().hex[:8]}"
+        self._add_events(db_service, sandbox_id)
+        store = InMemoryLivenessStore()
+        store.record_heartbeat(sandbox_id, status="alive")
+        monitor = IdleSandboxMonitor(
+            db=db_service, daytona_spawner=MagicMock(), liveness_store=store
+        )
+
+        snapshot, queries = self._count_queries(
+            db_service, lambda: monitor.get_activity_snapshot([sandbox_id])
+        )
+
+        assert queries == 1
+        assert snapshot[sandbox_id]["heartbeat_status"] == "alive"
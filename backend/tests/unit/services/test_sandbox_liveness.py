@@ -0,0 +1,189 @@
+"""Unit tests for the sandbox liveness store and heartbeat rollups."""
+
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from omoi_os.services.sandbox_liveness import (
+    InMemoryLivenessStore,
+    RedisLivenessStore,
+)
+from omoi_os.utils.datetime import utc_now
+
+
+@pytest.fixture(params=["memory", "redis"])
+def store(request):
+    if request.param == "memory":
+        return InMemoryLivenessStore(rollup_interval=timedelta(minutes=10))
+    fakeredis = pytest.importorskip("fakeredis")
+    return RedisLivenessStore(
+        rollup_interval=timedelta(minutes=10),
+        redis_client=fakeredis.FakeRedis(decode_responses=True),
+    )
+
+
+@pytest.mark.unit
+class TestLivenessStore:
+    def test_record_tracks_first_last_count_and_status(self, store):
+        start = utc_now()
+        store.record_heartbeat("sb-1", status="running", at=start)
+        record = store.record_heartbeat("sb-1", at=start + timedelta(seconds=30))
+
+        assert record.count == 2
+        assert abs(record.first_seen - start) < timedelta(milliseconds=1)
+        elapsed = record.last_seen - record.first_seen
+        assert abs(elapsed - timedelta(seconds=30)) < timedelta(milliseconds=1)
+        # Status is kept when a heartbeat doesn't report one
+        assert record.status == "running"
+        assert store.get("sb-1") == record
+        assert store.get("unknown") is None
+
+    def test_active_sandbox_ids_is_a_range_query(self, store):
+        now = utc_now()
+        store.record_heartbeat("stale", at=now - timedelta(minutes=5))
+        store.record_heartbeat("older", at=now - timedelta(seconds=60))
+        store.record_heartbeat("newest", at=now)
+
+        active = store.active_sandbox_ids(now - timedelta(minutes=2))
+
+        assert active == ["newest", "older"]
+        assert set(store.get_many(["stale", "newest", "missing"])) == {
+            "stale",
+            "newest",
+        }
+
+    def test_rollup_due_once_per_interval(self, store):
+        now = utc_now()
+        first = store.record_heartbeat("sb-1", at=now)
+        assert store.rollup_due(first)
+        store.mark_rolled_up(first)
+
+        second = store.record_heartbeat("sb-1", at=now + timedelta(minutes=5))
+        assert not store.rollup_due(second)
+        assert second.pending_count == 1
+
+        third = store.record_heartbeat("sb-1", at=now + timedelta(minutes=11))
+        assert store.rollup_due(third)
+        assert third.pending_count == 2
+
+    def test_remove(self, store):
+        store.record_heartbeat("sb-1")
+        store.remove("sb-1")
+
+        assert store.get("sb-1") is None
+        assert store.active_sandbox_ids(utc_now() - timedelta(minutes=1)) == []
+
+
+@pytest.mark.unit
+class TestHeartbeatRollups:
+    def _shared_store(self):
+        store = InMemoryLivenessStore(rollup_interval=timedelta(minutes=10))
+        store.shared = True
+        return store
+
+    def test_only_rollups_are_persisted(self):
+        from omoi_os.api.routes.sandbox import record_sandbox_heartbeat
+
+        store = self._shared_store()
+        now = utc_now()
+        rows = []
+        with patch("omoi_os.api.routes.sandbox.get_liveness_store", return_value=store):
+            # 30s heartbeats for 20 minutes
+            for i in range(40):
+                with patch(
+                    "omoi_os.services.sandbox_liveness.utc_now",
+                    return_value=now + timedelta(seconds=30 * i),
+                ):
+                    data = record_sandbox_heartbeat("sb-1", {"status": "running"})
+                if data is not None:
+                    rows.append(data)
+
+        assert len(rows) == 2
+        assert rows[0]["heartbeat_count"] == 1
+        # The second rollup carries the heartbeats since the first
+        assert rows[1]["heartbeat_count"] == 20
+        assert all(row["rollup"] for row in rows)
+        assert store.get("sb-1").count == 40
+
+    def test_process_local_store_keeps_every_row(self):
+        from omoi_os.api.routes.sandbox import record_sandbox_heartbeat
+
+        store = InMemoryLivenessStore()
+        with patch("omoi_os.api.routes.sandbox.get_liveness_store", return_value=store):
+            results = [record_sandbox_heartbeat("sb-1", {}) for _ in range(3)]
+
+        assert results == [{}, {}, {}]
+        assert store.get("sb-1").count == 3
+
+    def test_store_failure_falls_back_to_row(self):
+        from omoi_os.api.routes.sandbox import record_sandbox_heartbeat
+
+        store = MagicMock(shared=True)
+        store.record_heartbeat.side_effect = ConnectionError("redis down")
+        with patch("omoi_os.api.routes.sandbox.get_liveness_store", return_value=store):
+            assert record_sandbox_heartbeat("sb-1", {"status": "idle"}) == {
+                "status": "idle"
+            }
+
+
+@pytest.mark.unit
+class TestIdleMonitorLiveness:
+    def test_active_sandboxes_come_from_store(self):
+        from omoi_os.services.idle_sandbox_monitor import IdleSandboxMonitor
+
+        store = InMemoryLivenessStore()
+        store.record_heartbeat("sb-live")
+        store.record_heartbeat("sb-dead", at=utc_now() - timedelta(minutes=10))
+        db = MagicMock()
+        monitor = IdleSandboxMonitor(
+            db=db, daytona_spawner=MagicMock(), liveness_store=store
+        )
+
+        assert monitor.get_active_sandbox_ids() == ["sb-live"]
+        db.get_session.assert_not_called()
+
+    def test_last_heartbeat_comes_from_store(self):
+        from omoi_os.services.idle_sandbox_monitor import IdleSandboxMonitor
+
+        store = InMemoryLivenessStore()
+        record = store.record_heartbeat("sb-1", status="running")
+        session = MagicMock()
+        monitor = IdleSandboxMonitor(
+            db=MagicMock(), daytona_spawner=MagicMock(), liveness_store=store
+        )
+
+        assert monitor._last_heartbeats(session, ["sb-1"]) == {
+            "sb-1": (record.last_seen, "running")
+        }
+        session.query.assert_not_called()
+
+
+@pytest.mark.unit
+class TestGetLivenessStore:
+    def test_redis_is_retried_after_backoff(self, monkeypatch):
+        from omoi_os.services import sandbox_liveness
+
+        monkeypatch.delenv("TESTING", raising=False)
+        sandbox_liveness.reset_liveness_store()
+        redis_store = MagicMock(shared=True)
+        factory = MagicMock(side_effect=[ConnectionError("redis down"), redis_store])
+        clock = MagicMock(return_value=100.0)
+
+        with (
+            patch.object(sandbox_liveness, "RedisLivenessStore", factory),
+            patch.object(sandbox_liveness.time, "monotonic", clock),
+            patch("omoi_os.config.get_app_settings"),
+        ):
+            fallback = sandbox_liveness.get_liveness_store()
+            assert isinstance(fallback, InMemoryLivenessStore)
+            # Within the backoff the fallback is reused without reconnecting
+            assert sandbox_liveness.get_liveness_store() is fallback
+            assert factory.call_count == 1
+
+            clock.return_value = 100.0 + sandbox_liveness.RETRY_BACKOFF_INITIAL
+            assert sandbox_liveness.get_liveness_store() is redis_store
+            assert sandbox_liveness.get_liveness_store() is redis_store
+            assert factory.call_count == 2
+
+        sandbox_liveness.reset_liveness_store()
@@ -0,0 +1,328 @@
+"""Unit tests for the warm sandbox pool."""
+
+import asyncio
+import time
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from omoi_os.services.daytona_spawner import DaytonaSpawnerService
+from omoi_os.services.sandbox_pool import (
+    DaytonaSandboxProvider,
+    MockSandboxProvider,
+    SandboxProfile,
+    WarmSandboxPool,
+)
+
+PROFILE = SandboxProfile(
+    snapshot="ai-agent-dev-light", image=None, cpu=2, memory_gb=4, disk_gb=8
+)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestWarmSandboxPool:
+    async def test_lease_hit_and_miss(self):
+        provider = MockSandboxProvider()
+        pool = WarmSandboxPool(provider)
+        pool.add_profile(PROFILE, 1)
+
+        assert await pool.lease(PROFILE) is None
+        await pool.refill()
+        await pool.wait_for_creates()
+        pooled = await pool.lease(PROFILE)
+
+        assert pooled.sandbox is provider.created[0]
+        assert pooled.sandbox.labels["profile"] == PROFILE.key
+        assert pool.stats["hits"] == 1
+        assert pool.stats["misses"] == 1
+
+    async def test_refill_creates_only_the_deficit(self):
+        provider = MockSandboxProvider()
+        pool = WarmSandboxPool(provider)
+        pool.add_profile(PROFILE, 3)
+
+        assert await pool.refill() == 3
+        # In-flight creates count toward the target
+        assert await pool.refill() == 0
+        assert await pool.wait_for_creates() == 3
+        await pool.lease(PROFILE)
+        assert await pool.refill() == 1
+        await pool.wait_for_creates()
+
+        assert pool.ready_count(PROFILE) == 3
+        assert len(provider.created) == 4
+
+    async def test_profiles_are_pooled_separately(self):
+        pool = WarmSandboxPool(MockSandboxProvider())
+        openhands = SandboxProfile(
+            snapshot="ai-agent-dev-light",
+            image=None,
+            cpu=2,
+            memory_gb=4,
+            disk_gb=8,
+            runtime="openhands",
+        )
+        pool.add_profile(PROFILE, 1)
+        await pool.refill()
+        await pool.wait_for_creates()
+
+        assert await pool.lease(openhands) is None
+        assert await pool.lease(PROFILE) is not None
+
+    async def test_idle_sandboxes_are_evicted(self):
+        provider = MockSandboxProvider()
+        pool = WarmSandboxPool(provider, max_idle=timedelta(seconds=60))
+        pool.add_profile(PROFILE, 2)
+        await pool.refill()
+        await pool.wait_for_creates()
+
+        with patch(
+            "omoi_os.services.sandbox_pool.time.monotonic",
+            return_value=pool._ready[PROFILE][0].ready_at + 61,
+        ):
+            assert await pool.evict_idle() == 2
+            assert await pool.lease(PROFILE) is None
+
+        assert len(provider.destroyed) == 2
+        assert pool.stats["evicted"] == 2
+
+    async def test_failed_provision_destroys_sandbox(self):
+        async def provision(sandbox, profile):
+            raise RuntimeError("install failed")
+
+        provider = MockSandboxProvider()
+        pool = WarmSandboxPool(provider, provision=provision)
+        pool.add_profile(PROFILE, 1)
+
+        await pool.refill()
+        assert await pool.wait_for_creates() == 0
+        assert pool.stats["create_errors"] == 1
+        assert provider.destroyed == provider.created
+        assert pool.ready_count() == 0
+
+    async def test_failed_create_backs_off_per_profile(self):
+        provider = MockSandboxProvider(fail_creates=2)
+        pool = WarmSandboxPool(provider, create_backoff=10, max_create_backoff=15)
+        pool.add_profile(PROFILE, 1)
+        now = time.monotonic()
+
+        with patch("omoi_os.services.sandbox_pool.time.monotonic") as monotonic:
+            monotonic.return_value = now
+            assert await pool.refill() == 1
+            assert await pool.wait_for_creates() == 0
+            # Leases and wakeups don't retry until the backoff has passed
+            assert await pool.lease(PROFILE) is None
+            assert await pool.refill() == 0
+            assert provider.fail_creates == 1
+
+            monotonic.return_value = now + 10
+            assert await pool.refill() == 1
+            assert await pool.wait_for_creates() == 0
+            # Second failure doubles the backoff, capped at 15s
+            monotonic.return_value = now + 24
+            assert await pool.refill() == 0
+            monotonic.return_value = now + 25
+            assert await pool.refill() == 1
+            assert await pool.wait_for_creates() == 1
+
+        assert pool.stats["create_errors"] == 2
+        assert pool._retry_at == {}
+
+    async def test_background_refill_and_close(self):
+        provider = MockSandboxProvider()
+        pool = WarmSandboxPool(provider, refill_interval=0.01)
+        pool.add_profile(PROFILE, 2)
+
+        await pool.start()
+        for _ in range(100):
+            if pool.ready_count(PROFILE) == 2:
+                break
+            await asyncio.sleep(0.01)
+        await pool.close()
+
+        assert len(provider.created) == 2
+        assert all(sandbox.deleted for sandbox in provider.created)
+        assert not pool.running
+
+    async def test_refill_does_not_wait_for_creates(self):
+        provider = MockSandboxProvider(create_delay=0.2)
+        pool = WarmSandboxPool(provider)
+        pool.add_profile(PROFILE, 2)
+
+        start = time.perf_counter()
+        assert await pool.refill() == 2
+        # Eviction and the next refill pass are not held up by the creates
+        assert await pool.evict_idle() == 0
+        assert time.perf_counter() - start < 0.1
+        assert pool.ready_count(PROFILE) == 0
+
+        assert await pool.wait_for_creates() == 2
+        assert pool.ready_count(PROFILE) == 2
+        await pool.close()
+
+    async def test_close_cancels_creates_in_flight(self):
+        async def provision(sandbox, profile):
+            await asyncio.sleep(10)
+
+        provider = MockSandboxProvider()
+        pool = WarmSandboxPool(provider, provision=provision)
+        pool.add_profile(PROFILE, 1)
+        await pool.refill()
+        await asyncio.sleep(0.01)
+
+        await pool.close()
+
+        # Created but not yet provisioned: destroyed rather than leaked
+        assert len(provider.created) == 1
+        assert provider.destroyed == provider.created
+        assert pool.ready_count() == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestDaytonaSdkCalls:
+    """Blocking SDK calls run on the provider's thread pool."""
+
+    async def test_calls_run_concurrently_off_the_loop(self):
+        provider = DaytonaSandboxProvider("key", "https://daytona", max_concurrency=8)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticking = asyncio.create_task(ticker())
+        start = time.perf_counter()
+        await asyncio.gather(
+            *[provider.run("create", time.sleep, 0.2) for _ in range(8)]
+        )
+        elapsed = time.perf_counter() - start
+        ticking.cancel()
+        provider.close()
+
+        assert elapsed < 0.8
+        assert ticks >= 5
+        assert provider.stats["operations"]["create"]["calls"] == 8
+
+    async def test_concurrency_limit_shows_as_queue_wait(self):
+        provider = DaytonaSandboxProvider("key", "https://daytona", max_concurrency=1)
+
+        await asyncio.gather(
+            *[provider.run("exec", time.sleep, 0.05) for _ in range(3)]
+        )
+        provider.close()
+
+        exec_stats = provider.stats["operations"]["exec"]
+        # The 2nd and 3rd calls waited for the single worker thread
+        assert exec_stats["queue_wait_seconds"] >= 0.1
+        assert exec_stats["exec_seconds"] >= 0.15
+
+    async def test_teardown_is_not_queued_behind_long_calls(self):
+        provider = DaytonaSandboxProvider("key", "https://daytona", max_concurrency=1)
+
+        start_worker = asyncio.create_task(
+            provider.run("start_worker", time.sleep, 0.5)
+        )
+        await asyncio.sleep(0.05)
+        start = time.perf_counter()
+        await provider.run("stop", time.sleep, 0.01)
+        stop_elapsed = time.perf_counter() - start
+        await start_worker
+        provider.close()
+
+        assert stop_elapsed < 0.3
+        assert provider.stats["operations"]["stop"]["queue_wait_seconds"] < 0.3
+
+    async def test_timeout(self):
+        provider = DaytonaSandboxProvider("key", "https://daytona")
+
+        with pytest.raises(TimeoutError, match="stop timed out"):
+            await provider.run("stop", time.sleep, 0.5, timeout=0.05)
+        provider.close()
+
+        assert provider.stats["timeouts"] == 1
+        assert provider.stats["in_flight"] == 0
+
+    async def test_timed_out_create_deletes_late_sandbox(self):
+        provider = DaytonaSandboxProvider(
+            "key", "https://daytona", timeouts={"create": 0.05}
+        )
+        sandbox = MagicMock()
+
+        def slow_create(profile, labels):
+            time.sleep(0.2)
+            return sandbox
+
+        with patch.object(provider, "create_sandbox", side_effect=slow_create):
+            with pytest.raises(TimeoutError, match="create timed out"):
+                await provider.create(PROFILE, {})
+        for _ in range(100):
+            if sandbox.delete.called:
+                break
+            await asyncio.sleep(0.01)
+        provider.close()
+
+        sandbox.delete.assert_called_once()
+        assert provider.stats["abandoned_cleanups"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSpawnerWarmPool:
+    @pytest.fixture
+    def settings(self):
+        settings = MagicMock()
+        settings.api_key = "test-api-key"
+        settings.api_url = "https://api.daytona.io"
+        settings.snapshot = "ai-agent-dev-light"
+        settings.image = None
+        settings.sandbox_memory_gb = 4
+        settings.sandbox_cpu = 2
+        settings.sandbox_disk_gb = 8
+        settings.sdk_max_concurrency = 4
+        settings.warm_pool_size = 1
+        settings.warm_pool_max_idle_seconds = 1200
+        settings.warm_pool_refill_interval_seconds = 60
+        settings.warm_pool_runtimes = ["claude"]
+        return settings
+
+    async def test_pool_disabled_by_default_size(self, settings):
+        settings.warm_pool_size = 0
+        with patch(
+            "omoi_os.services.daytona_spawner.load_daytona_settings",
+            return_value=settings,
+        ):
+            spawner = DaytonaSpawnerService()
+            assert await spawner.start_warm_pool(MockSandboxProvider()) is None
+
+    async def test_spawner_leases_provisioned_sandbox(self, settings):
+        provider = MockSandboxProvider()
+        with patch(
+            "omoi_os.services.daytona_spawner.load_daytona_settings",
+            return_value=settings,
+        ):
+            spawner = DaytonaSpawnerService()
+            pool = await spawner.start_warm_pool(provider)
+        await pool.refill()
+        await pool.wait_for_creates()
+        pooled_sandbox = provider.created[0]
+        install_commands = list(pooled_sandbox.process.commands)
+        assert any("claude-agent-sdk" in cmd for cmd in install_commands)
+
+        with patch.object(spawner, "_start_worker_in_sandbox") as start_worker:
+            await spawner._create_daytona_sandbox(
+                sandbox_id="omoios-task-1",
+                env_vars={},
+                labels={"task_id": "task-1"},
+                runtime="claude",
+            )
+        await spawner.stop_warm_pool()
+
+        assert start_worker.call_args.args[0] is pooled_sandbox
+        assert start_worker.call_args.kwargs["provisioned"] is True
+        assert pooled_sandbox.labels["task_id"] == "task-1"
+        assert pool.stats["hits"] == 1
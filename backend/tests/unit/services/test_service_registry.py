@@ -0,0 +1,99 @@
+"""Unit tests for ServiceRegistry (lazy service construction)."""
+
+import asyncio
+import threading
+
+import pytest
+
+from omoi_os.services.service_registry import ServiceRegistry
+
+
+@pytest.mark.unit
+class TestServiceRegistry:
+    def test_builds_once_on_first_get(self):
+        registry = ServiceRegistry()
+        built = []
+        registry.register("memory", lambda: built.append("memory") or object())
+
+        assert built == []
+        assert registry.peek("memory") is None
+        memory = registry.get("memory")
+
+        assert registry.get("memory") is memory
+        assert registry.peek("memory") is memory
+        assert built == ["memory"]
+        assert "memory" in registry.build_seconds
+
+    def test_factories_resolve_dependencies(self):
+        registry = ServiceRegistry()
+        registry.register("embedding", lambda: "embedding")
+        registry.register("memory", lambda: ("memory", registry.get("embedding")))
+
+        assert registry.get("memory") == ("memory", "embedding")
+        assert registry.peek("embedding") == "embedding"
+
+    def test_none_result_is_kept(self):
+        registry = ServiceRegistry()
+        calls = []
+        registry.register("monitoring_loop", lambda: calls.append(1))
+
+        assert registry.get("monitoring_loop") is None
+        assert registry.get("monitoring_loop") is None
+        assert calls == [1]
+
+    def test_unregistered_service_raises(self):
+        with pytest.raises(KeyError):
+            ServiceRegistry().get("missing")
+
+    def test_failed_build_is_retried(self):
+        registry = ServiceRegistry()
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("model download failed")
+            return "embedding"
+
+        registry.register("embedding", flaky)
+        asyncio.run(registry.warmup(["embedding", "unregistered"]))
+
+        assert registry.peek("embedding") is None
+        assert registry.get("embedding") == "embedding"
+
+    def test_concurrent_gets_build_once(self):
+        registry = ServiceRegistry()
+        started = threading.Event()
+        release = threading.Event()
+        built = []
+
+        def slow():
+            started.set()
+            release.wait(5)
+            built.append(1)
+            return object()
+
+        registry.register("diagnostic", slow)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(registry.get("diagnostic")))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        started.wait(5)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert built == [1]
+        assert len(results) == 4 and len({id(r) for r in results}) == 1
+
+    def test_provide_and_register_replace_instances(self):
+        registry = ServiceRegistry()
+        registry.provide("llm", "provided")
+        assert registry.peek("llm") == "provided"
+
+        registry.register("llm", lambda: "rebuilt")
+        assert registry.peek("llm") is None
+        assert registry.get("llm") == "rebuilt"
@@ -381,6 +381,125 @@ class TestCheckDuplicateLogic:
         assert result.candidates[0].is_exact_match
 
 
+# =============================================================================
+# Test: Batched Bulk Deduplication
+# =============================================================================
+
+
+class TestBulkDeduplicationBatching:
+    """Bulk dedup issues a fixed number of queries regardless of batch size."""
+
+    @pytest.fixture
+    def mock_session(self):
+        """Async session whose begin_nested() works as a context manager."""
+        session = AsyncMock()
+        savepoint = AsyncMock()
+        savepoint.__aenter__.return_value = None
+        savepoint.__aexit__.return_value = None
+        session.begin_nested = MagicMock(return_value=savepoint)
+        return session
+
+    @staticmethod
+    def _task(task_id: str, title: str, description: str) -> MagicMock:
+        task = MagicMock()
+        task.id = task_id
+        task.title = title
+        task.description = description
+        task.content_hash = compute_content_hash(f"{title}\n{description}")
+        return task
+
+    @pytest.mark.asyncio
+    async def test_deduplicate_tasks_bulk_batches_queries(self, mock_session):
+        existing_exact = self._task("task-exact", "Add login", "OAuth flow")
+        existing_near = self._task("task-near", "Build cache", "LRU cache")
+
+        hash_result = MagicMock()
+        hash_result.scalars.return_value = iter([existing_exact])
+        ann_result = MagicMock()
+        ann_result.fetchall.return_value = [
+            MagicMock(idx=0, id="task-near", similarity=0.97),
+        ]
+        hydrate_result = MagicMock()
+        hydrate_result.scalars.return_value = iter([existing_near])
+        mock_session.execute = AsyncMock(
+            side_effect=[hash_result, ann_result, hydrate_result]
+        )
+
+        embedding_service = MagicMock()
+        embedding_service.batch_generate_embeddings.return_value = [
+            [0.1] * 8,
+            [0.2] * 8,
+        ]
+        service = SpecDeduplicationService(
+            db=MagicMock(), embedding_service=embedding_service
+        )
+
+        tasks = [
+            {"title": "Build caching", "description": "LRU cache layer"},
+            {"title": "Add login", "description": "OAuth flow"},
+            {"title": "Write docs", "description": "User guide"},
+        ]
+        result = await service.deduplicate_tasks_bulk(
+            spec_id="spec-1", tasks=tasks, session=mock_session
+        )
+
+        # Hash query + one nearest-neighbour query + one hydration query
+        assert mock_session.execute.await_count == 3
+        # Only the two hash misses are embedded, in a single call
+        embedding_service.batch_generate_embeddings.assert_called_once_with(
+            ["Build caching\nLRU cache layer", "Write docs\nUser guide"]
+        )
+        # Query vectors are bound as one parameter, not formatted into SQL
+        ann_sql, ann_params = mock_session.execute.await_args_list[1].args
+        assert "[0.1," not in str(ann_sql)
+        assert ann_params["indices"] == [0, 1]
+        assert len(ann_params["vectors"]) == 2
+
+        assert result.stats == {
+            "total": 3,
+            "created": 1,
+            "skipped": 2,
+            "merged": 0,
+        }
+        assert [t["title"] for t in result.to_create] == ["Write docs"]
+        assert result.to_create[0]["embedding_vector"] == [0.2] * 8
+        assert {t["title"] for t in result.to_skip} == {"Build caching", "Add login"}
+
+    @pytest.mark.asyncio
+    async def test_pgvector_failure_falls_back_in_memory(self, mock_session):
+        existing = self._task("task-1", "Build cache", "LRU cache")
+        existing.embedding_vector = [1.0, 0.0]
+
+        hash_result = MagicMock()
+        hash_result.scalars.return_value = iter([])
+        scan_result = MagicMock()
+        scan_result.scalars.return_value.all.return_value = [existing]
+        mock_session.execute = AsyncMock(
+            side_effect=[hash_result, RuntimeError("no pgvector"), scan_result]
+        )
+
+        embedding_service = MagicMock()
+        embedding_service.batch_generate_embeddings.return_value = [
+            [1.0, 0.0],
+            [0.0, 1.0],
+        ]
+        service = SpecDeduplicationService(
+            db=MagicMock(), embedding_service=embedding_service
+        )
+
+        result = await service.deduplicate_tasks_bulk(
+            spec_id="spec-1",
+            tasks=[
+                {"title": "Build cache", "description": "LRU"},
+                {"title": "Write docs", "description": "Guide"},
+            ],
+            session=mock_session,
+        )
+
+        assert [t["title"] for t in result.to_skip] == ["Build cache"]
+        assert [t["title"] for t in result.to_create] == ["Write docs"]
+
+
 # =============================================================================
 # Test: Edge Cases
 # =============================================================================
@@ -0,0 +1,233 @@
+"""Unit tests for incremental TrajectoryContext building."""
+
+import json
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from omoi_os.models.trajectory_context_state import TrajectoryContextState
+from omoi_os.services.trajectory_context import TrajectoryContext, _AccumulatedState
+from omoi_os.utils.datetime import utc_now
+
+MESSAGES = [
+    "The goal is to build a login endpoint for the API.",
+    "Don't add any external dependencies to the project.",
+    "Always run the full test suite before committing changes.",
+    "Let me create the auth module with password hashing.",
+    "I found that the session store was already configured.",
+    "Blocked by the missing database migration for users.",
+    "Now we need to add token refresh to the login flow.",
+    "Feel free to add any external dependencies to the project.",
+    "Completed the exploration phase, moving to implementation.",
+    "Fix this by implementing the login.py handler.",
+]
+
+
+@dataclass
+class FakeLog:
+    id: str
+    log_type: str
+    message: str
+    created_at: datetime
+    details: Optional[dict] = None
+
+
+def _logs(count: int) -> list[FakeLog]:
+    start = utc_now() - timedelta(hours=1)
+    return [
+        FakeLog(
+            id=str(uuid4()),
+            log_type="output" if i % 3 else "status",
+            message=MESSAGES[i % len(MESSAGES)] + f" (step {i})",
+            created_at=start + timedelta(seconds=i),
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def trajectory() -> TrajectoryContext:
+    db = MagicMock()
+    session = db.get_session.return_value.__enter__.return_value
+    # No agent or running task for the test agents
+    session.query.return_value.filter_by.return_value.first.return_value = None
+    # No persisted trajectory state
+    session.get.return_value = None
+    return TrajectoryContext(db, cache_max_entries=2)
+
+
+@pytest.mark.unit
+class TestIncrementalFolding:
+    @pytest.mark.parametrize("batch_size", [1, 7, 50])
+    def test_batches_match_single_pass(self, trajectory, batch_size):
+        logs = _logs(120)
+
+        full = _AccumulatedState()
+        trajectory._fold_logs(full, logs)
+        incremental = _AccumulatedState()
+        for i in range(0, len(logs), batch_size):
+            trajectory._fold_logs(incremental, logs[i : i + batch_size])
+
+        assert trajectory._context_from_state(
+            incremental, None
+        ) == trajectory._context_from_state(full, None)
+        assert list(incremental.recent_logs) == list(full.recent_logs)
+        assert incremental.watermark == (logs[-1].created_at, logs[-1].id)
+
+    def test_lifted_constraints_are_removed(self, trajectory):
+        state = _AccumulatedState()
+        trajectory._fold_logs(state, _logs(2))
+        assert state.constraint_candidates
+
+        trajectory._fold_logs(state, _logs(8)[7:])
+        context = trajectory._context_from_state(state, None)
+
+        assert (
+            "add any external dependencies to the project"
+            not in (context["constraints"])
+        )
+
+    def test_long_running_state_stays_bounded(self, trajectory):
+        from omoi_os.services.trajectory_context import (
+            MAX_CONSTRAINT_CANDIDATES,
+            MAX_LIFTED_CONSTRAINTS,
+            MAX_REFERENCES,
+        )
+
+        start = utc_now() - timedelta(hours=1)
+        logs = [
+            FakeLog(
+                id=str(uuid4()),
+                log_type="output",
+                message=(
+                    f"Never touch the legacy module number {i}. "
+                    f"You can now rename the old helper number {i}. "
+                    f"Fix this by implementing the handler_{i}.py file."
+                ),
+                created_at=start + timedelta(seconds=i),
+            )
+            for i in range(300)
+        ]
+        state = _AccumulatedState()
+        for i in range(0, len(logs), 25):
+            trajectory._fold_logs(state, logs[i : i + 25])
+
+        assert len(state.constraint_candidates) == MAX_CONSTRAINT_CANDIDATES
+        assert len(state.lifted_constraints) == MAX_LIFTED_CONSTRAINTS
+        assert len(state.references) <= MAX_REFERENCES
+        # The most recent lifts are the ones kept
+        assert state.lifted_constraints[-1] == "rename the old helper number 299"
+
+    def test_rebuild_only_reads_new_logs(self, trajectory):
+        logs = _logs(30)
+        batches = [logs[:20], logs[20:]]
+
+        def fold_next(session, agent_id, state):
+            trajectory._fold_logs(state, batches.pop(0))
+
+        with patch.object(
+            trajectory, "_fold_new_agent_logs", side_effect=fold_next
+        ) as fold:
+            first = trajectory.build_accumulated_context("agent-1")
+            trajectory.cache_ttl = timedelta(0)  # Force the next build
+            second = trajectory.build_accumulated_context("agent-1")
+
+        state = fold.call_args.args[2]
+        assert state.log_count == 30
+        assert first["conversation_length"] < second["conversation_length"]
+        assert trajectory.stats["logs_folded"] == 30
+
+
+@pytest.mark.unit
+class TestContextCache:
+    def test_hit_has_same_shape_as_miss(self, trajectory):
+        with patch.object(
+            trajectory,
+            "_fold_new_agent_logs",
+            side_effect=lambda s, a, state: trajectory._fold_logs(state, _logs(5)),
+        ):
+            miss = trajectory.build_accumulated_context("agent-1")
+            hit = trajectory.build_accumulated_context("agent-1")
+
+        assert hit == miss
+        assert "accumulated_context" in hit
+        assert trajectory.stats["hits"] == 1
+
+    def test_cache_evicts_least_recently_used(self, trajectory):
+        with patch.object(
+            trajectory,
+            "_fold_new_agent_logs",
+            side_effect=lambda s, a, state: trajectory._fold_logs(state, _logs(3)),
+        ):
+            trajectory.build_accumulated_context("agent-1")
+            trajectory.build_accumulated_context("agent-2")
+            trajectory.build_accumulated_context("agent-1")  # Refresh agent-1
+            trajectory.build_accumulated_context("agent-3")
+
+        assert list(trajectory.context_cache) == ["agent-1", "agent-3"]
+        assert trajectory.stats["evictions"] == 1
+
+
+@pytest.mark.unit
+class TestPersistedState:
+    def test_json_round_trip_keeps_context(self, trajectory):
+        state = _AccumulatedState()
+        trajectory._fold_logs(state, _logs(40))
+
+        data = json.loads(json.dumps(state.to_json()))
+        restored = _AccumulatedState.from_json(data, state.watermark, state.log_count)
+
+        assert trajectory._context_from_state(
+            restored, None
+        ) == trajectory._context_from_state(state, None)
+        assert list(restored.recent_logs) == list(state.recent_logs)
+        assert restored.goal_statements.maxlen == state.goal_statements.maxlen
+
+    def test_build_resumes_from_persisted_state(self, trajectory):
+        logs = _logs(30)
+        persisted = _AccumulatedState()
+        trajectory._fold_logs(persisted, logs[:20])
+        session = trajectory.db.get_session.return_value.__enter__.return_value
+        session.get.return_value = TrajectoryContextState(
+            context_key="agent-1",
+            watermark_at=persisted.watermark[0],
+            watermark_id=persisted.watermark[1],
+            log_count=persisted.log_count,
+            state=json.loads(json.dumps(persisted.to_json())),
+        )
+
+        def fold_rest(session, agent_id, state):
+            assert state.watermark == persisted.watermark
+            trajectory._fold_logs(state, logs[20:])
+
+        with (
+            patch.object(trajectory, "_fold_new_agent_logs", side_effect=fold_rest),
+            patch.object(trajectory, "_save_state") as save,
+        ):
+            trajectory.build_accumulated_context("agent-1")
+
+        key, state = save.call_args.args
+        assert key == "agent-1"
+        assert state.log_count == 30
+        assert state.watermark == (logs[-1].created_at, logs[-1].id)
+
+    def test_state_not_saved_without_new_logs(self, trajectory):
+        with (
+            patch.object(
+                trajectory,
+                "_fold_new_agent_logs",
+                side_effect=lambda s, a, state: trajectory._fold_logs(state, _logs(3)),
+            ),
+            patch.object(trajectory, "_save_state") as save,
+        ):
+            trajectory.build_accumulated_context("agent-1")
+            trajectory.cache_ttl = timedelta(0)
+            # No new logs on the second build
+            trajectory._fold_new_agent_logs.side_effect = None
+            trajectory.build_accumulated_context("agent-1")
+
+        assert save.call_count == 1
@@ -0,0 +1,65 @@
+"""Unit tests for the compressed, content-addressed transcript store."""
+
+import base64
+
+import pytest
+
+pytest.importorskip("zstandard")
+
+from omoi_os.services.transcript_store import (  # noqa: E402
+    FilesystemBlobStore,
+    TranscriptNotFoundError,
+    TranscriptStore,
+)
+
+
+def _transcript(lines: int = 2000) -> bytes:
+    return b"".join(
+        b'{"type":"assistant","turn":%d,"text":"running the test suite"}\n' % i
+        for i in range(lines)
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    return TranscriptStore(FilesystemBlobStore(tmp_path / "blobs"))
+
+
+@pytest.mark.unit
+class TestTranscriptStore:
+    def test_round_trip_is_compressed(self, store):
+        content = _transcript()
+
+        stored = store.put_b64(base64.b64encode(content).decode())
+
+        assert stored.ref.startswith("sha256:")
+        assert stored.size == len(content)
+        assert stored.compressed_size < len(content) // 10
+        assert b"".join(store.iter_chunks(stored.ref)) == content
+
+    def test_identical_transcripts_share_a_blob(self, store, tmp_path):
+        first = store.put(_transcript())
+        second = store.put(_transcript())
+
+        assert first == second
+        blobs = [p for p in (tmp_path / "blobs").rglob("*") if p.is_file()]
+        assert len(blobs) == 1
+
+    def test_reads_are_chunked(self, store):
+        content = _transcript()
+        stored = store.put(content)
+
+        chunks = list(store.iter_chunks(stored.ref, chunk_size=3000))
+
+        assert all(len(chunk) == 3000 for chunk in chunks[:-1])
+        assert b"".join(chunks) == content
+
+    def test_read_b64_matches_single_encoding(self, store):
+        content = _transcript()
+        stored = store.put(content)
+
+        assert store.read_b64(stored.ref) == base64.b64encode(content).decode()
+
+    def test_missing_blob(self, store):
+        with pytest.raises(TranscriptNotFoundError):
+            store.open("sha256:" + "0" * 64)
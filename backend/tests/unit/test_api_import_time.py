@@ -0,0 +1,81 @@
+"""Import cost of the API server entry point.
+
+Every uvicorn worker imports omoi_os.api.main before serving; heavy
+services and the MCP server are loaded lazily, so the import itself should
+stay cheap.
+
+The wall-clock budget depends on the machine, so it only runs when
+OMOIOS_IMPORT_BUDGET_SECONDS is set (CI runs it as a separate step):
+
+    OMOIOS_IMPORT_BUDGET_SECONDS=12 pytest -m performance \\
+        tests/unit/test_api_import_time.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+IMPORT_BUDGET_ENV = "OMOIOS_IMPORT_BUDGET_SECONDS"
+
+# Modules that must only be imported when first used, not by the import
+LAZY_MODULES = (
+    "fastembed",
+    "pydantic_ai",
+    "omoi_os.mcp.fastmcp_server",
+    "omoi_os.services.monitoring_loop",
+)
+
+
+def _import_main(*args: str) -> subprocess.CompletedProcess:
+    code = (
+        "import json, sys\n"
+        "import omoi_os.api.main\n"
+        f"print(json.dumps([m for m in {LAZY_MODULES!r} if m in sys.modules]))\n"
+    )
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True,
+        text=True,
+        timeout=120,
+        env={**os.environ, "TESTING": "true"},
+    )
+
+
+def _cumulative_seconds(importtime_output: str, module: str) -> float:
+    """Cumulative import time of module from `python -X importtime` output."""
+    for line in importtime_output.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:"):
+            continue
+        fields = [field.strip() for field in line[len("import time:") :].split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1]) / 1_000_000
+    raise AssertionError(f"{module} not found in importtime output")
+
+
+@pytest.mark.unit
+class TestApiLazyImports:
+    def test_heavy_modules_not_imported(self):
+        result = _import_main()
+        assert result.returncode == 0, result.stderr[-2000:]
+
+        assert json.loads(result.stdout.strip().splitlines()[-1]) == []
+
+
+@pytest.mark.performance
+@pytest.mark.skipif(
+    IMPORT_BUDGET_ENV not in os.environ, reason=f"{IMPORT_BUDGET_ENV} not set"
+)
+class TestApiImportTime:
+    def test_import_within_budget(self):
+        budget = float(os.environ[IMPORT_BUDGET_ENV])
+        result = _import_main("-X", "importtime")
+        assert result.returncode == 0, result.stderr[-2000:]
+
+        seconds = _cumulative_seconds(result.stderr, "omoi_os.api.main")
+        assert seconds <= budget, (
+            f"import omoi_os.api.main took {seconds:.2f}s (budget {budget:.2f}s)"
+        )
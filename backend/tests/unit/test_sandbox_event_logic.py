@@ -199,3 +199,280 @@ class TestSpecPhaseStartedHandling:
         assert event.event_type == "spec.phase_started"
         assert event.event_data["phase"] == "requirements"
         assert "spec_id" in event.event_data
+
+
+@pytest.mark.unit
+class TestBatchEventIngest:
+    """Test the batch ingest endpoint logic with persistence mocked."""
+
+    def _batch(self, *events):
+        from omoi_os.api.routes.sandbox import SandboxEventBatchCreate
+
+        return SandboxEventBatchCreate(events=list(events))
+
+    def test_batch_size_is_bounded(self):
+        """Empty and oversized batches should be rejected."""
+        from omoi_os.api.routes.sandbox import (
+            MAX_EVENT_BATCH_SIZE,
+            SandboxEventBatchCreate,
+        )
+
+        with pytest.raises(ValidationError):
+            SandboxEventBatchCreate(events=[])
+        with pytest.raises(ValidationError):
+            SandboxEventBatchCreate(
+                events=[{"event_type": "agent.tool_use"}] * (MAX_EVENT_BATCH_SIZE + 1)
+            )
+
+    @pytest.mark.asyncio
+    async def test_batch_persists_once_and_broadcasts_in_order(self):
+        """One persistence call for the batch; duplicates are not re-broadcast."""
+        from unittest.mock import AsyncMock
+
+        from omoi_os.api.routes.sandbox import post_sandbox_events_batch
+
+        batch = self._batch(
+            {"event_type": "agent.tool_use", "idempotency_key": "k1", "sequence": 1},
+            {"event_type": "agent.tool_use", "idempotency_key": "k1", "sequence": 1},
+            {"event_type": "agent.thinking", "idempotency_key": "k2", "sequence": 2},
+            {"event_type": "agent.tool_use", "idempotency_key": "k3", "sequence": 3},
+        )
+        # k2 was stored by an earlier, retried request
+        persist = AsyncMock(return_value=["id-1", None, "id-3"])
+
+        with (
+            patch("omoi_os.api.routes.sandbox.get_db_service"),
+            patch(
+                "omoi_os.api.routes.sandbox.persist_sandbox_events_batch_async",
+                persist,
+            ),
+            patch("omoi_os.api.routes.sandbox.broadcast_sandbox_event") as broadcast,
+        ):
+            response = await post_sandbox_events_batch("sb-1", batch)
+
+        persist.assert_awaited_once()
+        # In-batch duplicate removed before persistence
+        persisted = persist.await_args.kwargs["events"]
+        assert [e.idempotency_key for e in persisted] == ["k1", "k2", "k3"]
+
+        assert response.accepted == 2
+        assert response.duplicates == 2
+        assert response.event_ids == ["id-1", "id-3"]
+        assert [c.kwargs["event_type"] for c in broadcast.call_args_list] == [
+            "agent.tool_use",
+            "agent.tool_use",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_absorbed_heartbeats_are_not_counted_as_accepted(self):
+        """Heartbeats folded into a rollup are broadcast but not accepted."""
+        from unittest.mock import AsyncMock
+
+        from omoi_os.api.routes.sandbox import post_sandbox_events_batch
+
+        batch = self._batch(
+            {"event_type": "agent.heartbeat", "idempotency_key": "k1"},
+            {"event_type": "agent.tool_use", "idempotency_key": "k2"},
+            {"event_type": "agent.heartbeat", "idempotency_key": "k3"},
+        )
+        persist = AsyncMock(return_value=["id-2"])
+
+        with (
+            patch("omoi_os.api.routes.sandbox.get_db_service"),
+            patch(
+                "omoi_os.api.routes.sandbox.persist_sandbox_events_batch_async",
+                persist,
+            ),
+            patch(
+                "omoi_os.api.routes.sandbox.record_sandbox_heartbeat",
+                return_value=None,
+            ),
+            patch("omoi_os.api.routes.sandbox.broadcast_sandbox_event") as broadcast,
+        ):
+            response = await post_sandbox_events_batch("sb-1", batch)
+
+        assert [e.idempotency_key for e in persist.await_args.kwargs["events"]] == [
+            "k2"
+        ]
+        assert response.accepted == 1
+        assert response.absorbed == 2
+        assert response.duplicates == 0
+        assert broadcast.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_rollup_is_persisted_but_original_heartbeat_broadcast(self):
+        """Subscribers see the same heartbeat payload as the single endpoint."""
+        from unittest.mock import AsyncMock
+
+        from omoi_os.api.routes.sandbox import post_sandbox_events_batch
+
+        batch = self._batch(
+            {"event_type": "agent.heartbeat", "event_data": {"turn": 7}},
+        )
+        persist = AsyncMock(return_value=["id-1"])
+
+        with (
+            patch("omoi_os.api.routes.sandbox.get_db_service"),
+            patch(
+                "omoi_os.api.routes.sandbox.persist_sandbox_events_batch_async",
+                persist,
+            ),
+            patch(
+                "omoi_os.api.routes.sandbox.record_sandbox_heartbeat",
+                return_value={"rollup": True, "heartbeats": 12},
+            ),
+            patch("omoi_os.api.routes.sandbox.broadcast_sandbox_event") as broadcast,
+        ):
+            response = await post_sandbox_events_batch("sb-1", batch)
+
+        persisted = persist.await_args.kwargs["events"]
+        assert persisted[0].event_data == {"rollup": True, "heartbeats": 12}
+        assert broadcast.call_args.kwargs["event_data"] == {"turn": 7}
+        assert response.accepted == 1
+
+    @pytest.mark.asyncio
+    async def test_status_transitions_share_resolved_task(self):
+        """Only status events run transitions, reusing the resolved task_id."""
+        from unittest.mock import AsyncMock
+
+        from omoi_os.api.routes.sandbox import post_sandbox_events_batch
+
+        batch = self._batch(
+            {"event_type": "agent.started"},
+            {"event_type": "agent.tool_use"},
+            {"event_type": "agent.completed"},
+        )
+        transition = AsyncMock(return_value="task-9")
+
+        with (
+            patch("omoi_os.api.routes.sandbox.get_db_service"),
+            patch(
+                "omoi_os.api.routes.sandbox.persist_sandbox_events_batch_async",
+                AsyncMock(return_value=["a", "b", "c"]),
+            ),
+            patch("omoi_os.api.routes.sandbox._handle_status_transition", transition),
+            patch("omoi_os.api.routes.sandbox.broadcast_sandbox_event"),
+        ):
+            await post_sandbox_events_batch("sb-1", batch)
+
+        calls = transition.await_args_list
+        assert [c.args[1] for c in calls] == ["agent.started", "agent.completed"]
+        assert calls[0].kwargs["task_id"] is None
+        assert calls[1].kwargs["task_id"] == "task-9"
+
+
+@pytest.mark.unit
+class TestEventQueryPagination:
+    """Keyset cursors, field projection and cached counts for event queries."""
+
+    def test_cursor_round_trip(self):
+        from datetime import datetime, timezone
+
+        from omoi_os.api.routes.sandbox import (
+            decode_event_cursor,
+            encode_event_cursor,
+        )
+
+        created_at = datetime(2026, 10, 16, 12, 0, 0, 123456, tzinfo=timezone.utc)
+        cursor = encode_event_cursor(created_at, "event-1")
+
+        assert decode_event_cursor(cursor) == (created_at, "event-1")
+
+    def test_bare_event_id_is_not_a_cursor(self):
+        """Old clients pass event IDs; those are looked up instead."""
+        from omoi_os.api.routes.sandbox import decode_event_cursor
+
+        assert decode_event_cursor("3f1c2a9e-6f0d-4c1b-9d7e-2b8a5c4e1f00") is None
+
+    def test_event_data_loaded_only_when_requested(self):
+        from omoi_os.api.routes.sandbox import parse_event_fields
+
+        assert "event_data" in parse_event_fields(None)
+        assert parse_event_fields("source") == (
+            "id",
+            "sandbox_id",
+            "event_type",
+            "created_at",
+            "source",
+        )
+        with pytest.raises(ValueError, match="payload"):
+            parse_event_fields("payload")
+
+    def test_page_query_uses_keyset_not_offset(self):
+        from datetime import datetime, timezone
+
+        from sqlalchemy.dialects import postgresql
+
+        from omoi_os.api.routes.sandbox import _count_filter, _event_page_query
+
+        query = _event_page_query(
+            ("id", "created_at", "event_type"),
+            _count_filter("sb-1", None),
+            (datetime(2026, 10, 16, tzinfo=timezone.utc), "event-1"),
+            "older",
+            50,
+        )
+        sql = str(query.compile(dialect=postgresql.dialect()))
+
+        assert "(sandbox_events.created_at, sandbox_events.id) <" in sql
+        assert "ORDER BY sandbox_events.created_at DESC, sandbox_events.id DESC" in sql
+        assert "OFFSET" not in sql
+        assert "event_data" not in sql
+
+    def test_count_cache_expires(self):
+        from omoi_os.api.routes.sandbox import EventCountCache
+
+        cache = EventCountCache(ttl=10, max_entries=2)
+        with patch("omoi_os.api.routes.sandbox.time.monotonic", return_value=100):
+            cache.set(("sb-1", None), 42)
+            assert cache.get(("sb-1", None)) == 42
+        with patch("omoi_os.api.routes.sandbox.time.monotonic", return_value=111):
+            assert cache.get(("sb-1", None)) is None
+
+    def test_count_cache_evicts_least_recently_used(self):
+        from omoi_os.api.routes.sandbox import EventCountCache
+
+        cache = EventCountCache(max_entries=2)
+        cache.set(("sb-1", None), 1)
+        cache.set(("sb-2", None), 2)
+        cache.get(("sb-1", None))
+        cache.set(("sb-3", None), 3)
+
+        assert cache.get(("sb-2", None)) is None
+        assert cache.get(("sb-1", None)) == 1
+
+
+@pytest.mark.unit
+class TestEventTranscriptStripping:
+    """Session transcripts are stored out of row, not in event payloads."""
+
+    def test_transcript_is_split_from_payload(self):
+        from omoi_os.api.routes.sandbox import split_event_transcript
+
+        event_data = {"session_id": "s-1", "transcript_b64": "eyJ0eXBlIjoiYSJ9Cg=="}
+
+        payload, transcript_b64 = split_event_transcript(event_data)
+
+        assert payload == {"session_id": "s-1"}
+        assert transcript_b64 == "eyJ0eXBlIjoiYSJ9Cg=="
+        assert "transcript_b64" in event_data  # Caller's dict is untouched
+
+    def test_payload_without_transcript_is_unchanged(self):
+        from omoi_os.api.routes.sandbox import split_event_transcript
+
+        event_data = {"tool": "bash"}
+
+        assert split_event_transcript(event_data) == (event_data, None)
+
+    def test_transcript_is_not_broadcast(self):
+        from omoi_os.api.routes.sandbox import _create_system_event
+
+        system_event = _create_system_event(
+            sandbox_id="sb-1",
+            event_type="agent.completed",
+            event_data={"session_id": "s-1", "transcript_b64": "eA=="},
+            source="agent",
+        )
+
+        assert "transcript_b64" not in system_event.payload
+        assert system_event.payload["session_id"] == "s-1"
@@ -692,6 +692,153 @@ class TestEventReporter:
         # (httpx.AsyncClient.aclose is called)
 
 
+class TestEventReporterBatching:
+    """Tests for EventReporter batch mode (EVENT_FLUSH_INTERVAL > 0)."""
+
+    @pytest.fixture
+    def batch_reporter(self, mock_worker_config):
+        mock_worker_config.event_flush_interval = 60.0
+        mock_worker_config.event_batch_size = 3
+        reporter = EventReporter(mock_worker_config)
+        reporter.client = AsyncMock()
+        reporter.client.post = AsyncMock(return_value=MagicMock(status_code=200))
+        return reporter
+
+    @pytest.mark.asyncio
+    async def test_events_buffered_until_batch_size(self, batch_reporter):
+        """Non-status events should be posted together once the batch fills."""
+        for i in range(2):
+            assert await batch_reporter.report("agent.tool_use", {"i": i}) is True
+        batch_reporter.client.post.assert_not_awaited()
+
+        await batch_reporter.report("agent.tool_use", {"i": 2})
+
+        batch_reporter.client.post.assert_awaited_once()
+        url = batch_reporter.client.post.call_args[0][0]
+        assert url.endswith("/sandboxes/sb-test-001/events/batch")
+        events = batch_reporter.client.post.call_args[1]["json"]["events"]
+        assert [e["sequence"] for e in events] == [1, 2, 3]
+        assert len({e["idempotency_key"] for e in events}) == 3
+        assert events[0]["event_data"]["task_id"] == "task-123"
+
+    @pytest.mark.asyncio
+    async def test_status_event_flushes_immediately(self, batch_reporter):
+        """Status events should flush the buffer with them, in order."""
+        await batch_reporter.report("agent.tool_use", {})
+
+        result = await batch_reporter.report("agent.completed", {"success": True})
+
+        assert result is True
+        events = batch_reporter.client.post.call_args[1]["json"]["events"]
+        assert [e["event_type"] for e in events] == [
+            "agent.tool_use",
+            "agent.completed",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_buffered_events(self, batch_reporter):
+        """Buffered events survive a failed flush; the status event is the caller's."""
+        batch_reporter.client.post = AsyncMock(return_value=MagicMock(status_code=503))
+        await batch_reporter.report("agent.tool_use", {})
+
+        result = await batch_reporter.report("agent.completed", {})
+
+        assert result is False
+        assert [e["event_type"] for e in batch_reporter._buffer] == ["agent.tool_use"]
+
+        # A retry resends the same idempotency key
+        key = batch_reporter._buffer[0]["idempotency_key"]
+        batch_reporter.client.post = AsyncMock(return_value=MagicMock(status_code=200))
+        assert await batch_reporter.flush() is True
+        sent = batch_reporter.client.post.call_args[1]["json"]["events"]
+        assert sent[0]["idempotency_key"] == key
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_single_posts_on_404(self, batch_reporter):
+        """Servers without the batch endpoint get one request per event."""
+        batch_reporter.client.post = AsyncMock(
+            side_effect=[
+                MagicMock(status_code=404),
+                MagicMock(status_code=200),
+                MagicMock(status_code=200),
+            ]
+        )
+        await batch_reporter.report("agent.tool_use", {})
+        await batch_reporter.report("agent.completed", {})
+
+        urls = [c[0][0] for c in batch_reporter.client.post.call_args_list]
+        assert urls[0].endswith("/events/batch")
+        assert all(url.endswith("/events") for url in urls[1:])
+        assert batch_reporter.batching is False
+
+
+class TestEventReporterOutbox:
+    """Tests for EventReporter with a durable outbox (EVENT_OUTBOX_DIR)."""
+
+    @pytest.fixture
+    def outbox_config(self, mock_worker_config, tmp_path):
+        mock_worker_config.event_flush_interval = 60.0
+        mock_worker_config.event_batch_size = 3
+        mock_worker_config.event_outbox_dir = str(tmp_path / "outbox")
+        mock_worker_config.event_outbox_drain_timeout = 2.0
+        return mock_worker_config
+
+    def _reporter(self, config, *status_codes):
+        reporter = EventReporter(config)
+        reporter.client = AsyncMock()
+        reporter.client.post = AsyncMock(
+            side_effect=[MagicMock(status_code=code) for code in status_codes]
+        )
+        return reporter
+
+    @pytest.mark.asyncio
+    async def test_report_does_not_wait_for_network(self, outbox_config):
+        """report() returns once the event is on disk, even for status events."""
+        reporter = self._reporter(outbox_config)
+
+        assert await reporter.report("agent.tool_use", {}) is True
+        assert await reporter.report("agent.completed", {"success": True}) is True
+
+        reporter.client.post.assert_not_awaited()
+        assert reporter.outbox_lag()["pending_events"] == 2
+
+    @pytest.mark.asyncio
+    async def test_undelivered_events_are_retried_in_order(self, outbox_config):
+        """A failed batch is resent with the same keys once the server is back."""
+        reporter = self._reporter(outbox_config, 502, 200)
+        reporter._sender.max_backoff = 0.01
+        await reporter.report("agent.tool_use", {})
+        await reporter.report("agent.completed", {})
+
+        assert await reporter.flush() is True
+
+        first, second = [
+            c[1]["json"]["events"] for c in reporter.client.post.call_args_list
+        ]
+        assert first == second
+        assert [e["sequence"] for e in second] == [1, 2]
+        assert all("enqueued_at" not in e for e in second)
+        lag = reporter.outbox_lag()
+        assert lag["pending_events"] == 0
+        assert lag["send_failures"] == 1
+        await reporter._sender.stop()
+
+    @pytest.mark.asyncio
+    async def test_events_survive_restart(self, outbox_config):
+        """Events not delivered before shutdown are sent by the next worker."""
+        reporter = self._reporter(outbox_config)
+        await reporter.report("agent.tool_use", {"i": 1})
+        reporter.outbox.close()
+
+        restarted = self._reporter(outbox_config, 200)
+        assert await restarted.flush() is True
+
+        events = restarted.client.post.call_args[1]["json"]["events"]
+        assert [e["event_data"]["i"] for e in events] == [1]
+        assert events[0]["idempotency_key"].startswith("sb-test-001:")
+        await restarted._sender.stop()
+
+
 # ============================================================================
 # Tests: MessagePoller
 # ============================================================================
@@ -653,12 +653,19 @@ def create_tickets(tasks_file, api_url, api_key, project_id, user_id, spec_id, d
     is_flag=True,
     help="Preview what would be synced without making API calls",
 )
+@click.option(
+    "--state-file",
+    type=click.Path(dir_okay=False),
+    help="File recording what was synced, so unchanged files are skipped next time",
+)
 @click.option(
     "--verbose", "-v",
     is_flag=True,
     help="Show detailed progress output",
 )
-def sync_markdown(input_dir, api_url, api_key, project_id, user_id, spec_id, dry_run, verbose):
+def sync_markdown(
+    input_dir, api_url, api_key, project_id, user_id, spec_id, dry_run, state_file, verbose
+):
     """Sync markdown files with frontmatter to the backend API.
 
     This command reads markdown files from the input directory structure:
@@ -754,6 +761,7 @@ def sync_markdown(input_dir, api_url, api_key, project_id, user_id, spec_id, dry
         api_key=api_key,
         user_id=user_id,
         dry_run=dry_run,
+        state_file=Path(state_file) if state_file else None,
     )
 
     # Create reporter for progress
@@ -51,6 +51,17 @@ class SpecSandboxSettings(BaseSettings):
     callback_url: Optional[str] = Field(
         default=None, description="HTTP callback URL (production)"
     )
+    event_flush_interval: float = Field(
+        default=0.0,
+        description="Seconds between batched event posts (0 = one request per event)",
+    )
+    event_batch_size: int = Field(
+        default=10, description="Most events per request to the callback URL"
+    )
+    event_outbox_dir: Optional[Path] = Field(
+        default=None,
+        description="Directory of the durable event outbox (None = no outbox)",
+    )
 
     # === Claude Agent SDK ===
     anthropic_api_key: Optional[str] = Field(
@@ -2,6 +2,12 @@
 
 POSTs events to the backend sandbox events API endpoint:
   POST /api/v1/sandboxes/{sandbox_id}/events
+or, with use_batch_endpoint, many events per request to:
+  POST /api/v1/sandboxes/{sandbox_id}/events/batch
+
+With outbox_dir, events are first written to a durable on-disk outbox
+(see spec_sandbox.reporters.outbox) and sent to the batch endpoint in the
+background, so reporting never waits on the network.
 
 This is the callback mechanism for spec-sandbox to report progress
 to the backend. Events are persisted to the sandbox_events table
@@ -11,11 +17,14 @@ Includes SyncSummary-style reporting for traceability statistics.
 """
 
 import asyncio
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+from uuid import uuid4
 
 import httpx
 
 from spec_sandbox.reporters.base import Reporter
+from spec_sandbox.reporters.outbox import EventOutbox, OutboxSender
 from spec_sandbox.schemas.events import Event
 
 
@@ -31,6 +40,15 @@ class HTTPReporter(Reporter):
 
     Features:
     - Batching: Collects events and sends in batches
+    - Batch endpoint (use_batch_endpoint=True): each flush is one request to
+      /events/batch, flushes also run every flush_interval seconds, and
+      status events (IMMEDIATE_EVENT_TYPES) flush at once. Events carry an
+      idempotency key so retried batches are not stored twice. Falls back
+      to per-event posts if the backend has no batch endpoint.
+    - Outbox (outbox_dir): report() appends to an on-disk outbox and returns;
+      a background sender drains it to /events/batch with backoff. Events
+      are delivered at least once, survive restarts, and flush() waits at
+      most drain_timeout for the outbox to empty.
     - Retry: Retries failed requests with exponential backoff
     - Timeout: Configurable request timeout
     - SyncSummary: Final spec summary with traceability stats
@@ -46,6 +64,19 @@ class HTTPReporter(Reporter):
         await machine.run()
     """
 
+    # Events the backend acts on; sent without waiting for the batch to fill
+    IMMEDIATE_EVENT_TYPES = frozenset(
+        {
+            "agent.completed",
+            "spec.phase_started",
+            "spec.phase_completed",
+            "spec.phase_failed",
+            "spec.phase_retry",
+            "spec.execution_completed",
+            "spec.criterion_met",
+        }
+    )
+
     def __init__(
         self,
         callback_url: str,
@@ -56,6 +87,9 @@ class HTTPReporter(Reporter):
         flush_interval: float = 5.0,
         timeout: float = 30.0,
         max_retries: int = 3,
+        use_batch_endpoint: bool = False,
+        outbox_dir: Optional[Union[str, Path]] = None,
+        drain_timeout: float = 10.0,
     ) -> None:
         self.callback_url = callback_url.rstrip("/")
         self.sandbox_id = sandbox_id
@@ -65,11 +99,34 @@ class HTTPReporter(Reporter):
         self.flush_interval = flush_interval
         self.timeout = timeout
         self.max_retries = max_retries
+        # The outbox always sends to the batch endpoint when the backend has it
+        self.use_batch_endpoint = use_batch_endpoint or bool(outbox_dir)
 
         self._buffer: List[Event] = []
         self._client: Optional[httpx.AsyncClient] = None
         self._sync_summary: Optional[Dict[str, Any]] = None
 
+        # Batch endpoint mode: payloads with idempotency keys, in order
+        self._pending: List[Dict[str, Any]] = []
+        self._sequence = 0
+        # Distinguishes idempotency keys across sandbox restarts
+        self._key_prefix = f"{sandbox_id}:{uuid4().hex[:8]}"
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # Outbox mode: durable queue drained by a background sender
+        self.drain_timeout = drain_timeout
+        self._outbox: Optional[EventOutbox] = None
+        self._sender: Optional[OutboxSender] = None
+        if outbox_dir:
+            self._outbox = EventOutbox(Path(outbox_dir), key_prefix=sandbox_id)
+            self._sender = OutboxSender(
+                self._outbox,
+                self._send_outbox_batch,
+                batch_size=batch_size,
+                linger=flush_interval,
+            )
+
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client with authentication."""
         if self._client is None:
@@ -84,19 +141,78 @@ class HTTPReporter(Reporter):
 
     async def report(self, event: Event) -> None:
         """Add event to buffer, flush if batch size reached."""
+        if self._outbox is not None:
+            self._enqueue(self._event_payload(event))
+            return
+
+        if self.use_batch_endpoint:
+            self._sequence += 1
+            self._pending.append(
+                {
+                    **self._event_payload(event),
+                    "idempotency_key": f"{self._key_prefix}:{self._sequence}",
+                    "sequence": self._sequence,
+                }
+            )
+            self._ensure_flush_task()
+            if (
+                event.event_type in self.IMMEDIATE_EVENT_TYPES
+                or len(self._pending) >= self.batch_size
+            ):
+                await self.flush()
+            return
+
         self._buffer.append(event)
 
         if len(self._buffer) >= self.batch_size:
             await self.flush()
 
+    def _enqueue(self, payload: Dict[str, Any]) -> None:
+        """Append a payload to the outbox and wake the sender if needed."""
+        self._outbox.append(payload)
+        self._sender.start()
+        self._sender.notify(
+            urgent=payload["event_type"] in self.IMMEDIATE_EVENT_TYPES
+        )
+
+    def _event_payload(self, event: Event) -> Dict[str, Any]:
+        """Build payload matching backend's SandboxEventCreate schema."""
+        event_data = event.data.copy() if event.data else {}
+        # Inject spec_id into event_data for spec-driven development tracking
+        if self.spec_id:
+            event_data["spec_id"] = self.spec_id
+        # Include phase in event_data if present (for spec.phase_* events)
+        if event.phase:
+            event_data["phase"] = event.phase
+
+        return {
+            "event_type": event.event_type,
+            "event_data": event_data,
+            "source": "agent",
+        }
+
     async def flush(self) -> None:
         """Send buffered events to sandbox events endpoint.
 
         Events are sent one-by-one to:
           POST /api/v1/sandboxes/{sandbox_id}/events
+        or, with use_batch_endpoint, up to batch_size per request to:
+          POST /api/v1/sandboxes/{sandbox_id}/events/batch
 
         Each event includes spec_id in event_data for spec-driven development.
+        In outbox mode, waits up to drain_timeout for the outbox to empty;
+        undelivered events stay in the outbox.
         """
+        if self._sender is not None:
+            await self._sender.drain(self.drain_timeout)
+            return
+
+        async with self._flush_lock:
+            if self._pending:
+                await self._flush_pending()
+            await self._flush_buffer()
+
+    async def _flush_buffer(self) -> None:
         if not self._buffer:
             return
 
@@ -107,36 +223,94 @@ class HTTPReporter(Reporter):
         endpoint = f"{self.callback_url}/api/v1/sandboxes/{self.sandbox_id}/events"
 
         for event in events_to_send:
-            # Build event payload matching backend's SandboxEventCreate schema
-            event_data = event.data.copy() if event.data else {}
-            # Inject spec_id into event_data for spec-driven development tracking
-            if self.spec_id:
-                event_data["spec_id"] = self.spec_id
-            # Include phase in event_data if present (for spec.phase_* events)
-            if event.phase:
-                event_data["phase"] = event.phase
-
-            payload = {
-                "event_type": event.event_type,
-                "event_data": event_data,
-                "source": "agent",
-            }
+            payload = self._event_payload(event)
+            await self._post_event(client, endpoint, payload)
+
+    async def _post_event(
+        self, client: httpx.AsyncClient, endpoint: str, payload: Dict[str, Any]
+    ) -> None:
+        for attempt in range(self.max_retries):
+            try:
+                response = await client.post(endpoint, json=payload)
+                response.raise_for_status()
+                return
+            except httpx.HTTPError as e:
+                if attempt < self.max_retries - 1:
+                    await asyncio.sleep(2**attempt)  # Exponential backoff
+                else:
+                    # On final failure, log but don't crash
+                    # Events are lost but execution continues
+                    print(
+                        f"Failed to send event {payload['event_type']} after {self.max_retries} attempts: {e}"
+                    )
+
+    async def _flush_pending(self) -> None:
+        client = await self._get_client()
+        base = f"{self.callback_url}/api/v1/sandboxes/{self.sandbox_id}/events"
+
+        while self._pending:
+            batch = self._pending[: self.batch_size]
+            del self._pending[: self.batch_size]
 
             for attempt in range(self.max_retries):
                 try:
-                    response = await client.post(endpoint, json=payload)
+                    response = await client.post(
+                        f"{base}/batch", json={"events": batch}
+                    )
+                    if response.status_code == 404:
+                        # Older backend without the batch endpoint
+                        self.use_batch_endpoint = False
+                        for payload in batch + self._pending:
+                            await self._post_event(client, base, payload)
+                        self._pending.clear()
+                        return
                     response.raise_for_status()
-                    break  # Success, move to next event
+                    break
                 except httpx.HTTPError as e:
                     if attempt < self.max_retries - 1:
-                        await asyncio.sleep(2**attempt)  # Exponential backoff
+                        # Same idempotency keys, so a retry can't duplicate
+                        await asyncio.sleep(2**attempt)
                     else:
-                        # On final failure, log but don't crash
-                        # Events are lost but execution continues
                         print(
-                            f"Failed to send event {event.event_type} after {self.max_retries} attempts: {e}"
+                            f"Failed to send batch of {len(batch)} events after {self.max_retries} attempts: {e}"
                         )
 
+    async def _send_outbox_batch(self, events: List[Dict[str, Any]]) -> bool:
+        """Deliver one outbox batch; the sender retries on False."""
+        client = await self._get_client()
+        base = f"{self.callback_url}/api/v1/sandboxes/{self.sandbox_id}/events"
+
+        if self.use_batch_endpoint:
+            try:
+                response = await client.post(f"{base}/batch", json={"events": events})
+            except httpx.HTTPError:
+                return False
+            if response.status_code == 422:
+                # A malformed batch will never succeed; don't retry it forever
+                print(f"Event batch of {len(events)} events rejected")
+                return True
+            if response.status_code != 404:
+                return response.status_code == 200
+            # Older backend without the batch endpoint
+            self.use_batch_endpoint = False
+
+        for payload in events:
+            single = {k: payload[k] for k in ("event_type", "event_data", "source")}
+            await self._post_event(client, base, single)
+        return True
+
+    def _ensure_flush_task(self) -> None:
+        """Start the periodic flush once an event loop is running."""
+        if self.flush_interval <= 0:
+            return
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
     async def report_sync_summary(
         self,
         spec_id: str,
@@ -189,9 +363,6 @@ class HTTPReporter(Reporter):
 
         # Send as agent.completed event with phase_data
         # The backend's _update_spec_phase_data() will merge this into the spec
-        client = await self._get_client()
-        endpoint = f"{self.callback_url}/api/v1/sandboxes/{self.sandbox_id}/events"
-
         event_payload = {
             "event_type": "agent.completed",
             "event_data": {
@@ -203,6 +374,18 @@ class HTTPReporter(Reporter):
             "source": "agent",
         }
 
+        if self._outbox is not None:
+            # Queued behind earlier events, so it's delivered after them
+            self._enqueue(event_payload)
+            return
+
+        # Deliver earlier events first so the backend sees them in order
+        if self.use_batch_endpoint:
+            await self.flush()
+
+        client = await self._get_client()
+        endpoint = f"{self.callback_url}/api/v1/sandboxes/{self.sandbox_id}/events"
+
         for attempt in range(self.max_retries):
             try:
                 response = await client.post(endpoint, json=event_payload)
@@ -219,8 +402,27 @@ class HTTPReporter(Reporter):
         """Get the last reported sync summary."""
         return self._sync_summary
 
+    def outbox_lag(self) -> Optional[Dict[str, Any]]:
+        """Outbox delivery lag metrics (None without an outbox)."""
+        return self._sender.lag() if self._sender else None
+
     async def close(self) -> None:
-        """Close HTTP client."""
+        """Stop periodic flushing and close HTTP client.
+
+        Undelivered outbox events stay on disk for the next run.
+        """
+        if self._sender:
+            await self._sender.stop()
+            self._outbox.close()
+            self._sender = None
+            self._outbox = None
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
         if self._client:
             await self._client.aclose()
             self._client = None
@@ -0,0 +1,331 @@
+"""Durable on-disk outbox for events awaiting delivery to the backend.
+
+Reporters append events to the outbox and return at once; an OutboxSender
+drains it in the background, one batch per request, backing off while the
+backend is unreachable. Undelivered events survive a process restart as
+long as the same directory is reused.
+
+Layout of the outbox directory:
+  events.log     append-only, one JSON event per line
+  events.cursor  memory-mapped counters: byte offset of the first
+                 undelivered event, last assigned sequence and last
+                 delivered sequence
+  outbox.id      idempotency key prefix, fixed for the directory's lifetime
+
+Delivery is at-least-once: a batch the backend stored but that was not
+committed before a crash is sent again, with the same idempotency keys,
+and the backend's batch endpoint skips it.
+"""
+
+import asyncio
+import json
+import mmap
+import os
+import random
+import struct
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+
+class EventOutbox:
+    """Append-only event log with a persistent delivery cursor.
+
+    Usage:
+        outbox = EventOutbox(Path("/tmp/outbox"), key_prefix="sandbox-123")
+        outbox.append({"event_type": "agent.tool_use", "event_data": {}})
+        records, end = outbox.read_batch(50)
+        ...  # deliver records
+        outbox.commit(end, records[-1]["sequence"])
+    """
+
+    # Read offset, last assigned sequence, last delivered sequence
+    CURSOR = struct.Struct("<QQQ")
+    # Delivered log bytes kept before the log is truncated
+    COMPACT_BYTES = 1 << 20
+    # Bytes read per step when looking for the end of the last complete line
+    RECOVER_CHUNK_BYTES = 1 << 16
+
+    def __init__(self, directory: Path, key_prefix: str) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        self.directory = directory
+        self._log_path = directory / "events.log"
+
+        id_path = directory / "outbox.id"
+        if id_path.exists():
+            self.key_prefix = id_path.read_text().strip()
+        else:
+            self.key_prefix = f"{key_prefix}:{uuid4().hex[:8]}"
+            id_path.write_text(self.key_prefix)
+
+        cursor_path = directory / "events.cursor"
+        with open(cursor_path, "ab") as f:
+            if f.tell() < self.CURSOR.size:
+                f.write(b"\0" * (self.CURSOR.size - f.tell()))
+        self._cursor_file = open(cursor_path, "r+b")
+        self._cursor = mmap.mmap(self._cursor_file.fileno(), self.CURSOR.size)
+        self._offset, self._sequence, self._delivered = self.CURSOR.unpack_from(
+            self._cursor
+        )
+
+        self._log = open(self._log_path, "ab")
+        self._recover()
+        self._oldest_pending_at: Optional[float] = None
+
+    def _recover(self) -> None:
+        """Drop a partially written last line and clamp the cursor."""
+        size = self._log_size()
+        end = self._last_line_end(size)
+        if end < size:
+            os.truncate(self._log_path, end)
+            size = end
+        if self._offset > size:
+            self._offset = size
+        self._store_cursor()
+
+    def _last_line_end(self, size: int) -> int:
+        """Offset just past the log's last newline (0 if it has none)."""
+        # Scan back in chunks: a torn line can be longer than any one chunk
+        position = size
+        with open(self._log_path, "rb") as f:
+            while position > 0:
+                start = max(0, position - self.RECOVER_CHUNK_BYTES)
+                f.seek(start)
+                newline = f.read(position - start).rfind(b"\n")
+                if newline >= 0:
+                    return start + newline + 1
+                position = start
+        return 0
+
+    def _log_size(self) -> int:
+        return os.fstat(self._log.fileno()).st_size
+
+    def _store_cursor(self) -> None:
+        self.CURSOR.pack_into(
+            self._cursor, 0, self._offset, self._sequence, self._delivered
+        )
+
+    @property
+    def pending_events(self) -> int:
+        """Events appended but not yet delivered."""
+        return self._sequence - self._delivered
+
+    @property
+    def pending_bytes(self) -> int:
+        """Size of the undelivered part of the log."""
+        return self._log_size() - self._offset
+
+    def append(self, event: Dict[str, Any]) -> int:
+        """Append an event, assigning its sequence and idempotency key.
+
+        Returns:
+            The event's sequence number
+        """
+        # The sequence is stored first, so a crash mid-write leaves a gap
+        # rather than reusing the number (and idempotency key)
+        self._sequence += 1
+        self._store_cursor()
+        record = {
+            **event,
+            "sequence": self._sequence,
+            "idempotency_key": f"{self.key_prefix}:{self._sequence}",
+            "enqueued_at": time.time(),
+        }
+        line = json.dumps(record, separators=(",", ":"), default=str)
+        self._log.write(line.encode("utf-8") + b"\n")
+        self._log.flush()
+        if self._oldest_pending_at is None:
+            self._oldest_pending_at = record["enqueued_at"]
+        return self._sequence
+
+    def read_batch(self, limit: int) -> Tuple[List[Dict[str, Any]], int]:
+        """Read up to limit undelivered events, oldest first.
+
+        Returns:
+            The events and the log offset to commit once they are delivered
+        """
+        records: List[Dict[str, Any]] = []
+        end = self._offset
+        with open(self._log_path, "rb") as f:
+            f.seek(self._offset)
+            while len(records) < limit:
+                line = f.readline()
+                if not line.endswith(b"\n"):
+                    break
+                end += len(line)
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue  # Unreadable line; skipped with this batch
+        if records:
+            self._oldest_pending_at = records[0].get("enqueued_at")
+        return records, end
+
+    def commit(self, end: int, sequence: int) -> None:
+        """Mark events up to a read_batch() offset as delivered."""
+        self._offset = end
+        self._delivered = max(self._delivered, sequence)
+        if self._offset >= self._log_size():
+            # Nothing left; this also closes sequence gaps from a crash
+            self._delivered = self._sequence
+            self._oldest_pending_at = None
+            if self._offset >= self.COMPACT_BYTES:
+                self._log.truncate(0)
+                self._offset = 0
+        self._store_cursor()
+
+    def lag(self) -> Dict[str, Any]:
+        """Delivery lag metrics."""
+        oldest = self._oldest_pending_at if self.pending_bytes else None
+        return {
+            "pending_events": self.pending_events,
+            "pending_bytes": self.pending_bytes,
+            "oldest_pending_age_seconds": (
+                round(time.time() - oldest, 3) if oldest else 0.0
+            ),
+            "last_sequence": self._sequence,
+            "delivered_sequence": self._delivered,
+        }
+
+    def close(self) -> None:
+        """Close the log and cursor files."""
+        self._log.close()
+        self._cursor.flush()
+        self._cursor.close()
+        self._cursor_file.close()
+
+
+class OutboxSender:
+    """Drains an EventOutbox in the background, one batch per send() call.
+
+    The sender waits until a full batch is pending, an urgent event is
+    appended (notify(urgent=True)) or linger seconds pass. A failed send
+    is retried after an exponential backoff (with jitter), so callers
+    never wait on the network.
+
+    Args:
+        outbox: Outbox to drain
+        send: Delivers a batch of events; returns True once stored
+        batch_size: Most events per send() call
+        linger: Longest time a non-urgent event waits for a batch
+        max_backoff: Upper bound of the retry delay (seconds)
+    """
+
+    def __init__(
+        self,
+        outbox: EventOutbox,
+        send: Callable[[List[Dict[str, Any]]], Awaitable[bool]],
+        batch_size: int = 50,
+        linger: float = 1.0,
+        max_backoff: float = 30.0,
+    ) -> None:
+        self.outbox = outbox
+        self._send = send
+        self.batch_size = max(1, batch_size)
+        self.linger = linger if linger > 0 else 1.0
+        self.max_backoff = max_backoff
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+        self._drained = asyncio.Event()
+        if not outbox.pending_bytes:
+            self._drained.set()
+        self.stats: Dict[str, Any] = {
+            "batches_sent": 0,
+            "events_sent": 0,
+            "send_failures": 0,
+            "last_delivery_at": None,
+        }
+
+    def start(self) -> None:
+        """Start the background sender (needs a running event loop)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background sender; undelivered events stay on disk."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def notify(self, urgent: bool = False) -> None:
+        """Tell the sender events were appended."""
+        self._drained.clear()
+        if urgent or self.outbox.pending_events >= self.batch_size:
+            self._wakeup.set()
+
+    async def drain(self, timeout: float) -> bool:
+        """Wait until every appended event is delivered.
+
+        Returns:
+            True if the outbox emptied within timeout
+        """
+        if not self.outbox.pending_bytes:
+            return True
+        self.start()
+        self._wakeup.set()
+        try:
+            await asyncio.wait_for(self._drained.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def lag(self) -> Dict[str, Any]:
+        """Outbox lag plus sender statistics."""
+        return {**self.outbox.lag(), **self.stats}
+
+    async def _run(self) -> None:
+        backoff = 0.0
+        while True:
+            if backoff:
+                await asyncio.sleep(backoff * random.uniform(0.5, 1.0))
+            elif (
+                self.outbox.pending_events < self.batch_size
+                and not self._wakeup.is_set()
+            ):
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.linger)
+                except asyncio.TimeoutError:
+                    pass
+            self._wakeup.clear()
+
+            if await self.send_batch():
+                backoff = 0.0
+                if self.outbox.pending_bytes:
+                    self._wakeup.set()  # Once woken, send everything pending
+            else:
+                backoff = min(self.max_backoff, max(0.5, backoff * 2))
+
+    async def send_batch(self) -> bool:
+        """Send the oldest pending batch.
+
+        Returns:
+            False if the batch could not be delivered
+        """
+        records, end = self.outbox.read_batch(self.batch_size)
+        if records:
+            events = [
+                {k: v for k, v in record.items() if k != "enqueued_at"}
+                for record in records
+            ]
+            try:
+                delivered = await self._send(events)
+            except Exception:
+                delivered = False
+            if not delivered:
+                self.stats["send_failures"] += 1
+                return False
+            self.stats["batches_sent"] += 1
+            self.stats["events_sent"] += len(records)
+            self.stats["last_delivery_at"] = time.time()
+            self.outbox.commit(end, records[-1]["sequence"])
+        else:
+            self.outbox.commit(end, 0)  # Skips unreadable lines, if any
+
+        if not self.outbox.pending_bytes:
+            self._drained.set()
+        return True
@@ -12,13 +12,20 @@ Sync Behavior:
 - UPDATE: If item exists but description differs, update it
 - SKIP: If item exists with same description, skip
 - FAILED: If sync operation fails
+
+Files unchanged since their last successful sync (by content hash) are
+skipped without parsing or API calls, and writes are sent concurrently
+through the backend's bulk-upsert endpoints.
 """
 
+import asyncio
+import hashlib
+import json
 import re
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Dict, List, Optional, Set, Tuple, Union
 
 import httpx
 
@@ -144,6 +151,18 @@ def convert_api_endpoints_to_spec(api_endpoints: List[Dict[str, Any]]) -> List[D
     return api_spec
 
 
+def _file_hash(path: Path) -> str:
+    """SHA-256 of a file's content."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _same_description(existing: Optional[Dict[str, Any]], description: str) -> bool:
+    """Whether an existing item already has this description."""
+    if not existing:
+        return False
+    return (existing.get("description") or "").strip() == description.strip()
+
+
 class SyncAction(Enum):
     """Action taken during sync."""
 
@@ -165,6 +184,18 @@ class SyncConfig:
     timeout: float = 30.0
     max_retries: int = 3
     dry_run: bool = False
+    # Concurrent API requests for independent items
+    max_concurrency: int = 8
+    # Send writes through the bulk-upsert endpoints, bulk_batch_size items
+    # per request (backends without them get one request per item). The
+    # backend handles a batch's items one after another, so bulk requests
+    # get their own, longer timeout.
+    use_bulk: bool = True
+    bulk_batch_size: int = 10
+    bulk_timeout: float = 120.0
+    # Where to keep file hashes of the last sync, to skip unchanged files
+    # (opt-in; keep it outside the synced directory)
+    state_file: Optional[Path] = None
 
 
 @dataclass
@@ -299,6 +330,37 @@ class SyncSummary:
         }
 
 
+@dataclass(frozen=True)
+class _ItemKind:
+    """Endpoints, events and messages for one kind of synced item."""
+
+    name: str
+    create_endpoint: str
+    update_endpoint: str  # Format string with {id}
+    bulk_endpoint: str
+    created_event: str
+    updated_event: str
+    skip_message: str = "Already exists with same description"
+    update_message: str = "Updated description"
+    dry_run_update_message: str = "Would update description (dry run)"
+
+
+@dataclass
+class _PendingWrite:
+    """A create or update decided while planning, sent in the apply step."""
+
+    local_id: str
+    title: str
+    payload: Dict[str, Any]
+    existing_id: Optional[str] = None  # Update this item; create when None
+    file_path: Optional[Path] = None
+    event_data: Dict[str, Any] = field(default_factory=dict)
+
+
+# Planning yields either a final result (skip, failure, dry run) or a write
+_Plan = Union[SyncResult, _PendingWrite]
+
+
 class MarkdownSyncService:
     """Syncs markdown files to backend API.
 
@@ -317,6 +379,22 @@ class MarkdownSyncService:
     markdown body (description). The frontmatter is validated against
     Pydantic models and converted to API payloads.
 
+    Sync runs in two steps per item kind: planning compares each item with
+    the existing backend items (no network), then the resulting creates and
+    updates are sent together - through the bulk-upsert endpoints in
+    concurrent batches, or one request per item (bounded by
+    max_concurrency) on backends without them. Tickets are fully synced
+    before tasks, since tasks need their parent ticket IDs.
+
+    A bulk request that gets no response (e.g. a timeout) may still have
+    been applied, so it is not retried blindly: the existing items are
+    listed again and each write is matched by title, and only writes that
+    did not land are resent one by one.
+
+    When ``config.state_file`` is set, content hashes of synced files are
+    kept there; a file whose hash matches its last successful sync is
+    skipped without parsing it or calling the API.
+
     Usage:
         service = MarkdownSyncService(config, reporter)
         summary = await service.sync_directory(Path("./output"))
@@ -330,6 +408,37 @@ class MarkdownSyncService:
         self.config = config
         self.reporter = reporter
         self._client: Optional[httpx.AsyncClient] = None
+        # Item kinds whose bulk endpoint the backend doesn't have
+        self._bulk_unsupported: Set[str] = set()
+
+        requirements_endpoint = f"/api/v1/specs/{config.spec_id}/requirements"
+        self._tickets = _ItemKind(
+            name="ticket",
+            create_endpoint="/api/v1/tickets",
+            update_endpoint="/api/v1/tickets/{id}",
+            bulk_endpoint="/api/v1/tickets/bulk",
+            created_event=EventTypes.TICKET_CREATED,
+            updated_event=EventTypes.TICKET_UPDATED,
+        )
+        self._tasks = _ItemKind(
+            name="task",
+            create_endpoint="/api/v1/tasks",
+            update_endpoint="/api/v1/tasks/{id}",
+            bulk_endpoint="/api/v1/tasks/bulk",
+            created_event=EventTypes.TASK_CREATED,
+            updated_event=EventTypes.TASK_UPDATED,
+        )
+        self._requirements = _ItemKind(
+            name="requirement",
+            create_endpoint=requirements_endpoint,
+            update_endpoint=requirements_endpoint + "/{id}",
+            bulk_endpoint=requirements_endpoint + "/bulk",
+            created_event=EventTypes.REQUIREMENT_CREATED,
+            updated_event=EventTypes.REQUIREMENT_UPDATED,
+            skip_message="Already exists with same content",
+            update_message="Updated",
+            dry_run_update_message="Would update (dry run)",
+        )
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
@@ -372,33 +481,58 @@ class MarkdownSyncService:
         method: str,
         endpoint: str,
         json: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        retries: Optional[int] = None,
     ) -> tuple[int, Optional[Dict[str, Any]]]:
-        """Make HTTP request to API."""
+        """Make HTTP request to API.
+
+        Args:
+            method: HTTP method
+            endpoint: API path
+            json: Request body
+            timeout: Overrides config.timeout for this request
+            retries: Overrides config.max_retries (attempts on request errors)
+
+        Returns:
+            (status, data); status is 0 if no response was received
+        """
         if self.config.dry_run and method != "GET":
             # Simulate successful creation/update in dry-run mode (but allow GET)
             return 201, {"id": f"dry-run-{endpoint.split('/')[-1]}"}
 
         client = await self._get_client()
         url = f"{self.config.api_url.rstrip('/')}{endpoint}"
+        attempts = self.config.max_retries if retries is None else retries
+        options: Dict[str, Any] = {}
+        if timeout is not None:
+            options["timeout"] = timeout
 
-        for attempt in range(self.config.max_retries):
+        for attempt in range(attempts):
             try:
-                response = await client.request(method, url, json=json)
+                response = await client.request(method, url, json=json, **options)
                 try:
                     data = response.json()
                 except Exception:
                     data = None
                 return response.status_code, data
             except httpx.RequestError as e:
-                if attempt < self.config.max_retries - 1:
-                    import asyncio
-
+                if attempt < attempts - 1:
                     await asyncio.sleep(0.5 * (2**attempt))
                 else:
                     return 0, {"error": str(e)}
 
         return 0, {"error": "Unknown error"}
 
+    async def _gather_bounded(self, coros: List[Awaitable[Any]]) -> List[Any]:
+        """Run coroutines concurrently, at most max_concurrency at a time."""
+        semaphore = asyncio.Semaphore(max(1, self.config.max_concurrency))
+
+        async def run(coro: Awaitable[Any]) -> Any:
+            async with semaphore:
+                return await coro
+
+        return list(await asyncio.gather(*(run(coro) for coro in coros)))
+
     async def _list_tickets(self) -> List[Dict[str, Any]]:
         """Fetch existing tickets from API for the project."""
         status, data = await self._request(
@@ -420,17 +554,13 @@ class MarkdownSyncService:
             return data.get("items", data.get("tasks", []))
         return []
 
-    async def _update_ticket(
-        self, ticket_id: str, payload: Dict[str, Any]
-    ) -> tuple[int, Optional[Dict[str, Any]]]:
-        """Update an existing ticket."""
-        return await self._request("PATCH", f"/api/v1/tickets/{ticket_id}", json=payload)
-
-    async def _update_task(
-        self, task_id: str, payload: Dict[str, Any]
-    ) -> tuple[int, Optional[Dict[str, Any]]]:
-        """Update an existing task."""
-        return await self._request("PATCH", f"/api/v1/tasks/{task_id}", json=payload)
+    async def _list_existing(self, kind: _ItemKind) -> List[Dict[str, Any]]:
+        """Fetch existing items of a kind from API."""
+        if kind is self._tickets:
+            return await self._list_tickets()
+        if kind is self._tasks:
+            return await self._list_tasks()
+        return await self._list_spec_requirements()
 
     # =========================================================================
     # Spec Requirements and Design API Methods
@@ -459,38 +589,309 @@ class MarkdownSyncService:
             return spec.get("design")
         return None
 
-    async def _create_requirement(
-        self, payload: Dict[str, Any]
+    async def _update_design(
+        self, design: Dict[str, Any]
     ) -> tuple[int, Optional[Dict[str, Any]]]:
-        """Create a new requirement for the spec."""
+        """Update the spec design."""
         return await self._request(
-            "POST", f"/api/v1/specs/{self.config.spec_id}/requirements", json=payload
+            "PUT", f"/api/v1/specs/{self.config.spec_id}/design", json=design
         )
 
-    async def _update_requirement(
-        self, req_id: str, payload: Dict[str, Any]
-    ) -> tuple[int, Optional[Dict[str, Any]]]:
-        """Update an existing requirement."""
-        return await self._request(
-            "PATCH", f"/api/v1/specs/{self.config.spec_id}/requirements/{req_id}",
-            json=payload
+    # =========================================================================
+    # Plan / Apply
+    # =========================================================================
+
+    def _plan_write(
+        self,
+        kind: _ItemKind,
+        local_id: str,
+        title: str,
+        existing: Optional[Dict[str, Any]],
+        unchanged: bool,
+        create_payload: Dict[str, Any],
+        update_payload: Dict[str, Any],
+        file_path: Optional[Path] = None,
+        event_data: Optional[Dict[str, Any]] = None,
+    ) -> _Plan:
+        """Decide create/update/skip for one item against its existing match."""
+        if existing:
+            if unchanged:
+                return SyncResult(
+                    local_id=local_id,
+                    action=SyncAction.SKIPPED,
+                    api_id=existing.get("id"),
+                    success=True,
+                    message=kind.skip_message,
+                    file_path=file_path,
+                )
+            if self.config.dry_run:
+                return SyncResult(
+                    local_id=local_id,
+                    action=SyncAction.UPDATED,
+                    api_id=existing.get("id"),
+                    success=True,
+                    message=kind.dry_run_update_message,
+                    file_path=file_path,
+                )
+            return _PendingWrite(
+                local_id=local_id,
+                title=title,
+                payload=update_payload,
+                existing_id=existing["id"],
+                file_path=file_path,
+                event_data=event_data or {},
+            )
+
+        if self.config.dry_run:
+            return SyncResult(
+                local_id=local_id,
+                action=SyncAction.CREATED,
+                api_id=f"dry-run-{local_id}",
+                success=True,
+                message="Would create (dry run)",
+                file_path=file_path,
+            )
+        return _PendingWrite(
+            local_id=local_id,
+            title=title,
+            payload=create_payload,
+            file_path=file_path,
+            event_data=event_data or {},
         )
 
-    async def _update_design(
-        self, design: Dict[str, Any]
+    async def _resolve(self, kind: _ItemKind, plans: List[_Plan]) -> List[SyncResult]:
+        """Apply the pending writes among plans; results keep the plan order."""
+        writes = [plan for plan in plans if isinstance(plan, _PendingWrite)]
+        applied = iter(await self._apply_writes(kind, writes) if writes else [])
+        return [
+            next(applied) if isinstance(plan, _PendingWrite) else plan
+            for plan in plans
+        ]
+
+    async def _apply_writes(
+        self, kind: _ItemKind, writes: List[_PendingWrite]
+    ) -> List[SyncResult]:
+        """Send writes in bulk when supported, else one request per item."""
+        responses = None
+        if self.config.use_bulk and kind.name not in self._bulk_unsupported:
+            responses = await self._bulk_upsert(kind, writes)
+        if responses is None:
+            responses = await self._gather_bounded(
+                [self._write_one(kind, write) for write in writes]
+            )
+
+        # Events are emitted in item order, after the writes complete
+        return [
+            await self._write_result(kind, write, status, data)
+            for write, (status, data) in zip(writes, responses)
+        ]
+
+    async def _write_one(
+        self, kind: _ItemKind, write: _PendingWrite
     ) -> tuple[int, Optional[Dict[str, Any]]]:
-        """Update the spec design."""
-        return await self._request(
-            "PUT", f"/api/v1/specs/{self.config.spec_id}/design", json=design
+        """Create or update a single item."""
+        if write.existing_id:
+            return await self._request(
+                "PATCH",
+                kind.update_endpoint.format(id=write.existing_id),
+                json=write.payload,
+            )
+        return await self._request("POST", kind.create_endpoint, json=write.payload)
+
+    async def _bulk_upsert(
+        self, kind: _ItemKind, writes: List[_PendingWrite]
+    ) -> Optional[List[tuple[int, Optional[Dict[str, Any]]]]]:
+        """Send writes through the bulk-upsert endpoint in concurrent batches.
+
+        Returns:
+            (status, data) per write, or None if the backend has no bulk
+            endpoint for this kind
+        """
+        size = max(1, self.config.bulk_batch_size)
+        batches = [writes[i : i + size] for i in range(0, len(writes), size)]
+
+        async def send(batch: List[_PendingWrite]):
+            items = [
+                {"local_id": w.local_id, "id": w.existing_id, "data": w.payload}
+                for w in batch
+            ]
+            # No retries: the batch may have been applied without a response
+            return await self._request(
+                "POST",
+                kind.bulk_endpoint,
+                json={"items": items},
+                timeout=self.config.bulk_timeout,
+                retries=1,
+            )
+
+        replies = await self._gather_bounded([send(batch) for batch in batches])
+
+        unanswered = [
+            write
+            for batch, (status, _) in zip(batches, replies)
+            if status == 0
+            for write in batch
+        ]
+        reconciled = iter(
+            await self._reconcile(kind, unanswered) if unanswered else []
+        )
+
+        responses: List[tuple[int, Optional[Dict[str, Any]]]] = []
+        for batch, (status, data) in zip(batches, replies):
+            if status in (404, 405):
+                self._bulk_unsupported.add(kind.name)
+                return None
+            if status == 0:
+                responses.extend(next(reconciled) for _ in batch)
+                continue
+            results = data.get("results") if isinstance(data, dict) else None
+            if status != 200 or not isinstance(results, list) or (
+                len(results) != len(batch)
+            ):
+                # The whole batch failed; report it on every item
+                responses.extend([(status, data)] * len(batch))
+                continue
+            for item in results:
+                if item.get("error"):
+                    responses.append(
+                        (item.get("status_code") or 400, {"detail": item["error"]})
+                    )
+                else:
+                    responses.append(
+                        (
+                            item.get("status_code") or 200,
+                            item.get("item") or {"id": item.get("id")},
+                        )
+                    )
+        return responses
+
+    async def _reconcile(
+        self, kind: _ItemKind, writes: List[_PendingWrite]
+    ) -> List[tuple[int, Optional[Dict[str, Any]]]]:
+        """Settle writes whose bulk request got no response.
+
+        Creates that landed anyway are found by title and reported as
+        created; the rest (and all updates, which are idempotent) are resent
+        one by one.
+        """
+        existing = {
+            item.get("title", ""): item for item in await self._list_existing(kind)
+        }
+
+        async def settle(write: _PendingWrite):
+            found = existing.get(write.title) if not write.existing_id else None
+            if found:
+                return 201, found
+            return await self._write_one(kind, write)
+
+        return await self._gather_bounded([settle(write) for write in writes])
+
+    async def _write_result(
+        self,
+        kind: _ItemKind,
+        write: _PendingWrite,
+        status: int,
+        data: Optional[Dict[str, Any]],
+    ) -> SyncResult:
+        """Turn a write's API response into a result, emitting its event."""
+        if status in (200, 201) and data:
+            api_id = data.get("id", write.existing_id)
+            await self._emit(
+                kind.updated_event if write.existing_id else kind.created_event,
+                data={
+                    "local_id": write.local_id,
+                    "api_id": api_id,
+                    **write.event_data,
+                    "title": write.title,
+                },
+            )
+            return SyncResult(
+                local_id=write.local_id,
+                action=SyncAction.UPDATED if write.existing_id else SyncAction.CREATED,
+                api_id=api_id,
+                success=True,
+                message=kind.update_message if write.existing_id else "Created",
+                file_path=write.file_path,
+            )
+
+        error = data.get("detail", str(data)) if data else f"HTTP {status}"
+        return SyncResult(
+            local_id=write.local_id,
+            action=SyncAction.FAILED,
+            success=False,
+            error=error,
+            file_path=write.file_path,
         )
 
+    # =========================================================================
+    # Sync State (content hashes)
+    # =========================================================================
+
+    def _state_scope(self, output_dir: Path) -> Dict[str, str]:
+        """What the recorded hashes and API IDs are valid for."""
+        return {
+            "api_url": self.config.api_url.rstrip("/"),
+            "project_id": self.config.project_id,
+            "spec_id": self.config.spec_id,
+            "output_dir": str(output_dir.resolve()),
+        }
+
+    def _load_state(self, output_dir: Path) -> Dict[str, Dict[str, Any]]:
+        """Load file hashes from the last sync of this directory and spec."""
+        path = self.config.state_file
+        if path is None or not Path(path).exists():
+            return {}
+        try:
+            state = json.loads(Path(path).read_text())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(state, dict) or state.get("scope") != self._state_scope(
+            output_dir
+        ):
+            return {}
+        return state.get("files", {})
+
+    def _save_state(self, output_dir: Path, files: Dict[str, Dict[str, Any]]) -> None:
+        """Persist file hashes of this sync (never in dry-run mode)."""
+        if self.config.state_file is None or self.config.dry_run:
+            return
+        path = Path(self.config.state_file)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(
+                json.dumps(
+                    {"scope": self._state_scope(output_dir), "files": files},
+                    indent=2,
+                    sort_keys=True,
+                )
+            )
+        except OSError:
+            pass
+
+    @staticmethod
+    def _unchanged_result(entry: Dict[str, Any], file_path: Path) -> SyncResult:
+        """Result for a file unchanged since it last synced successfully."""
+        return SyncResult(
+            local_id=entry["local_id"],
+            action=SyncAction.SKIPPED,
+            api_id=entry["api_id"],
+            success=True,
+            message="Unchanged since last sync",
+            file_path=file_path,
+        )
+
+    # =========================================================================
+    # Directory Sync
+    # =========================================================================
+
     async def sync_directory(self, output_dir: Path) -> SyncSummary:
         """Sync all markdown files from a directory.
 
         Behavior:
         - CREATE: If ticket/task doesn't exist (by title match)
         - UPDATE: If exists but description differs
-        - SKIP: If exists with same description
+        - SKIP: If exists with same description, or the file is unchanged
+          since its last successful sync
 
         Args:
             output_dir: Directory containing tickets/ and tasks/ subdirectories
@@ -504,8 +905,10 @@ class MarkdownSyncService:
         tasks_dir = output_dir / "tasks"
 
         # Count files to sync
-        ticket_files = list(tickets_dir.glob("TKT-*.md")) if tickets_dir.exists() else []
-        task_files = list(tasks_dir.glob("TSK-*.md")) if tasks_dir.exists() else []
+        ticket_files = (
+            sorted(tickets_dir.glob("TKT-*.md")) if tickets_dir.exists() else []
+        )
+        task_files = sorted(tasks_dir.glob("TSK-*.md")) if tasks_dir.exists() else []
 
         await self._emit(
             EventTypes.SYNC_STARTED,
@@ -516,21 +919,16 @@ class MarkdownSyncService:
             },
         )
 
-        # Fetch existing items for comparison (create/update/skip logic)
-        existing_tickets = await self._list_tickets()
-        existing_tasks = await self._list_tasks()
-
-        # Build lookup by title for comparison
-        ticket_by_title = {t.get("title", ""): t for t in existing_tickets}
-        task_by_title = {t.get("title", ""): t for t in existing_tasks}
+        previous = self._load_state(output_dir)
+        state: Dict[str, Dict[str, Any]] = {}
 
         # Sync tickets first (tasks depend on ticket IDs)
-        if tickets_dir.exists():
-            await self._sync_tickets(tickets_dir, summary, ticket_by_title)
+        await self._sync_tickets(ticket_files, summary, previous, state)
 
         # Sync tasks (using ticket ID map for parent resolution)
-        if tasks_dir.exists():
-            await self._sync_tasks(tasks_dir, summary, task_by_title)
+        await self._sync_tasks(task_files, summary, previous, state)
+
+        self._save_state(output_dir, state)
 
         await self._emit(
             EventTypes.SYNC_COMPLETED,
@@ -541,21 +939,45 @@ class MarkdownSyncService:
 
     async def _sync_tickets(
         self,
-        tickets_dir: Path,
+        ticket_files: List[Path],
         summary: SyncSummary,
-        existing_tickets: Dict[str, Dict[str, Any]],
+        previous: Dict[str, Dict[str, Any]],
+        state: Dict[str, Dict[str, Any]],
     ) -> None:
-        """Sync all ticket markdown files with create/update/skip logic."""
-        for ticket_file in sorted(tickets_dir.glob("TKT-*.md")):
-            result = await self._sync_ticket_file(ticket_file, existing_tickets)
+        """Sync ticket markdown files with create/update/skip logic."""
+        plans: List[Optional[_Plan]] = []
+        hashes = [_file_hash(path) for path in ticket_files]
+        for path, digest in zip(ticket_files, hashes):
+            entry = previous.get(f"tickets/{path.name}")
+            if entry and entry.get("hash") == digest:
+                plans.append(self._unchanged_result(entry, path))
+            else:
+                plans.append(None)
+
+        if None in plans:
+            # Only changed files need the existing tickets
+            existing = {t.get("title", ""): t for t in await self._list_tickets()}
+            plans = [
+                plan or self._plan_ticket_file(path, existing)
+                for plan, path in zip(plans, ticket_files)
+            ]
+
+        results = await self._resolve(self._tickets, plans)
+        for path, digest, result in zip(ticket_files, hashes, results):
             summary.add_ticket_result(result)
-
-    async def _sync_ticket_file(
+            if result.success and result.api_id:
+                state[f"tickets/{path.name}"] = {
+                    "hash": digest,
+                    "local_id": result.local_id,
+                    "api_id": result.api_id,
+                }
+
+    def _plan_ticket_file(
         self,
         file_path: Path,
         existing_tickets: Dict[str, Dict[str, Any]],
-    ) -> SyncResult:
-        """Sync a single ticket markdown file with create/update/skip logic."""
+    ) -> _Plan:
+        """Plan the sync of a single ticket markdown file."""
         try:
             ticket, body = parse_ticket_markdown(file_path)
         except MarkdownParseError as e:
@@ -567,68 +989,6 @@ class MarkdownSyncService:
                 file_path=file_path,
             )
 
-        # Check if ticket already exists by title
-        existing = existing_tickets.get(ticket.title)
-
-        if existing:
-            # Ticket exists - check if we need to update description
-            existing_desc = (existing.get("description") or "").strip()
-            new_desc = body.strip()
-
-            if existing_desc == new_desc:
-                # Same description - skip
-                return SyncResult(
-                    local_id=ticket.id,
-                    action=SyncAction.SKIPPED,
-                    api_id=existing.get("id"),
-                    success=True,
-                    message="Already exists with same description",
-                    file_path=file_path,
-                )
-            else:
-                # Different description - update
-                if self.config.dry_run:
-                    return SyncResult(
-                        local_id=ticket.id,
-                        action=SyncAction.UPDATED,
-                        api_id=existing.get("id"),
-                        success=True,
-                        message="Would update description (dry run)",
-                        file_path=file_path,
-                    )
-
-                status, data = await self._update_ticket(
-                    existing["id"], {"description": body}
-                )
-                if status in (200, 201) and data:
-                    api_id = data.get("id", existing.get("id"))
-                    await self._emit(
-                        EventTypes.TICKET_UPDATED,
-                        data={
-                            "local_id": ticket.id,
-                            "api_id": api_id,
-                            "title": ticket.title,
-                        },
-                    )
-                    return SyncResult(
-                        local_id=ticket.id,
-                        action=SyncAction.UPDATED,
-                        api_id=api_id,
-                        success=True,
-                        message="Updated description",
-                        file_path=file_path,
-                    )
-                else:
-                    error = data.get("detail", str(data)) if data else f"HTTP {status}"
-                    return SyncResult(
-                        local_id=ticket.id,
-                        action=SyncAction.FAILED,
-                        success=False,
-                        error=error,
-                        file_path=file_path,
-                    )
-
-        # Ticket doesn't exist - create new
         payload = ticket.to_api_payload(
             project_id=self.config.project_id,
             spec_id=self.config.spec_id,
@@ -638,151 +998,103 @@ class MarkdownSyncService:
         if self.config.user_id:
             payload["user_id"] = self.config.user_id
 
-        if self.config.dry_run:
-            return SyncResult(
-                local_id=ticket.id,
-                action=SyncAction.CREATED,
-                api_id=f"dry-run-{ticket.id}",
-                success=True,
-                message="Would create (dry run)",
-                file_path=file_path,
-            )
-
-        status, data = await self._request("POST", "/api/v1/tickets", json=payload)
-
-        if status in (200, 201) and data:
-            api_id = data.get("id")
-            await self._emit(
-                EventTypes.TICKET_CREATED,
-                data={
-                    "local_id": ticket.id,
-                    "api_id": api_id,
-                    "title": ticket.title,
-                },
-            )
-            return SyncResult(
-                local_id=ticket.id,
-                action=SyncAction.CREATED,
-                api_id=api_id,
-                success=True,
-                message="Created",
-                file_path=file_path,
-            )
-        else:
-            error = data.get("detail", str(data)) if data else f"HTTP {status}"
-            return SyncResult(
-                local_id=ticket.id,
-                action=SyncAction.FAILED,
-                success=False,
-                error=error,
-                file_path=file_path,
-            )
+        # Check if ticket already exists by title
+        existing = existing_tickets.get(ticket.title)
+        return self._plan_write(
+            self._tickets,
+            local_id=ticket.id,
+            title=ticket.title,
+            existing=existing,
+            unchanged=_same_description(existing, body),
+            create_payload=payload,
+            update_payload={"description": body},
+            file_path=file_path,
+        )
 
     async def _sync_tasks(
         self,
-        tasks_dir: Path,
+        task_files: List[Path],
         summary: SyncSummary,
-        existing_tasks: Dict[str, Dict[str, Any]],
+        previous: Dict[str, Dict[str, Any]],
+        state: Dict[str, Dict[str, Any]],
     ) -> None:
-        """Sync all task markdown files with create/update/skip logic."""
-        for task_file in sorted(tasks_dir.glob("TSK-*.md")):
-            result = await self._sync_task_file(
-                task_file, summary.ticket_id_map, existing_tasks
-            )
-            summary.add_task_result(result)
+        """Sync task markdown files with create/update/skip logic."""
+        ticket_api_ids = set(summary.ticket_id_map.values())
+        plans: List[Optional[_Plan]] = []
+        parents: List[Optional[str]] = []
+        hashes = [_file_hash(path) for path in task_files]
+        for path, digest in zip(task_files, hashes):
+            entry = previous.get(f"tasks/{path.name}")
+            # Unchanged only if its parent ticket is still the same one
+            if (
+                entry
+                and entry.get("hash") == digest
+                and entry.get("ticket_api_id") in ticket_api_ids
+            ):
+                plans.append(self._unchanged_result(entry, path))
+                parents.append(entry["ticket_api_id"])
+            else:
+                plans.append(None)
+                parents.append(None)
+
+        if None in plans:
+            existing = {t.get("title", ""): t for t in await self._list_tasks()}
+            for i, path in enumerate(task_files):
+                if plans[i] is None:
+                    plans[i], parents[i] = self._plan_task_file(
+                        path, summary.ticket_id_map, existing
+                    )
 
-    async def _sync_task_file(
+        results = await self._resolve(self._tasks, plans)
+        for path, digest, parent, result in zip(task_files, hashes, parents, results):
+            summary.add_task_result(result)
+            if result.success and result.api_id:
+                state[f"tasks/{path.name}"] = {
+                    "hash": digest,
+                    "local_id": result.local_id,
+                    "api_id": result.api_id,
+                    "ticket_api_id": parent,
+                }
+
+    def _plan_task_file(
         self,
         file_path: Path,
         ticket_id_map: Dict[str, str],
         existing_tasks: Dict[str, Dict[str, Any]],
-    ) -> SyncResult:
-        """Sync a single task markdown file with create/update/skip logic."""
+    ) -> Tuple[_Plan, Optional[str]]:
+        """Plan the sync of a single task markdown file.
+
+        Returns:
+            The plan and the parent ticket's API ID
+        """
         try:
             task, body = parse_task_markdown(file_path)
         except MarkdownParseError as e:
-            return SyncResult(
-                local_id=file_path.stem,
-                action=SyncAction.FAILED,
-                success=False,
-                error=str(e),
-                file_path=file_path,
+            return (
+                SyncResult(
+                    local_id=file_path.stem,
+                    action=SyncAction.FAILED,
+                    success=False,
+                    error=str(e),
+                    file_path=file_path,
+                ),
+                None,
             )
 
         # Resolve parent ticket to API ID
         ticket_api_id = ticket_id_map.get(task.parent_ticket)
         if not ticket_api_id:
-            return SyncResult(
-                local_id=task.id,
-                action=SyncAction.FAILED,
-                success=False,
-                error=f"Parent ticket {task.parent_ticket} not found in sync",
-                file_path=file_path,
-            )
-
-        # Check if task already exists by title
-        existing = existing_tasks.get(task.title)
-
-        if existing:
-            # Task exists - check if we need to update description
-            existing_desc = (existing.get("description") or "").strip()
-            new_desc = body.strip()
-
-            if existing_desc == new_desc:
-                # Same description - skip
-                return SyncResult(
+            return (
+                SyncResult(
                     local_id=task.id,
-                    action=SyncAction.SKIPPED,
-                    api_id=existing.get("id"),
-                    success=True,
-                    message="Already exists with same description",
+                    action=SyncAction.FAILED,
+                    success=False,
+                    error=f"Parent ticket {task.parent_ticket} not found in sync",
                     file_path=file_path,
-                )
-            else:
-                # Different description - update
-                if self.config.dry_run:
-                    return SyncResult(
-                        local_id=task.id,
-                        action=SyncAction.UPDATED,
-                        api_id=existing.get("id"),
-                        success=True,
-                        message="Would update description (dry run)",
-                        file_path=file_path,
-                    )
-
-                status, data = await self._update_task(
-                    existing["id"], {"description": body}
-                )
-                if status in (200, 201) and data:
-                    api_id = data.get("id", existing.get("id"))
-                    await self._emit(
-                        EventTypes.TASK_UPDATED,
-                        data={
-                            "local_id": task.id,
-                            "api_id": api_id,
-                            "ticket_api_id": ticket_api_id,
-                            "title": task.title,
-                        },
-                    )
-                    return SyncResult(
-                        local_id=task.id,
-                        action=SyncAction.UPDATED,
-                        api_id=api_id,
-                        success=True,
-                        message="Updated description",
-                        file_path=file_path,
-                    )
-                else:
-                    error = data.get("detail", str(data)) if data else f"HTTP {status}"
-                    return SyncResult(
-                        local_id=task.id,
-                        action=SyncAction.FAILED,
-                        success=False,
-                        error=error,
-                        file_path=file_path,
-                    )
+                ),
+                None,
+            )
 
-        # Task doesn't exist - create new
         # Pass description and ensure phase_id=PHASE_IMPLEMENTATION for continuous mode
         payload = task.to_api_payload(
             ticket_api_id=ticket_api_id,
@@ -790,46 +1102,24 @@ class MarkdownSyncService:
             phase_id="PHASE_IMPLEMENTATION",
         )
 
-        if self.config.dry_run:
-            return SyncResult(
-                local_id=task.id,
-                action=SyncAction.CREATED,
-                api_id=f"dry-run-{task.id}",
-                success=True,
-                message="Would create (dry run)",
-                file_path=file_path,
-            )
-
-        status, data = await self._request("POST", "/api/v1/tasks", json=payload)
+        # Check if task already exists by title
+        existing = existing_tasks.get(task.title)
+        plan = self._plan_write(
+            self._tasks,
+            local_id=task.id,
+            title=task.title,
+            existing=existing,
+            unchanged=_same_description(existing, body),
+            create_payload=payload,
+            update_payload={"description": body},
+            file_path=file_path,
+            event_data={"ticket_api_id": ticket_api_id},
+        )
+        return plan, ticket_api_id
 
-        if status in (200, 201) and data:
-            api_id = data.get("id")
-            await self._emit(
-                EventTypes.TASK_CREATED,
-                data={
-                    "local_id": task.id,
-                    "api_id": api_id,
-                    "ticket_api_id": ticket_api_id,
-                    "title": task.title,
-                },
-            )
-            return SyncResult(
-                local_id=task.id,
-                action=SyncAction.CREATED,
-                api_id=api_id,
-                success=True,
-                message="Created",
-                file_path=file_path,
-            )
-        else:
-            error = data.get("detail", str(data)) if data else f"HTTP {status}"
-            return SyncResult(
-                local_id=task.id,
-                action=SyncAction.FAILED,
-                success=False,
-                error=error,
-                file_path=file_path,
-            )
+    # =========================================================================
+    # Phase Output Sync
+    # =========================================================================
 
     async def sync_from_phase_output(
         self,
@@ -863,23 +1153,28 @@ class MarkdownSyncService:
         )
 
         # Fetch existing items for comparison (create/update/skip logic)
-        existing_tickets = await self._list_tickets()
-        existing_tasks = await self._list_tasks()
+        existing_tickets, existing_tasks = await asyncio.gather(
+            self._list_tickets(), self._list_tasks()
+        )
 
         # Build lookup by title for comparison
         ticket_by_title = {t.get("title", ""): t for t in existing_tickets}
         task_by_title = {t.get("title", ""): t for t in existing_tasks}
 
         # Sync tickets
-        for ticket_data in tickets:
-            result = await self._sync_ticket_dict(ticket_data, ticket_by_title)
+        ticket_plans = [
+            self._plan_ticket_dict(ticket_data, ticket_by_title)
+            for ticket_data in tickets
+        ]
+        for result in await self._resolve(self._tickets, ticket_plans):
             summary.add_ticket_result(result)
 
         # Sync tasks
-        for task_data in tasks:
-            result = await self._sync_task_dict(
-                task_data, summary.ticket_id_map, task_by_title
-            )
+        task_plans = [
+            self._plan_task_dict(task_data, summary.ticket_id_map, task_by_title)
+            for task_data in tasks
+        ]
+        for result in await self._resolve(self._tasks, task_plans):
             summary.add_task_result(result)
 
         await self._emit(
@@ -889,71 +1184,17 @@ class MarkdownSyncService:
 
         return summary
 
-    async def _sync_ticket_dict(
+    def _plan_ticket_dict(
         self,
         ticket_data: Dict[str, Any],
         existing_tickets: Dict[str, Dict[str, Any]],
-    ) -> SyncResult:
-        """Sync a ticket from dict data with create/update/skip logic."""
+    ) -> _Plan:
+        """Plan the sync of a ticket from dict data."""
         local_id = ticket_data.get("id", "unknown")
         title = ticket_data.get("title", local_id)
         description = ticket_data.get("description", "")
         priority = ticket_data.get("priority", "MEDIUM")
 
-        # Check if ticket already exists by title
-        existing = existing_tickets.get(title)
-
-        if existing:
-            # Ticket exists - check if we need to update description
-            existing_desc = (existing.get("description") or "").strip()
-            new_desc = description.strip()
-
-            if existing_desc == new_desc:
-                # Same description - skip
-                return SyncResult(
-                    local_id=local_id,
-                    action=SyncAction.SKIPPED,
-                    api_id=existing.get("id"),
-                    success=True,
-                    message="Already exists with same description",
-                )
-            else:
-                # Different description - update
-                if self.config.dry_run:
-                    return SyncResult(
-                        local_id=local_id,
-                        action=SyncAction.UPDATED,
-                        api_id=existing.get("id"),
-                        success=True,
-                        message="Would update description (dry run)",
-                    )
-
-                status, data = await self._update_ticket(
-                    existing["id"], {"description": description}
-                )
-                if status in (200, 201) and data:
-                    api_id = data.get("id", existing.get("id"))
-                    await self._emit(
-                        EventTypes.TICKET_UPDATED,
-                        data={"local_id": local_id, "api_id": api_id, "title": title},
-                    )
-                    return SyncResult(
-                        local_id=local_id,
-                        action=SyncAction.UPDATED,
-                        api_id=api_id,
-                        success=True,
-                        message="Updated description",
-                    )
-                else:
-                    error = data.get("detail", str(data)) if data else f"HTTP {status}"
-                    return SyncResult(
-                        local_id=local_id,
-                        action=SyncAction.FAILED,
-                        success=False,
-                        error=error,
-                    )
-
-        # Ticket doesn't exist - create new
         payload = {
             "title": title,
             "description": description,
@@ -969,46 +1210,25 @@ class MarkdownSyncService:
         if self.config.user_id:
             payload["user_id"] = self.config.user_id
 
-        if self.config.dry_run:
-            return SyncResult(
-                local_id=local_id,
-                action=SyncAction.CREATED,
-                api_id=f"dry-run-{local_id}",
-                success=True,
-                message="Would create (dry run)",
-            )
-
-        status, data = await self._request("POST", "/api/v1/tickets", json=payload)
-
-        if status in (200, 201) and data:
-            api_id = data.get("id")
-            await self._emit(
-                EventTypes.TICKET_CREATED,
-                data={"local_id": local_id, "api_id": api_id, "title": title},
-            )
-            return SyncResult(
-                local_id=local_id,
-                action=SyncAction.CREATED,
-                api_id=api_id,
-                success=True,
-                message="Created",
-            )
-        else:
-            error = data.get("detail", str(data)) if data else f"HTTP {status}"
-            return SyncResult(
-                local_id=local_id,
-                action=SyncAction.FAILED,
-                success=False,
-                error=error,
-            )
+        # Check if ticket already exists by title
+        existing = existing_tickets.get(title)
+        return self._plan_write(
+            self._tickets,
+            local_id=local_id,
+            title=title,
+            existing=existing,
+            unchanged=_same_description(existing, description),
+            create_payload=payload,
+            update_payload={"description": description},
+        )
 
-    async def _sync_task_dict(
+    def _plan_task_dict(
         self,
         task_data: Dict[str, Any],
         ticket_id_map: Dict[str, str],
         existing_tasks: Dict[str, Dict[str, Any]],
-    ) -> SyncResult:
-        """Sync a task from dict data with create/update/skip logic."""
+    ) -> _Plan:
+        """Plan the sync of a task from dict data."""
         local_id = task_data.get("id", "unknown")
         title = task_data.get("title", local_id)
         description = task_data.get("description", task_data.get("objective", ""))
@@ -1025,65 +1245,6 @@ class MarkdownSyncService:
                 error=f"Parent ticket {parent_ticket} not found",
             )
 
-        # Check if task already exists by title
-        existing = existing_tasks.get(title)
-
-        if existing:
-            # Task exists - check if we need to update description
-            existing_desc = (existing.get("description") or "").strip()
-            new_desc = description.strip()
-
-            if existing_desc == new_desc:
-                # Same description - skip
-                return SyncResult(
-                    local_id=local_id,
-                    action=SyncAction.SKIPPED,
-                    api_id=existing.get("id"),
-                    success=True,
-                    message="Already exists with same description",
-                )
-            else:
-                # Different description - update
-                if self.config.dry_run:
-                    return SyncResult(
-                        local_id=local_id,
-                        action=SyncAction.UPDATED,
-                        api_id=existing.get("id"),
-                        success=True,
-                        message="Would update description (dry run)",
-                    )
-
-                status, data = await self._update_task(
-                    existing["id"], {"description": description}
-                )
-                if status in (200, 201) and data:
-                    api_id = data.get("id", existing.get("id"))
-                    await self._emit(
-                        EventTypes.TASK_UPDATED,
-                        data={
-                            "local_id": local_id,
-                            "api_id": api_id,
-                            "ticket_api_id": ticket_api_id,
-                            "title": title,
-                        },
-                    )
-                    return SyncResult(
-                        local_id=local_id,
-                        action=SyncAction.UPDATED,
-                        api_id=api_id,
-                        success=True,
-                        message="Updated description",
-                    )
-                else:
-                    error = data.get("detail", str(data)) if data else f"HTTP {status}"
-                    return SyncResult(
-                        local_id=local_id,
-                        action=SyncAction.FAILED,
-                        success=False,
-                        error=error,
-                    )
-
-        # Task doesn't exist - create new
         payload = {
             "ticket_id": ticket_api_id,
             "title": title,
@@ -1092,43 +1253,18 @@ class MarkdownSyncService:
             "priority": priority,
         }
 
-        if self.config.dry_run:
-            return SyncResult(
-                local_id=local_id,
-                action=SyncAction.CREATED,
-                api_id=f"dry-run-{local_id}",
-                success=True,
-                message="Would create (dry run)",
-            )
-
-        status, data = await self._request("POST", "/api/v1/tasks", json=payload)
-
-        if status in (200, 201) and data:
-            api_id = data.get("id")
-            await self._emit(
-                EventTypes.TASK_CREATED,
-                data={
-                    "local_id": local_id,
-                    "api_id": api_id,
-                    "ticket_api_id": ticket_api_id,
-                    "title": title,
-                },
-            )
-            return SyncResult(
-                local_id=local_id,
-                action=SyncAction.CREATED,
-                api_id=api_id,
-                success=True,
-                message="Created",
-            )
-        else:
-            error = data.get("detail", str(data)) if data else f"HTTP {status}"
-            return SyncResult(
-                local_id=local_id,
-                action=SyncAction.FAILED,
-                success=False,
-                error=error,
-            )
+        # Check if task already exists by title
+        existing = existing_tasks.get(title)
+        return self._plan_write(
+            self._tasks,
+            local_id=local_id,
+            title=title,
+            existing=existing,
+            unchanged=_same_description(existing, description),
+            create_payload=payload,
+            update_payload={"description": description},
+            event_data={"ticket_api_id": ticket_api_id},
+        )
 
     # =========================================================================
     # Requirements and Design Sync Methods
@@ -1160,8 +1296,10 @@ class MarkdownSyncService:
         existing_reqs = await self._list_spec_requirements()
         req_by_title = {r.get("title", ""): r for r in existing_reqs}
 
-        for req_data in requirements:
-            result = await self._sync_requirement(req_data, req_by_title)
+        plans = [
+            self._plan_requirement(req_data, req_by_title) for req_data in requirements
+        ]
+        for result in await self._resolve(self._requirements, plans):
             summary.add_requirement_result(result)
 
         await self._emit(
@@ -1176,12 +1314,12 @@ class MarkdownSyncService:
 
         return summary
 
-    async def _sync_requirement(
+    def _plan_requirement(
         self,
         req_data: Dict[str, Any],
         existing_reqs: Dict[str, Dict[str, Any]],
-    ) -> SyncResult:
-        """Sync a single requirement with create/update/skip logic.
+    ) -> _Plan:
+        """Plan the sync of a single requirement.
 
         Handles both formats:
         - Direct condition/action fields
@@ -1212,106 +1350,27 @@ class MarkdownSyncService:
             else:
                 criteria_list.append(str(crit))
 
-        # Check if requirement already exists by title
-        existing = existing_reqs.get(title)
-
-        if existing:
-            # Requirement exists - check if we need to update
-            existing_condition = existing.get("condition", "").strip()
-            existing_action = existing.get("action", "").strip()
-
-            if existing_condition == condition.strip() and existing_action == action.strip():
-                # Same content - skip
-                return SyncResult(
-                    local_id=local_id,
-                    action=SyncAction.SKIPPED,
-                    api_id=existing.get("id"),
-                    success=True,
-                    message="Already exists with same content",
-                )
-            else:
-                # Different content - update
-                if self.config.dry_run:
-                    return SyncResult(
-                        local_id=local_id,
-                        action=SyncAction.UPDATED,
-                        api_id=existing.get("id"),
-                        success=True,
-                        message="Would update (dry run)",
-                    )
-
-                payload = {"condition": condition, "action": action}
-                if linked_design:
-                    payload["linked_design"] = linked_design
-                if criteria_list:
-                    payload["acceptance_criteria"] = criteria_list
-
-                status, data = await self._update_requirement(existing["id"], payload)
-                if status in (200, 201) and data:
-                    api_id = data.get("id", existing.get("id"))
-                    await self._emit(
-                        EventTypes.REQUIREMENT_UPDATED,
-                        data={"local_id": local_id, "api_id": api_id, "title": title},
-                    )
-                    return SyncResult(
-                        local_id=local_id,
-                        action=SyncAction.UPDATED,
-                        api_id=api_id,
-                        success=True,
-                        message="Updated",
-                    )
-                else:
-                    error = data.get("detail", str(data)) if data else f"HTTP {status}"
-                    return SyncResult(
-                        local_id=local_id,
-                        action=SyncAction.FAILED,
-                        success=False,
-                        error=error,
-                    )
-
-        # Requirement doesn't exist - create new
-        payload = {
-            "title": title,
-            "condition": condition,
-            "action": action,
-        }
+        update_payload: Dict[str, Any] = {"condition": condition, "action": action}
         if linked_design:
-            payload["linked_design"] = linked_design
+            update_payload["linked_design"] = linked_design
         if criteria_list:
-            payload["acceptance_criteria"] = criteria_list
+            update_payload["acceptance_criteria"] = criteria_list
 
-        if self.config.dry_run:
-            return SyncResult(
-                local_id=local_id,
-                action=SyncAction.CREATED,
-                api_id=f"dry-run-{local_id}",
-                success=True,
-                message="Would create (dry run)",
-            )
-
-        status, data = await self._create_requirement(payload)
-
-        if status in (200, 201) and data:
-            api_id = data.get("id")
-            await self._emit(
-                EventTypes.REQUIREMENT_CREATED,
-                data={"local_id": local_id, "api_id": api_id, "title": title},
-            )
-            return SyncResult(
-                local_id=local_id,
-                action=SyncAction.CREATED,
-                api_id=api_id,
-                success=True,
-                message="Created",
-            )
-        else:
-            error = data.get("detail", str(data)) if data else f"HTTP {status}"
-            return SyncResult(
-                local_id=local_id,
-                action=SyncAction.FAILED,
-                success=False,
-                error=error,
-            )
+        # Check if requirement already exists by title
+        existing = existing_reqs.get(title)
+        unchanged = bool(existing) and (
+            (existing.get("condition") or "").strip() == condition.strip()
+            and (existing.get("action") or "").strip() == action.strip()
+        )
+        return self._plan_write(
+            self._requirements,
+            local_id=local_id,
+            title=title,
+            existing=existing,
+            unchanged=unchanged,
+            create_payload={"title": title, **update_payload},
+            update_payload=update_payload,
+        )
 
     async def sync_design_to_spec(
         self,
@@ -44,6 +44,10 @@ def create_reporter(settings: SpecSandboxSettings) -> Reporter:
             callback_url=settings.callback_url,
             sandbox_id=settings.sandbox_id,
             spec_id=settings.spec_id,
+            batch_size=settings.event_batch_size,
+            flush_interval=settings.event_flush_interval,
+            use_batch_endpoint=settings.event_flush_interval > 0,
+            outbox_dir=settings.event_outbox_dir,
         )
     else:
         raise ValueError(f"Unknown reporter mode: {settings.reporter_mode}")
@@ -0,0 +1,157 @@
+"""Tests for the durable event outbox."""
+
+import asyncio
+
+import pytest
+
+from spec_sandbox.reporters.outbox import EventOutbox, OutboxSender
+
+
+def _append(outbox: EventOutbox, count: int) -> None:
+    for i in range(count):
+        outbox.append({"event_type": "agent.tool_use", "event_data": {"i": i}})
+
+
+def test_batches_are_read_in_order_until_committed(tmp_path):
+    """Uncommitted events are read again; committed ones are not."""
+    outbox = EventOutbox(tmp_path, key_prefix="sb-1")
+    _append(outbox, 5)
+
+    records, end = outbox.read_batch(3)
+    assert [r["sequence"] for r in records] == [1, 2, 3]
+    assert outbox.read_batch(3)[0] == records
+
+    outbox.commit(end, records[-1]["sequence"])
+    records, end = outbox.read_batch(3)
+    assert [r["sequence"] for r in records] == [4, 5]
+    assert outbox.lag()["pending_events"] == 2
+    outbox.close()
+
+
+def test_cursor_and_keys_survive_reopen(tmp_path):
+    """A reopened outbox resumes after the last committed event."""
+    outbox = EventOutbox(tmp_path, key_prefix="sb-1")
+    _append(outbox, 3)
+    records, end = outbox.read_batch(2)
+    outbox.commit(end, records[-1]["sequence"])
+    key = outbox.read_batch(1)[0][0]["idempotency_key"]
+    outbox.close()
+
+    reopened = EventOutbox(tmp_path, key_prefix="sb-1")
+    records, _ = reopened.read_batch(10)
+
+    assert [r["sequence"] for r in records] == [3]
+    assert records[0]["idempotency_key"] == key
+    assert reopened.append({"event_type": "x"}) == 4
+    reopened.close()
+
+
+def test_partial_last_line_is_dropped(tmp_path):
+    """A write torn by a crash doesn't block later events."""
+    outbox = EventOutbox(tmp_path, key_prefix="sb-1")
+    _append(outbox, 1)
+    outbox.close()
+    with open(tmp_path / "events.log", "ab") as f:
+        f.write(b'{"event_type": "agent.tool')
+
+    reopened = EventOutbox(tmp_path, key_prefix="sb-1")
+    reopened.append({"event_type": "agent.completed"})
+    records, _ = reopened.read_batch(10)
+
+    assert [r["event_type"] for r in records] == ["agent.tool_use", "agent.completed"]
+    reopened.close()
+
+
+def test_torn_line_longer_than_a_chunk_is_dropped(tmp_path):
+    """Recovery scans back past the first chunk to the last complete line."""
+    outbox = EventOutbox(tmp_path, key_prefix="sb-1")
+    outbox.append({"event_type": "agent.output", "event_data": {"text": "a" * 70000}})
+    outbox.close()
+    with open(tmp_path / "events.log", "ab") as f:
+        f.write(b'{"event_type": "agent.output", "text": "' + b"b" * 150000)
+
+    reopened = EventOutbox(tmp_path, key_prefix="sb-1")
+    reopened.append({"event_type": "agent.completed"})
+    records, _ = reopened.read_batch(10)
+
+    assert [r["event_type"] for r in records] == ["agent.output", "agent.completed"]
+    assert len(records[0]["event_data"]["text"]) == 70000
+    reopened.close()
+
+
+def test_torn_first_line_empties_the_log(tmp_path):
+    EventOutbox(tmp_path, key_prefix="sb-1").close()
+    (tmp_path / "events.log").write_bytes(b"x" * 100000)
+
+    reopened = EventOutbox(tmp_path, key_prefix="sb-1")
+
+    assert (tmp_path / "events.log").stat().st_size == 0
+    assert reopened.read_batch(10)[0] == []
+    reopened.close()
+
+
+def test_drained_log_is_compacted(tmp_path):
+    outbox = EventOutbox(tmp_path, key_prefix="sb-1")
+    outbox.COMPACT_BYTES = 1
+    _append(outbox, 2)
+
+    records, end = outbox.read_batch(10)
+    outbox.commit(end, records[-1]["sequence"])
+
+    assert (tmp_path / "events.log").stat().st_size == 0
+    assert outbox.pending_bytes == 0
+    outbox.append({"event_type": "x"})
+    assert [r["sequence"] for r in outbox.read_batch(10)[0]] == [3]
+    outbox.close()
+
+
+@pytest.mark.asyncio
+async def test_sender_retries_with_backoff_until_delivered(tmp_path):
+    outbox = EventOutbox(tmp_path, key_prefix="sb-1")
+    sent = []
+    replies = [False, False, True, True]
+
+    async def send(events):
+        if replies.pop(0):
+            sent.extend(events)
+            return True
+        return False
+
+    sender = OutboxSender(outbox, send, batch_size=2, linger=60, max_backoff=0.01)
+    _append(outbox, 3)
+    sender.notify(urgent=True)
+
+    assert await sender.drain(timeout=2) is True
+    await sender.stop()
+
+    assert [e["sequence"] for e in sent] == [1, 2, 3]
+    assert all("enqueued_at" not in e for e in sent)
+    lag = sender.lag()
+    assert lag["send_failures"] == 2
+    assert lag["pending_events"] == 0
+    outbox.close()
+
+
+@pytest.mark.asyncio
+async def test_sender_waits_for_full_batch_or_urgent_event(tmp_path):
+    outbox = EventOutbox(tmp_path, key_prefix="sb-1")
+    batches = []
+
+    async def send(events):
+        batches.append([e["event_type"] for e in events])
+        return True
+
+    sender = OutboxSender(outbox, send, batch_size=10, linger=60)
+    sender.start()
+    outbox.append({"event_type": "agent.tool_use"})
+    sender.notify()
+    await asyncio.sleep(0.05)
+    assert batches == []
+
+    outbox.append({"event_type": "agent.completed"})
+    sender.notify(urgent=True)
+    await asyncio.sleep(0.05)
+    await sender.stop()
+
+    assert batches == [["agent.tool_use", "agent.completed"]]
+    outbox.close()
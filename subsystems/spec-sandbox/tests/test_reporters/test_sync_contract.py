@@ -484,6 +484,145 @@ class TestHTTPReporterBatching:
             assert payload["event_type"] == "single"
 
 
+class TestHTTPReporterBatchEndpoint:
+    """Test HTTPReporter with use_batch_endpoint=True."""
+
+    def _reporter(self, **kwargs):
+        return HTTPReporter(
+            callback_url="http://localhost:8000",
+            sandbox_id="test-sandbox-123",
+            spec_id="spec-1",
+            use_batch_endpoint=True,
+            flush_interval=0,
+            **kwargs,
+        )
+
+    def _client(self, *status_codes):
+        mock_client = AsyncMock()
+        responses = []
+        for code in status_codes:
+            response = AsyncMock()
+            response.status_code = code
+            response.raise_for_status = lambda: None
+            responses.append(response)
+        mock_client.post = AsyncMock(side_effect=responses)
+        return mock_client
+
+    @pytest.mark.asyncio
+    async def test_batch_sent_in_one_request(self):
+        """A full batch should be one POST to /events/batch."""
+        reporter = self._reporter(batch_size=3)
+        mock_client = self._client(200)
+
+        with patch.object(reporter, "_get_client", return_value=mock_client):
+            for name in ("a", "b", "c"):
+                await reporter.report(Event(event_type=name, spec_id="spec-1"))
+
+        assert mock_client.post.call_count == 1
+        url = mock_client.post.call_args[0][0]
+        assert url == "http://localhost:8000/api/v1/sandboxes/test-sandbox-123/events/batch"
+        events = mock_client.post.call_args[1]["json"]["events"]
+        assert [e["event_type"] for e in events] == ["a", "b", "c"]
+        assert [e["sequence"] for e in events] == [1, 2, 3]
+        assert all(e["event_data"]["spec_id"] == "spec-1" for e in events)
+        assert len({e["idempotency_key"] for e in events}) == 3
+
+    @pytest.mark.asyncio
+    async def test_phase_event_flushes_immediately(self):
+        """Phase events should not wait for the batch to fill."""
+        reporter = self._reporter(batch_size=50)
+        mock_client = self._client(200)
+
+        with patch.object(reporter, "_get_client", return_value=mock_client):
+            await reporter.report(Event(event_type="spec.heartbeat", spec_id="spec-1"))
+            await reporter.report(
+                Event(event_type=EventTypes.PHASE_STARTED, spec_id="spec-1", phase="prd")
+            )
+
+        events = mock_client.post.call_args[1]["json"]["events"]
+        assert [e["event_type"] for e in events] == [
+            "spec.heartbeat",
+            EventTypes.PHASE_STARTED,
+        ]
+        assert events[1]["event_data"]["phase"] == "prd"
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_single_posts_on_404(self):
+        """Backends without the batch endpoint get one request per event."""
+        reporter = self._reporter(batch_size=2)
+        mock_client = self._client(404, 200, 200)
+
+        with patch.object(reporter, "_get_client", return_value=mock_client):
+            await reporter.report(Event(event_type="a", spec_id="spec-1"))
+            await reporter.report(Event(event_type="b", spec_id="spec-1"))
+
+        urls = [c[0][0] for c in mock_client.post.call_args_list]
+        assert urls[0].endswith("/events/batch")
+        assert [u.endswith("/events") for u in urls[1:]] == [True, True]
+        assert reporter.use_batch_endpoint is False
+
+
+class TestHTTPReporterOutbox:
+    """Test HTTPReporter with a durable outbox (outbox_dir)."""
+
+    def _client(self, *status_codes):
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(
+            side_effect=[AsyncMock(status_code=code) for code in status_codes]
+        )
+        return mock_client
+
+    @pytest.mark.asyncio
+    async def test_report_returns_before_delivery(self, tmp_path):
+        """Events go to the outbox; flush() delivers them in one batch."""
+        reporter = HTTPReporter(
+            callback_url="http://localhost:8000",
+            sandbox_id="test-sandbox-123",
+            spec_id="spec-1",
+            batch_size=10,
+            flush_interval=60,
+            outbox_dir=tmp_path,
+        )
+        mock_client = self._client(200)
+
+        with patch.object(reporter, "_get_client", return_value=mock_client):
+            await reporter.report(Event(event_type="spec.heartbeat", spec_id="spec-1"))
+            await reporter.report(Event(event_type="spec.progress", spec_id="spec-1"))
+            mock_client.post.assert_not_called()
+
+            await reporter.flush()
+
+        url = mock_client.post.call_args[0][0]
+        assert url.endswith("/sandboxes/test-sandbox-123/events/batch")
+        events = mock_client.post.call_args[1]["json"]["events"]
+        assert [e["sequence"] for e in events] == [1, 2]
+        assert reporter.outbox_lag()["pending_events"] == 0
+        await reporter.close()
+
+    @pytest.mark.asyncio
+    async def test_sync_summary_is_queued_after_earlier_events(self, tmp_path):
+        """The final agent.completed event is delivered after earlier events."""
+        reporter = HTTPReporter(
+            callback_url="http://localhost:8000",
+            sandbox_id="test-sandbox-123",
+            outbox_dir=tmp_path,
+        )
+        mock_client = self._client(200, 200)
+
+        with patch.object(reporter, "_get_client", return_value=mock_client):
+            await reporter.report(Event(event_type="spec.progress", spec_id="spec-1"))
+            await reporter.report_sync_summary("spec-1", {"ready_for_execution": True})
+            await reporter.flush()
+
+        sent = [
+            e["event_type"]
+            for c in mock_client.post.call_args_list
+            for e in c[1]["json"]["events"]
+        ]
+        assert sent == ["spec.progress", "agent.completed"]
+        await reporter.close()
+
+
 # ============================================================================
 # INTEGRATION: FULL SYNC FLOW SIMULATION
 # ============================================================================
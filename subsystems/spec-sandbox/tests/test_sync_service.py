@@ -0,0 +1,250 @@
+"""Tests for MarkdownSyncService change detection and bulk writes."""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+from spec_sandbox.reporters.array import ArrayReporter
+from spec_sandbox.schemas.events import EventTypes
+from spec_sandbox.sync.service import MarkdownSyncService, SyncConfig
+
+
+class FakeAPI:
+    """Stands in for MarkdownSyncService._request, recording every call."""
+
+    def __init__(self, bulk: bool = True, bulk_timeouts: int = 0) -> None:
+        self.bulk = bulk
+        # Bulk requests that are applied but get no response
+        self.bulk_timeouts = bulk_timeouts
+        self.calls: List[Tuple[str, str, Optional[Dict[str, Any]]]] = []
+        self.tickets: List[Dict[str, Any]] = []
+        self.tasks: List[Dict[str, Any]] = []
+
+    def writes(self) -> List[Tuple[str, str]]:
+        return [(method, path) for method, path, _ in self.calls if method != "GET"]
+
+    def _store(self, endpoint: str) -> List[Dict[str, Any]]:
+        return self.tickets if endpoint.startswith("/api/v1/tickets") else self.tasks
+
+    def _upsert(
+        self, endpoint: str, item_id: Optional[str], data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        store = self._store(endpoint)
+        for item in store:
+            if item["id"] == item_id:
+                item.update(data)
+                return item
+        prefix = "ticket" if store is self.tickets else "task"
+        item = {**data, "id": f"{prefix}-{len(store) + 1}"}
+        store.append(item)
+        return item
+
+    async def __call__(
+        self,
+        method: str,
+        endpoint: str,
+        json: Optional[Dict[str, Any]] = None,
+        **options: Any,
+    ) -> Tuple[int, Optional[Dict[str, Any]]]:
+        self.calls.append((method, endpoint, json))
+        if method == "GET":
+            return 200, list(self._store(endpoint))
+        if endpoint.endswith("/bulk"):
+            if not self.bulk:
+                return 404, {"detail": "Not Found"}
+            results = [
+                {
+                    "local_id": item["local_id"],
+                    "id": self._upsert(endpoint, item["id"], item["data"])["id"],
+                    "status_code": 200 if item["id"] else 201,
+                }
+                for item in json["items"]
+            ]
+            if self.bulk_timeouts:
+                self.bulk_timeouts -= 1
+                return 0, {"error": "ReadTimeout"}
+            return 200, {"results": results}
+        item_id = endpoint.rsplit("/", 1)[-1] if method == "PATCH" else None
+        return 201, self._upsert(endpoint, item_id, json)
+
+
+def _write_ticket(output_dir: Path, number: int, body: str = "Ticket body") -> None:
+    path = output_dir / "tickets" / f"TKT-{number:03d}.md"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        f"---\nid: TKT-{number:03d}\ntitle: Ticket {number}\n"
+        f"created: 2025-01-16\n---\n\n{body}\n"
+    )
+
+
+def _write_task(output_dir: Path, number: int, ticket: int) -> None:
+    path = output_dir / "tasks" / f"TSK-{number:03d}.md"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        f"---\nid: TSK-{number:03d}\ntitle: Task {number}\ncreated: 2025-01-16\n"
+        f"parent_ticket: TKT-{ticket:03d}\n---\n\nTask body\n"
+    )
+
+
+def _service(
+    api: FakeAPI, state_file: Optional[Path] = None, **overrides: Any
+) -> MarkdownSyncService:
+    config = SyncConfig(
+        api_url="http://localhost:8000",
+        project_id="project-1",
+        spec_id="spec-1",
+        state_file=state_file,
+        **overrides,
+    )
+    service = MarkdownSyncService(config, ArrayReporter())
+    service._request = api
+    return service
+
+
+class TestDirectorySync:
+    @pytest.mark.asyncio
+    async def test_tickets_are_synced_before_tasks(self, tmp_path):
+        _write_ticket(tmp_path, 1)
+        _write_task(tmp_path, 1, ticket=1)
+        _write_task(tmp_path, 2, ticket=1)
+        api = FakeAPI()
+
+        summary = await _service(api).sync_directory(tmp_path)
+
+        assert summary.tickets_created == 1
+        assert summary.tasks_created == 2
+        assert api.writes() == [
+            ("POST", "/api/v1/tickets/bulk"),
+            ("POST", "/api/v1/tasks/bulk"),
+        ]
+        task_payloads = api.calls[-1][2]["items"]
+        assert {item["data"]["ticket_id"] for item in task_payloads} == {"ticket-1"}
+
+    @pytest.mark.asyncio
+    async def test_unchanged_files_are_skipped(self, tmp_path):
+        output_dir = tmp_path / "output"
+        state_file = tmp_path / "state" / "sync.json"
+        _write_ticket(output_dir, 1)
+        _write_ticket(output_dir, 2)
+        _write_task(output_dir, 1, ticket=1)
+        api = FakeAPI()
+        await _service(api, state_file).sync_directory(output_dir)
+        assert state_file.exists()
+        assert sorted(p.name for p in output_dir.iterdir()) == ["tasks", "tickets"]
+
+        api.calls.clear()
+        summary = await _service(api, state_file).sync_directory(output_dir)
+
+        assert api.calls == []
+        assert summary.tickets_skipped == 2
+        assert summary.tasks_skipped == 1
+        assert summary.ticket_id_map == {"TKT-001": "ticket-1", "TKT-002": "ticket-2"}
+        assert summary.task_results[0].message == "Unchanged since last sync"
+
+    @pytest.mark.asyncio
+    async def test_state_is_opt_in(self, tmp_path):
+        _write_ticket(tmp_path, 1)
+        api = FakeAPI()
+        await _service(api).sync_directory(tmp_path)
+
+        api.calls.clear()
+        summary = await _service(api).sync_directory(tmp_path)
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["tickets"]
+        assert summary.tickets_skipped == 1
+        assert summary.ticket_results[0].message != "Unchanged since last sync"
+
+    @pytest.mark.asyncio
+    async def test_only_changed_files_are_written(self, tmp_path):
+        state_file = tmp_path / "sync.json"
+        output_dir = tmp_path / "output"
+        _write_ticket(output_dir, 1)
+        _write_ticket(output_dir, 2)
+        api = FakeAPI()
+        await _service(api, state_file).sync_directory(output_dir)
+
+        _write_ticket(output_dir, 2, body="Rewritten body")
+        api.calls.clear()
+        summary = await _service(api, state_file).sync_directory(output_dir)
+
+        assert summary.tickets_skipped == 1
+        assert summary.tickets_updated == 1
+        assert api.writes() == [("POST", "/api/v1/tickets/bulk")]
+        items = api.calls[-1][2]["items"]
+        assert [(item["local_id"], item["id"]) for item in items] == [
+            ("TKT-002", "ticket-2")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_dry_run_does_not_save_state(self, tmp_path):
+        state_file = tmp_path / "sync.json"
+        _write_ticket(tmp_path / "output", 1)
+
+        await _service(FakeAPI(), state_file, dry_run=True).sync_directory(
+            tmp_path / "output"
+        )
+
+        assert not state_file.exists()
+
+
+class TestBulkWrites:
+    @pytest.mark.asyncio
+    async def test_writes_are_batched(self, tmp_path):
+        for number in range(1, 8):
+            _write_ticket(tmp_path, number)
+        api = FakeAPI()
+
+        summary = await _service(api, bulk_batch_size=3).sync_directory(tmp_path)
+
+        assert summary.tickets_created == 7
+        bulk_sizes = [len(json["items"]) for _, _, json in api.calls if json]
+        assert bulk_sizes == [3, 3, 1]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_single_requests_without_bulk_endpoint(
+        self, tmp_path
+    ):
+        _write_ticket(tmp_path, 1)
+        _write_ticket(tmp_path, 2)
+        api = FakeAPI(bulk=False)
+        reporter = ArrayReporter()
+        service = _service(api)
+        service.reporter = reporter
+
+        summary = await service.sync_directory(tmp_path)
+
+        assert summary.tickets_created == 2
+        assert api.writes() == [
+            ("POST", "/api/v1/tickets/bulk"),
+            ("POST", "/api/v1/tickets"),
+            ("POST", "/api/v1/tickets"),
+        ]
+        created = [
+            event.data["local_id"]
+            for event in reporter.events
+            if event.event_type == EventTypes.TICKET_CREATED
+        ]
+        assert created == ["TKT-001", "TKT-002"]
+
+    @pytest.mark.asyncio
+    async def test_unanswered_batch_is_reconciled_by_title(self, tmp_path):
+        for number in range(1, 4):
+            _write_ticket(tmp_path, number)
+        api = FakeAPI(bulk_timeouts=1)
+
+        summary = await _service(api, bulk_batch_size=2).sync_directory(tmp_path)
+
+        # The unanswered batch was applied; its items are found, not re-created
+        assert summary.tickets_created == 3
+        assert summary.tickets_failed == 0
+        assert len(api.tickets) == 3
+        assert summary.ticket_id_map == {
+            "TKT-001": "ticket-1",
+            "TKT-002": "ticket-2",
+            "TKT-003": "ticket-3",
+        }
+        assert api.writes() == [
+            ("POST", "/api/v1/tickets/bulk"),
+            ("POST", "/api/v1/tickets/bulk"),
+        ]